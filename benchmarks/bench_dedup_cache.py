@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark: DedupCache vs the legacy set/dict dedup patterns.
+
+Reports steady-state memory and per-op latency with a 1M-signature window.
+
+Usage:
+    python benchmarks/bench_dedup_cache.py
+    python benchmarks/bench_dedup_cache.py --n 200000
+"""
+
+import argparse
+import base64
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from monitoring.dedup_cache import DedupCache
+
+
+class LegacyTrimSet:
+    """Old receiver pattern: set + set(list(s)[-keep:]) when over limit."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.keep = limit // 2
+        self.s: set[str] = set()
+
+    def add(self, sig: str) -> bool:
+        if sig in self.s:
+            return False
+        self.s.add(sig)
+        if len(self.s) > self.limit:
+            self.s = set(list(self.s)[-self.keep:])
+        return True
+
+
+class LegacySignalDedup:
+    """Old SignalDedup: dict + full TTL rescan on every call once >= 50 entries."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.seen: dict[str, tuple[float, str]] = {}
+
+    def add(self, sig: str) -> bool:
+        if len(self.seen) >= 50:
+            cutoff = time.monotonic() - self.ttl
+            for k in [k for k, (ts, _) in self.seen.items() if ts < cutoff]:
+                del self.seen[k]
+        if sig in self.seen:
+            return False
+        self.seen[sig] = (time.monotonic(), "")
+        return True
+
+
+def make_sigs(n: int) -> list[str]:
+    # 88-char strings, same length as base58 tx signatures
+    return [base64.b64encode(os.urandom(66)).decode() for _ in range(n)]
+
+
+def measure_memory(factory, sigs: list[str]) -> int:
+    """Bytes retained by the structure after filling it with sigs.
+
+    The signature strings themselves are allocated before tracing starts, so
+    only what the structure keeps alive (containers, hashes, copies) counts,
+    except that a str-keyed set keeps the strings alive too - add their size.
+    """
+    gc.collect()
+    tracemalloc.start()
+    obj = factory()
+    for sig in sigs:
+        obj.add(sig)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if isinstance(obj, LegacyTrimSet):
+        size += sum(sys.getsizeof(s) for s in obj.s)
+    del obj
+    return size
+
+
+def time_ops(obj, sigs: list[str]) -> float:
+    """Mean ns per add() over sigs."""
+    start = time.perf_counter_ns()
+    for sig in sigs:
+        obj.add(sig)
+    return (time.perf_counter_ns() - start) / len(sigs)
+
+
+def worst_op(obj, sigs: list[str]) -> int:
+    """Slowest single add() in ns (captures trim/rescan spikes)."""
+    worst = 0
+    clock = time.perf_counter_ns
+    for sig in sigs:
+        t0 = clock()
+        obj.add(sig)
+        dt = clock() - t0
+        if dt > worst:
+            worst = dt
+    return worst
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=1_000_000, help="window size / signatures")
+    args = ap.parse_args()
+    n = args.n
+
+    print(f"generating {2 * n:,} signatures...")
+    sigs = make_sigs(2 * n)
+    first, second = sigs[:n], sigs[n:]
+
+    print(f"\nsteady-state memory, window = {n:,} signatures")
+    set_mem = measure_memory(lambda: LegacyTrimSet(limit=n), first)
+    ring_mem = measure_memory(lambda: DedupCache(maxsize=n), first)
+    ttl_mem = measure_memory(lambda: DedupCache(maxsize=n, ttl=300), first)
+    print(f"  set[str] (legacy)        {set_mem / n:7.1f} B/entry  {set_mem / 2**20:8.1f} MiB")
+    print(f"  DedupCache               {ring_mem / n:7.1f} B/entry  {ring_mem / 2**20:8.1f} MiB")
+    print(f"  DedupCache(ttl=300)      {ttl_mem / n:7.1f} B/entry  {ttl_mem / 2**20:8.1f} MiB")
+
+    print("\nper-op latency at steady state (window full, every insert evicts)")
+    print(f"  {'window':>10}  {'structure':<18} {'mean ns':>9} {'worst ns':>10}")
+    for window in sorted({10_000, n}):
+        for name, factory in (
+            ("legacy trim set", lambda: LegacyTrimSet(limit=window)),
+            ("DedupCache", lambda: DedupCache(maxsize=window)),
+            ("DedupCache(ttl)", lambda: DedupCache(maxsize=window, ttl=300)),
+        ):
+            obj = factory()
+            time_ops(obj, first)
+            mean = time_ops(obj, second[: n // 2])
+            worst = worst_op(obj, second[n // 2:])
+            print(f"  {window:>10,}  {name:<18} {mean:9.0f} {worst:10,}")
+
+    ring = DedupCache(maxsize=n)
+    time_ops(ring, first)
+    print(f"\n  DedupCache duplicate hit ({n:,} window)   {time_ops(ring, first):6.0f} ns")
+
+    sample = second[:20_000]
+    print(f"  legacy SignalDedup insert (20k entries)  {time_ops(LegacySignalDedup(ttl=300), sample):6.0f} ns")
+    new_sd = DedupCache(maxsize=50_000, ttl=300, track_source=True)
+    print(f"  DedupCache SignalDedup insert (20k)      {time_ops(new_sd, sample):6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
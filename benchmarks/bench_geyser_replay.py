@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+End-to-end WhaleGeyserReceiver latency benchmark over a local Geyser replay.
+
+A fake Geyser server (monitoring/geyser_replay.py) streams recorded or
+synthetic SubscribeUpdate messages over real gRPC into an unmodified
+receiver, and each pipeline stage is timed:
+
+    transport   server send            -> update handed to _run_stream_instance
+    stream      _run_stream_instance loop body per update (filter/dedup/dispatch)
+    parse       LocalTxParser.parse
+    emit        _emit_from_local_parse
+    end_to_end  server send            -> on_whale_buy callback
+
+Usage:
+    python benchmarks/bench_geyser_replay.py
+    python benchmarks/bench_geyser_replay.py --count 5000 --speed 0
+    python benchmarks/bench_geyser_replay.py --recording geyser_recording.bin --speed 10
+    python benchmarks/bench_geyser_replay.py --write-synthetic synth.bin
+
+--recording takes a GEYSER_RECORD_FILE capture (or any length-prefixed
+SubscribeUpdate stream). Without --wallets every fee payer whose tx the
+local parser recognises as a swap is treated as a whale, so the emit path
+is exercised and everything else is dropped by the raw pre-filter.
+--speed 0 replays as fast as possible, 1.0 at recorded speed, N at N x.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import base58
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tests" / "unit"))
+
+from geyser_fixtures import fee_payer_of, synthesize_tx_infos
+
+from geyser.generated import geyser_pb2
+from monitoring.geyser_replay import (
+    ReplayGeyserServicer,
+    attach_replay,
+    load_updates,
+    start_replay_server,
+    write_recording,
+)
+from monitoring.local_tx_parser import LocalTxParser
+from monitoring.whale_geyser import WhaleGeyserReceiver
+
+
+def synthetic_updates(count: int, interval: float) -> list[tuple[float, object]]:
+    """Mixed tx workload (geyser_fixtures) wrapped as SubscribeUpdate messages."""
+    return [
+        (
+            i * interval,
+            geyser_pb2.SubscribeUpdate(
+                transaction=geyser_pb2.SubscribeUpdateTransaction(transaction=info, slot=300_000_000 + i)
+            ),
+        )
+        for i, info in enumerate(synthesize_tx_infos(count))
+    ]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class StageProbe:
+    """Collects per-stage samples (seconds) from the instrumented receiver."""
+
+    def __init__(self, sig_index: dict, send_times: dict):
+        self.sig_index = sig_index
+        self.send_times = send_times
+        self.received = 0
+        self.samples: dict[str, list[float]] = {
+            "transport": [], "stream": [], "parse": [], "emit": [], "end_to_end": [],
+        }
+        self.last_done = 0.0
+        self.helius_fallbacks = 0
+
+
+class _TimedSubscribe:
+    """Stub proxy: times the receiver's loop body between consecutive updates."""
+
+    def __init__(self, stub, probe: StageProbe):
+        self._stub = stub
+        self._probe = probe
+
+    def Subscribe(self, request_iterator):
+        return self._iterate(self._stub.Subscribe(request_iterator))
+
+    async def _iterate(self, call):
+        probe = self._probe
+        async for update in call:
+            received = time.monotonic()
+            if not update.HasField("pong"):
+                probe.received += 1
+            if update.HasField("transaction"):
+                idx = probe.sig_index.get(base58.b58encode(update.transaction.transaction.signature).decode())
+                if idx in probe.send_times:
+                    probe.samples["transport"].append(received - probe.send_times[idx])
+                received = time.monotonic()  # signature lookup is harness overhead
+            yield update
+            done = time.monotonic()
+            probe.samples["stream"].append(done - received)
+            probe.last_done = done
+
+
+def instrument(receiver: WhaleGeyserReceiver, probe: StageProbe) -> None:
+    create_channel = receiver._create_channel_for
+
+    async def _create_channel_for(inst):
+        return _TimedSubscribe(await create_channel(inst), probe)
+    receiver._create_channel_for = _create_channel_for
+
+    if receiver.local_parser:
+        parse = receiver.local_parser.parse
+
+        def _timed_parse(tx, fee_payer):
+            t0 = time.perf_counter()
+            try:
+                return parse(tx, fee_payer)
+            finally:
+                probe.samples["parse"].append(time.perf_counter() - t0)
+        receiver.local_parser.parse = _timed_parse
+
+    emit = receiver._emit_from_local_parse
+
+    async def _timed_emit(parsed, grpc_receive_time, source_name=""):
+        t0 = time.perf_counter()
+        try:
+            return await emit(parsed, grpc_receive_time, source_name)
+        finally:
+            probe.samples["emit"].append(time.perf_counter() - t0)
+    receiver._emit_from_local_parse = _timed_emit
+
+    async def _on_whale_buy(whale_buy):
+        idx = probe.sig_index.get(whale_buy.tx_signature)
+        if idx in probe.send_times:
+            probe.samples["end_to_end"].append(time.monotonic() - probe.send_times[idx])
+    receiver.set_callback(_on_whale_buy)
+
+    # Symbol lookup (DexScreener) and the local-parse-miss fallback (Helius)
+    # are HTTP calls - keep the network out of the numbers, just count fallbacks
+    async def _no_symbol(mint, whale_buy_obj):
+        return None
+    receiver._deferred_symbol_update = _no_symbol
+
+    async def _no_helius(signature, fee_payer, grpc_receive_time):
+        probe.helius_fallbacks += 1
+    receiver._parse_and_emit = _no_helius
+
+
+async def run(args) -> None:
+    if args.recording:
+        updates = load_updates(args.recording)
+    else:
+        updates = synthetic_updates(args.count, args.interval)
+        if args.write_synthetic:
+            n = write_recording(args.write_synthetic, [u for _, u in updates], args.interval)
+            print(f"wrote {n} synthetic updates to {args.write_synthetic}")
+            return
+
+    tx_updates = [(i, u) for i, (_, u) in enumerate(updates) if u.HasField("transaction")]
+    sig_index = {
+        base58.b58encode(u.transaction.transaction.signature).decode(): i for i, u in tx_updates
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        wallets_file = args.wallets
+        if not wallets_file:
+            parser = LocalTxParser()
+            payers = sorted({
+                fee_payer_of(u.transaction.transaction)
+                for _, u in tx_updates
+                if parser.parse(u.transaction.transaction, fee_payer_of(u.transaction.transaction))
+            })
+            wallets_file = str(Path(tmp) / "wallets.json")
+            Path(wallets_file).write_text(json.dumps(
+                {"whales": [{"wallet": w, "label": f"replay{i}"} for i, w in enumerate(payers)]}
+            ))
+
+        receiver = WhaleGeyserReceiver(wallets_file=wallets_file, min_buy_amount=args.min_buy)
+        servicer = ReplayGeyserServicer(updates, speed=args.speed)
+        server, target = await start_replay_server(servicer)
+        servicer.streams = attach_replay(receiver, target)
+
+        probe = StageProbe(sig_index, servicer.stats.send_times)
+        instrument(receiver, probe)
+
+        await receiver.start()
+        try:
+            await asyncio.wait_for(servicer.finished.wait(), timeout=args.timeout)
+            # Let the receiver drain what is in flight, then emit tasks settle
+            deadline = time.monotonic() + 5.0
+            while probe.received < servicer.stats.sent and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.2)
+        finally:
+            await receiver.stop()
+            await server.stop(grace=None)
+
+    elapsed = (probe.last_done or time.monotonic()) - servicer.stats.started_at
+    stats = receiver.get_stats()
+
+    print(f"replayed {servicer.stats.sent} updates ({len(tx_updates)} tx) at speed={args.speed or 'max'}")
+    print(f"throughput {probe.received / elapsed if elapsed > 0 else 0:,.0f} msg/s over {elapsed:.3f}s")
+    print(
+        f"buys emitted {stats.get('buys_emitted', 0)}, prefiltered {stats.get('prefiltered', 0)}, "
+        f"helius fallbacks {probe.helius_fallbacks}"
+    )
+    print(f"{'stage':<12} {'n':>7} {'p50 us':>10} {'p99 us':>10} {'max us':>10}")
+    for stage, values in probe.samples.items():
+        us = [v * 1e6 for v in values]
+        print(f"{stage:<12} {len(us):>7} {percentile(us, 50):>10.1f} {percentile(us, 99):>10.1f} {max(us, default=0):>10.1f}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--recording", help="GEYSER_RECORD_FILE capture / length-prefixed SubscribeUpdate stream")
+    ap.add_argument("--wallets", help="whale wallets JSON (default: every recorded fee payer)")
+    ap.add_argument("--count", type=int, default=2000, help="synthetic update count")
+    ap.add_argument("--interval", type=float, default=0.0005, help="synthetic spacing, seconds")
+    ap.add_argument("--speed", type=float, default=0.0, help="0 = max, 1 = recorded, N = N x")
+    ap.add_argument("--min-buy", type=float, default=0.001, help="receiver min_buy_amount (SOL)")
+    ap.add_argument("--timeout", type=float, default=120.0)
+    ap.add_argument("--write-synthetic", help="write the synthetic workload as a recording and exit")
+    args = ap.parse_args()
+
+    logging.disable(logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
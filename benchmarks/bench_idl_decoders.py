@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: precompiled IDL struct decoders vs the recursive IDLParser
+interpreter, for the hot account/event types and a busy log batch.
+
+Usage:
+    python benchmarks/bench_idl_decoders.py
+    python benchmarks/bench_idl_decoders.py --rounds 20000
+"""
+
+import argparse
+import base64
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tests" / "unit"))
+
+from test_idl_compiled import _encode  # random valid encodings per IDL type
+
+from utils.idl_parser import DISCRIMINATOR_SIZE, IDLParser
+
+CASES = [
+    ("pump_fun_idl.json", "BondingCurve", "account"),
+    ("pump_fun_idl.json", "TradeEvent", "event"),
+    ("pump_fun_idl.json", "CreateEvent", "event"),
+    ("raydium_launchlab_idl.json", "PoolState", "account"),
+    ("raydium_launchlab_idl.json", "TradeEvent", "event"),
+]
+
+
+def best_us(fn, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        t0 = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        best = min(best, time.perf_counter() - t0)
+    return best / rounds * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rounds", type=int, default=5000)
+    args = ap.parse_args()
+    rng = random.Random(7)
+
+    print(f"{'type':<34} {'interpreter us':>15} {'compiled us':>12} {'raw pubkeys us':>15} {'speedup':>8}")
+    for idl, name, kind in CASES:
+        parser = IDLParser(str(ROOT / "idl" / idl))
+        body = _encode(parser, {"defined": name}, rng)
+        if kind == "event":
+            data = parser.get_event_discriminators()[name] + body
+        else:
+            data = b"\0" * DISCRIMINATOR_SIZE + body
+        layout = parser.compiled_types[name]
+
+        interp = best_us(lambda: parser._decode_defined_type(data[DISCRIMINATOR_SIZE:], 0, name), args.rounds)
+        compiled = best_us(lambda: layout.decode(data, DISCRIMINATOR_SIZE), args.rounds)
+        raw = best_us(lambda: layout.decode(data, DISCRIMINATOR_SIZE, raw_pubkeys=True), args.rounds)
+        print(f"{idl.split('_')[0] + ':' + name:<34} {interp:>15.2f} {compiled:>12.2f} {raw:>15.2f} {interp / raw:>7.1f}x")
+
+    # Busy log subscription: 1 pump TradeEvent among foreign Program data lines
+    parser = IDLParser(str(ROOT / "idl" / "pump_fun_idl.json"))
+    trade = parser.get_event_discriminators()["TradeEvent"] + _encode(parser, {"defined": "TradeEvent"}, rng)
+    logs = ["Program log: Instruction: Buy"] * 6
+    logs += ["Program data: " + base64.b64encode(rng.randbytes(200)).decode() for _ in range(8)]
+    logs.append("Program data: " + base64.b64encode(trade).decode())
+    compiled_types = parser.compiled_types
+
+    found = best_us(lambda: parser.find_event_in_logs(logs, "TradeEvent"), args.rounds // 5)
+    parser.compiled_types = {}
+    parser._event_b64_prefixes_by_name = {"TradeEvent": _AnyPrefix()}
+    legacy = best_us(lambda: parser.find_event_in_logs(logs, "TradeEvent"), args.rounds // 5)
+    parser.compiled_types = compiled_types
+    print(f"{'find_event_in_logs (15 lines)':<34} {legacy:>15.2f} {found:>12.2f} {'':>15} {legacy / found:>7.1f}x")
+
+
+class _AnyPrefix:
+    """Disables the discriminator prefix filter (legacy behaviour)."""
+
+    def __contains__(self, item):
+        return True
+
+
+if __name__ == "__main__":
+    main()
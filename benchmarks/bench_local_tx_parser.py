@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: LocalTxParser legacy path vs zero-decode path.
+
+Usage:
+    python benchmarks/bench_local_tx_parser.py
+    python benchmarks/bench_local_tx_parser.py --fixtures recorded_txs.bin --rounds 20
+
+--fixtures takes a length-prefixed stream of SubscribeUpdateTransactionInfo
+(or SubscribeUpdate) messages; without it a synthetic mixed workload is used.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tests" / "unit"))
+
+from geyser_fixtures import fee_payer_of, load_tx_infos, synthesize_tx_infos
+
+from monitoring.local_tx_parser import LocalTxParser
+
+
+def _run(parser: LocalTxParser, workload: list, rounds: int) -> float:
+    """Return mean microseconds per parse over all rounds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for tx_info, fee_payer in workload:
+            parser.parse(tx_info, fee_payer)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(workload)) * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--fixtures", help="length-prefixed protobuf fixture file")
+    ap.add_argument("--count", type=int, default=2000, help="synthetic tx count")
+    ap.add_argument("--rounds", type=int, default=10)
+    args = ap.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    tx_infos = load_tx_infos(args.fixtures) if args.fixtures else synthesize_tx_infos(args.count)
+    workload = [(tx, fee_payer_of(tx)) for tx in tx_infos]
+
+    legacy = LocalTxParser(zero_decode=False)
+    fast = LocalTxParser(zero_decode=True)
+
+    # Both paths must agree before timing means anything
+    for tx_info, fee_payer in workload:
+        a = legacy.parse(tx_info, fee_payer)
+        b = fast.parse(tx_info, fee_payer)
+        assert a == b, f"parse mismatch: {a} != {b}"
+
+    _run(legacy, workload, 1)
+    _run(fast, workload, 1)
+    legacy_us = _run(legacy, workload, args.rounds)
+    fast_us = _run(fast, workload, args.rounds)
+
+    print(f"fixtures: {len(workload)} txs x {args.rounds} rounds")
+    print(f"  legacy      {legacy_us:8.2f} us/tx")
+    print(f"  zero-decode {fast_us:8.2f} us/tx")
+    print(f"  speedup     {legacy_us / fast_us:8.2f}x")
+    print(f"  swaps found {fast.stats.successful // (args.rounds + 2)} per pass")
+
+
+if __name__ == "__main__":
+    main()
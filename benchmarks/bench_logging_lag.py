@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark: event-loop lag caused by logging, sync StreamHandler vs QueueHandler.
+
+A producer coroutine emits hot-path style log calls (one DEBUG and one
+INFO per event, plus a per-mint WARNING through the hot-path logger), while
+a probe task measures how late asyncio.sleep(1ms) wakes up. The sink is a
+stream whose write() sleeps --sink-delay seconds, like stdout when
+journald/systemd is backed up.
+
+    sync   StreamHandler on the loop thread (previous setup_file_logging)
+    queue  NonBlockingQueueHandler -> QueueListener thread -> same sink
+
+Each runs with the root level at WARNING and at DEBUG.
+
+Usage:
+    python benchmarks/bench_logging_lag.py
+    python benchmarks/bench_logging_lag.py --events 20000 --sink-delay 0.0005
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils.logger import LOG_DATE_FORMAT, HotPathLogger, build_queue_handler
+
+
+class SlowSink:
+    """Text stream that blocks for `delay` seconds per write."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.writes = 0
+
+    def write(self, msg: str) -> int:
+        self.writes += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return len(msg)
+
+    def flush(self) -> None:
+        pass
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def _probe(lags: list[float], stop: asyncio.Event, tick: float = 0.001) -> None:
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(tick)
+        lags.append(time.perf_counter() - t0 - tick)
+
+
+async def _produce(log: logging.Logger, hot: HotPathLogger, events: int, mints: int, batch: int) -> None:
+    for i in range(events):
+        mint = f"mint{i % mints}"
+        log.debug("[GEYSER] curve update %s slot=%d vsr=%d", mint, 300_000_000 + i, 30_000_000_000 + i)
+        log.info("[GEYSER] Vault price move: %s %.10f SOL (%+.1f%%)", mint, 1e-7 * (1 + i % 7), 5.5)
+        hot.warning(mint, "[SL WARNING] %s: Price %.10f approaching SL %.10f", mint, 1e-7, 0.9e-7)
+        if i % batch == batch - 1:
+            await asyncio.sleep(0)  # other events get the loop between bursts
+
+
+async def run_case(mode: str, level: int, args) -> dict:
+    sink = SlowSink(args.sink_delay)
+    handler = logging.StreamHandler(sink)
+    handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)-8s | %(name)s | %(message)s", LOG_DATE_FORMAT))
+
+    log = logging.getLogger(f"bench.{mode}.{logging.getLevelName(level)}")
+    log.propagate = False
+    log.setLevel(level)
+    listener = None
+    if mode == "queue":
+        queue_handler, listener = build_queue_handler([handler])
+        log.addHandler(queue_handler)
+    else:
+        queue_handler = None
+        log.addHandler(handler)
+    hot = HotPathLogger(log, interval=args.hot_interval)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    t0 = time.perf_counter()
+    await _produce(log, hot, args.events, args.mints, args.batch)
+    produce_s = time.perf_counter() - t0
+    stop.set()
+    await probe
+    if listener is not None:
+        listener.stop()  # drain, so the sink write count is complete
+    log.handlers.clear()
+
+    return {
+        "mode": mode,
+        "level": logging.getLevelName(level),
+        "p50": percentile(lags, 50) * 1e3,
+        "p99": percentile(lags, 99) * 1e3,
+        "max": max(lags, default=0.0) * 1e3,
+        "produce_ms": produce_s * 1e3,
+        "writes": sink.writes,
+        "dropped": queue_handler.dropped if queue_handler else 0,
+        "suppressed": hot.suppressed,
+    }
+
+
+async def main_async(args) -> None:
+    print(
+        f"events={args.events} mints={args.mints} sink_delay={args.sink_delay * 1e6:.0f}us "
+        f"hot_interval={args.hot_interval}s"
+    )
+    print(f"{'mode':<6} {'level':<8} {'lag p50 ms':>11} {'p99 ms':>9} {'max ms':>9} "
+          f"{'produce ms':>11} {'writes':>7} {'dropped':>8} {'suppressed':>11}")
+    for level in (logging.WARNING, logging.DEBUG):
+        for mode in ("sync", "queue"):
+            r = await run_case(mode, level, args)
+            print(f"{r['mode']:<6} {r['level']:<8} {r['p50']:>11.3f} {r['p99']:>9.3f} {r['max']:>9.3f} "
+                  f"{r['produce_ms']:>11.1f} {r['writes']:>7} {r['dropped']:>8} {r['suppressed']:>11}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--events", type=int, default=5000)
+    ap.add_argument("--mints", type=int, default=50)
+    ap.add_argument("--batch", type=int, default=20, help="events per loop iteration")
+    ap.add_argument("--sink-delay", type=float, default=0.0002, help="seconds blocked per write")
+    ap.add_argument("--hot-interval", type=float, default=10.0)
+    args = ap.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
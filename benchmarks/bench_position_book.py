@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized PositionBook vs per-object Position.update_price +
+Position.should_exit, for one batch of price updates across N positions.
+
+Usage:
+    python benchmarks/bench_position_book.py
+    python benchmarks/bench_position_book.py --sizes 10 100 1000 10000
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from solders.pubkey import Pubkey
+
+from trading.position import Position
+from trading.position_book import PositionBook, utc_now_ts
+
+
+def make_positions(n: int, seed: int = 7) -> list[Position]:
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    out = []
+    for _ in range(n):
+        entry = rng.uniform(1e-8, 1e-5)
+        pos = Position(
+            mint=Pubkey(os.urandom(32)),
+            symbol="BENCH",
+            entry_price=entry,
+            quantity=rng.uniform(1e3, 1e6),
+            entry_time=now - timedelta(seconds=rng.uniform(0, 7200)),
+            take_profit_price=entry * 3,
+            stop_loss_price=entry * 0.8,
+            tsl_enabled=True,
+            is_moonbag=rng.random() < 0.5,
+        )
+        out.append(pos)
+    return out
+
+
+def make_prices(positions: list[Position], seed: int = 11) -> list[float]:
+    rng = random.Random(seed)
+    # Mostly quiet ticks, a few threshold crossings - the realistic case
+    return [p.entry_price * rng.uniform(0.85, 1.4) for p in positions]
+
+
+def bench_objects(positions, prices, rounds: int) -> float:
+    """Mean us per batch, per-object Python path (what the monitors do today)."""
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        exits = []
+        for pos, price in zip(positions, prices):
+            pos.update_price(price)
+            should, reason = pos.should_exit(price)
+            if should:
+                exits.append((str(pos.mint), reason))
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e6
+
+
+def bench_book(positions, prices, rounds: int) -> float:
+    """Mean us per batch, vectorized book (mints + prices in, exits out)."""
+    book = PositionBook()
+    book.load(positions)
+    mints = [str(p.mint) for p in positions]
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        now = utc_now_ts()
+        book.apply_prices(mints, prices, now=now)
+        book.exit_decisions(mints, prices, now=now)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e6
+
+
+def bench_sweep(positions, prices, rounds: int) -> float:
+    """Mean us per whole-book sweep over stored prices (engine sweeper path)."""
+    book = PositionBook()
+    book.load(positions)
+    for pos, price in zip(positions, prices):
+        book.set_price(str(pos.mint), price)
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        book.exit_decisions()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    ap.add_argument("--rounds", type=int, default=50)
+    args = ap.parse_args()
+
+    logging.disable(logging.CRITICAL)  # should_exit logs TSL debug lines
+
+    print(f"{'positions':>10} {'per-object us':>14} {'book us':>10} {'sweep us':>10} {'speedup':>8}")
+    for n in args.sizes:
+        positions = make_positions(n)
+        prices = make_prices(positions)
+        obj_us = bench_objects(make_positions(n), prices, args.rounds)
+        book_us = bench_book(positions, prices, args.rounds)
+        sweep_us = bench_sweep(positions, prices, args.rounds)
+        print(f"{n:>10,} {obj_us:>14.1f} {book_us:>10.1f} {sweep_us:>10.1f} {obj_us / book_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark: building a signed buy transaction per attempt, regular builders vs
+pre-compiled TransactionTemplate, for pumpfun, letsbonk and bags.
+
+    build     what each buy attempt does today: build_buy_instruction (PDAs,
+              account metas) + get_required_accounts_for_buy + compute budget
+              + Jito tip + Message + Transaction (sign)
+    retry     a retry of the same buy today: Message + Transaction only
+    template  TransactionTemplate.render: patch amounts/fee/blockhash + sign
+    patch     render_message only (template minus the ed25519 signature)
+    compile   one-time template build (miss path)
+
+Usage:
+    python benchmarks/bench_tx_templates.py
+    python benchmarks/bench_tx_templates.py --iterations 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+
+from core.client import set_loaded_accounts_data_size_limit
+from core.tx_template import build_buy_template
+from interfaces.core import Platform, TokenInfo
+from platforms import get_platform_implementations
+from trading.jito_sender import JitoSender
+
+CU_LIMIT = 150_000
+DATA_SIZE_LIMIT = 512_000
+
+
+def make_token(platform: Platform) -> TokenInfo:
+    return TokenInfo(
+        name="Bench", symbol="BENCH", uri="", mint=Pubkey.new_unique(), platform=platform,
+        creator=Pubkey.new_unique(), bonding_curve=Pubkey.new_unique(),
+        associated_bonding_curve=Pubkey.new_unique(), pool_state=Pubkey.new_unique(),
+        base_vault=Pubkey.new_unique(), quote_vault=Pubkey.new_unique(),
+    )
+
+
+async def timed(fn, iterations: int) -> float:
+    """Mean microseconds per call (awaits coroutines)."""
+    t0 = time.perf_counter()
+    for i in range(iterations):
+        result = fn(i)
+        if asyncio.iscoroutine(result):
+            await result
+    return (time.perf_counter() - t0) / iterations * 1e6
+
+
+async def bench_platform(platform: Platform, iterations: int) -> dict:
+    impl = get_platform_implementations(platform, SimpleNamespace(rpc_endpoint="http://bench"))
+    builder, provider = impl.instruction_builder, impl.address_provider
+    signer = Keypair()
+    user = signer.pubkey()
+    token = make_token(platform)
+    jito = JitoSender(tip_lamports=10_000, enabled=True)
+    blockhash = Hash.new_unique()
+
+    def fee_ixs(fee: int):
+        return [
+            set_loaded_accounts_data_size_limit(DATA_SIZE_LIMIT),
+            set_compute_unit_limit(CU_LIMIT),
+            set_compute_unit_price(fee),
+        ]
+
+    async def build(i: int):
+        ixs = await builder.build_buy_instruction(token, user, 1_000_000_000 + i, 30_000_000_000, provider)
+        builder.get_required_accounts_for_buy(token, user, provider)
+        ixs = fee_ixs(100_000 + i) + ixs + [jito.create_tip_instruction(user)]
+        return Transaction([signer], Message(ixs, user), blockhash)
+
+    prebuilt = fee_ixs(100_000) + await builder.build_buy_instruction(
+        token, user, 1_000_000_000, 30_000_000_000, provider
+    )
+
+    def retry(i: int):
+        ixs = list(prebuilt) + [jito.create_tip_instruction(user)]
+        return Transaction([signer], Message(ixs, user), blockhash)
+
+    def compile_template(i: int):
+        return build_buy_template(
+            builder, provider, token, user,
+            compute_unit_limit=CU_LIMIT, account_data_size_limit=DATA_SIZE_LIMIT,
+            tip_instruction=jito.create_tip_instruction(user),
+        )
+
+    template = await compile_template(0)
+
+    def render(i: int):
+        return template.render(signer, blockhash, 1_000_000_000 + i, 30_000_000_000, 100_000 + i)
+
+    def patch(i: int):
+        return template.render_message(blockhash, 1_000_000_000 + i, 30_000_000_000, 100_000 + i)
+
+    return {
+        "platform": platform.value,
+        "build": await timed(build, iterations),
+        "retry": await timed(retry, iterations),
+        "template": await timed(render, iterations),
+        "patch": await timed(patch, iterations),
+        "compile": await timed(compile_template, max(1, iterations // 10)),
+        "slots": len(template.slots),
+        "tx_bytes": len(bytes(render(0))),
+    }
+
+
+async def main_async(args) -> None:
+    print(f"iterations={args.iterations} (mean us per signed transaction)")
+    print(f"{'platform':<10} {'build':>9} {'retry':>9} {'template':>9} {'patch':>7} "
+          f"{'compile':>9} {'speedup':>8} {'slots':>6} {'bytes':>6}")
+    for platform in (Platform.PUMP_FUN, Platform.LETS_BONK, Platform.BAGS):
+        r = await bench_platform(platform, args.iterations)
+        print(f"{r['platform']:<10} {r['build']:>9.1f} {r['retry']:>9.1f} {r['template']:>9.1f} "
+              f"{r['patch']:>7.1f} {r['compile']:>9.1f} {r['build'] / r['template']:>7.1f}x "
+              f"{r['slots']:>6} {r['tx_bytes']:>6}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--iterations", type=int, default=2000)
+    args = ap.parse_args()
+    logging.disable(logging.CRITICAL)  # builders/Jito log at INFO
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -983,6 +983,9 @@ def main():
         import time
         import subprocess, json, requests, base58, os
         from solders.keypair import Keypair
+        from pathlib import Path
+        from trading.position_journal import get_journal
+        from trading.purchase_history import add_to_purchase_history, get_purchase_index
 
         try:
             pk = os.environ.get("SOLANA_PRIVATE_KEY")
@@ -1001,17 +1004,9 @@ def main():
                 except json.JSONDecodeError:
                     existing_redis = None
 
-            existing_json = None
-            positions_from_file = []
-            try:
-                with open("/opt/pumpfun-bonkfun-bot/positions.json", "r") as f:
-                    positions_from_file = json.load(f)
-                for p in positions_from_file:
-                    if p.get("mint") == mint_addr:
-                        existing_json = p
-                        break
-            except (FileNotFoundError, json.JSONDecodeError):
-                positions_from_file = []
+            # positions.json is a snapshot + append-only journal shared with the bot
+            positions_journal = get_journal(Path("/opt/pumpfun-bonkfun-bot/positions.json"))
+            existing_json = positions_journal.get(mint_addr)
 
             existing_pos = existing_redis or existing_json
             old_qty = 0
@@ -1166,30 +1161,18 @@ def main():
                     capture_output=True, timeout=5
                 )
 
-                with open("/opt/pumpfun-bonkfun-bot/positions.json", "r") as f:
-                    all_positions = json.load(f)
-                all_positions = [p for p in all_positions if p.get("mint") != mint_addr]
-                all_positions.append(pos)
-                with open("/opt/pumpfun-bonkfun-bot/positions.json", "w") as f:
-                    json.dump(all_positions, f, indent=2)
+                positions_journal.put(mint_addr, pos)
 
-                try:
-                    with open("/opt/pumpfun-bonkfun-bot/data/purchased_tokens_history.json", "r") as f:
-                        history = json.load(f)
-                    if "purchased_tokens" not in history:
-                        history["purchased_tokens"] = {}
-                    history["purchased_tokens"][mint_addr] = {
-                        "symbol": symbol,
-                        "bot_name": "manual_buy",
-                        "platform": pos.get("platform", "jupiter"),
-                        "price": current_price,
-                        "amount": real_balance,
-                        "timestamp": datetime.utcnow().isoformat(),
-                    }
-                    with open("/opt/pumpfun-bonkfun-bot/data/purchased_tokens_history.json", "w") as f:
-                        json.dump(history, f, indent=2)
-                except Exception:
-                    pass
+                # Purchase history index (append-only log shared with the bot)
+                add_to_purchase_history(
+                    mint=mint_addr,
+                    symbol=symbol,
+                    bot_name="manual_buy",
+                    platform=pos.get("platform", "jupiter"),
+                    price=current_price,
+                    amount=real_balance,
+                )
+                get_purchase_index().flush()
 
                 if existing_pos:
                     print(f"\u2705 Синхронизировано: {real_balance:,.2f} (sync: {time.time()-_sync_start:.1f}s)")
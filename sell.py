@@ -53,6 +53,11 @@ try:
     POSITIONS_AVAILABLE = True
 except ImportError:
     POSITIONS_AVAILABLE = False
+from pathlib import Path
+from trading.position_journal import get_journal
+from trading.purchase_history import get_purchase_index, update_purchase_amount
+
+POSITIONS_JSON = Path("/opt/pumpfun-bonkfun-bot/positions.json")
 
 # JITO integration for faster transaction landing
 from src.trading.jito_sender import get_jito_sender
@@ -134,11 +139,7 @@ def sync_position_after_sell(mint_str: str, percent: float):
 
             # positions.json — удалить все записи с этим mint
             try:
-                with open("/opt/pumpfun-bonkfun-bot/positions.json", "r") as f:
-                    positions = json.load(f)
-                positions = [p for p in positions if p.get("mint") != mint_str]
-                with open("/opt/pumpfun-bonkfun-bot/positions.json", "w") as f:
-                    json.dump(positions, f, indent=2)
+                get_journal(POSITIONS_JSON).delete([mint_str])
             except Exception:
                 if POSITIONS_AVAILABLE:
                     remove_position(mint_str)
@@ -213,42 +214,18 @@ def sync_position_after_sell(mint_str: str, percent: float):
     except Exception:
         pass
 
-    # Обновить positions.json (с дедупликацией)
+    # Обновить positions.json (journal: одна запись на mint, дубликатов нет)
     try:
-        with open("/opt/pumpfun-bonkfun-bot/positions.json", "r") as f:
-            positions = json.load(f)
-
-        updated = False
-        seen = set()
-        clean = []
-        for p in positions:
-            m = p.get("mint")
-            if m == mint_str:
-                if m not in seen:
-                    p["quantity"] = real_balance
-                    clean.append(p)
-                    seen.add(m)
-                    updated = True
-                # дубликаты пропускаем
-            else:
-                clean.append(p)
-
-        with open("/opt/pumpfun-bonkfun-bot/positions.json", "w") as f:
-            json.dump(clean, f, indent=2)
+        journal = get_journal(POSITIONS_JSON)
+        journal_pos = journal.get(mint_str)
+        if journal_pos:
+            journal.put(mint_str, {**journal_pos, "quantity": real_balance})
     except Exception:
         pass
 
     # History
-    try:
-        hist_path = "/opt/pumpfun-bonkfun-bot/data/purchased_tokens_history.json"
-        with open(hist_path, "r") as f:
-            history = json.load(f)
-        if mint_str in history.get("purchased_tokens", {}):
-            history["purchased_tokens"][mint_str]["amount"] = real_balance
-            with open(hist_path, "w") as f:
-                json.dump(history, f, indent=2)
-    except Exception:
-        pass
+    if update_purchase_amount(mint_str, real_balance):
+        get_purchase_index().flush()
 
     print(f"\U0001f4ca Баланс: {old_qty:,.2f} -> {real_balance:,.2f} (sync: {time.time()-_sync_start:.1f}s)")
     _restart_bot()
@@ -1222,15 +1199,8 @@ def update_position_after_sell(mint, percent: float):
                     save_positions(positions)
                 
                 # Обновляем history
-                try:
-                    with open("/opt/pumpfun-bonkfun-bot/data/purchased_tokens_history.json", "r") as f:
-                        history = json.load(f)
-                    if mint_str in history.get("purchased_tokens", {}):
-                        history["purchased_tokens"][mint_str]["amount"] = real_balance
-                        with open("/opt/pumpfun-bonkfun-bot/data/purchased_tokens_history.json", "w") as f:
-                            json.dump(history, f, indent=2)
-                except:
-                    pass
+                if update_purchase_amount(mint_str, real_balance):
+                    get_purchase_index().flush()
                 
                 print(f"✅ Баланс: {old_qty:.2f} -> {real_balance:.2f}")
             else:
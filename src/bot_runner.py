@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import os
+import re
 import sys
 
 import multiprocessing
@@ -8,6 +9,7 @@ from datetime import datetime
 from pathlib import Path
 
 import uvloop
+import yaml
 
 asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 # Disable verbose httpx logging
@@ -18,11 +20,16 @@ logging.getLogger("httpcore").setLevel(logging.CRITICAL)
 
 # Suppress httpx verbose output
 import io
+
+_HTTPX_NOISE = re.compile(r"httpx|http request", re.IGNORECASE)
+
+
 class FilteredStream:
     def __init__(self, stream):
         self.stream = stream
     def write(self, msg):
-        if "httpx" not in msg.lower() and "http request" not in msg.lower():
+        # One case-insensitive scan instead of lowercasing every write twice
+        if not _HTTPX_NOISE.search(msg):
             self.stream.write(msg)
     def flush(self):
         self.stream.flush()
@@ -33,11 +40,13 @@ logging.getLogger("httpcore").propagate = False
 
 
 from config_loader import (
+    get_env_file,
     get_platform_from_config,
     load_bot_config,
     print_config_summary,
     validate_platform_listener_combination,
 )
+from core.wallet import Wallet
 #DISABLED: from trading.restore_and_monitor import restore_and_monitor_positions
 from trading.universal_trader import UniversalTrader
 from trading.wallet_sync import sync_wallet
@@ -86,6 +95,19 @@ from utils.logger import setup_file_logging, setup_trace_logging
 
 logger = logging.getLogger(__name__)
 
+# Process-wide services already started in this process (several bots can share one loop)
+_started_services: set[str] = set()
+# Wallets (pubkeys) of the bots sharing this process's event loop
+_process_wallets: set[str] = set()
+
+
+def _first_start(service: str) -> bool:
+    """True only the first time a process-wide service is started."""
+    if service in _started_services:
+        return False
+    _started_services.add(service)
+    return True
+
 
 def setup_logging(bot_name: str):
     """Set up logging to file for a specific bot instance."""
@@ -332,14 +354,15 @@ async def start_bot(config_path: str):
         # Then start listening for new tokens
         logger.warning("[MAIN] Starting new token listener...")
 
-        # === Start Metrics Server ===
-        try:
-            from analytics.metrics_server import start_metrics_server
-            metrics_port = cfg.get("metrics", {}).get("port", 9090)
-            await start_metrics_server(host='0.0.0.0', port=metrics_port)
-            logger.info(f"[METRICS] Server started on port {metrics_port}")
-        except Exception as e:
-            logger.warning(f"[METRICS] Failed to start metrics server: {e}")
+        # === Start Metrics Server (once per process) ===
+        if _first_start("metrics"):
+            try:
+                from analytics.metrics_server import start_metrics_server
+                metrics_port = cfg.get("metrics", {}).get("port", 9090)
+                await start_metrics_server(host='0.0.0.0', port=metrics_port)
+                logger.info(f"[METRICS] Server started on port {metrics_port}")
+            except Exception as e:
+                logger.warning(f"[METRICS] Failed to start metrics server: {e}")
         # === End Metrics Server ===
         
         # === Start AutoSweeper ===
@@ -362,30 +385,40 @@ async def start_bot(config_path: str):
         # === End AutoSweeper ===
         
 
-        # === WALLET SYNC - restore lost positions ===
-        logger.warning("[STARTUP] Running wallet sync...")
-        try:
-            await sync_wallet()
-            logger.warning("[STARTUP] Wallet sync completed")
-        except Exception as e:
-            logger.error(f"[STARTUP] Wallet sync failed: {e}")
-        # === END WALLET SYNC ===
-        
-        # === PERIODIC SYNC ===
-        start_periodic_sync()
-        logger.warning("[STARTUP] Periodic sync scheduled (5 min)")
-        # === PERIODIC DUST CLEANUP ===
-        start_periodic_dust()
-        logger.warning("[STARTUP] Periodic dust scheduled (60 min, first run in 5 min)")
-        
-        # === PERIODIC SOLD_MINTS CLEANUP ===
-        start_periodic_sold_cleanup()
-        start_periodic_purchase_cleanup()
-        logger.warning("[STARTUP] Periodic purchase_history cleanup scheduled (24h)")
-        logger.warning("[STARTUP] Periodic sold_mints cleanup scheduled (24h)")
-        # === DEPLOYER BLACKLIST ===
-        start_deployer_blacklist()
-        logger.warning("[STARTUP] Deployer blacklist scheduled (refresh every 5 min)")
+        # === Per-wallet jobs: wallet/periodic sync (once per distinct wallet) ===
+        # Each one checks and saves only its wallet's positions; untagged legacy
+        # positions are claimed only when the process trades from a single wallet.
+        wallet = str(trader.wallet.pubkey)
+        claim_untagged = len(_process_wallets) <= 1
+        if _first_start(f"wallet_sync:{wallet}"):
+            # === WALLET SYNC - restore lost positions ===
+            logger.warning(f"[STARTUP] Running wallet sync for {wallet[:8]}...")
+            try:
+                await sync_wallet(wallet, claim_untagged)
+                logger.warning("[STARTUP] Wallet sync completed")
+            except Exception as e:
+                logger.error(f"[STARTUP] Wallet sync failed: {e}")
+            # === END WALLET SYNC ===
+
+            # === PERIODIC SYNC ===
+            start_periodic_sync(wallet, claim_untagged)
+            logger.warning("[STARTUP] Periodic sync scheduled (5 min)")
+
+        # === Process-wide background jobs: cleanups, blacklist ===
+        # (once per process, however many bots share the event loop)
+        if _first_start("background_jobs"):
+            # === PERIODIC DUST CLEANUP ===
+            start_periodic_dust()
+            logger.warning("[STARTUP] Periodic dust scheduled (60 min, first run in 5 min)")
+
+            # === PERIODIC SOLD_MINTS CLEANUP ===
+            start_periodic_sold_cleanup()
+            start_periodic_purchase_cleanup()
+            logger.warning("[STARTUP] Periodic purchase_history cleanup scheduled (24h)")
+            logger.warning("[STARTUP] Periodic sold_mints cleanup scheduled (24h)")
+            # === DEPLOYER BLACKLIST ===
+            start_deployer_blacklist()
+            logger.warning("[STARTUP] Deployer blacklist scheduled (refresh every 5 min)")
         # === HELIUS WEBHOOK SYNC (CRITICAL!) ===
         if HELIUS_SYNC_AVAILABLE and cfg.get("whale_copy", {}).get("enabled", False):
             logger.warning("[STARTUP] Syncing Helius webhook...")
@@ -412,10 +445,64 @@ async def start_bot(config_path: str):
         raise
 
 
+def _env_file_of(config_path: str):
+    """env_file a bot configuration would load (without loading it)."""
+    with open(config_path) as f:
+        return get_env_file(yaml.safe_load(f) or {}, config_path)
+
+
 def run_bot_process(config_path):
     asyncio.run(start_bot(config_path))
 
 
+async def run_bots(config_paths: list[str]) -> None:
+    """Run several bots concurrently in one event loop.
+
+    The bots share this process's infrastructure singletons (one SolanaClient
+    per RPC endpoint, blockhash cache, market-data client, confirmation
+    service, account coalescers, fee estimator, batch price service), the
+    positions journal (each bot saves with its own scope) and the
+    process-wide background jobs started by the first bot; wallet and
+    periodic sync run once per distinct wallet. A bot that fails is logged;
+    the others keep running.
+
+    Not shared: each whale-copy bot still opens its own whale-geyser
+    streams (the receiver serves one wallet and one callback), and
+    separate_process workers share nothing with this process.
+
+    Bots share os.environ, so they must all load the same env_file: a bot
+    with a different one is rejected (run it with separate_process: true).
+    """
+    env_file = _env_file_of(config_paths[0]) if config_paths else None
+    accepted = []
+    for path in config_paths:
+        if _env_file_of(path) != env_file:
+            logging.error(
+                f"Bot from {path} loads a different env_file than {config_paths[0]}; "
+                "not starting it in this process (use separate_process: true)"
+            )
+            continue
+        accepted.append(path)
+    config_paths = accepted
+
+    for path in config_paths:
+        try:
+            _process_wallets.add(str(Wallet(load_bot_config(path)["private_key"]).pubkey))
+        except Exception as e:
+            logging.error(f"Could not read wallet of bot from {path}: {e}")
+
+    logging.info(
+        f"Running {len(config_paths)} bots in one event loop "
+        f"({len(_process_wallets)} wallets); whale-geyser streams are opened per bot"
+    )
+    results = await asyncio.gather(
+        *(start_bot(path) for path in config_paths), return_exceptions=True
+    )
+    for path, result in zip(config_paths, results):
+        if isinstance(result, BaseException):
+            logging.error(f"Bot from {path} stopped with error: {result!r}")
+
+
 def run_all_bots():
     """Run all bots defined in YAML files in the 'bots' directory."""
     bot_dir = Path("bots")
@@ -431,6 +518,8 @@ def run_all_bots():
     logging.info(f"Found {len(bot_files)} bot configuration files")
 
     processes = []
+    in_process_bots: list[str] = []
+    in_process_env = None
     skipped_bots = 0
 
     for file in bot_files:
@@ -477,6 +566,15 @@ def run_all_bots():
                 skipped_bots += 1
                 continue
 
+            # Bots in the main process share os.environ: one env_file for all of them
+            env_file = get_env_file(cfg, str(file))
+            if not cfg.get("separate_process", False) and in_process_bots and env_file != in_process_env:
+                logging.warning(
+                    f"Bot '{bot_name}' loads a different env_file than the other "
+                    "main-process bots; starting it in a separate process"
+                )
+                cfg["separate_process"] = True
+
             # Start bot in separate process or main process
             if cfg.get("separate_process", False):
                 logging.info(
@@ -491,7 +589,9 @@ def run_all_bots():
                 logging.info(
                     f"Starting bot '{bot_name}' ({platform.value}) in main process"
                 )
-                asyncio.run(start_bot(str(file)))
+                if not in_process_bots:
+                    in_process_env = env_file
+                in_process_bots.append(str(file))
 
         except Exception as e:
             logging.exception(f"Failed to start bot from {file}: {e}")
@@ -501,6 +601,10 @@ def run_all_bots():
         f"Started {len(bot_files) - skipped_bots} bots, skipped {skipped_bots} disabled/invalid bots"
     )
 
+    # All main-process bots share one event loop (previously the first one blocked the rest)
+    if in_process_bots:
+        asyncio.run(run_bots(in_process_bots))
+
     # Wait for all processes to complete
     for p in processes:
         p.join()
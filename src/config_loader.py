@@ -109,20 +109,24 @@ PLATFORM_LISTENER_COMPATIBILITY = {
 }
 
 
+def get_env_file(config: dict, path: str) -> Path | None:
+    """Resolved env_file a bot configuration loads (None if it has none)."""
+    env_file = config.get("env_file")
+    if not env_file:
+        return None
+    env_path = Path(path).parent / env_file
+    return (env_path if env_path.exists() else Path(env_file)).resolve()
+
+
 def load_bot_config(path: str) -> dict:
     """Load and validate a bot configuration from a YAML file."""
     config_path = Path(path)
     with config_path.open() as f:
         config = yaml.safe_load(f)
 
-    env_file = config.get("env_file")
+    env_file = get_env_file(config, path)
     if env_file:
-        config_path = Path(path)
-        env_path = config_path.parent / env_file
-        if env_path.exists():
-            load_dotenv(env_path, override=True)
-        else:
-            load_dotenv(env_file, override=True)
+        load_dotenv(env_file, override=True)
 
     resolve_env_vars(config)
 
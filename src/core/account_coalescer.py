@@ -0,0 +1,135 @@
+"""
+Account read coalescer: single-account reads batched into getMultipleAccounts.
+
+Curve managers, the fallback seller, the decimals resolver and the token
+vetter read one account at a time, and a burst of signals turns into a
+burst of getAccountInfo round trips (and 429s). Reads issued within
+ACCOUNT_BATCH_WINDOW_MS (default 1.5ms) of each other are sent as one
+getMultipleAccounts call (100 keys per call, the RPC limit; a full batch
+is sent at once). A key already queued or in flight is not requested
+again: later callers await the same result.
+
+    account = await get_account_coalescer(async_client).get(pubkey)  # Account | None
+
+Waiters are shielded, so a caller's own timeout (asyncio.wait_for) does
+not cancel the batch for everyone else.
+"""
+
+import asyncio
+import os
+import weakref
+from typing import Any, Awaitable, Callable, Hashable, Optional, Sequence
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAX_ACCOUNTS_PER_CALL = 100
+ACCOUNT_BATCH_WINDOW = float(os.getenv("ACCOUNT_BATCH_WINDOW_MS", "1.5")) / 1000
+
+
+class AccountCoalescer:
+    """Batches concurrent single-key reads through a fetch_many(keys) -> values coroutine."""
+
+    def __init__(
+        self,
+        fetch_many: Callable[[list], Awaitable[Sequence[Any]]],
+        window: float = ACCOUNT_BATCH_WINDOW,
+        max_batch: int = MAX_ACCOUNTS_PER_CALL,
+        name: str = "rpc",
+    ):
+        self._fetch_many = fetch_many
+        self.window = window
+        self.max_batch = max_batch
+        self.name = name
+        self._queued: dict[Hashable, asyncio.Future] = {}
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._stats = {"reads": 0, "deduped": 0, "batches": 0, "keys_fetched": 0, "errors": 0}
+
+    async def get(self, key: Hashable) -> Any:
+        """Value for key (None if the account does not exist).
+
+        Raises:
+            Exception: Whatever the batch fetch raised, for every waiter of that batch.
+        """
+        self._stats["reads"] += 1
+        future = self._inflight.get(key) or self._queued.get(key)
+        if future is not None:
+            self._stats["deduped"] += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = self._queued[key] = loop.create_future()
+            if len(self._queued) >= self.max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        return await asyncio.shield(future)
+
+    async def get_many(self, keys: Sequence[Hashable]) -> list[Any]:
+        """Values for keys in order; chunked and deduped like single reads."""
+        return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._queued:
+            return
+        batch, self._queued = self._queued, {}
+        self._inflight.update(batch)
+        keys = list(batch)
+        for i in range(0, len(keys), self.max_batch):
+            chunk = keys[i:i + self.max_batch]
+            asyncio.create_task(self._fetch(chunk, [batch[k] for k in chunk]))
+
+    async def _fetch(self, keys: list, futures: list[asyncio.Future]) -> None:
+        self._stats["batches"] += 1
+        self._stats["keys_fetched"] += len(keys)
+        try:
+            values = list(await self._fetch_many(keys))
+            if len(values) != len(keys):
+                raise ValueError(f"getMultipleAccounts returned {len(values)} values for {len(keys)} keys")
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.debug(f"[ACCOUNTS] {self.name} batch of {len(keys)} failed: {e}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future, value in zip(futures, values):
+                if not future.done():
+                    future.set_result(value)
+        finally:
+            for key in keys:
+                self._inflight.pop(key, None)
+
+    def get_stats(self) -> dict:
+        batches = self._stats["batches"]
+        return {
+            **self._stats,
+            "avg_batch": round(self._stats["keys_fetched"] / batches, 1) if batches else 0.0,
+            "round_trips_saved": self._stats["reads"] - batches,
+        }
+
+
+_coalescers: "weakref.WeakKeyDictionary[Any, AccountCoalescer]" = weakref.WeakKeyDictionary()
+
+
+def get_account_coalescer(client) -> AccountCoalescer:
+    """Coalescer bound to a solana-py AsyncClient (values: solders Account | None)."""
+    coalescer = _coalescers.get(client)
+    if coalescer is None:
+        client_ref = weakref.ref(client)  # the coalescer must not keep its client alive
+
+        async def fetch_many(pubkeys: list) -> list:
+            response = await client_ref().get_multiple_accounts(pubkeys, encoding="base64")
+            return response.value
+
+        endpoint = getattr(getattr(client, "_provider", None), "endpoint_uri", "rpc")
+        coalescer = _coalescers[client] = AccountCoalescer(fetch_many, name=str(endpoint)[:40])
+    return coalescer
+
+
+def get_account_coalescer_stats() -> dict:
+    return {c.name: c.get_stats() for c in list(_coalescers.values())}
@@ -22,20 +22,16 @@ from solders.transaction import Transaction
 from solders.signature import Signature
 
 from utils.logger import get_logger
+from core.account_coalescer import get_account_coalescer
 from core.blockhash_cache import get_blockhash_cache
 from trading.jito_sender import get_jito_sender
 
 logger = get_logger(__name__)
 
-# Redis cache for RPC
-try:
-    from core.redis_cache import cache_get, cache_set
-    REDIS_AVAILABLE = True
+# Redis cache for RPC (async pooled facade - never blocks the event loop)
+from core.redis_pool import REDIS_AVAILABLE, get_async_redis
+if REDIS_AVAILABLE:
     logger.info("[RPC] Redis cache enabled")
-except ImportError:
-    REDIS_AVAILABLE = False
-    cache_get = lambda k: None
-    cache_set = lambda k, v, t=60: False
 
 # =============================================================================
 # GLOBAL RPC CACHE - reduces QuickNode/Helius API calls
@@ -53,30 +49,29 @@ CACHE_TTL = {
     "balance": 5,            # 5 sec
 }
 
-def _cache_get(key: str):
-    """Get from cache (Redis first, then local)."""
-    # Try Redis first
-    if REDIS_AVAILABLE:
-        cached = cache_get(f"rpc:{key}")
-        if cached is not None:
-            _cache_stats["hits"] += 1
-            return cached
-
-    # Fall back to local cache
+async def _cache_get(key: str):
+    """Get from cache (local first, then shared Redis)."""
     if key in _rpc_cache:
         value, expiry = _rpc_cache[key]
         if _time.time() < expiry:
             _cache_stats["hits"] += 1
             return value
         del _rpc_cache[key]
+
+    # Another bot may have fetched it already
+    if REDIS_AVAILABLE:
+        cached = await get_async_redis().get_json(f"rpc:{key}", caller="client_cache")
+        if cached is not None:
+            _cache_stats["hits"] += 1
+            return cached
     _cache_stats["misses"] += 1
     return None
 
 def _cache_set(key: str, value, ttl: int):
     """Set cache with TTL (Redis + local)."""
-    # Save to Redis for cross-bot sharing
+    # Save to Redis for cross-bot sharing (queued, pipelined)
     if REDIS_AVAILABLE:
-        cache_set(f"rpc:{key}", value, ttl)
+        get_async_redis().set_json_nowait(f"rpc:{key}", value, ttl, caller="client_cache")
 
     # Also save locally for speed
     if len(_rpc_cache) > 5000:
@@ -164,7 +159,7 @@ class SolanaClient:
 
     async def get_health(self) -> str | None:
         cache_key = "health"
-        cached = _cache_get(cache_key)
+        cached = await _cache_get(cache_key)
         if cached is not None:
             return cached  # Return cached value as-is
 
@@ -192,30 +187,29 @@ class SolanaClient:
             ValueError: If account doesn't exist or has no data
         """
         cache_key = f"acc:{str(pubkey)}"
-        cached = _cache_get(cache_key)
+        cached = await _cache_get(cache_key)
         if cached is not None:
             if isinstance(cached, int):
                 return cached
             return Account.from_json(cached)
 
-        client = await self.get_client()
-        response = await client.get_account_info(
-            pubkey, encoding="base64"
-        )  # base64 encoding for account data by default
-        if not response.value:
+        # Coalesced with concurrent reads into one getMultipleAccounts (base64)
+        account = await get_account_coalescer(await self.get_client()).get(pubkey)
+        if not account:
             raise ValueError(f"Account {pubkey} not found")
 
-        _cache_set(cache_key, response.value.to_json(), CACHE_TTL["account_info"])
-        return response.value
+        _cache_set(cache_key, account.to_json(), CACHE_TTL["account_info"])
+        return account
 
     async def get_multiple_accounts(self, pubkeys: list[Pubkey]) -> list[dict[str, Any] | None]:
         """Get multiple accounts in a single RPC call (batch).
 
         Much more efficient than calling get_account_info multiple times.
-        Solana supports up to 100 accounts per call.
+        Keys are split into 100-account calls (the Solana limit) and
+        coalesced with concurrent get_account_info reads.
 
         Args:
-            pubkeys: List of public keys (max 100)
+            pubkeys: List of public keys
 
         Returns:
             List of account info dicts (None for accounts that don't exist)
@@ -223,19 +217,8 @@ class SolanaClient:
         if not pubkeys:
             return []
 
-        # Solana limit is 100 accounts per call
-        if len(pubkeys) > 100:
-            logger.warning(f"get_multiple_accounts: truncating {len(pubkeys)} to 100")
-            pubkeys = pubkeys[:100]
-
         client = await self.get_client()
-        response = await client.get_multiple_accounts(pubkeys, encoding="base64")
-
-        results = []
-        for account in response.value:
-            results.append(account if account else None)
-
-        return results
+        return await get_account_coalescer(client).get_many(pubkeys)
 
     async def get_token_account_balance(
         self, 
@@ -256,7 +239,7 @@ class SolanaClient:
         cache_key = f"bal:{str(token_account)}"
         
         if not skip_cache:
-            cached = _cache_get(cache_key)
+            cached = await _cache_get(cache_key)
             # FIX: cached value is int, not JSON
             if cached is not None and isinstance(cached, int):
                 return cached
@@ -318,8 +301,6 @@ class SolanaClient:
             ValueError: If insufficient funds detected
             RuntimeError: If all retry attempts fail
         """
-        client = await self.get_client()
-
         logger.info(
             f"Priority fee in microlamports: {priority_fee if priority_fee else 0}"
         )
@@ -348,6 +329,73 @@ class SolanaClient:
 
             instructions = fee_instructions + instructions
 
+        def make_transaction(recent_blockhash: Hash) -> Transaction:
+            # Add JITO tip instruction if JITO is enabled
+            jito = get_jito_sender()
+            tx_instructions = list(instructions)  # copy
+            if jito.enabled and use_jito:
+                tip_ix = jito.create_tip_instruction(signer_keypair.pubkey())
+                tx_instructions.append(tip_ix)
+                logger.debug(f"[JITO] Added tip: {jito.tip_lamports} lamports")
+
+            message = Message(tx_instructions, signer_keypair.pubkey())
+            return Transaction([signer_keypair], message, recent_blockhash)
+
+        return await self._send_with_retries(
+            make_transaction, skip_preflight, max_retries, use_jito
+        )
+
+    async def send_templated_transaction(
+        self,
+        template,
+        signer_keypair: Keypair,
+        amount_in: int,
+        minimum_amount_out: int,
+        priority_fee: int | None = None,
+        skip_preflight: bool = False,
+        max_retries: int = 5,
+    ) -> str:
+        """
+        Send a pre-compiled TransactionTemplate (see core.tx_template).
+
+        Each attempt patches the blockhash, amounts and priority fee into the
+        template and signs it - no instruction or message rebuild. Error
+        handling and retries are the same as build_and_send_transaction.
+
+        Returns:
+            Transaction signature.
+        """
+        logger.info(
+            f"Priority fee in microlamports: {priority_fee if priority_fee else 0}"
+        )
+
+        def make_transaction(recent_blockhash: Hash) -> Transaction:
+            return template.render(
+                signer_keypair,
+                recent_blockhash,
+                amount_in,
+                minimum_amount_out,
+                priority_fee or 0,
+            )
+
+        return await self._send_with_retries(
+            make_transaction, skip_preflight, max_retries, template.has_tip
+        )
+
+    async def _send_with_retries(
+        self,
+        make_transaction,
+        skip_preflight: bool,
+        max_retries: int,
+        use_jito: bool,
+    ) -> str:
+        """Send make_transaction(blockhash) with a fresh blockhash per attempt.
+
+        Raises:
+            ValueError: If insufficient funds detected
+            RuntimeError: If all retry attempts fail
+        """
+        client = await self.get_client()
         last_error = None
 
         for attempt in range(max_retries):
@@ -359,16 +407,8 @@ class SolanaClient:
                     # Fallback to direct fetch if cache not ready
                     recent_blockhash = await self.get_latest_blockhash()
 
-                # Add JITO tip instruction if JITO is enabled
                 jito = get_jito_sender()
-                tx_instructions = list(instructions)  # copy
-                if jito.enabled and use_jito:
-                    tip_ix = jito.create_tip_instruction(signer_keypair.pubkey())
-                    tx_instructions.append(tip_ix)
-                    logger.debug(f"[JITO] Added tip: {jito.tip_lamports} lamports")
-
-                message = Message(tx_instructions, signer_keypair.pubkey())
-                transaction = Transaction([signer_keypair], message, recent_blockhash)
+                transaction = make_transaction(recent_blockhash)
 
                 tx_opts = TxOpts(
                     skip_preflight=skip_preflight, preflight_commitment=Processed
@@ -589,8 +629,9 @@ class SolanaClient:
     ) -> bool:
         """Wait for transaction confirmation with timeout.
 
-        IMPROVED: If timeout occurs, check transaction status directly.
-        Transactions may be confirmed even if wait times out.
+        Waits on the shared ConfirmationService (one batched status poll for
+        all pending signatures). IMPROVED: If timeout occurs, check the
+        transaction directly - it may have landed outside the status cache.
 
         Args:
             signature: Transaction signature
@@ -600,32 +641,26 @@ class SolanaClient:
         Returns:
             Whether transaction was confirmed
         """
-        client = await self.get_client()
-        sig_obj = Signature.from_string(signature) if isinstance(signature, str) else signature
+        from core.confirmation_service import get_confirmation_service
 
+        signature = str(signature)
         try:
             logger.info(f"Waiting for confirmation (timeout: {timeout}s)...")
-            await asyncio.wait_for(
-                client.confirm_transaction(sig_obj, commitment=commitment, sleep_seconds=0.5),
-                timeout=timeout,
+            outcome = await get_confirmation_service(self.rpc_endpoint).wait(
+                signature, commitment=commitment, timeout=timeout
             )
-            return True
-        except TimeoutError:
+            if outcome.landed:
+                if outcome.err is not None:
+                    logger.error(f"Transaction failed with error: {outcome.err}")
+                    return False
+                return True
+
             logger.warning(f"Confirmation wait timed out after {timeout}s, checking status directly...")
-            # Don't give up! Check if transaction actually succeeded
+            # Don't give up! Status cache may have missed it - check transaction directly
             try:
-                status = await client.get_signature_statuses([sig_obj])
-                if status.value and status.value[0]:
-                    stat = status.value[0]
-                    if stat.err is None:
-                        logger.info(f"Transaction {signature[:20]}... confirmed despite timeout!")
-                        return True
-                    else:
-                        logger.error(f"Transaction failed with error: {stat.err}")
-                        return False
-                # Status not found yet - check transaction directly
+                client = await self.get_client()
                 tx_resp = await client.get_transaction(
-                    sig_obj,
+                    Signature.from_string(signature),
                     encoding="jsonParsed",
                     max_supported_transaction_version=0
                 )
@@ -839,3 +874,30 @@ class SolanaClient:
         except Exception as e:
             logger.warning(f"Failed to check transaction status: {e}")
             return False, str(e)
+
+
+# One SolanaClient per RPC endpoint for bots sharing this process (bot_runner.run_bots):
+# one AsyncClient connection pool and one account coalescer instead of one per bot
+_shared_clients: dict[str, SolanaClient] = {}
+_shared_refs: dict[str, int] = {}
+
+
+def acquire_solana_client(rpc_endpoint: str) -> SolanaClient:
+    """Get the process-wide SolanaClient for an endpoint. Pair with release_solana_client()."""
+    client = _shared_clients.get(rpc_endpoint)
+    if client is None:
+        client = _shared_clients[rpc_endpoint] = SolanaClient(rpc_endpoint)
+    _shared_refs[rpc_endpoint] = _shared_refs.get(rpc_endpoint, 0) + 1
+    return client
+
+
+async def release_solana_client(client: SolanaClient) -> None:
+    """Drop one reference; the last owner closes the connection."""
+    endpoint = client.rpc_endpoint
+    if _shared_clients.get(endpoint) is not client:
+        await client.close()
+        return
+    _shared_refs[endpoint] -= 1
+    if _shared_refs[endpoint] <= 0:
+        del _shared_clients[endpoint], _shared_refs[endpoint]
+        await client.close()
@@ -0,0 +1,257 @@
+"""
+Confirmation service: one batched status poll for every in-flight signature.
+
+Callers register a signature and await a future instead of each running
+their own getSignatureStatuses loop. A single ticker sends one
+getSignatureStatuses per CONFIRM_TICK seconds covering all pending
+signatures (chunks of 256, the RPC limit), so N concurrent sells cost one
+request per tick instead of N.
+
+The geyser stream (PROCESSED commitment, own-wallet transactions pass the
+pre-filter) reports our landed transactions before the first poll could:
+``observe_signature`` resolves on-chain failures and "processed" waiters
+immediately; "confirmed"/"finalized" waiters keep polling.
+
+    outcome = await get_confirmation_service(rpc_url).wait(sig, "confirmed", timeout=15)
+    if outcome.success: ...
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import aiohttp
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+COMMITMENT_RANK = {"processed": 0, "confirmed": 1, "finalized": 2}
+MAX_SIGNATURES_PER_CALL = 256
+
+
+@dataclass
+class SignatureOutcome:
+    """Final state of one signature as seen by the confirmation service."""
+
+    signature: str
+    landed: bool
+    err: Optional[str] = None
+    slot: Optional[int] = None
+    commitment: Optional[str] = None  # "processed" / "confirmed" / "finalized"
+    source: Optional[str] = None  # "rpc" / "geyser"
+    latency_ms: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.landed and self.err is None
+
+    @property
+    def error(self) -> Optional[str]:
+        if self.err is not None:
+            return f"TX failed: {self.err}"
+        if not self.landed:
+            return f"Confirmation timeout after {self.latency_ms / 1000:.1f}s"
+        return None
+
+
+@dataclass
+class _Pending:
+    registered_at: float
+    waiters: list[tuple[int, asyncio.Future]] = field(default_factory=list)
+
+
+class ConfirmationService:
+    """Multiplexes signature confirmation over one polling loop."""
+
+    def __init__(self, endpoints: list[str] | None = None, interval: float = 0.4, request_timeout: float = 5.0):
+        self.endpoints: list[str] = []
+        for url in endpoints or []:
+            self.add_endpoint(url)
+        self.interval = interval
+        self.request_timeout = request_timeout
+        self._pending: dict[str, _Pending] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ticker: Optional[asyncio.Task] = None
+        self._endpoint_index = 0
+        self._stats = {
+            "registered": 0,
+            "resolved_rpc": 0,
+            "resolved_geyser": 0,
+            "timeouts": 0,
+            "rpc_calls": 0,
+            "rpc_errors": 0,
+        }
+
+    def add_endpoint(self, url: str) -> None:
+        if url and url not in self.endpoints:
+            self.endpoints.append(url)
+
+    # --- Registration -------------------------------------------------------
+
+    def watch(self, signature: str, commitment: str = "confirmed") -> asyncio.Future:
+        """Future resolved with a SignatureOutcome once signature reaches commitment or fails."""
+        future = asyncio.get_running_loop().create_future()
+        entry = self._pending.get(signature)
+        if entry is None:
+            entry = self._pending[signature] = _Pending(time.monotonic())
+        entry.waiters.append((COMMITMENT_RANK.get(commitment, 1), future))
+        self._stats["registered"] += 1
+        if self._ticker is None or self._ticker.done():
+            self._ticker = asyncio.create_task(self._tick_loop())
+        return future
+
+    async def wait(self, signature: str, commitment: str = "confirmed", timeout: float = 30.0) -> SignatureOutcome:
+        """Await confirmation of signature; returns landed=False on timeout."""
+        signature = str(signature)
+        future = self.watch(signature, commitment)
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except (asyncio.TimeoutError, TimeoutError):
+            self._stats["timeouts"] += 1
+            return SignatureOutcome(signature, landed=False, latency_ms=timeout * 1000)
+        finally:
+            self._discard(signature, future)
+
+    def _discard(self, signature: str, future: asyncio.Future) -> None:
+        entry = self._pending.get(signature)
+        if entry is None:
+            return
+        entry.waiters = [(rank, f) for rank, f in entry.waiters if f is not future and not f.done()]
+        if not entry.waiters:
+            del self._pending[signature]
+
+    # --- Resolution ---------------------------------------------------------
+
+    def _resolve(
+        self, signature: str, err, slot: Optional[int], commitment: Optional[str], source: str
+    ) -> int:
+        """Resolve waiters satisfied by this status. Returns how many were resolved."""
+        entry = self._pending.get(signature)
+        if entry is None:
+            return 0
+        rank = COMMITMENT_RANK.get(commitment or "", -1)
+        outcome = SignatureOutcome(
+            signature,
+            landed=True,
+            err=str(err) if err is not None else None,
+            slot=slot,
+            commitment=commitment,
+            source=source,
+            latency_ms=(time.monotonic() - entry.registered_at) * 1000,
+        )
+        remaining, resolved = [], 0
+        for wanted, future in entry.waiters:
+            if future.done():
+                continue
+            # An on-chain error is final at any commitment
+            if err is not None or rank >= wanted:
+                future.set_result(outcome)
+                resolved += 1
+            else:
+                remaining.append((wanted, future))
+        if remaining:
+            entry.waiters = remaining
+        else:
+            del self._pending[signature]
+        if resolved:
+            self._stats[f"resolved_{source}"] += resolved
+        return resolved
+
+    def observe(self, signature: str, err=None, slot: Optional[int] = None, commitment: str = "processed") -> int:
+        """Status pushed by a stream (geyser). No-op for signatures nobody waits on."""
+        if signature not in self._pending:
+            return 0
+        return self._resolve(signature, err, slot, commitment, "geyser")
+
+    # --- Polling ------------------------------------------------------------
+
+    async def _tick_loop(self) -> None:
+        try:
+            while self._pending:
+                await asyncio.sleep(self.interval)
+                if not self._pending:
+                    break
+                if not self.endpoints:
+                    logger.warning("[CONFIRM] No RPC endpoint configured, cannot poll signature statuses")
+                    continue
+                signatures = list(self._pending)
+                chunks = [
+                    signatures[i:i + MAX_SIGNATURES_PER_CALL]
+                    for i in range(0, len(signatures), MAX_SIGNATURES_PER_CALL)
+                ]
+                await asyncio.gather(*(self._poll(chunk) for chunk in chunks))
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"[CONFIRM] Ticker error: {e}")
+        finally:
+            self._ticker = None
+
+    async def _poll(self, signatures: list[str]) -> None:
+        endpoint = self.endpoints[self._endpoint_index % len(self.endpoints)]
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getSignatureStatuses",
+            "params": [signatures, {"searchTransactionHistory": False}],
+        }
+        self._stats["rpc_calls"] += 1
+        try:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.request_timeout))
+            async with self._session.post(endpoint, json=payload) as resp:
+                data = await resp.json(content_type=None)
+            statuses = data["result"]["value"]
+        except Exception as e:
+            # Move to the next endpoint for the following tick
+            self._stats["rpc_errors"] += 1
+            self._endpoint_index += 1
+            logger.debug(f"[CONFIRM] getSignatureStatuses via {endpoint[:40]} failed: {e}")
+            return
+
+        for signature, status in zip(signatures, statuses):
+            if status is None:
+                continue
+            self._resolve(
+                signature, status.get("err"), status.get("slot"), status.get("confirmationStatus"), "rpc"
+            )
+
+    async def close(self) -> None:
+        if self._ticker:
+            self._ticker.cancel()
+        for entry in self._pending.values():
+            for _, future in entry.waiters:
+                future.cancel()
+        self._pending.clear()
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def get_stats(self) -> dict:
+        return {**self._stats, "pending": len(self._pending), "endpoints": len(self.endpoints)}
+
+
+_service: Optional[ConfirmationService] = None
+
+
+def get_confirmation_service(rpc_url: str | None = None) -> ConfirmationService:
+    """Process-wide confirmation service; rpc_url is added as a polling endpoint."""
+    global _service
+    if _service is None:
+        env_url = os.getenv("CHAINSTACK_RPC_ENDPOINT") or os.getenv("SOLANA_NODE_RPC_ENDPOINT")
+        _service = ConfirmationService(
+            [url for url in (rpc_url, env_url) if url],
+            interval=float(os.getenv("CONFIRM_TICK", "0.4")),
+        )
+    elif rpc_url:
+        _service.add_endpoint(rpc_url)
+    return _service
+
+
+def observe_signature(signature: str, err=None, slot: Optional[int] = None) -> None:
+    """Geyser hook: feed a landed transaction to the service if it exists."""
+    if _service is not None and _service._pending:
+        _service.observe(signature, err, slot)
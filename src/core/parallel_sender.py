@@ -16,6 +16,7 @@ from enum import Enum
 
 import aiohttp
 
+from core.confirmation_service import get_confirmation_service
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -203,130 +204,40 @@ class ParallelTransactionSender:
         target_commitment: str = "confirmed"
     ) -> ConfirmResult:
         """
-        Подтверждает транзакцию, опрашивая все RPC параллельно.
+        Подтверждает транзакцию через общий ConfirmationService
+        (один батч getSignatureStatuses на все ожидающие подписи,
+        ранний резолв из geyser-стрима).
         """
         if not self._initialized:
             await self.initialize()
 
-        confirmed_event = asyncio.Event()
-        result_holder = {"result": None}
-
-        async def poll_endpoint(endpoint: str) -> None:
-            start_time = time.time()
-            poll_count = 0
-
-            while not confirmed_event.is_set():
-                if (time.time() - start_time) > timeout:
-                    return
-
-                poll_count += 1
-
-                try:
-                    payload = {
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "getSignatureStatuses",
-                        "params": [[signature], {"searchTransactionHistory": False}]
-                    }
-
-                    async with self._session.post(
-                        endpoint,
-                        json=payload,
-                        headers={"Content-Type": "application/json"},
-                        timeout=aiohttp.ClientTimeout(total=5)
-                    ) as resp:
-                        data = await resp.json()
-
-                        if "result" not in data:
-                            continue
-
-                        value = data["result"].get("value", [])
-                        if not value or value[0] is None:
-                            # Транзакция ещё не найдена - продолжаем опрос
-                            await asyncio.sleep(0.3)
-                            continue
-
-                        status = value[0]
-
-                        # Проверяем на ошибку транзакции
-                        if status.get("err"):
-                            result_holder["result"] = ConfirmResult(
-                                success=False,
-                                status=ConfirmationStatus.FAILED,
-                                error=str(status["err"]),
-                                confirmed_by=endpoint
-                            )
-                            confirmed_event.set()
-                            return
-
-                        confirmation_status = status.get("confirmationStatus", "")
-                        slot = status.get("slot")
-                        confirmations = status.get("confirmations")
-
-                        # Finalized - всегда успех
-                        if confirmation_status == "finalized":
-                            result_holder["result"] = ConfirmResult(
-                                success=True,
-                                status=ConfirmationStatus.FINALIZED,
-                                slot=slot,
-                                confirmations=confirmations,
-                                confirmed_by=endpoint
-                            )
-                            confirmed_event.set()
-                            return
-
-                        # Confirmed
-                        if confirmation_status == "confirmed":
-                            if target_commitment in ["confirmed", "processed"]:
-                                result_holder["result"] = ConfirmResult(
-                                    success=True,
-                                    status=ConfirmationStatus.CONFIRMED,
-                                    slot=slot,
-                                    confirmations=confirmations,
-                                    confirmed_by=endpoint
-                                )
-                                confirmed_event.set()
-                                return
-
-                        # Processed
-                        if confirmation_status == "processed":
-                            if target_commitment == "processed":
-                                result_holder["result"] = ConfirmResult(
-                                    success=True,
-                                    status=ConfirmationStatus.PROCESSED,
-                                    slot=slot,
-                                    confirmed_by=endpoint
-                                )
-                                confirmed_event.set()
-                                return
-
-                except asyncio.CancelledError:
-                    return
-                except asyncio.TimeoutError:
-                    pass
-                except Exception as e:
-                    logger.debug(f"[ParallelSender] Poll error: {e}")
-
-                await asyncio.sleep(0.5)
-
-        tasks = [asyncio.create_task(poll_endpoint(ep)) for ep in self._endpoints]
+        service = get_confirmation_service()
+        for endpoint in self._endpoints:
+            service.add_endpoint(endpoint)
 
-        try:
-            await asyncio.wait_for(confirmed_event.wait(), timeout=timeout)
-        except asyncio.TimeoutError:
-            pass
-        finally:
-            for task in tasks:
-                task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
+        outcome = await service.wait(signature, commitment=target_commitment, timeout=timeout)
+
+        if not outcome.landed:
+            return ConfirmResult(
+                success=False,
+                status=ConfirmationStatus.EXPIRED,
+                error=f"Timeout after {timeout}s"
+            )
 
-        if result_holder["result"]:
-            return result_holder["result"]
+        if outcome.err is not None:
+            return ConfirmResult(
+                success=False,
+                status=ConfirmationStatus.FAILED,
+                slot=outcome.slot,
+                error=outcome.err,
+                confirmed_by=outcome.source
+            )
 
         return ConfirmResult(
-            success=False,
-            status=ConfirmationStatus.EXPIRED,
-            error=f"Timeout after {timeout}s"
+            success=True,
+            status=ConfirmationStatus(outcome.commitment),
+            slot=outcome.slot,
+            confirmed_by=outcome.source
         )
 
     async def send_and_confirm(
@@ -0,0 +1,80 @@
+"""
+Memoized PDA and ATA derivation shared by all address providers and parsers.
+
+``Pubkey.find_program_address`` is a bump-seed search (SHA-256 + off-curve
+check per bump, ~15us); bonding curves, vaults, creator vaults, volume
+accumulators and ATAs are derived again for every instruction build and
+every parsed event. Results are pure functions of (program, seeds), so they
+sit behind bounded LRUs (functools.lru_cache: C implementation, thread-safe).
+
+Sizes: PDA_CACHE_SIZE / ATA_CACHE_SIZE env (default 65536 / 32768 entries,
+~200 bytes each).
+"""
+
+import os
+from functools import lru_cache
+from typing import Sequence
+
+from solders.pubkey import Pubkey
+
+from core.pubkeys import ASSOCIATED_TOKEN_PROGRAM, TOKEN_2022_PROGRAM, TOKEN_PROGRAM
+
+PDA_CACHE_SIZE = int(os.getenv("PDA_CACHE_SIZE", "65536"))
+ATA_CACHE_SIZE = int(os.getenv("ATA_CACHE_SIZE", "32768"))
+
+
+@lru_cache(maxsize=PDA_CACHE_SIZE)
+def _find_program_address(seeds: tuple[bytes, ...], program_id: Pubkey) -> tuple[Pubkey, int]:
+    return Pubkey.find_program_address(list(seeds), program_id)
+
+
+@lru_cache(maxsize=ATA_CACHE_SIZE)
+def _associated_token_address(owner: Pubkey, mint: Pubkey, token_program_id: Pubkey) -> Pubkey:
+    address, _ = Pubkey.find_program_address(
+        [bytes(owner), bytes(token_program_id), bytes(mint)], ASSOCIATED_TOKEN_PROGRAM
+    )
+    return address
+
+
+def find_program_address(seeds: Sequence[bytes], program_id: Pubkey) -> tuple[Pubkey, int]:
+    """Drop-in for ``Pubkey.find_program_address`` (memoized).
+
+    Returns:
+        (address, bump)
+    """
+    return _find_program_address(tuple(seeds), program_id)
+
+
+def get_associated_token_address(
+    owner: Pubkey, mint: Pubkey, token_program_id: Pubkey = TOKEN_PROGRAM
+) -> Pubkey:
+    """Drop-in for ``spl.token.instructions.get_associated_token_address`` (memoized).
+
+    Raises:
+        ValueError: If token_program_id is not Token or Token-2022.
+    """
+    if token_program_id != TOKEN_PROGRAM and token_program_id != TOKEN_2022_PROGRAM:
+        raise ValueError("token_program_id must be one of TOKEN_PROGRAM_ID or TOKEN_2022_PROGRAM_ID.")
+    return _associated_token_address(owner, mint, token_program_id)
+
+
+def _info(cached) -> dict:
+    info = cached.cache_info()
+    total = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hit_rate": f"{(info.hits / total * 100) if total else 0:.1f}%",
+    }
+
+
+def get_pda_cache_stats() -> dict:
+    """Hit/miss counters for the PDA and ATA memo caches."""
+    return {"pda": _info(_find_program_address), "ata": _info(_associated_token_address)}
+
+
+def clear_pda_cache() -> None:
+    _find_program_address.cache_clear()
+    _associated_token_address.cache_clear()
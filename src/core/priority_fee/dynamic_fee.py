@@ -37,6 +37,7 @@ class DynamicPriorityFee(PriorityFeePlugin):
     MAX_FEE = 10_000_000       # Максимум 10M микролампортов
     FALLBACK_FEE = 500_000     # Запасное значение при ошибке
     CACHE_TTL = 2.0            # Время жизни кэша в секундах
+    RPC_ANCHOR_TTL = 30.0      # Как часто обновлять RPC-потолок для потоковой оценки
 
     # Множители для стратегий
     STRATEGY_MULTIPLIERS = {
@@ -60,6 +61,7 @@ class DynamicPriorityFee(PriorityFeePlugin):
         max_fee: int = None,
         fallback_fee: int = None,
         use_default_accounts: bool = True,
+        estimator=None,
     ):
         """
         Initialize the dynamic fee plugin.
@@ -71,6 +73,9 @@ class DynamicPriorityFee(PriorityFeePlugin):
             max_fee: Maximum fee in microlamports.
             fallback_fee: Fallback fee when RPC fails.
             use_default_accounts: Use DEX program accounts for relevant fees.
+            estimator: StreamingFeeEstimator fed by the Geyser stream. Its quote
+                is used while warm, capped by the RPC quote (re-fetched every
+                RPC_ANCHOR_TTL); the RPC fetch is also the cold-start fallback.
         """
         self.client = client
         self.strategy = strategy
@@ -78,9 +83,13 @@ class DynamicPriorityFee(PriorityFeePlugin):
         self.max_fee = max_fee or self.MAX_FEE
         self.fallback_fee = fallback_fee or self.FALLBACK_FEE
         self.use_default_accounts = use_default_accounts
+        self.estimator = estimator
 
         # Кэш: (timestamp, fee_value)
         self._cache: Optional[Tuple[float, int]] = None
+        # Последняя RPC-оценка — потолок для потоковой: (timestamp, fee_value)
+        self._anchor: Optional[Tuple[float, int]] = None
+        self._anchor_checked = 0.0
 
     def set_strategy(self, strategy: FeeStrategy | str):
         """Change the fee calculation strategy."""
@@ -89,6 +98,8 @@ class DynamicPriorityFee(PriorityFeePlugin):
         self.strategy = strategy
         # Сбрасываем кэш при смене стратегии
         self._cache = None
+        self._anchor = None
+        self._anchor_checked = 0.0
         logger.info(f"Priority fee strategy changed to: {strategy.value}")
 
     async def get_priority_fee(
@@ -104,6 +115,20 @@ class DynamicPriorityFee(PriorityFeePlugin):
         Returns:
             Optional[int]: Calculated priority fee in microlamports.
         """
+        # Потоковая оценка из Geyser, не выше RPC-оценки (поток смещён вверх:
+        # только киты и наш кошелёк); RPC — раз в RPC_ANCHOR_TTL
+        if self.estimator is not None:
+            streamed = self.estimator.quote_for_accounts(
+                self.STRATEGY_PERCENTILES.get(self.strategy, 0.75), accounts
+            )
+            if streamed is not None:
+                fee = self._apply_strategy(streamed)
+                now = time.time()
+                if now - self._anchor_checked >= self.RPC_ANCHOR_TTL:
+                    self._anchor_checked = now  # also throttles retries while RPC fails
+                    await self._fetch_quote(accounts)
+                return min(fee, self._anchor[1]) if self._anchor else fee
+
         # Проверяем кэш
         if self._cache:
             cache_time, cached_fee = self._cache
@@ -111,6 +136,11 @@ class DynamicPriorityFee(PriorityFeePlugin):
                 logger.debug(f"Using cached priority fee: {cached_fee:,}")
                 return cached_fee
 
+        fee = await self._fetch_quote(accounts)
+        return fee if fee is not None else self.fallback_fee
+
+    async def _fetch_quote(self, accounts: list[Pubkey] | None = None) -> int | None:
+        """Strategy fee from getRecentPrioritizationFees (None on no data / error)."""
         try:
             # Используем дефолтные аккаунты если не переданы и включена опция
             if accounts is None and self.use_default_accounts:
@@ -119,12 +149,13 @@ class DynamicPriorityFee(PriorityFeePlugin):
             fees = await self._fetch_recent_fees(accounts)
             if not fees:
                 logger.warning(f"No fees data, using fallback: {self.fallback_fee:,}")
-                return self.fallback_fee
+                return None
 
             calculated_fee = self._calculate_fee(fees)
 
             # Обновляем кэш
-            self._cache = (time.time(), calculated_fee)
+            self._cache = self._anchor = (time.time(), calculated_fee)
+            self._anchor_checked = self._anchor[0]
 
             logger.info(
                 f"Priority fee calculated: {calculated_fee:,} µL "
@@ -134,7 +165,7 @@ class DynamicPriorityFee(PriorityFeePlugin):
 
         except Exception:
             logger.exception("Failed to fetch priority fee, using fallback")
-            return self.fallback_fee
+            return None
 
     async def _fetch_recent_fees(
         self, accounts: list[Pubkey] | None = None
@@ -183,22 +214,21 @@ class DynamicPriorityFee(PriorityFeePlugin):
             idx = min(idx, len(sorted_fees) - 1)
             base_fee = sorted_fees[idx]
 
-        # Применяем множитель стратегии
-        multiplier = self.STRATEGY_MULTIPLIERS.get(self.strategy, 1.0)
-        calculated_fee = int(base_fee * multiplier)
-
-        # Применяем границы
-        final_fee = max(self.min_fee, min(calculated_fee, self.max_fee))
+        final_fee = self._apply_strategy(base_fee)
 
         logger.debug(
             f"Fee calculation: base={base_fee:,}, "
-            f"multiplier={multiplier}, "
-            f"calculated={calculated_fee:,}, "
+            f"multiplier={self.STRATEGY_MULTIPLIERS.get(self.strategy, 1.0)}, "
             f"final={final_fee:,}"
         )
 
         return final_fee
 
+    def _apply_strategy(self, base_fee: float) -> int:
+        """Apply the strategy multiplier and min/max bounds to a base fee."""
+        multiplier = self.STRATEGY_MULTIPLIERS.get(self.strategy, 1.0)
+        return max(self.min_fee, min(int(base_fee * multiplier), self.max_fee))
+
 
 # Удобная функция для standalone использования
 async def get_dynamic_fee_standalone(
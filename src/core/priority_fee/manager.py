@@ -3,6 +3,7 @@ from solders.pubkey import Pubkey
 from core.client import SolanaClient
 from core.priority_fee.dynamic_fee import DynamicPriorityFee, FeeStrategy
 from core.priority_fee.fixed_fee import FixedPriorityFee
+from core.priority_fee.streaming_fee import get_fee_estimator
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +24,7 @@ class PriorityFeeManager:
         strategy: str = "aggressive",
         min_fee: int = 50_000,
         max_fee: int = 10_000_000,
+        use_streaming_fee: bool = False,
     ):
         """
         Initialize the priority fee manager.
@@ -37,6 +39,10 @@ class PriorityFeeManager:
             strategy: Fee strategy - "conservative", "aggressive", or "sniper".
             min_fee: Minimum fee in microlamports.
             max_fee: Maximum fee in microlamports.
+            use_streaming_fee: Quote dynamic fees from Geyser-observed transactions
+                (core/priority_fee/streaming_fee.py) once warm, capped by the
+                RPC quote (refreshed every RPC_ANCHOR_TTL). Off by default: the
+                stream only sees whale/own-wallet traffic.
         """
         self.client = client
         self.enable_dynamic_fee = enable_dynamic_fee
@@ -64,6 +70,7 @@ class PriorityFeeManager:
             min_fee=min_fee,
             max_fee=max_fee,
             fallback_fee=fixed_fee,  # Use fixed_fee as fallback
+            estimator=get_fee_estimator() if use_streaming_fee else None,
         )
         self.fixed_fee_plugin = FixedPriorityFee(fixed_fee)
 
@@ -0,0 +1,225 @@
+"""
+Streaming priority fee estimator.
+
+WhaleGeyserReceiver sees every relevant transaction as it lands. Each one's
+SetComputeUnitPrice (micro-lamports per CU) is fed into a sliding-window
+histogram per DEX program, plus one for all programs together. Quotes are
+read from those histograms with no RPC call. getRecentPrioritizationFees
+(DynamicPriorityFee) is only needed until enough samples have come in.
+
+Histogram: fixed log-spaced buckets (BUCKETS_PER_OCTAVE per doubling,
+~19% wide) in a ring of time slices. Old slices are cleared as the window
+moves. A quantile is the upper bound of the bucket it falls in, which
+rounds up - the safe direction for a fee. A computed quote is cached for
+QUOTE_REFRESH seconds, so a hot-path quote is a dict lookup.
+
+The stream only carries whale and own-wallet traffic, which pays more than
+the average landed tx, so DynamicPriorityFee caps a streamed quote by its
+RPC quote. Samples are deduped by signature: dual endpoints and shards see
+the same transaction more than once.
+"""
+
+import math
+import time
+from typing import Iterable, Optional
+
+import base58
+from solders.pubkey import Pubkey
+
+from core.priority_fee.dynamic_fee import DEFAULT_DEX_ACCOUNTS
+from monitoring.dedup_cache import DedupCache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+COMPUTE_BUDGET_PROGRAM = "ComputeBudget111111111111111111111111111111"
+_COMPUTE_BUDGET_RAW = base58.b58decode(COMPUTE_BUDGET_PROGRAM)
+_SET_COMPUTE_UNIT_PRICE = 3  # ComputeBudgetInstruction::SetComputeUnitPrice(u64)
+
+_PROGRAMS_RAW: dict[bytes, str] = {base58.b58decode(p): p for p in DEFAULT_DEX_ACCOUNTS}
+_PROGRAM_PUBKEYS: dict[Pubkey, str] = {Pubkey.from_string(p): p for p in DEFAULT_DEX_ACCOUNTS}
+
+ALL_PROGRAMS = "*"
+
+BUCKETS_PER_OCTAVE = 4
+MAX_OCTAVES = 40  # up to ~1.1e12 micro-lamports/CU
+_NUM_BUCKETS = BUCKETS_PER_OCTAVE * MAX_OCTAVES + 1
+
+
+def compute_unit_price(msg) -> tuple[Optional[int], Optional[str]]:
+    """(SetComputeUnitPrice micro-lamports, first DEX program) of a geyser Message.
+
+    Program ids are always static account keys, so no ALT lookup is needed.
+    """
+    keys = msg.account_keys
+    n_keys = len(keys)
+    price = None
+    program = None
+    for ix in msg.instructions:
+        idx = ix.program_id_index
+        if idx >= n_keys:
+            continue
+        key = keys[idx]
+        if key == _COMPUTE_BUDGET_RAW:
+            data = ix.data
+            if len(data) >= 9 and data[0] == _SET_COMPUTE_UNIT_PRICE:
+                price = int.from_bytes(data[1:9], "little")
+        elif program is None:
+            program = _PROGRAMS_RAW.get(key)
+    return price, program
+
+
+def _bucket(value: int) -> int:
+    if value <= 1:
+        return 0
+    return min(_NUM_BUCKETS - 1, math.ceil(math.log2(value) * BUCKETS_PER_OCTAVE))
+
+
+def _bucket_upper(index: int) -> int:
+    return math.ceil(2 ** (index / BUCKETS_PER_OCTAVE))
+
+
+class SlidingHistogram:
+    """Log-bucket histogram over the last `window` seconds, in `slices` time slices."""
+
+    __slots__ = ("window", "slice_seconds", "_counts", "_totals", "_head", "_head_start")
+
+    def __init__(self, window: float = 60.0, slices: int = 6):
+        self.window = window
+        self.slice_seconds = window / slices
+        self._counts = [[0] * _NUM_BUCKETS for _ in range(slices)]
+        self._totals = [0] * slices
+        self._head = 0
+        self._head_start = 0.0
+
+    def _advance(self, now: float) -> None:
+        elapsed = int((now - self._head_start) // self.slice_seconds)
+        if elapsed <= 0:
+            return
+        n = len(self._counts)
+        for step in range(1, min(elapsed, n) + 1):
+            i = (self._head + step) % n
+            if self._totals[i]:
+                self._counts[i] = [0] * _NUM_BUCKETS
+                self._totals[i] = 0
+        self._head = (self._head + elapsed) % n
+        self._head_start = now if elapsed >= n else self._head_start + elapsed * self.slice_seconds
+
+    def add(self, value: int, now: float) -> None:
+        self._advance(now)
+        self._counts[self._head][_bucket(value)] += 1
+        self._totals[self._head] += 1
+
+    def count(self, now: float) -> int:
+        self._advance(now)
+        return sum(self._totals)
+
+    def quantile(self, q: float, now: float) -> Optional[int]:
+        """Upper bucket bound of the q-quantile, or None when empty."""
+        total = self.count(now)
+        if total == 0:
+            return None
+        rank = max(1, math.ceil(q * total))
+        seen = 0
+        live = [c for c, t in zip(self._counts, self._totals) if t]
+        for b in range(_NUM_BUCKETS):
+            seen += sum(c[b] for c in live)
+            if seen >= rank:
+                return _bucket_upper(b)
+        return _bucket_upper(_NUM_BUCKETS - 1)
+
+
+class StreamingFeeEstimator:
+    """Per-program sliding-window compute unit price quantiles."""
+
+    MIN_SAMPLES = 20        # below this a quote is None (use the RPC fallback)
+    QUOTE_REFRESH = 0.25    # seconds a computed quote is reused
+    SEEN_SIGNATURES = 20_000
+
+    def __init__(self, window: float = 60.0, slices: int = 6, min_samples: int | None = None):
+        self.window = window
+        self.slices = slices
+        self.min_samples = min_samples if min_samples is not None else self.MIN_SAMPLES
+        self._hist: dict[str, SlidingHistogram] = {ALL_PROGRAMS: SlidingHistogram(window, slices)}
+        # (program, q) -> (computed_at, quote)
+        self._quotes: dict[tuple[str, float], tuple[float, int]] = {}
+        self._seen = DedupCache(maxsize=self.SEEN_SIGNATURES)
+        self.stats = {"observed": 0, "duplicates": 0, "no_price": 0, "quotes": 0, "computed": 0}
+
+    def observe(self, price: int, program: str | None = None, now: float | None = None) -> None:
+        """Record one landed transaction's compute unit price (micro-lamports)."""
+        if now is None:
+            now = time.monotonic()
+        self._hist[ALL_PROGRAMS].add(price, now)
+        if program:
+            hist = self._hist.get(program)
+            if hist is None:
+                hist = self._hist[program] = SlidingHistogram(self.window, self.slices)
+            hist.add(price, now)
+        self.stats["observed"] += 1
+
+    def observe_transaction(self, msg, meta=None, signature: bytes | None = None) -> None:
+        """Ingest a geyser Message (failed transactions are skipped when meta is given).
+
+        A signature already observed (other endpoint / shard) is not counted again.
+        """
+        if meta is not None and meta.HasField("err"):
+            return
+        if signature and not self._seen.add(signature):
+            self.stats["duplicates"] += 1
+            return
+        price, program = compute_unit_price(msg)
+        if price is None:
+            self.stats["no_price"] += 1
+            return
+        self.observe(price, program)
+
+    def quote(self, percentile: float, program: str = ALL_PROGRAMS, now: float | None = None) -> Optional[int]:
+        """percentile-quantile compute unit price for program, None while cold."""
+        if now is None:
+            now = time.monotonic()
+        self.stats["quotes"] += 1
+        key = (program, percentile)
+        cached = self._quotes.get(key)
+        if cached is not None and now - cached[0] < self.QUOTE_REFRESH:
+            return cached[1]
+        hist = self._hist.get(program)
+        if hist is None or hist.count(now) < self.min_samples:
+            return None  # cold: not cached, so the first warm call quotes at once
+        value = hist.quantile(percentile, now)
+        self._quotes[key] = (now, value)
+        self.stats["computed"] += 1
+        return value
+
+    def quote_for_accounts(self, percentile: float, accounts: Iterable | None = None) -> Optional[int]:
+        """Quote for the highest-fee tracked program among accounts, else for all programs."""
+        best = None
+        if accounts:
+            for account in accounts:
+                program = account if isinstance(account, str) else _PROGRAM_PUBKEYS.get(account)
+                if program in self._hist and program != ALL_PROGRAMS:
+                    value = self.quote(percentile, program)
+                    if value is not None and (best is None or value > best):
+                        best = value
+        return best if best is not None else self.quote(percentile)
+
+    def sample_count(self, program: str = ALL_PROGRAMS) -> int:
+        hist = self._hist.get(program)
+        return hist.count(time.monotonic()) if hist else 0
+
+    def get_stats(self) -> dict:
+        return {
+            **self.stats,
+            "programs": {p: self.sample_count(p) for p in self._hist},
+        }
+
+
+_fee_estimator: Optional[StreamingFeeEstimator] = None
+
+
+def get_fee_estimator() -> StreamingFeeEstimator:
+    """Process-wide estimator shared by the geyser feed and PriorityFeeManager."""
+    global _fee_estimator
+    if _fee_estimator is None:
+        _fee_estimator = StreamingFeeEstimator()
+    return _fee_estimator
@@ -1,4 +1,8 @@
-"""Redis cache for sharing data between bots with persistence."""
+"""Redis cache for sharing data between bots with persistence.
+
+Synchronous API for scripts and sync callers. Async code uses the pooled
+non-blocking facade in core.redis_pool instead.
+"""
 
 import json
 import redis
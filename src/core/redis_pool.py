@@ -0,0 +1,358 @@
+"""
+Async, connection-pooled Redis facade shared by the whole bot.
+
+Before: ``core/redis_cache.py`` used a synchronous ``redis.Redis`` singleton
+that ``client._cache_get/_cache_set`` and ``RPCManager._get_cache/_set_cache``
+called straight from async code, and the monitor loop / restore / buy paths
+opened a fresh ``redis.Redis()`` per call just to ``zrem`` sold_mints. Every
+one of those blocked the event loop for a full round trip (plus a TCP
+connect for the inline clients).
+
+Now:
+- one ``redis.asyncio`` ConnectionPool per event loop, shared by every caller
+- cache reads go through a local TTL mirror first (client-side cache); a miss
+  is one pipelined GET+PTTL and the mirror never outlives the Redis key
+- cache writes are queued and flushed as ONE pipeline per event-loop turn
+- every command is timed per caller (``get_stats()`` / ``log_stats()``)
+- a failed connect backs off for RETRY_AFTER seconds instead of stalling
+  every call on the connect timeout
+
+RESP3 client tracking would need a dedicated invalidation connection per
+process; cross-bot cache keys here are short-TTL RPC/score data, so a
+mirror capped at MIRROR_MAX_TTL gives the same hit path without it.
+"""
+
+import asyncio
+import inspect
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+from utils.logger import get_logger
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    RedisConnectionError = RedisTimeoutError = OSError
+    REDIS_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "32"))
+
+# Local mirror entries live at most this long (cross-bot writes become visible after it)
+MIRROR_MAX_TTL = 2.0
+MIRROR_MAX_SIZE = 10_000
+
+# After a connection failure, skip Redis for this long
+RETRY_AFTER = 10.0
+
+
+class _CallerStats:
+    __slots__ = ("calls", "total", "max", "errors")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+
+    def add(self, elapsed: float, calls: int = 1, error: bool = False) -> None:
+        self.calls += calls
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        if error:
+            self.errors += 1
+
+
+class _InstrumentedClient:
+    """Proxy over the pooled client that times every command under one caller."""
+
+    def __init__(self, facade: "AsyncRedis", caller: str):
+        self._facade = facade
+        self._caller = caller
+
+    def __getattr__(self, name: str):
+        if name == "pipeline":
+            return self._pipeline
+        attr = getattr(self._facade.client, name)
+        if not callable(attr):
+            return attr
+        caller = f"{self._caller}.{name}"
+
+        def _call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if not inspect.isawaitable(result):
+                return result  # e.g. scan_iter async generators
+            return self._facade._await_timed(caller, result)
+        return _call
+
+    def _pipeline(self, *args, **kwargs):
+        pipe = self._facade.client.pipeline(*args, **kwargs)
+        execute = pipe.execute
+        facade, caller = self._facade, self._caller
+
+        async def _timed_execute(*a, **kw):
+            async with facade.timed(f"{caller}.pipeline", calls=len(pipe.command_stack) or 1):
+                return await execute(*a, **kw)
+        pipe.execute = _timed_execute
+        return pipe
+
+
+class AsyncRedis:
+    """Pooled redis.asyncio client + local TTL mirror + per-caller timing."""
+
+    def __init__(self, url: str = REDIS_URL, max_connections: int = MAX_CONNECTIONS):
+        self.url = url
+        self.max_connections = max_connections
+        self._client = None
+        self._loop = None
+        self._down_until = 0.0
+        self._mirror: dict[str, tuple[Any, float]] = {}
+        self._write_queue: dict[str, tuple[str, int, str]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._stats_task: Optional[asyncio.Task] = None
+        self._stats: dict[str, _CallerStats] = defaultdict(_CallerStats)
+        self._mirror_hits = 0
+        self._mirror_misses = 0
+
+    # ==================== CONNECTION ====================
+
+    @property
+    def client(self):
+        """Pooled client for the running event loop (recreated if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            pool = aioredis.ConnectionPool.from_url(
+                self.url,
+                max_connections=self.max_connections,
+                decode_responses=True,
+                socket_timeout=5.0,
+                socket_connect_timeout=2.0,
+            )
+            self._client = aioredis.Redis(connection_pool=pool)
+            self._loop = loop
+        return self._client
+
+    @property
+    def available(self) -> bool:
+        return REDIS_AVAILABLE and time.monotonic() >= self._down_until
+
+    def client_for(self, caller: str) -> _InstrumentedClient:
+        """redis.asyncio-compatible client whose commands are timed under caller."""
+        return _InstrumentedClient(self, caller)
+
+    @asynccontextmanager
+    async def timed(self, caller: str, calls: int = 1):
+        """Time a block of Redis work under caller. Connection errors start the back-off."""
+        t0 = time.perf_counter()
+        error = False
+        try:
+            yield
+        except (RedisConnectionError, RedisTimeoutError, OSError):
+            error = True
+            self._down_until = time.monotonic() + RETRY_AFTER
+            raise
+        except Exception:
+            error = True
+            raise
+        finally:
+            self._stats[caller].add(time.perf_counter() - t0, calls, error)
+
+    async def _await_timed(self, caller: str, awaitable):
+        async with self.timed(caller):
+            return await awaitable
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception:
+                pass
+            self._client = None
+
+    # ==================== JSON CACHE ====================
+
+    def _mirror_get(self, key: str) -> tuple[bool, Any]:
+        entry = self._mirror.get(key)
+        if entry is not None:
+            if time.monotonic() < entry[1]:
+                self._mirror_hits += 1
+                return True, entry[0]
+            del self._mirror[key]
+        self._mirror_misses += 1
+        return False, None
+
+    def _mirror_put(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        if len(self._mirror) >= MIRROR_MAX_SIZE:
+            now = time.monotonic()
+            for k in [k for k, (_, exp) in self._mirror.items() if exp <= now]:
+                del self._mirror[k]
+            if len(self._mirror) >= MIRROR_MAX_SIZE:
+                # Drop the oldest-inserted quarter
+                for k in list(self._mirror)[: MIRROR_MAX_SIZE // 4]:
+                    del self._mirror[k]
+        self._mirror[key] = (value, time.monotonic() + min(ttl, MIRROR_MAX_TTL))
+
+    async def get_json(self, key: str, caller: str = "cache") -> Any:
+        """Cached JSON value: local mirror, then one GET+PTTL round trip."""
+        hit, value = self._mirror_get(key)
+        if hit:
+            return value
+        if not self.available:
+            return None
+        try:
+            async with self.timed(caller):
+                pipe = self.client.pipeline(transaction=False)
+                pipe.get(key)
+                pipe.pttl(key)
+                data, pttl = await pipe.execute()
+        except Exception as e:
+            logger.debug(f"[REDIS] Get error ({caller}): {e}")
+            return None
+        if not data:
+            return None
+        try:
+            value = json.loads(data)
+        except ValueError:
+            return None
+        # pttl -1 = no expiry: mirror for the max
+        self._mirror_put(key, value, MIRROR_MAX_TTL if pttl == -1 else pttl / 1000)
+        return value
+
+    def set_json_nowait(self, key: str, value: Any, ttl: int = 60, caller: str = "cache") -> None:
+        """Queue a JSON cache write (0 ttl = no expiry). Flushed as one pipeline per loop turn."""
+        self._mirror_put(key, value, ttl if ttl > 0 else MIRROR_MAX_TTL)
+        if not self.available:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop - nothing can flush it
+        self._write_queue[key] = (json.dumps(value), ttl, caller)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> int:
+        """Write every queued cache entry in one pipeline. Returns entries written."""
+        written = 0
+        while self._write_queue:
+            batch = self._write_queue
+            self._write_queue = {}
+            callers = ",".join(sorted({c for _, _, c in batch.values()}))
+            try:
+                async with self.timed(f"{callers}.pipeline", calls=len(batch)):
+                    pipe = self.client.pipeline(transaction=False)
+                    for key, (data, ttl, _) in batch.items():
+                        if ttl > 0:
+                            pipe.setex(key, ttl, data)
+                        else:
+                            pipe.set(key, data)
+                    await pipe.execute()
+                written += len(batch)
+            except Exception as e:
+                logger.debug(f"[REDIS] Pipelined set error: {e}")
+                return written
+        return written
+
+    # ==================== COMMANDS ====================
+
+    async def delete(self, *keys: str, caller: str = "cache") -> int:
+        for key in keys:
+            self._mirror.pop(key, None)
+            self._write_queue.pop(key, None)
+        if not self.available or not keys:
+            return 0
+        try:
+            async with self.timed(caller):
+                return await self.client.delete(*keys)
+        except Exception as e:
+            logger.debug(f"[REDIS] Delete error ({caller}): {e}")
+            return 0
+
+    async def zrem(self, key: str, *members: str, caller: str = "zset") -> int:
+        if not self.available or not members:
+            return 0
+        try:
+            async with self.timed(caller):
+                return await self.client.zrem(key, *members)
+        except Exception as e:
+            logger.debug(f"[REDIS] ZREM error ({caller}): {e}")
+            return 0
+
+    async def hdel(self, key: str, *fields: str, caller: str = "hash") -> int:
+        if not self.available or not fields:
+            return 0
+        try:
+            async with self.timed(caller):
+                return await self.client.hdel(key, *fields)
+        except Exception as e:
+            logger.debug(f"[REDIS] HDEL error ({caller}): {e}")
+            return 0
+
+    # ==================== STATS ====================
+
+    def get_stats(self) -> dict:
+        """Per-caller Redis time: {caller: {calls, total_ms, avg_ms, max_ms, errors}}."""
+        callers = {
+            caller: {
+                "calls": s.calls,
+                "total_ms": round(s.total * 1000, 2),
+                "avg_ms": round(s.total * 1000 / s.calls, 3) if s.calls else 0.0,
+                "max_ms": round(s.max * 1000, 2),
+                "errors": s.errors,
+            }
+            for caller, s in self._stats.items()
+        }
+        total = self._mirror_hits + self._mirror_misses
+        return {
+            "callers": callers,
+            "mirror_size": len(self._mirror),
+            "mirror_hit_rate": f"{(self._mirror_hits / total * 100) if total else 0:.1f}%",
+            "queued_writes": len(self._write_queue),
+            "available": self.available,
+        }
+
+    def log_stats(self, top: int = 8) -> None:
+        stats = self.get_stats()
+        busiest = sorted(stats["callers"].items(), key=lambda kv: kv[1]["total_ms"], reverse=True)[:top]
+        parts = [f"{c}={s['total_ms']:.0f}ms/{s['calls']}" for c, s in busiest]
+        logger.info(f"[REDIS] Time by caller: {', '.join(parts) or '-'} | mirror hit {stats['mirror_hit_rate']}")
+
+    async def _stats_loop(self, interval: float) -> None:
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                self.log_stats()
+            except asyncio.CancelledError:
+                return
+            except Exception as e:
+                logger.warning(f"[REDIS] Stats log error: {e}")
+
+    def start_stats_logger(self, interval: float = 300.0) -> None:
+        """Log per-caller Redis time every interval seconds."""
+        if self._stats_task is None or self._stats_task.done():
+            self._stats_task = asyncio.create_task(self._stats_loop(interval))
+
+
+# Global singleton
+_async_redis: Optional[AsyncRedis] = None
+
+
+def get_async_redis() -> AsyncRedis:
+    """Get or create the global AsyncRedis facade."""
+    global _async_redis
+    if _async_redis is None:
+        _async_redis = AsyncRedis()
+    return _async_redis
@@ -19,6 +19,7 @@ from typing import Any
 
 import aiohttp
 
+from core.account_coalescer import MAX_ACCOUNTS_PER_CALL, AccountCoalescer
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -30,13 +31,7 @@ except ImportError:
     DYNAMIC_TESTER_AVAILABLE = False
     logger.warning("[RPC] DynamicRPCTester not available")
 
-try:
-    from core.redis_cache import cache_get as redis_get, cache_set as redis_set
-    REDIS_ENABLED = True
-except ImportError:
-    REDIS_ENABLED = False
-    redis_get = lambda k: None
-    redis_set = lambda k, v, t=60: False
+from core.redis_pool import REDIS_AVAILABLE as REDIS_ENABLED, get_async_redis
 
 
 NUM_BOTS = 6
@@ -99,6 +94,7 @@ class RPCManager:
         self._request_log: list[dict] = []
         self._max_log_entries = 100
         self._dynamic_tester: "DynamicRPCTester | None" = None
+        self._accounts = AccountCoalescer(self._fetch_multiple_accounts, name="rpc_manager")
 
     @classmethod
     async def get_instance(cls) -> "RPCManager":
@@ -208,7 +204,7 @@ class RPCManager:
             asyncio.create_task(self._dynamic_tester.start())
             logger.info(f"[RPC] Dynamic latency testing enabled (interval: {test_interval}s)")
 
-    def _get_cache(self, key: str) -> Any | None:
+    async def _get_cache(self, key: str) -> Any | None:
         if key in self._cache:
             value, timestamp, ttl = self._cache[key]
             if time.time() - timestamp < ttl:
@@ -217,7 +213,7 @@ class RPCManager:
             else:
                 del self._cache[key]
         if REDIS_ENABLED:
-            cached = redis_get(f"rpc:{key}")
+            cached = await get_async_redis().get_json(f"rpc:{key}", caller="rpc_manager")
             if cached is not None:
                 self._metrics["cache_hits"] += 1
                 self._cache[key] = (cached, time.time(), 3600)
@@ -228,7 +224,7 @@ class RPCManager:
     def _set_cache(self, key: str, value: Any, ttl: float) -> None:
         self._cache[key] = (value, time.time(), ttl)
         if REDIS_ENABLED:
-            redis_set(f"rpc:{key}", value, int(ttl))
+            get_async_redis().set_json_nowait(f"rpc:{key}", value, int(ttl), caller="rpc_manager")
         if len(self._cache) > self._cache_max_size:
             oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
             del self._cache[oldest_key]
@@ -325,7 +321,7 @@ class RPCManager:
         method = body.get("method", "unknown")
 
         if cache_key and cache_type:
-            cached = self._get_cache(cache_key)
+            cached = await self._get_cache(cache_key)
             if cached is not None:
                 return {"result": cached}
 
@@ -380,11 +376,42 @@ class RPCManager:
         return result.get("result") if result else None
 
     async def get_account_info(self, pubkey: str, use_cache: bool = True) -> dict | None:
-        cache_key = f"acc:{pubkey}" if use_cache else None
-        cache_type = CacheType.ACCOUNT_INFO if use_cache else None
-        body = {"jsonrpc": "2.0", "id": 1, "method": "getAccountInfo", "params": [pubkey, {"encoding": "base64"}]}
-        result = await self.post_rpc(body, cache_type, cache_key)
-        return result.get("result") if result else None
+        """getAccountInfo result ({"value": ...}), coalesced into getMultipleAccounts."""
+        cache_key = f"acc:{pubkey}"
+        if use_cache:
+            cached = await self._get_cache(cache_key)
+            if cached is not None:
+                return cached
+        try:
+            value = await self._accounts.get(pubkey)
+        except Exception:
+            return None
+        result = {"value": value}
+        if use_cache:
+            self._set_cache(cache_key, result, CacheType.ACCOUNT_INFO.value)
+        return result
+
+    async def get_multiple_accounts(self, pubkeys: list[str]) -> list[dict | None] | None:
+        """Account values (base64 JSON) for pubkeys in order; any number of keys."""
+        try:
+            return await self._accounts.get_many(pubkeys)
+        except Exception:
+            return None
+
+    async def _fetch_multiple_accounts(self, pubkeys: list[str]) -> list[dict | None]:
+        values = []
+        for i in range(0, len(pubkeys), MAX_ACCOUNTS_PER_CALL):
+            body = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getMultipleAccounts",
+                "params": [pubkeys[i:i + MAX_ACCOUNTS_PER_CALL], {"encoding": "base64"}],
+            }
+            result = await self.post_rpc(body)
+            if not result or "result" not in result:
+                raise RuntimeError(f"getMultipleAccounts failed: {(result or {}).get('error')}")
+            values.extend(result["result"]["value"])
+        return values
 
     async def get_balance(self, pubkey: str) -> int | None:
         body = {"jsonrpc": "2.0", "id": 1, "method": "getBalance", "params": [pubkey]}
@@ -440,6 +467,7 @@ class RPCManager:
             "chainstack_daily_remaining": CHAINSTACK_DAILY - chainstack_used,
             "cache_hit_rate": f"{cache_rate:.1f}%",
             "cache_size": len(self._cache),
+            "account_batches": self._accounts.get_stats(),
             "providers": {
                 name: {
                     "requests": p.total_requests,
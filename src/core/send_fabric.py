@@ -0,0 +1,395 @@
+"""
+Send fabric: first-wins transaction fan-out over learned top-K endpoints.
+
+Endpoints (RPCs, Jito regions, bloXroute, Circular, TPU, Helius Sender) are
+read from env once and kept as data; each has its own keep-alive
+aiohttp session whose connection is opened ahead of time and re-warmed
+in the background, so a send never pays TCP+TLS.
+
+Every response (the winner's and the losers', which finish in the
+background instead of being cancelled) updates a per-endpoint EWMA of
+ack latency and success. A send goes to:
+
+    the caller's primary RPC (send(primary_url=...)) + pinned endpoints
+    + endpoints with fewer than FABRIC_MIN_SAMPLES results (cold start)
+    + the best FABRIC_TOP_K by latency / success
+    + with probability FABRIC_EXPLORE one random other endpoint
+
+Endpoints that are rate limited (HTTP 429) or fail repeatedly cool down.
+FABRIC_TOP_K=0 sends to every endpoint.
+"""
+
+import asyncio
+import base64
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from core.sender import SendResult, SendStatus
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+JITO_REGIONS = (
+    "https://frankfurt.mainnet.block-engine.jito.wtf",
+    "https://amsterdam.mainnet.block-engine.jito.wtf",
+    "https://ny.mainnet.block-engine.jito.wtf",
+    "https://tokyo.mainnet.block-engine.jito.wtf",
+)
+BLOXROUTE_REGIONS = (
+    "https://ny.solana.dex.blxrbdn.com/api/v2/submit",
+    "https://uk.solana.dex.blxrbdn.com/api/v2/submit",
+)
+HELIUS_SENDER_REGIONS = (
+    ("fra", "http://fra-sender.helius-rpc.com/fast"),
+    ("ams", "http://ams-sender.helius-rpc.com/fast"),
+)
+CIRCULAR_URL = "https://fast.circular.bot/transactions"
+
+RPC_SEND_OPTIONS = {"encoding": "base64", "skipPreflight": True, "preflightCommitment": "processed", "maxRetries": 0}
+
+
+class _RateLimited(Exception):
+    pass
+
+
+@dataclass
+class SendEndpoint:
+    """One send target plus its learned latency/success."""
+
+    name: str
+    url: str
+    kind: str = "rpc"  # rpc | jito | bloxroute | circular
+    headers: dict = field(default_factory=dict)
+    options: dict = field(default_factory=lambda: dict(RPC_SEND_OPTIONS))
+    pinned: bool = False
+
+    ewma_ms: float = 0.0
+    success: float = 1.0
+    samples: int = 0
+    sends: int = 0
+    wins: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0
+    last_error: str = ""
+
+    ALPHA = 0.2
+
+    def payload(self, tx_b64: str) -> dict:
+        if self.kind == "bloxroute":
+            return {"transaction": {"content": tx_b64}, "frontRunningProtection": False, "useStakedRPCs": True}
+        if self.kind == "jito":
+            params = [tx_b64, {"encoding": "base64"}]
+        elif self.kind == "circular":
+            params = [tx_b64, {"frontRunningProtection": False}]
+        else:
+            params = [tx_b64, self.options]
+        return {"jsonrpc": "2.0", "id": 1, "method": "sendTransaction", "params": params}
+
+    def parse(self, data: dict) -> str:
+        """Signature from the response body, or raise with the endpoint's error."""
+        if self.kind == "bloxroute":
+            sig = data.get("signature")
+        else:
+            sig = data.get("result")
+            if isinstance(sig, dict):
+                sig = sig.get("signature")
+        if sig:
+            return sig
+        raise RuntimeError(str(data.get("error") or data)[:120])
+
+    def score(self) -> float:
+        """Expected latency to an accepted send; lower is better."""
+        return self.ewma_ms / max(self.success, 0.05)
+
+    def record(self, ok: bool, latency_ms: float) -> None:
+        self.samples += 1
+        if self.samples == 1:
+            self.ewma_ms = latency_ms
+        else:
+            self.ewma_ms += self.ALPHA * (latency_ms - self.ewma_ms)
+        self.success += self.ALPHA * ((1.0 if ok else 0.0) - self.success)
+        if ok:
+            self.consecutive_failures = 0
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+
+    def stats(self) -> dict:
+        return {
+            "kind": self.kind,
+            "ewma_ms": round(self.ewma_ms, 1),
+            "success": round(self.success, 3),
+            "sends": self.sends,
+            "wins": self.wins,
+            "failures": self.failures,
+            "cooling": self.cooldown_until > time.monotonic(),
+            "last_error": self.last_error,
+        }
+
+
+class SendFabric:
+    """Persistent-session, latency-learning multi-endpoint sender."""
+
+    FAILURE_COOLDOWN_AFTER = 3  # consecutive failures
+    FAILURE_COOLDOWN = 30.0
+    RATE_LIMIT_COOLDOWN = 10.0
+
+    def __init__(
+        self,
+        endpoints: list[SendEndpoint] | None = None,
+        top_k: int = 5,
+        min_samples: int = 5,
+        explore: float = 0.1,
+        timeout: float = 5.0,
+        keepalive_interval: float = 25.0,
+    ):
+        self.endpoints: list[SendEndpoint] = []
+        self.top_k = top_k
+        self.min_samples = min_samples
+        self.explore = explore
+        self.timeout = timeout
+        self.keepalive_interval = keepalive_interval
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        self._background: set[asyncio.Task] = set()
+        self._warm_task: Optional[asyncio.Task] = None
+        for endpoint in endpoints or []:
+            self.add(endpoint)
+
+    @classmethod
+    def from_env(cls, primary_rpc_url: str | None = None) -> "SendFabric":
+        """Endpoints and tuning from the environment (read once)."""
+        fabric = cls(
+            top_k=int(os.getenv("FABRIC_TOP_K", "5")),
+            min_samples=int(os.getenv("FABRIC_MIN_SAMPLES", "5")),
+            explore=float(os.getenv("FABRIC_EXPLORE", "0.1")),
+        )
+        if primary_rpc_url:
+            fabric.add(primary_endpoint(primary_rpc_url))
+        for env_key in ("CHAINSTACK_RPC_ENDPOINT", "DRPC_RPC_ENDPOINT", "ALCHEMY_RPC_ENDPOINT", "SOLANA_PUBLIC_RPC_ENDPOINT"):
+            url = os.getenv(env_key)
+            if url:
+                fabric.add(SendEndpoint(env_key.split("_")[0].lower(), url))
+        helius_key = os.getenv("HELIUS_API_KEY")
+        if helius_key:
+            fabric.add(SendEndpoint("helius", f"https://mainnet.helius-rpc.com/?api-key={helius_key}"))
+
+        from trading.jito_sender import get_jito_sender
+
+        jito = get_jito_sender()
+        if jito.enabled:
+            for url in (jito.block_engine_url, *JITO_REGIONS):
+                region = urlsplit(url).hostname.split(".")[0]
+                fabric.add(SendEndpoint(f"jito-{region}", f"{url}/api/v1/transactions", kind="jito"))
+
+        bloxroute_auth = os.getenv("BLOXROUTE_AUTH_HEADER")
+        if bloxroute_auth:
+            for url in BLOXROUTE_REGIONS:
+                region = urlsplit(url).hostname.split(".")[0]
+                fabric.add(SendEndpoint(
+                    f"bloxroute-{region}", url, kind="bloxroute", headers={"Authorization": bloxroute_auth}
+                ))
+        circular_key = os.getenv("CIRCULAR_FAST_API_KEY")
+        if circular_key:
+            fabric.add(SendEndpoint("circular", CIRCULAR_URL, kind="circular", headers={"x-api-key": circular_key}))
+        tpu_url = os.getenv("TPU_PENETRATOR_URL")
+        if tpu_url:
+            fabric.add(SendEndpoint("tpu", tpu_url, options={"encoding": "base64", "skipPreflight": True}))
+        for label, url in HELIUS_SENDER_REGIONS:
+            fabric.add(SendEndpoint(
+                f"helius-sender-{label}", url, options={"encoding": "base64", "skipPreflight": True, "maxRetries": 0}
+            ))
+        logger.info(
+            f"[FABRIC] {len(fabric.endpoints)} send endpoints, top_k={fabric.top_k}: "
+            f"{', '.join(e.name for e in fabric.endpoints)}"
+        )
+        return fabric
+
+    def add(self, endpoint: SendEndpoint) -> None:
+        """Register an endpoint (same URL registered twice is kept once; pinning sticks).
+
+        A name already taken by another URL gets a numeric suffix, so stats
+        stay per endpoint. Once the fabric is started, a new endpoint is
+        warmed right away instead of on the next keep-alive round.
+        """
+        names = set()
+        for existing in self.endpoints:
+            if existing.url == endpoint.url:
+                existing.pinned = existing.pinned or endpoint.pinned
+                return
+            names.add(existing.name)
+        if endpoint.name in names:
+            suffix = 2
+            while f"{endpoint.name}-{suffix}" in names:
+                suffix += 1
+            endpoint.name = f"{endpoint.name}-{suffix}"
+        self.endpoints.append(endpoint)
+        if self._warm_task is not None and not self._warm_task.done():
+            task = asyncio.create_task(self._warm_one(endpoint))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    # --- connections -----------------------------------------------------
+
+    def _session(self, endpoint: SendEndpoint) -> aiohttp.ClientSession:
+        session = self._sessions.get(endpoint.url)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._sessions[endpoint.url] = session
+        return session
+
+    async def warm(self) -> None:
+        """Open (or refresh) the keep-alive connection to every endpoint."""
+        await asyncio.gather(*(self._warm_one(e) for e in self.endpoints))
+
+    async def _warm_one(self, endpoint: SendEndpoint) -> None:
+        parts = urlsplit(endpoint.url)
+        try:
+            # Any response leaves a TLS connection in the pool
+            async with self._session(endpoint).get(f"{parts.scheme}://{parts.netloc}/") as resp:
+                await resp.read()
+        except Exception as e:
+            logger.debug(f"[FABRIC] Warm-up {endpoint.name} failed: {e}")
+
+    async def start(self) -> None:
+        """Warm all endpoints now and keep them warm in the background."""
+        if self._warm_task is None or self._warm_task.done():
+            await self.warm()
+            self._warm_task = asyncio.create_task(self._keepalive_loop())
+
+    async def _keepalive_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            await self.warm()
+
+    async def close(self) -> None:
+        if self._warm_task:
+            self._warm_task.cancel()
+        for task in list(self._background):
+            task.cancel()
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
+
+    # --- sending -----------------------------------------------------------
+
+    def select(self, primary_url: str | None = None) -> list[SendEndpoint]:
+        """Endpoints for the next send; primary_url is pinned for this send only."""
+        now = time.monotonic()
+        live = [e for e in self.endpoints if e.cooldown_until <= now] or list(self.endpoints)
+        if self.top_k <= 0 or len(live) <= self.top_k:
+            return live
+        pinned = [e for e in live if e.pinned or e.url == primary_url]
+        chosen = pinned + [e for e in live if e not in pinned and e.samples < self.min_samples]
+        ranked = sorted((e for e in live if e not in chosen), key=SendEndpoint.score)
+        take = max(0, self.top_k - (len(chosen) - len(pinned)))
+        chosen += ranked[:take]
+        rest = ranked[take:]
+        if rest and random.random() < self.explore:
+            chosen.append(random.choice(rest))
+        return chosen
+
+    async def send(self, tx_bytes: bytes, primary_url: str | None = None) -> SendResult:
+        """Fan out to the selected endpoints; first accepted signature wins.
+
+        primary_url (the sending bot's own RPC) always gets the tx; other
+        bots' primaries compete like any other endpoint. Losers keep running
+        in the background so their latency is learned.
+        """
+        tx_b64 = base64.b64encode(tx_bytes).decode("utf-8")
+        chosen = self.select(primary_url)
+        tasks = {asyncio.create_task(self._send_one(e, tx_b64)): e for e in chosen}
+        pending = set(tasks)
+        errors = []
+        winner = None
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if result.is_success and winner is None:
+                    winner = result
+                    tasks[task].wins += 1
+                elif not result.is_success:
+                    errors.append(f"{result.provider}: {result.error}")
+
+        for task in pending:
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+        if winner is None:
+            return SendResult(
+                status=SendStatus.FAILED,
+                error=f"All {len(chosen)} send endpoints failed: {errors[:3]}",
+            )
+        logger.info(
+            f"[FABRIC] Sent via {winner.provider} in {winner.latency_ms:.0f}ms "
+            f"({len(chosen)}/{len(self.endpoints)} endpoints)"
+        )
+        return winner
+
+    async def _send_one(self, endpoint: SendEndpoint, tx_b64: str) -> SendResult:
+        endpoint.sends += 1
+        t0 = time.monotonic()
+        try:
+            async with self._session(endpoint).post(
+                endpoint.url, json=endpoint.payload(tx_b64), headers=endpoint.headers
+            ) as resp:
+                if resp.status == 429:
+                    raise _RateLimited("HTTP 429")
+                data = await resp.json(content_type=None)
+            signature = endpoint.parse(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            latency_ms = (time.monotonic() - t0) * 1000
+            endpoint.last_error = str(e)[:120] or type(e).__name__
+            # Duplicate reject: the endpoint has the tx, it just wasn't first
+            error_lower = endpoint.last_error.lower()
+            endpoint.record("already" in error_lower and "processed" in error_lower, latency_ms)
+            if isinstance(e, _RateLimited):
+                endpoint.cooldown_until = time.monotonic() + self.RATE_LIMIT_COOLDOWN
+            elif endpoint.consecutive_failures >= self.FAILURE_COOLDOWN_AFTER:
+                endpoint.cooldown_until = time.monotonic() + self.FAILURE_COOLDOWN
+            status = SendStatus.RATE_LIMITED if isinstance(e, _RateLimited) else SendStatus.FAILED
+            return SendResult(status=status, provider=endpoint.name, latency_ms=latency_ms, error=endpoint.last_error)
+
+        latency_ms = (time.monotonic() - t0) * 1000
+        endpoint.record(True, latency_ms)
+        return SendResult(
+            status=SendStatus.SUCCESS, signature=signature, provider=endpoint.name, latency_ms=latency_ms
+        )
+
+    def get_stats(self) -> dict:
+        return {e.name: e.stats() for e in sorted(self.endpoints, key=SendEndpoint.score)}
+
+
+def primary_endpoint(url: str) -> SendEndpoint:
+    """A bot's own RPC as a send endpoint, named by host."""
+    return SendEndpoint(f"primary-{urlsplit(url).hostname}", url)
+
+
+_fabric: Optional[SendFabric] = None
+
+
+def get_send_fabric(primary_rpc_url: str | None = None) -> SendFabric:
+    """Process-wide send fabric (built from env on first use).
+
+    primary_rpc_url is registered as an endpoint; pass it again to send()
+    to have that bot's transactions always reach it.
+    """
+    global _fabric
+    if _fabric is None:
+        _fabric = SendFabric.from_env(primary_rpc_url)
+    elif primary_rpc_url:
+        _fabric.add(primary_endpoint(primary_rpc_url))
+    return _fabric
@@ -51,7 +51,7 @@ async def on_buy_success(tx: "PendingTransaction"):
         if not _wallet:
             try:
                 from trading.trader_registry import get_trader
-                _trader = get_trader()
+                _trader = get_trader(mint=mint, wallet=tx.context.get("wallet_pubkey"))
                 if _trader and hasattr(_trader, 'wallet'):
                     _wallet = str(_trader.wallet.pubkey)
             except Exception:
@@ -152,7 +152,7 @@ async def on_buy_success(tx: "PendingTransaction"):
             # Also update in-memory position in trader.active_positions
             try:
                 from trading.trader_registry import get_trader
-                _trader = get_trader()
+                _trader = get_trader(mint=mint, wallet=tx.context.get("wallet_pubkey"))
                 if _trader:
                     for _mp in _trader.active_positions:
                         if str(_mp.mint) == mint:
@@ -201,6 +201,7 @@ async def on_buy_success(tx: "PendingTransaction"):
                 # Whale info
                 whale_wallet=whale_wallet,
                 whale_label=whale_label,
+                wallet=tx.context.get("wallet_pubkey") or None,
                 # Phase 4: Pool vault data for real-time price stream
                 pool_base_vault=pool_base_vault,
                 pool_quote_vault=pool_quote_vault,
@@ -231,7 +232,8 @@ async def on_buy_success(tx: "PendingTransaction"):
                     "stop_loss_price": stop_loss_price,
                     "tsl_enabled": tsl_enabled,
                     "bonding_curve": bonding_curve,
-                }
+                },
+                wallet=tx.context.get("wallet_pubkey"),
             )
             if monitor_started:
                 logger.warning(f"[TX_CALLBACK] ✅ MONITOR STARTED for {symbol}")
@@ -242,7 +244,7 @@ async def on_buy_success(tx: "PendingTransaction"):
         # FIX S14-1: Check blacklist_sell_pending — sell immediately if deployer blacklisted
         try:
             from trading.trader_registry import get_trader
-            _trader = get_trader()
+            _trader = get_trader(mint=mint, wallet=tx.context.get("wallet_pubkey"))
             if _trader:
                 for _bp in _trader.active_positions:
                     if str(_bp.mint) == mint and getattr(_bp, 'blacklist_sell_pending', False):
@@ -298,7 +300,7 @@ async def on_buy_success(tx: "PendingTransaction"):
         _skip_grpc = False
         try:
             from trading.trader_registry import get_trader as _get_trader
-            _tr = _get_trader()
+            _tr = _get_trader(mint=mint, wallet=tx.context.get("wallet_pubkey"))
             if _tr:
                 # Check 1: Position still active?
                 _pos_found = False
@@ -335,7 +337,7 @@ async def on_buy_success(tx: "PendingTransaction"):
         if not _skip_grpc and not pool_base_vault and not pool_quote_vault and bonding_curve:
             try:
                 from trading.trader_registry import get_trader
-                _trader = get_trader()
+                _trader = get_trader(mint=mint, wallet=tx.context.get("wallet_pubkey"))
                 if _trader and _trader.whale_tracker and hasattr(_trader.whale_tracker, 'subscribe_bonding_curve'):
                     import asyncio as _aio
                     _aio.create_task(_trader.whale_tracker.subscribe_bonding_curve(
@@ -352,7 +354,7 @@ async def on_buy_success(tx: "PendingTransaction"):
         if not _skip_grpc and pool_base_vault and pool_quote_vault:
             try:
                 from trading.trader_registry import get_trader
-                _trader = get_trader()
+                _trader = get_trader(mint=mint, wallet=tx.context.get("wallet_pubkey"))
                 if _trader and _trader.whale_tracker and hasattr(_trader.whale_tracker, 'subscribe_vault_accounts'):
                     import asyncio as _aio
                     _aio.create_task(_trader.whale_tracker.subscribe_vault_accounts(
@@ -407,7 +409,7 @@ async def on_buy_failure(tx: "PendingTransaction"):
             # Also remove from trader's active_positions
             try:
                 from trading.trader_registry import get_trader
-                trader = get_trader()
+                trader = get_trader(mint=mint, wallet=tx.context.get("wallet_pubkey"))
                 if trader:
                     trader.active_positions = [p for p in trader.active_positions if str(p.mint) != mint]
                     trader._bought_tokens.discard(mint)
@@ -444,7 +446,7 @@ async def on_buy_failure(tx: "PendingTransaction"):
                 _is_mb_cb = False
                 try:
                     from trading.trader_registry import get_trader
-                    _tr = get_trader()
+                    _tr = get_trader(mint=mint, wallet=tx.context.get("wallet_pubkey"))
                     if _tr:
                         _is_mb_cb = any(
                             (getattr(p, 'is_moonbag', False) or getattr(p, 'tp_partial_done', False))
@@ -465,7 +467,7 @@ async def on_buy_failure(tx: "PendingTransaction"):
                 from monitoring.whale_geyser import WhaleGeyser
                 # Get geyser instance from trader
                 from trading.trader_registry import get_trader
-                trader = get_trader()
+                trader = get_trader(mint=mint, wallet=tx.context.get("wallet_pubkey"))
                 if trader and hasattr(trader, '_geyser') and trader._geyser:
                     await trader._geyser.unsubscribe_bonding_curve(mint)
                     logger.info(f"[TX_CALLBACK] Unsubscribed curve for {symbol}")
@@ -566,7 +568,7 @@ async def _delayed_symbol_update(mint: str, current_symbol: str, delay: int = 30
                             # Update memory
                             try:
                                 from trading.trader_registry import get_trader
-                                trader = get_trader()
+                                trader = get_trader(mint=mint)
                                 if trader and hasattr(trader, 'active_positions'):
                                     for p in trader.active_positions:
                                         if str(p.mint) == mint:
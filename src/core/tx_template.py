@@ -0,0 +1,292 @@
+"""
+Pre-compiled transaction templates for the buy hot path.
+
+A template is the serialized legacy Message of a complete buy transaction
+(compute budget + platform buy instructions + Jito tip), compiled once per
+(platform, mint, wallet). Sending it again only patches fixed byte slots
+and signs:
+
+    blockhash            32 bytes after the account keys
+    amount_in            u64 in the buy data (+ derived u64s such as the
+                         WSOL create-account lamports = amount_in + rent)
+    minimum_amount_out   u64 in the buy data
+    priority_fee         u64 in SetComputeUnitPrice
+
+Slots are found without per-platform code: the template is built by calling
+the platform's regular ``build_buy_instruction`` with sentinel amounts and
+scanning the instruction data for them, so the layout always matches the
+builders it replaces.
+"""
+
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Sentinels: distinctive high 32 bits, low 32 bits free for derived values
+# (e.g. amount_in + rent). Hex seeds and small constants never contain them.
+AMOUNT_SENTINEL = 0x5A5A5A5A << 32
+MIN_OUT_SENTINEL = 0x3C3C3C3C << 32
+FEE_SENTINEL = 0x6B6B6B6B << 32
+_SENTINELS = {
+    AMOUNT_SENTINEL >> 32: "amount_in",
+    MIN_OUT_SENTINEL >> 32: "minimum_amount_out",
+    FEE_SENTINEL >> 32: "priority_fee",
+}
+_U64 = struct.Struct("<Q")
+
+
+@dataclass(frozen=True)
+class PatchSlot:
+    """A u64 at `offset` in the serialized message: value = field + delta."""
+
+    offset: int
+    field: str
+    delta: int = 0
+
+
+def _read_shortvec(buf: bytes, pos: int) -> tuple[int, int]:
+    """Decode a compact-u16 length. Returns (value, next position)."""
+    value = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def message_layout(raw: bytes) -> tuple[int, list[tuple[int, int]]]:
+    """Byte layout of a serialized legacy message.
+
+    Returns:
+        (blockhash offset, [(data offset, data length) per instruction])
+    """
+    n_keys, pos = _read_shortvec(raw, 3)
+    blockhash_offset = pos + 32 * n_keys
+    n_ixs, pos = _read_shortvec(raw, blockhash_offset + 32)
+    data_spans = []
+    for _ in range(n_ixs):
+        pos += 1  # program id index
+        n_accounts, pos = _read_shortvec(raw, pos)
+        pos += n_accounts
+        data_len, pos = _read_shortvec(raw, pos)
+        data_spans.append((pos, data_len))
+        pos += data_len
+    return blockhash_offset, data_spans
+
+
+class TransactionTemplate:
+    """Serialized message skeleton with patchable amount/fee/blockhash slots."""
+
+    def __init__(
+        self,
+        message: Message,
+        slots: list[PatchSlot],
+        shape: tuple = (),
+        has_tip: bool = False,
+        priority_accounts: Optional[list[Pubkey]] = None,
+    ):
+        self.skeleton = bytes(message)
+        if self.skeleton[0] != 1:
+            raise ValueError("Templates support a single signer (fee payer) only")
+        self.blockhash_offset, _ = message_layout(self.skeleton)
+        self.slots = tuple(slots)
+        self.shape = shape
+        self.has_tip = has_tip
+        self.priority_accounts = priority_accounts or []
+        self.payer = message.account_keys[0]
+        self.renders = 0
+
+    @classmethod
+    def compile(
+        cls,
+        instructions: list[Instruction],
+        payer: Pubkey,
+        *,
+        compute_unit_limit: int,
+        account_data_size_limit: int | None = None,
+        tip_instruction: Instruction | None = None,
+        shape: tuple = (),
+        priority_accounts: Optional[list[Pubkey]] = None,
+    ) -> "TransactionTemplate":
+        """Compile sentinel-valued buy instructions into a template.
+
+        Instruction order matches ``SolanaClient.build_and_send_transaction``:
+        [data size limit], CU limit, CU price, buy instructions, [Jito tip].
+
+        Raises:
+            ValueError: If the amount or min-out sentinel is not found.
+        """
+        prefix = []
+        if account_data_size_limit is not None:
+            from core.client import set_loaded_accounts_data_size_limit
+
+            prefix.append(set_loaded_accounts_data_size_limit(account_data_size_limit))
+        prefix.append(set_compute_unit_limit(compute_unit_limit))
+        prefix.append(set_compute_unit_price(FEE_SENTINEL))
+        all_ixs = prefix + list(instructions)
+        if tip_instruction is not None:
+            all_ixs.append(tip_instruction)
+
+        message = Message(all_ixs, payer)
+        raw = bytes(message)
+        _, spans = message_layout(raw)
+
+        slots = []
+        for start, length in spans:
+            data = raw[start:start + length]
+            for i in range(length - 7):
+                (value,) = _U64.unpack_from(data, i)
+                field = _SENTINELS.get(value >> 32)
+                if field is not None:
+                    slots.append(PatchSlot(start + i, field, value & 0xFFFFFFFF))
+
+        found = {slot.field for slot in slots}
+        missing = {"amount_in", "minimum_amount_out", "priority_fee"} - found
+        if missing:
+            raise ValueError(f"Template slots not found: {sorted(missing)}")
+
+        return cls(
+            message,
+            slots,
+            shape=shape,
+            has_tip=tip_instruction is not None,
+            priority_accounts=priority_accounts,
+        )
+
+    def render_message(
+        self,
+        blockhash: Hash,
+        amount_in: int,
+        minimum_amount_out: int,
+        priority_fee: int = 0,
+    ) -> bytes:
+        """Patch the skeleton with this attempt's values."""
+        values = {
+            "amount_in": amount_in,
+            "minimum_amount_out": minimum_amount_out,
+            "priority_fee": priority_fee,
+        }
+        buf = bytearray(self.skeleton)
+        buf[self.blockhash_offset:self.blockhash_offset + 32] = bytes(blockhash)
+        for slot in self.slots:
+            _U64.pack_into(buf, slot.offset, values[slot.field] + slot.delta)
+        return bytes(buf)
+
+    def render(
+        self,
+        signer: Keypair,
+        blockhash: Hash,
+        amount_in: int,
+        minimum_amount_out: int,
+        priority_fee: int = 0,
+    ) -> Transaction:
+        """Patch, sign and wrap as a Transaction ready for send."""
+        if signer.pubkey() != self.payer:
+            raise ValueError("Signer does not match template fee payer")
+        message = self.render_message(blockhash, amount_in, minimum_amount_out, priority_fee)
+        self.renders += 1
+        return Transaction.from_bytes(b"\x01" + bytes(signer.sign_message(message)) + message)
+
+
+async def build_buy_template(
+    instruction_builder,
+    address_provider,
+    token_info,
+    user: Pubkey,
+    *,
+    compute_unit_limit: int,
+    account_data_size_limit: int | None = None,
+    tip_instruction: Instruction | None = None,
+    shape: tuple = (),
+) -> TransactionTemplate:
+    """Compile a buy template from the platform's regular instruction builder."""
+    instructions = await instruction_builder.build_buy_instruction(
+        token_info, user, AMOUNT_SENTINEL, MIN_OUT_SENTINEL, address_provider
+    )
+    priority_accounts = instruction_builder.get_required_accounts_for_buy(
+        token_info, user, address_provider
+    )
+    return TransactionTemplate.compile(
+        instructions,
+        user,
+        compute_unit_limit=compute_unit_limit,
+        account_data_size_limit=account_data_size_limit,
+        tip_instruction=tip_instruction,
+        shape=shape,
+        priority_accounts=priority_accounts,
+    )
+
+
+class TxTemplateCache:
+    """LRU of buy templates keyed by (platform, mint, wallet)."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._templates: OrderedDict[tuple, TransactionTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple, shape: tuple = ()) -> Optional[TransactionTemplate]:
+        """Template for key if it was compiled for the same shape."""
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None or template.shape != shape:
+                self.misses += 1
+                return None
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return template
+
+    def put(self, key: tuple, template: TransactionTemplate) -> None:
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_entries:
+                self._templates.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: tuple) -> None:
+        with self._lock:
+            self._templates.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._templates),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": f"{(self.hits / total * 100) if total else 0:.1f}%",
+        }
+
+
+_cache: Optional[TxTemplateCache] = None
+
+
+def get_tx_template_cache() -> TxTemplateCache:
+    """Process-wide transaction template cache."""
+    global _cache
+    if _cache is None:
+        _cache = TxTemplateCache()
+    return _cache
@@ -38,8 +38,7 @@ from datetime import datetime
 from typing import Callable, Optional, Any
 from enum import Enum
 
-from solana.rpc.async_api import AsyncClient
-from solders.signature import Signature
+from core.confirmation_service import get_confirmation_service
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +81,6 @@ class TxVerifier:
     
     # Configuration
     INITIAL_DELAY = 0.8  # Wait before first check (TX lands in ~400-800ms)
-    CHECK_INTERVAL = 0.2  # Check every 200ms for faster confirmation
     MAX_WAIT = 15.0  # Max time to wait for confirmation
     MAX_QUEUE_SIZE = 100  # Prevent memory issues
     
@@ -259,44 +257,26 @@ class TxVerifier:
     
     async def _check_confirmation(self, tx: PendingTransaction) -> tuple[bool, Optional[str]]:
         """
-        Check if transaction is confirmed on-chain.
+        Check if transaction is confirmed on-chain (via the shared
+        ConfirmationService: batched polling + geyser early resolve).
         
         Returns:
             (True, None) - Confirmed successfully
             (False, error_message) - Failed or timeout
         """
         try:
-            async with AsyncClient(tx.rpc_endpoint) as client:
-                sig = Signature.from_string(tx.signature)
-                start_time = asyncio.get_event_loop().time()
-                
-                while asyncio.get_event_loop().time() - start_time < self.MAX_WAIT:
-                    try:
-                        resp = await client.get_signature_statuses([sig])
-                        
-                        if resp.value and resp.value[0]:
-                            status = resp.value[0]
-                            
-                            # Check for on-chain error
-                            if status.err:
-                                return False, f"TX failed on-chain: {status.err}"
-                            
-                            # Check confirmation status
-                            if status.confirmation_status:
-                                conf_str = str(status.confirmation_status).lower()
-                                if "confirmed" in conf_str or "finalized" in conf_str:
-                                    return True, None
-                                    
-                    except Exception as e:
-                        logger.debug(f"[TxVerifier] Status check error: {e}")
-                    
-                    await asyncio.sleep(self.CHECK_INTERVAL)
-                
-                return False, f"Confirmation timeout after {self.MAX_WAIT}s"
-                
+            outcome = await get_confirmation_service(tx.rpc_endpoint).wait(
+                tx.signature, commitment="confirmed", timeout=self.MAX_WAIT
+            )
+            if outcome.success:
+                return True, None
+            if outcome.landed:
+                return False, f"TX failed on-chain: {outcome.err}"
+            return False, f"Confirmation timeout after {self.MAX_WAIT}s"
+
         except Exception as e:
             return False, f"Verification error: {e}"
-    
+
     def get_stats(self) -> dict:
         """Get verification statistics."""
         return {
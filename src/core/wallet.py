@@ -5,8 +5,8 @@ Wallet management for Solana transactions.
 import base58
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
-from spl.token.instructions import get_associated_token_address
 
+from core.pda_cache import get_associated_token_address
 from core.pubkeys import SystemAddresses
 
 
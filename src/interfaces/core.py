@@ -6,7 +6,7 @@ must implement to enable unified trading operations across different protocols.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -22,6 +22,78 @@ class Platform(Enum):
     BAGS = "bags"
 
 
+# Kept local (same values as core.pubkeys) so interfaces stay import-light
+_LAMPORTS_PER_SOL = 1_000_000_000
+_TOKEN_DECIMALS = 6
+
+
+@dataclass(frozen=True, slots=True)
+class CurveSnapshot:
+    """Immutable bonding curve / pool state captured from ONE account read.
+
+    Fetch it once per decision (CurveManager.get_curve_snapshot), or build it
+    from account bytes already in hand (snapshot_from_account_data, geyser
+    updates), then do all quote/slippage math on it without further RPC.
+
+    base_reserves / quote_reserves are the reserves the platform prices with
+    (pump.fun virtual token/SOL, LetsBonk virtual base/quote, BAGS base/quote).
+    """
+
+    platform: Platform
+    base_reserves: int
+    quote_reserves: int
+    real_base_reserves: int = 0
+    real_quote_reserves: int = 0
+    complete: bool = False
+    creator: str | None = None
+    pool_address: Pubkey | None = None
+    slot: int = 0
+    token_decimals: int = _TOKEN_DECIMALS
+    # Full decoded platform state (as returned by get_pool_state)
+    state: dict[str, Any] | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def reserves(self) -> tuple[int, int]:
+        """(base_reserves, quote_reserves) in raw units."""
+        return self.base_reserves, self.quote_reserves
+
+    def price(self) -> float:
+        """Token price in SOL (quote per base, decimal-adjusted)."""
+        if self.base_reserves <= 0 or self.quote_reserves <= 0:
+            raise ValueError("Invalid reserve state")
+        return (self.quote_reserves / self.base_reserves) * (10**self.token_decimals) / _LAMPORTS_PER_SOL
+
+    def buy_amount_out(self, amount_in: int) -> int:
+        """Raw tokens received for amount_in lamports (constant product)."""
+        denominator = self.quote_reserves + amount_in
+        if denominator == 0:
+            return 0
+        return (amount_in * self.base_reserves) // denominator
+
+    def sell_amount_out(self, amount_in: int) -> int:
+        """Lamports received for amount_in raw tokens (constant product)."""
+        denominator = self.base_reserves + amount_in
+        if denominator == 0:
+            return 0
+        return (amount_in * self.quote_reserves) // denominator
+
+    def min_amount_out(self, amount_out: int, slippage: float) -> int:
+        """amount_out reduced by slippage (0.25 = 25%)."""
+        return int(amount_out * (1 - slippage))
+
+    def progress(self, target_quote_sol: float = 85.0) -> dict[str, Any]:
+        """Completion progress, estimated from real quote raised vs target."""
+        sol_raised = self.real_quote_reserves / _LAMPORTS_PER_SOL
+        return {
+            "complete": self.complete,
+            "sol_raised": sol_raised,
+            "estimated_target_sol": target_quote_sol,
+            "progress_percentage": min((sol_raised / target_quote_sol) * 100, 100.0),
+            "tokens_available": self.base_reserves / 10**self.token_decimals,
+            "market_cap_sol": sol_raised,
+        }
+
+
 @dataclass
 class TokenInfo:
     """Enhanced token information with platform support."""
@@ -306,6 +378,37 @@ class CurveManager(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_curve_snapshot(self, pool_address: Pubkey) -> CurveSnapshot:
+        """Read the pool/curve account ONCE and return an immutable snapshot.
+
+        Args:
+            pool_address: Address of the pool/curve
+
+        Returns:
+            CurveSnapshot for price, amount-out and progress math
+        """
+        pass
+
+    @abstractmethod
+    def snapshot_from_account_data(
+        self, pool_address: Pubkey | None, data: bytes, slot: int = 0
+    ) -> CurveSnapshot:
+        """Build a snapshot from raw account bytes already in hand (no RPC).
+
+        Args:
+            pool_address: Address of the pool/curve (if known)
+            data: Raw account data including the discriminator
+            slot: Slot the data was observed at (0 if unknown)
+
+        Returns:
+            CurveSnapshot decoded from data
+
+        Raises:
+            ValueError: If the data cannot be decoded
+        """
+        pass
+
 
 class EventParser(ABC):
     """Abstract interface for parsing platform-specific token creation events."""
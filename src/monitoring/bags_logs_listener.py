@@ -8,20 +8,21 @@ This listener:
 1. Subscribes to logsSubscribe for Meteora DBC program
 2. When a log mentions the program, fetches the full transaction
 3. Parses the transaction to extract token creation data
+
+The websocket reader only prefilters frames; tokens that cannot be parsed
+from the logs are fetched and parsed by a TxFetchPipeline worker pool.
 """
 
 import asyncio
-import base64
 import json
 from collections.abc import Awaitable, Callable
 
 import websockets
-from solana.rpc.async_api import AsyncClient
-from solders.signature import Signature
 from solders.transaction import VersionedTransaction
 
 from interfaces.core import Platform, TokenInfo
 from monitoring.base_listener import BaseTokenListener
+from monitoring.logs_tx_pipeline import TxFetchPipeline, parse_program_creation
 from platforms.bags.address_provider import BagsAddresses
 from utils.logger import get_logger
 
@@ -89,100 +90,107 @@ class BagsLogsListener(BaseTokenListener):
             match_string: Optional filter string
             creator_address: Optional creator filter
         """
-        consecutive_errors = 0
-
-        while True:
-            try:
-                async with websockets.connect(
-                    self.wss_endpoint,
-                    ping_interval=30,  # Send ping every 30s
-                    ping_timeout=60,   # Wait 60s for pong (public Solana is slow)
-                    close_timeout=10,
-                ) as websocket:
-                    await self._subscribe_to_logs(websocket)
-                    ping_task = asyncio.create_task(self._ping_loop(websocket))
-                    consecutive_errors = 0
+        async def deliver(token_info: TokenInfo) -> None:
+            logger.info(
+                f"🎒 BAGS token detected: {token_info.name} ({token_info.symbol})"
+            )
 
-                    try:
-                        while True:
-                            token_info = await self._wait_for_token_creation(websocket)
-                            if not token_info:
-                                continue
-
-                            logger.info(
-                                f"🎒 BAGS token detected: {token_info.name} ({token_info.symbol})"
-                            )
-
-                            # Apply filters
-                            if match_string and not (
-                                match_string.lower() in token_info.name.lower()
-                                or match_string.lower() in token_info.symbol.lower()
-                            ):
-                                logger.info(
-                                    f"Token doesn't match '{match_string}', skipping"
-                                )
-                                continue
-
-                            if creator_address:
-                                creator_str = (
-                                    str(token_info.creator)
-                                    if token_info.creator
-                                    else ""
-                                )
-                                user_str = (
-                                    str(token_info.user) if token_info.user else ""
-                                )
-                                if creator_address not in [creator_str, user_str]:
-                                    logger.info(
-                                        f"Token not by {creator_address}, skipping"
-                                    )
-                                    continue
+            # Apply filters
+            if match_string and not (
+                match_string.lower() in token_info.name.lower()
+                or match_string.lower() in token_info.symbol.lower()
+            ):
+                logger.info(
+                    f"Token doesn't match '{match_string}', skipping"
+                )
+                return
 
-                            try:
-                                await asyncio.wait_for(
-                                    token_callback(token_info), timeout=30
-                                )
-                            except TimeoutError:
-                                logger.warning(
-                                    f"Callback timeout for {token_info.symbol}"
-                                )
-
-                    except websockets.exceptions.ConnectionClosed:
-                        logger.warning("WebSocket closed, reconnecting...")
-                    except asyncio.CancelledError:
-                        raise
-                    finally:
-                        ping_task.cancel()
-                        try:
-                            await ping_task
-                        except asyncio.CancelledError:
-                            pass
+            if creator_address:
+                creator_str = (
+                    str(token_info.creator)
+                    if token_info.creator
+                    else ""
+                )
+                user_str = (
+                    str(token_info.user) if token_info.user else ""
+                )
+                if creator_address not in [creator_str, user_str]:
+                    logger.info(
+                        f"Token not by {creator_address}, skipping"
+                    )
+                    return
 
-            except asyncio.CancelledError:
-                raise
+            try:
+                await asyncio.wait_for(
+                    token_callback(token_info), timeout=30
+                )
             except TimeoutError:
-                consecutive_errors += 1
                 logger.warning(
-                    f"Timeout (error {consecutive_errors}/{self.max_consecutive_errors})"
-                )
-            except Exception:
-                consecutive_errors += 1
-                logger.exception(
-                    f"Connection error ({consecutive_errors}/{self.max_consecutive_errors})"
+                    f"Callback timeout for {token_info.symbol}"
                 )
 
-            if consecutive_errors >= self.max_consecutive_errors:
-                if self.raise_on_max_errors:
-                    raise ConnectionError(
-                        f"BagsLogsListener failed after {consecutive_errors} errors"
+        # Two fetch workers: keeps the old ~2 getTransaction/s pacing for bags
+        pipeline = TxFetchPipeline(
+            self.rpc_endpoint, self._parse_transaction, deliver, workers=2, name="BAGS"
+        )
+        await pipeline.start()
+        consecutive_errors = 0
+
+        try:
+            while True:
+                try:
+                    async with websockets.connect(
+                        self.wss_endpoint,
+                        ping_interval=30,  # Send ping every 30s
+                        ping_timeout=60,   # Wait 60s for pong (public Solana is slow)
+                        close_timeout=10,
+                    ) as websocket:
+                        await self._subscribe_to_logs(websocket)
+                        ping_task = asyncio.create_task(self._ping_loop(websocket))
+                        consecutive_errors = 0
+
+                        try:
+                            while True:
+                                await self._read_frame(websocket, pipeline)
+
+                        except websockets.exceptions.ConnectionClosed:
+                            logger.warning("WebSocket closed, reconnecting...")
+                        except asyncio.CancelledError:
+                            raise
+                        finally:
+                            ping_task.cancel()
+                            try:
+                                await ping_task
+                            except asyncio.CancelledError:
+                                pass
+
+                except asyncio.CancelledError:
+                    raise
+                except TimeoutError:
+                    consecutive_errors += 1
+                    logger.warning(
+                        f"Timeout (error {consecutive_errors}/{self.max_consecutive_errors})"
+                    )
+                except Exception:
+                    consecutive_errors += 1
+                    logger.exception(
+                        f"Connection error ({consecutive_errors}/{self.max_consecutive_errors})"
                     )
-                logger.error(f"Too many errors ({consecutive_errors}), waiting 30s...")
-                await asyncio.sleep(30)
-                consecutive_errors = 0
-            else:
-                backoff = min(5 * (2**consecutive_errors), 30)
-                logger.info(f"Reconnecting in {backoff}s...")
-                await asyncio.sleep(backoff)
+
+                if consecutive_errors >= self.max_consecutive_errors:
+                    if self.raise_on_max_errors:
+                        raise ConnectionError(
+                            f"BagsLogsListener failed after {consecutive_errors} errors"
+                        )
+                    logger.error(f"Too many errors ({consecutive_errors}), waiting 30s...")
+                    await asyncio.sleep(30)
+                    consecutive_errors = 0
+                else:
+                    backoff = min(5 * (2**consecutive_errors), 30)
+                    logger.info(f"Reconnecting in {backoff}s...")
+                    await asyncio.sleep(backoff)
+        finally:
+            await pipeline.stop()
 
     async def _subscribe_to_logs(self, websocket) -> None:
         """Subscribe to Meteora DBC program logs."""
@@ -233,21 +241,26 @@ class BagsLogsListener(BaseTokenListener):
         except asyncio.CancelledError:
             pass
 
-    async def _wait_for_token_creation(self, websocket) -> TokenInfo | None:
-        """Wait for and parse token creation from logs."""
+    async def _read_frame(self, websocket, pipeline: TxFetchPipeline) -> None:
+        """Read one log notification; emit or queue it if it creates a pool."""
         try:
             response = await asyncio.wait_for(websocket.recv(), timeout=60)
+
+            # Raw prefilter: swaps (the vast majority) are dropped without JSON decoding
+            if "InitializeVirtualPoolWithSplToken" not in response:
+                return
+
             data = json.loads(response)
 
             if data.get("method") != "logsNotification":
-                return None
+                return
 
             log_data = data["params"]["result"]["value"]
             logs = log_data.get("logs", [])
             signature = log_data.get("signature", "")
 
             if not signature:
-                return None
+                return
 
             # Check if this looks like a token creation
             # Look for "initialize" in logs or specific patterns for Meteora DBC
@@ -259,7 +272,7 @@ class BagsLogsListener(BaseTokenListener):
             )
 
             if not is_initialize:
-                return None
+                return
 
             logger.debug(f"Potential BAGS token creation detected: {signature[:16]}...")
 
@@ -268,12 +281,11 @@ class BagsLogsListener(BaseTokenListener):
                 logs, signature
             )
             if token_info:
-                return token_info
+                pipeline.emit(token_info)
+                return
 
             # If logs parsing failed, fetch full transaction
-            await asyncio.sleep(0.5)  # Rate limit: max 2 req/sec
-            token_info = await self._fetch_and_parse_transaction(signature)
-            return token_info
+            pipeline.submit(signature)
 
         except TimeoutError:
             logger.debug("No logs for 60s")
@@ -284,82 +296,11 @@ class BagsLogsListener(BaseTokenListener):
         except Exception:
             logger.exception("Error processing log")
 
-        return None
-
-    async def _fetch_and_parse_transaction(self, signature: str) -> TokenInfo | None:
-        """Fetch transaction and parse token creation data."""
-        try:
-            async with AsyncClient(self.rpc_endpoint) as client:
-                # Convert string signature to Signature object
-                sig = Signature.from_string(signature)
-
-                # Fetch transaction with full encoding
-                response = await client.get_transaction(
-                    sig,
-                    encoding="base64",
-                    max_supported_transaction_version=0,
-                )
-
-                if not response.value:
-                    logger.debug(f"Transaction not found: {signature[:16]}...")
-                    return None
-
-                tx = response.value
-
-                # Get transaction data
-                tx_data = tx.transaction
-                if hasattr(tx_data, "transaction"):
-                    # Versioned transaction response
-                    raw_tx = tx_data.transaction
-                else:
-                    raw_tx = tx_data
-
-                # Decode if base64
-                if isinstance(raw_tx, str):
-                    raw_tx = base64.b64decode(raw_tx)
-                elif hasattr(raw_tx, "__iter__") and not isinstance(raw_tx, bytes):
-                    raw_tx = bytes(raw_tx)
-
-                # Parse transaction
-                try:
-                    transaction = VersionedTransaction.from_bytes(raw_tx)
-                except Exception:
-                    logger.debug("Failed to parse as VersionedTransaction")
-                    return None
-
-                # Extract account keys
-                account_keys = list(transaction.message.account_keys)
-
-                # Find and parse Meteora DBC instructions
-                for ix in transaction.message.instructions:
-                    program_idx = ix.program_id_index
-                    if program_idx >= len(account_keys):
-                        continue
-
-                    program_id = account_keys[program_idx]
-                    if str(program_id) != self.program_id:
-                        continue
-
-                    # Convert account keys to bytes
-                    account_keys_bytes = [bytes(key) for key in account_keys]
-
-                    # Parse instruction
-                    token_info = (
-                        self.event_parser.parse_token_creation_from_instruction(
-                            bytes(ix.data),
-                            list(ix.accounts),
-                            account_keys_bytes,
-                        )
-                    )
-
-                    if token_info:
-                        logger.info(
-                            f"Parsed BAGS token: {token_info.name} ({token_info.symbol})"
-                        )
-                        return token_info
-
-                return None
-
-        except Exception:
-            logger.exception(f"Failed to fetch/parse transaction: {signature[:16]}...")
-            return None
+    def _parse_transaction(self, transaction: VersionedTransaction) -> TokenInfo | None:
+        """Parse token creation from a fetched Meteora DBC transaction."""
+        token_info = parse_program_creation(transaction, self.program_id, self.event_parser)
+        if token_info:
+            logger.info(
+                f"Parsed BAGS token: {token_info.name} ({token_info.symbol})"
+            )
+        return token_info
@@ -6,7 +6,7 @@ migrates to DAMM v2 when the bonding curve reaches its threshold.
 
 This module:
 1. Monitors migration events from Meteora DBC program
-2. Tracks old pool -> new pool mappings
+2. Tracks old pool -> new pool mappings (persisted in trading/pool_index.py)
 3. Triggers fallback to Jupiter/DAMM v2 for migrated tokens
 """
 
@@ -117,7 +117,30 @@ class BagsMigrationTracker:
             New pool address if migrated, None otherwise
         """
         info = self.migrations.get(base_mint)
-        return info.new_pool if info else None
+        if info:
+            return info.new_pool
+        # Migrations seen before a restart live on in the pool index
+        try:
+            from trading.pool_index import DEX_METEORA_DAMM_V2, get_pool_index
+
+            entry = get_pool_index().get(base_mint)
+            if entry and entry.dex == DEX_METEORA_DAMM_V2:
+                return Pubkey.from_string(entry.pool)
+        except Exception as e:
+            logger.debug(f"Pool index lookup failed: {e}")
+        return None
+
+    def _index_pool(self, info: MigrationInfo) -> None:
+        """Persist base mint -> DAMM v2 pool in the pool index."""
+        try:
+            from trading.pool_index import DEX_METEORA_DAMM_V2, get_pool_index
+
+            get_pool_index().put(
+                str(info.base_mint), str(info.new_pool), DEX_METEORA_DAMM_V2,
+                source="bags_migration",
+            )
+        except Exception as e:
+            logger.debug(f"Pool index update failed: {e}")
 
     async def start(self) -> None:
         """Start monitoring for migrations."""
@@ -267,6 +290,7 @@ class BagsMigrationTracker:
                 # Store migration
                 base_mint_str = str(base_mint)
                 self.migrations[base_mint_str] = migration_info
+                self._index_pool(migration_info)
 
                 logger.info("[OK] Migration recorded:")
                 logger.info(f"   Base mint: {base_mint}")
@@ -0,0 +1,141 @@
+"""
+Bounded, insertion-ordered dedup cache for signatures and mints.
+
+Replaces the ``set`` + ``set(list(s)[-N:])`` pattern used by the whale
+receivers. That trim copied up to 2N strings on the hot path and evicted
+arbitrary entries (set order is not insertion order).
+
+Layout:
+- ``deque`` of 64-bit key hashes in insertion order (FIFO)
+- parallel ``deque`` of monotonic timestamps when a TTL is set
+- ``set[int]`` of live hashes for O(1) membership (shares the int objects
+  with the order deque, so each entry costs one small int + two slots)
+
+Insert, check and expire are O(1) amortized. Eviction is true FIFO (oldest
+first) on overflow and on TTL expiry. Only the 64-bit hash is retained, not
+the 88-char signature string; a false "duplicate" needs a 64-bit collision
+inside the window (~1e-8 at 1M entries).
+"""
+
+import time
+from collections import deque
+from typing import Hashable, Optional
+
+
+class DedupCache:
+    """FIFO/TTL-bounded "seen before?" set keyed by 64-bit hashes.
+
+    Usage:
+        seen = DedupCache(maxsize=10_000)
+        if not seen.add(signature):
+            return  # duplicate
+
+    Args:
+        maxsize: Ring capacity. Oldest entry is evicted when full.
+        ttl: Optional max age in seconds. Expired entries are dropped from
+             the head of the ring on every add/check.
+        track_source: Remember who inserted each key (see ``source_of``).
+    """
+
+    __slots__ = (
+        "_maxsize", "_ttl", "_order", "_times", "_live", "_sources",
+        "hits", "inserts", "evicted", "expired",
+    )
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: Optional[float] = None,
+        track_source: bool = False,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._order: deque[int] = deque()
+        self._times: Optional[deque[float]] = deque() if ttl is not None else None
+        self._live: set[int] = set()
+        self._sources: Optional[dict[int, str]] = {} if track_source else None
+        self.hits = 0
+        self.inserts = 0
+        self.evicted = 0
+        self.expired = 0
+
+    def add(self, key: Hashable, source: str = "") -> bool:
+        """Insert key. Returns True if it was new, False if already seen."""
+        h = hash(key)
+        live = self._live
+        if self._times is not None:
+            now = time.monotonic()
+            self._expire(now)
+        if h in live:
+            self.hits += 1
+            return False
+        order = self._order
+        if len(order) >= self._maxsize:
+            self._pop_oldest()
+            self.evicted += 1
+        order.append(h)
+        live.add(h)
+        if self._times is not None:
+            self._times.append(now)
+        if self._sources is not None:
+            self._sources[h] = source
+        self.inserts += 1
+        return True
+
+    def __contains__(self, key: Hashable) -> bool:
+        if self._times is not None:
+            self._expire(time.monotonic())
+        return hash(key) in self._live
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def source_of(self, key: Hashable) -> str:
+        """Source recorded by the first ``add`` (requires track_source=True)."""
+        if self._sources is None:
+            return ""
+        return self._sources.get(hash(key), "")
+
+    def expire(self) -> int:
+        """Drop TTL-expired entries now. Returns number removed."""
+        if self._times is None:
+            return 0
+        before = len(self._order)
+        self._expire(time.monotonic())
+        return before - len(self._order)
+
+    def clear(self) -> None:
+        self._order.clear()
+        self._live.clear()
+        if self._times is not None:
+            self._times.clear()
+        if self._sources is not None:
+            self._sources.clear()
+
+    def _pop_oldest(self) -> None:
+        h = self._order.popleft()
+        self._live.discard(h)
+        if self._times is not None:
+            self._times.popleft()
+        if self._sources is not None:
+            self._sources.pop(h, None)
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self._ttl
+        times = self._times
+        while times and times[0] < cutoff:
+            self._pop_oldest()
+            self.expired += 1
+
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self._order),
+            "maxsize": self._maxsize,
+            "ttl": self._ttl,
+            "hits": self.hits,
+            "inserts": self.inserts,
+            "evicted": self.evicted,
+            "expired": self.expired,
+        }
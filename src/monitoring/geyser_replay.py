@@ -0,0 +1,270 @@
+"""
+Geyser record / replay for offline latency benchmarking.
+
+Recorder: WhaleGeyserReceiver appends every raw SubscribeUpdate it receives
+to GEYSER_RECORD_FILE (unset = off). Recording format:
+
+    b"GSRREC1\\n"                                  magic
+    [u32 LE payload length][i64 LE receive offset ns][serialized SubscribeUpdate] ...
+
+Plain length-prefixed streams without the magic (tests/unit/geyser_fixtures.py)
+are read too; their messages carry no timing and replay back-to-back.
+
+Sliced account data (geyser_subscriptions shards) is re-aligned to account
+offsets before it is written.
+
+Replay: ReplayGeyserServicer implements the Geyser Subscribe RPC and streams
+a recording, filtered and sliced per stream like Yellowstone, at recorded
+speed (speed=1.0), accelerated (speed=N) or as fast as possible (speed=0).
+Point a receiver at it with attach_replay() and the real
+_run_stream_instance -> LocalTxParser -> _emit_from_local_parse pipeline
+runs unchanged, with no Yellowstone endpoint.
+"""
+
+import asyncio
+import os
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Iterator
+
+import base58
+from grpc import aio as grpc_aio
+
+from geyser.generated import geyser_pb2, geyser_pb2_grpc
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+RECORDING_MAGIC = b"GSRREC1\n"
+
+_TIMED = struct.Struct("<Iq")
+_PLAIN = struct.Struct("<I")
+
+
+class GeyserRecorder:
+    """Appends raw SubscribeUpdate messages with receive offsets to a file."""
+
+    def __init__(self, path: str | os.PathLike, flush_every: int = 256):
+        self.path = str(path)
+        self.flush_every = flush_every
+        self.count = 0
+        self._t0_ns = time.monotonic_ns()
+        self._fh = open(self.path, "wb")
+        self._fh.write(RECORDING_MAGIC)
+
+    def record(self, update, data_offset: int = 0) -> None:
+        """Record one update (call right after it is received).
+
+        data_offset: account offset of data[0] on sliced account streams.
+        Sliced data is re-aligned (zero-filled prefix) so recordings always
+        hold account-layout data and replay can re-slice it per subscriber.
+        """
+        if self._fh is None:
+            return
+        if data_offset and update.HasField("account"):
+            aligned = geyser_pb2.SubscribeUpdate()
+            aligned.CopyFrom(update)
+            aligned.account.account.data = bytes(data_offset) + update.account.account.data
+            update = aligned
+        payload = update.SerializeToString()
+        self._fh.write(_TIMED.pack(len(payload), time.monotonic_ns() - self._t0_ns))
+        self._fh.write(payload)
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            logger.info(f"[GEYSER-REPLAY] Recorded {self.count} updates to {self.path}")
+
+
+def read_recording(path: str | os.PathLike) -> Iterator[tuple[float, bytes]]:
+    """Yield (receive offset seconds, serialized payload) from a recording.
+
+    Untimed length-prefixed streams yield offset 0.0 for every message.
+    A torn final record is ignored.
+    """
+    with open(path, "rb") as f:
+        timed = f.read(len(RECORDING_MAGIC)) == RECORDING_MAGIC
+        if not timed:
+            f.seek(0)
+        header = _TIMED if timed else _PLAIN
+        while True:
+            raw = f.read(header.size)
+            if len(raw) < header.size:
+                return
+            if timed:
+                size, offset_ns = header.unpack(raw)
+            else:
+                (size,), offset_ns = header.unpack(raw), 0
+            payload = f.read(size)
+            if len(payload) < size:
+                return
+            yield offset_ns / 1e9, payload
+
+
+def write_recording(path: str | os.PathLike, updates, interval: float = 0.0) -> int:
+    """Write SubscribeUpdate messages as a timed recording spaced by interval. Returns count."""
+    count = 0
+    with open(path, "wb") as f:
+        f.write(RECORDING_MAGIC)
+        for i, update in enumerate(updates):
+            payload = update.SerializeToString()
+            f.write(_TIMED.pack(len(payload), int(i * interval * 1e9)))
+            f.write(payload)
+            count += 1
+    return count
+
+
+def load_updates(path: str | os.PathLike) -> list[tuple[float, "geyser_pb2.SubscribeUpdate"]]:
+    """Parse a recording into (offset, SubscribeUpdate) pairs."""
+    updates = []
+    for offset, payload in read_recording(path):
+        update = geyser_pb2.SubscribeUpdate()
+        update.ParseFromString(payload)
+        updates.append((offset, update))
+    return updates
+
+
+@dataclass
+class ReplayStats:
+    """Send-side bookkeeping for one replay pass."""
+    sent: int = 0
+    pongs: int = 0
+    requests: int = 0
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    # update index -> time.monotonic() when it was first handed to gRPC
+    send_times: dict[int, float] = field(default_factory=dict)
+
+
+class _StreamFilter:
+    """Filters and slices of the latest SubscribeRequest on one stream."""
+
+    def __init__(self):
+        self.transactions = False
+        self.accounts: set[bytes] = set()
+        self.slices: list[tuple[int, int]] = []
+
+    def update(self, request) -> None:
+        self.transactions = len(request.transactions) > 0
+        self.accounts = {
+            base58.b58decode(addr) for f in request.accounts.values() for addr in f.account
+        }
+        self.slices = [(s.offset, s.length) for s in request.accounts_data_slice]
+
+    def apply(self, update):
+        """update as this stream would receive it, or None if filtered out."""
+        if update.HasField("transaction"):
+            return update if self.transactions else None
+        if update.HasField("account"):
+            if update.account.account.pubkey not in self.accounts:
+                return None
+            if self.slices:
+                data = update.account.account.data
+                sliced = geyser_pb2.SubscribeUpdate()
+                sliced.CopyFrom(update)
+                sliced.account.account.data = b"".join(data[o:o + n] for o, n in self.slices)
+                return sliced
+        return update
+
+
+class ReplayGeyserServicer(geyser_pb2_grpc.GeyserServicer):
+    """Fake Yellowstone Geyser: replays recorded updates on Subscribe.
+
+    Every Subscribe call replays the full recording once through that
+    stream's filters (transactions, account pubkeys, accounts_data_slice),
+    answering pings with pongs, then keeps the stream open until the client
+    disconnects (like a quiet live stream). `finished` is set once
+    `streams` Subscribe calls have sent their last update (a sharded
+    receiver opens one stream per shard - see attach_replay()).
+    """
+
+    def __init__(self, updates: list[tuple[float, object]], speed: float = 1.0, streams: int = 1):
+        self.updates = updates
+        self.speed = speed
+        self.streams = streams
+        self.stats = ReplayStats()
+        self.finished = asyncio.Event()
+        self.subscribe_requests: list = []
+        self._completed = 0
+
+    async def Subscribe(self, request_iterator, context):
+        pongs: asyncio.Queue = asyncio.Queue()
+        stream = _StreamFilter()
+        subscribed = asyncio.Event()
+        reader = asyncio.create_task(self._read_requests(request_iterator, pongs, stream, subscribed))
+        stats = self.stats
+        try:
+            await subscribed.wait()
+            started_at = time.monotonic()
+            stats.started_at = stats.started_at or started_at
+            for index, (offset, update) in enumerate(self.updates):
+                if self.speed > 0:
+                    delay = started_at + offset / self.speed - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                while not pongs.empty():
+                    yield pongs.get_nowait()
+                out = stream.apply(update)
+                if out is None:
+                    continue
+                stats.send_times.setdefault(index, time.monotonic())
+                stats.sent += 1
+                yield out
+            stats.finished_at = time.monotonic()
+            self._completed += 1
+            if self._completed >= self.streams:
+                self.finished.set()
+            logger.info(f"[GEYSER-REPLAY] Replayed {stats.sent} updates in {stats.finished_at - stats.started_at:.3f}s")
+            while True:
+                yield await pongs.get()
+        finally:
+            reader.cancel()
+
+    async def _read_requests(
+        self, request_iterator, pongs: asyncio.Queue, stream: _StreamFilter, subscribed: asyncio.Event
+    ) -> None:
+        try:
+            async for request in request_iterator:
+                self.stats.requests += 1
+                if request.HasField("ping"):
+                    self.stats.pongs += 1
+                    await pongs.put(geyser_pb2.SubscribeUpdate(
+                        pong=geyser_pb2.SubscribeUpdatePong(id=request.ping.id)
+                    ))
+                else:
+                    self.subscribe_requests.append(request)
+                    stream.update(request)
+                    subscribed.set()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"[GEYSER-REPLAY] Request stream closed: {e}")
+
+
+async def start_replay_server(
+    servicer: ReplayGeyserServicer, host: str = "127.0.0.1", port: int = 0
+) -> tuple[object, str]:
+    """Start an insecure local gRPC server for servicer. Returns (server, "host:port")."""
+    server = grpc_aio.server(options=[("grpc.max_send_message_length", 64 * 1024 * 1024)])
+    geyser_pb2_grpc.add_GeyserServicer_to_server(servicer, server)
+    bound = server.add_insecure_port(f"{host}:{port}")
+    await server.start()
+    return server, f"{host}:{bound}"
+
+
+def attach_replay(receiver, target: str) -> int:
+    """Point a WhaleGeyserReceiver at a local replay server (insecure, same stream sharding).
+
+    Returns the number of streams the receiver will open (ReplayGeyserServicer streams=).
+    """
+    from monitoring.whale_geyser import GrpcInstance
+
+    receiver._grpc_instances = receiver._shard_instances(
+        [GrpcInstance(name="replay", endpoint=target, api_key="", insecure=True)]
+    )
+    return len(receiver._grpc_instances)
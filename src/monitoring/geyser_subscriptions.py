@@ -0,0 +1,103 @@
+"""
+Sharded, incremental Geyser subscription filters.
+
+Before: every subscribe/unsubscribe (curve, vault, ATA, migration) rebuilt the
+full whale + vault + curve + ATA SubscribeRequest and pushed it to every
+stream, on the same stream that carries latency-critical whale transactions.
+
+Now filters are split into shards, each on its own stream:
+
+    tx     whale_tracker (transactions)             full transactions
+    curve  curve_tracker (bonding curve accounts)   data slice 8..49
+    token  vault_tracker + ata_tracker (SPL token)  data slice 64..72
+
+A request is only pushed to a stream when that stream's shard filter set
+actually changed, so a curve subscribe never touches the whale tx stream.
+Yellowstone applies accounts_data_slice to the whole request, which is why
+curve and token accounts need separate streams.
+
+Shard "all" is the legacy single-stream layout (no slicing).
+"""
+
+from geyser.generated import geyser_pb2
+
+SHARD_ALL = "all"
+SHARD_TX = "tx"
+SHARD_CURVE = "curve"
+SHARD_TOKEN = "token"
+
+SPLIT_SHARDS = (SHARD_TX, SHARD_CURVE, SHARD_TOKEN)
+
+# Filter name -> shard
+FILTER_SHARDS = {
+    "whale_tracker": SHARD_TX,
+    "curve_tracker": SHARD_CURVE,
+    "vault_tracker": SHARD_TOKEN,
+    "ata_tracker": SHARD_TOKEN,
+}
+
+# Shard -> (offset, length) of account data to stream.
+# Curve: virtual/real reserves + supply + complete flag (offsets 8..49).
+# Token: SPL token account amount (offsets 64..72).
+DATA_SLICES = {
+    SHARD_CURVE: (8, 41),
+    SHARD_TOKEN: (64, 8),
+}
+
+
+def slice_offset(shard: str) -> int:
+    """Account data offset of byte 0 in updates received on shard."""
+    return DATA_SLICES.get(shard, (0, 0))[0]
+
+
+class GeyserSubscriptionManager:
+    """Builds per-shard SubscribeRequests and tracks what each stream was sent."""
+
+    def __init__(self):
+        # stream name -> {filter name: frozenset(addresses)} last sent
+        self._sent: dict[str, dict[str, frozenset]] = {}
+        self.stats = {"pushed": 0, "skipped": 0}
+
+    @staticmethod
+    def shard_filters(shard: str, filters: dict[str, frozenset]) -> dict[str, frozenset]:
+        """Project the full filter set onto one shard."""
+        if shard == SHARD_ALL:
+            return dict(filters)
+        return {name: addrs for name, addrs in filters.items() if FILTER_SHARDS.get(name) == shard}
+
+    def build_request(self, shard: str, filters: dict[str, frozenset]):
+        """SubscribeRequest for shard (PROCESSED commitment, sliced if the shard has a slice)."""
+        request = geyser_pb2.SubscribeRequest()
+        for name, addrs in self.shard_filters(shard, filters).items():
+            if name == "whale_tracker":
+                tx_filter = request.transactions[name]
+                tx_filter.account_include.extend(addrs)
+                tx_filter.failed = False
+            elif addrs:
+                request.accounts[name].account.extend(addrs)
+        if shard in DATA_SLICES:
+            offset, length = DATA_SLICES[shard]
+            request.accounts_data_slice.append(
+                geyser_pb2.SubscribeRequestAccountsDataSlice(offset=offset, length=length)
+            )
+        # PROCESSED = fastest, see tx before full confirmation
+        request.commitment = geyser_pb2.CommitmentLevel.PROCESSED
+        return request
+
+    def request_if_changed(self, stream: str, shard: str, filters: dict[str, frozenset]):
+        """Request for stream if its shard filters changed since last sent, else None."""
+        wanted = self.shard_filters(shard, filters)
+        if self._sent.get(stream) == wanted:
+            self.stats["skipped"] += 1
+            return None
+        self._sent[stream] = wanted
+        self.stats["pushed"] += 1
+        return self.build_request(shard, filters)
+
+    def mark_sent(self, stream: str, shard: str, filters: dict[str, frozenset]) -> None:
+        """Record the filters sent on (re)connect."""
+        self._sent[stream] = self.shard_filters(shard, filters)
+
+    def forget(self, stream: str) -> None:
+        """Stream disconnected: next connect sends a full request."""
+        self._sent.pop(stream, None)
@@ -12,6 +12,8 @@ from typing import Optional
 
 import base58
 
+from monitoring.pubkey_index import build_pubkey_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -183,6 +185,84 @@ PUMP_FUN_SELL_DISCRIMINATOR = bytes([51, 230, 133, 164, 1, 127, 131, 173])
 
 SOL_MINT = "So11111111111111111111111111111111111111112"
 
+PUMP_FUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+PUMPSWAP_PROGRAM = "pAMMBay6oceH9fJKBRHGP5D4bD4sWpmSwMn52FMfXEA"
+PUMP_FUN_GLOBAL = "4wTV1YmiEkRvAtNtsSGPtUrqRYQMe5SKy2uB4Jjaxnjf"
+
+# Anchor emit_cpi! envelope: [8B anchor:event tag][8B event discriminator][data]
+ANCHOR_EVENT_TAG = bytes.fromhex("e445a52e51cb9a1d")
+TRADE_EVENT_DISC = bytes.fromhex("bddb7fd34ee661ee")
+
+
+# =============================================================================
+# Raw 32-byte pubkey index (zero-decode fast path)
+# gRPC delivers pubkeys as raw bytes — comparing bytes avoids a base58 encode
+# per account key. Only keys that end up in ParsedSwap are ever encoded.
+# =============================================================================
+
+def _b58(raw: bytes) -> str:
+    return base58.b58encode(raw).decode()
+
+
+DEX_PROGRAM_IDS_RAW: dict[bytes, str] = {
+    base58.b58decode(program_id): platform
+    for program_id, platform in DEX_PROGRAM_IDS.items()
+}
+PUMP_FUN_PROGRAM_RAW = base58.b58decode(PUMP_FUN_PROGRAM)
+PUMPSWAP_PROGRAM_RAW = base58.b58decode(PUMPSWAP_PROGRAM)
+PUMP_FUN_GLOBAL_RAW = base58.b58decode(PUMP_FUN_GLOBAL)
+
+
+class AccountKeys:
+    """Static + ALT-loaded account keys of a transaction.
+
+    Keys are kept as raw bytes. Indexing returns the base58 string, encoded on
+    first access and memoized, so ``account_keys[i]`` keeps working for code
+    that expects ``list[str]``. Use ``raw(i)`` for comparisons.
+
+    Order matches the runtime: static keys, then loaded_writable, then
+    loaded_readonly addresses.
+    """
+
+    __slots__ = ("_raw", "_encoded")
+
+    def __init__(self, msg, meta, eager: bool = False):
+        raw_keys = list(msg.account_keys)
+        if meta.loaded_writable_addresses:
+            raw_keys.extend(meta.loaded_writable_addresses)
+        if meta.loaded_readonly_addresses:
+            raw_keys.extend(meta.loaded_readonly_addresses)
+        self._raw: list[bytes] = raw_keys
+        self._encoded: dict[int, str] = {}
+        if eager:
+            for i, raw in enumerate(raw_keys):
+                self._encoded[i] = _b58(raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index: int) -> str:
+        encoded = self._encoded.get(index)
+        if encoded is None:
+            encoded = _b58(self._raw[index])
+            self._encoded[index] = encoded
+        return encoded
+
+    def raw(self, index: int) -> bytes:
+        """Raw 32-byte key at index, or b"" when out of range."""
+        if 0 <= index < len(self._raw):
+            return self._raw[index]
+        return b""
+
+    @property
+    def raw_keys(self) -> list[bytes]:
+        return self._raw
+
+    @property
+    def encoded_count(self) -> int:
+        """How many keys were base58-encoded (for benchmarks/diagnostics)."""
+        return len(self._encoded)
+
 
 # =============================================================================
 # Data classes
@@ -240,26 +320,44 @@ class LocalTxParser:
     Filtering is applied at parse time:
     - Tokens in COMPREHENSIVE_TOKEN_BLACKLIST are rejected
     - Additional blacklist can be passed via constructor (stablecoin_filter from YAML)
+
+    Zero-decode mode (default): account keys stay raw bytes, program IDs and
+    blacklisted mints are matched against pre-built bytes indexes, and only the
+    keys that end up in ParsedSwap are base58-encoded. ``zero_decode=False``
+    keeps the legacy behaviour (encode every key, string scan) for comparison.
     """
 
-    def __init__(self, extra_blacklist: set[str] | None = None):
+    def __init__(
+        self,
+        extra_blacklist: set[str] | None = None,
+        zero_decode: bool = True,
+    ):
         """
         Args:
             extra_blacklist: Additional token mints to blacklist
                              (e.g. from stablecoin_filter in bot config)
+            zero_decode: Use the raw-bytes fast path (see class docstring)
         """
         self.blacklist: set[str] = COMPREHENSIVE_TOKEN_BLACKLIST.copy()
         if extra_blacklist:
             self.blacklist.update(extra_blacklist)
+        self._blacklist_raw: frozenset[bytes] = build_pubkey_index(self.blacklist)
+        self.zero_decode = zero_decode
 
         self.stats = ParserStats()
 
         logger.info(
             f"[LOCAL_PARSER] Initialized with {len(self.blacklist)} blacklisted tokens "
             f"({len(COMPREHENSIVE_TOKEN_BLACKLIST)} built-in + "
-            f"{len(extra_blacklist) if extra_blacklist else 0} extra)"
+            f"{len(extra_blacklist) if extra_blacklist else 0} extra), "
+            f"zero_decode={zero_decode}"
         )
 
+    def _is_blacklisted_raw(self, mint_raw: bytes) -> bool:
+        if self.zero_decode:
+            return mint_raw in self._blacklist_raw
+        return _b58(mint_raw) in self.blacklist
+
     def parse(self, tx_update, fee_payer: str) -> Optional[ParsedSwap]:
         """
         Parse a gRPC SubscribeUpdateTransactionInfo into a ParsedSwap.
@@ -275,9 +373,9 @@ class LocalTxParser:
         self.stats.total_parsed += 1
 
         try:
-            # Extract signature
+            # Signature is encoded only once a swap is found (zero-decode)
             sig_bytes = bytes(tx_update.signature)
-            signature = base58.b58encode(sig_bytes).decode()
+            signature = "" if self.zero_decode else _b58(sig_bytes)
 
             meta = tx_update.meta
             msg = tx_update.transaction.message
@@ -287,30 +385,27 @@ class LocalTxParser:
                 return None
 
             # ------------------------------------------------------------------
-            # Step 1: Build account_keys list (static + loaded from ALT)
+            # Step 1: Account keys (static + loaded from ALT), kept as raw bytes
             # ------------------------------------------------------------------
-            account_keys: list[str] = []
-            for key_bytes in msg.account_keys:
-                account_keys.append(base58.b58encode(bytes(key_bytes)).decode())
-
-            # Add loaded addresses from Address Lookup Tables (ALTs)
-            # These are appended AFTER the static keys, in order:
-            # first loaded_writable, then loaded_readonly
-            if meta.loaded_writable_addresses:
-                for addr_bytes in meta.loaded_writable_addresses:
-                    account_keys.append(base58.b58encode(bytes(addr_bytes)).decode())
-            if meta.loaded_readonly_addresses:
-                for addr_bytes in meta.loaded_readonly_addresses:
-                    account_keys.append(base58.b58encode(bytes(addr_bytes)).decode())
+            account_keys = AccountKeys(msg, meta, eager=not self.zero_decode)
 
             # ------------------------------------------------------------------
             # Step 2: Detect DEX platform from account keys
             # ------------------------------------------------------------------
             platform = "unknown"
-            for key in account_keys:
-                if key in DEX_PROGRAM_IDS:
-                    platform = DEX_PROGRAM_IDS[key]
-                    break
+            if self.zero_decode:
+                for raw in account_keys.raw_keys:
+                    platform = DEX_PROGRAM_IDS_RAW.get(raw)
+                    if platform is not None:
+                        break
+                else:
+                    platform = "unknown"
+            else:
+                for i in range(len(account_keys)):
+                    key = account_keys[i]
+                    if key in DEX_PROGRAM_IDS:
+                        platform = DEX_PROGRAM_IDS[key]
+                        break
 
             # ------------------------------------------------------------------
             # Step 3: Try pump.fun discriminator first (most precise)
@@ -326,6 +421,8 @@ class LocalTxParser:
                     else:
                         self.stats.sells_detected += 1
                     self.stats.successful += 1
+                    if not result.signature:
+                        result.signature = _b58(sig_bytes)
                     return result
 
             # ------------------------------------------------------------------
@@ -342,6 +439,8 @@ class LocalTxParser:
                 else:
                     self.stats.sells_detected += 1
                 self.stats.successful += 1
+                if not result.signature:
+                    result.signature = _b58(sig_bytes)
                 return result
 
             self.stats.no_swap_detected += 1
@@ -353,7 +452,7 @@ class LocalTxParser:
             return None
 
     def _try_pump_discriminator(
-        self, msg, meta, account_keys: list[str],
+        self, msg, meta, account_keys: AccountKeys,
         signature: str, fee_payer: str
     ) -> Optional[ParsedSwap]:
         """
@@ -393,8 +492,6 @@ class LocalTxParser:
             # S12: Check inner instructions for Anchor CPI TradeEvent
             # pump.fun emits TradeEvent via emit_cpi! which wraps in Anchor event envelope
             # Layout: [8B anchor:event tag][8B event discriminator][event data...]
-            ANCHOR_EVENT_TAG = bytes.fromhex("e445a52e51cb9a1d")
-            TRADE_EVENT_DISC = bytes.fromhex("bddb7fd34ee661ee")
             if meta.inner_instructions:
                 for inner_group in meta.inner_instructions:
                     for ix in inner_group.instructions:
@@ -411,7 +508,10 @@ class LocalTxParser:
                             # Skip 16 bytes (8 anchor tag + 8 event discriminator)
                             _off = 16
                             _mint_bytes = _ixdata[_off:_off+32]
-                            _mint = base58.b58encode(_mint_bytes).decode()
+                            if self._is_blacklisted_raw(_mint_bytes):
+                                self.stats.blacklisted_skipped += 1
+                                return None
+                            _mint = _b58(_mint_bytes)
                             _off += 32
                             _sol_raw = struct.unpack("<Q", _ixdata[_off:_off+8])[0]
                             _sol_amount = _sol_raw / 1e9
@@ -427,10 +527,6 @@ class LocalTxParser:
                             _off += 8
                             _vtr = struct.unpack("<Q", _ixdata[_off:_off+8])[0]
 
-                            if _mint in self.blacklist:
-                                self.stats.blacklisted_skipped += 1
-                                return None
-
                             # S12: Validate reserves — pump.fun BC max is ~85 SOL (~85B lamports)
                             # and max tokens ~1.07T (1073000000000000)
                             _reserves_valid = (
@@ -463,17 +559,16 @@ class LocalTxParser:
                             _w_creator_vault = ""
                             _w_fee_recipient = ""
                             _w_assoc_bc = ""
-                            _PUMP_PROG = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
-                            _GLOBAL = "4wTV1YmiEkRvAtNtsSGPtUrqRYQMe5SKy2uB4Jjaxnjf"
                             _s14_found = False
                             try:
                                 # --- Pass 1: outer instructions (direct pump.fun TX) ---
                                 for _oix in msg.instructions:
                                     _oix_accs = list(_oix.accounts)
                                     if len(_oix_accs) >= 16:
-                                        _a0 = account_keys[_oix_accs[0]] if _oix_accs[0] < len(account_keys) else ""
-                                        _a11 = account_keys[_oix_accs[11]] if _oix_accs[11] < len(account_keys) else ""
-                                        if _a0 == _GLOBAL and _a11 == _PUMP_PROG:
+                                        if (
+                                            account_keys.raw(_oix_accs[0]) == PUMP_FUN_GLOBAL_RAW
+                                            and account_keys.raw(_oix_accs[11]) == PUMP_FUN_PROGRAM_RAW
+                                        ):
                                             if _oix_accs[1] < len(account_keys):
                                                 _w_fee_recipient = account_keys[_oix_accs[1]]
                                             if _oix_accs[4] < len(account_keys):
@@ -496,15 +591,12 @@ class LocalTxParser:
                                         for _iix in _ig.instructions:
                                             _iix_accs = list(_iix.accounts)
                                             # Inner CPI: program_id_index points to pump.fun in account_keys
-                                            _iix_prog_idx = _iix.program_id_index
-                                            _iix_prog = account_keys[_iix_prog_idx] if _iix_prog_idx < len(account_keys) else ""
-                                            if _iix_prog != _PUMP_PROG:
+                                            if account_keys.raw(_iix.program_id_index) != PUMP_FUN_PROGRAM_RAW:
                                                 continue
                                             if len(_iix_accs) < 10:
                                                 continue
                                             # Validate: first account should be GLOBAL
-                                            _ia0 = account_keys[_iix_accs[0]] if _iix_accs[0] < len(account_keys) else ""
-                                            if _ia0 != _GLOBAL:
+                                            if account_keys.raw(_iix_accs[0]) != PUMP_FUN_GLOBAL_RAW:
                                                 continue
                                             # Found pump.fun CPI with correct layout!
                                             if _iix_accs[1] < len(account_keys):
@@ -557,7 +649,7 @@ class LocalTxParser:
 
     def _check_pump_instruction(
         self, data: bytes, program_id_index: int,
-        account_keys: list[str], signature: str, fee_payer: str
+        account_keys: AccountKeys, signature: str, fee_payer: str
     ) -> Optional[ParsedSwap]:
         """Check single instruction for pump.fun discriminator."""
         data = bytes(data)
@@ -568,11 +660,7 @@ class LocalTxParser:
         # S13: DIAG removed (was S12, caused confusing logs)
 
         # Verify program is pump.fun
-        if program_id_index < len(account_keys):
-            prog = account_keys[program_id_index]
-            if prog != "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P":
-                return None
-        else:
+        if account_keys.raw(program_id_index) != PUMP_FUN_PROGRAM_RAW:
             return None
 
         discriminator = data[:8]
@@ -590,7 +678,6 @@ class LocalTxParser:
 
         offset = 8
         mint_bytes = data[offset:offset + 32]
-        mint = base58.b58encode(mint_bytes).decode()
         offset += 32
 
         sol_amount_raw = struct.unpack("<Q", data[offset:offset + 8])[0]
@@ -615,11 +702,12 @@ class LocalTxParser:
             offset += 8
             _vtr = struct.unpack("<Q", data[offset:offset + 8])[0]
 
-        # Blacklist check
-        if mint in self.blacklist:
+        # Blacklist check (raw bytes — mint is only encoded if it passes)
+        if self._is_blacklisted_raw(mint_bytes):
             self.stats.blacklisted_skipped += 1
-            logger.debug(f"[LOCAL_PARSER] Blacklisted token via discriminator: {mint[:16]}...")
+            logger.debug("[LOCAL_PARSER] Blacklisted token via discriminator")
             return None
+        mint = _b58(mint_bytes)
 
         return ParsedSwap(
             signature=signature,
@@ -634,7 +722,7 @@ class LocalTxParser:
         )
 
     def _parse_from_balances(
-        self, msg, meta, account_keys: list[str],
+        self, msg, meta, account_keys: AccountKeys,
         signature: str, fee_payer: str, platform: str
     ) -> Optional[ParsedSwap]:
         """
@@ -725,14 +813,14 @@ class LocalTxParser:
             if is_buy and sol_change_lamports > 0:
                 # Token increased but SOL also increased? Not a standard swap
                 logger.debug(
-                    f"[LOCAL_PARSER] Ambiguous: token+ but SOL+, skipping {signature[:16]}..."
+                    f"[LOCAL_PARSER] Ambiguous: token+ but SOL+, skipping {best_mint[:16]}..."
                 )
                 return None
 
             if not is_buy and sol_change_lamports < 0:
                 # Token decreased but SOL also decreased? Not a standard swap
                 logger.debug(
-                    f"[LOCAL_PARSER] Ambiguous: token- but SOL-, skipping {signature[:16]}..."
+                    f"[LOCAL_PARSER] Ambiguous: token- but SOL-, skipping {best_mint[:16]}..."
                 )
                 return None
 
@@ -769,7 +857,7 @@ class LocalTxParser:
             return None
 
     def _extract_pumpswap_accounts(
-        self, msg, meta, account_keys: list[str]
+        self, msg, meta, account_keys: AccountKeys
     ) -> tuple[str, str, str, str]:
         """S46: Extract PumpSwap pool, vault, and token_program accounts from whale TX.
 
@@ -790,7 +878,6 @@ class LocalTxParser:
 
         Returns (pool, base_vault, quote_vault, base_token_program) or ("","","","").
         """
-        _PUMPSWAP_PROG = "pAMMBay6oceH9fJKBRHGP5D4bD4sWpmSwMn52FMfXEA"
         _pool = ""
         _base_vault = ""
         _quote_vault = ""
@@ -817,9 +904,7 @@ class LocalTxParser:
 
         # Pass 1: outer instructions (direct PumpSwap TX)
         for _oix in msg.instructions:
-            _prog_idx = _oix.program_id_index
-            _prog = account_keys[_prog_idx] if _prog_idx < len(account_keys) else ""
-            if _prog != _PUMPSWAP_PROG:
+            if account_keys.raw(_oix.program_id_index) != PUMPSWAP_PROGRAM_RAW:
                 continue
             _oix_accs = list(_oix.accounts)
             if _try_extract(_oix_accs, "OUTER"):
@@ -829,9 +914,7 @@ class LocalTxParser:
         if meta.inner_instructions:
             for _ig in meta.inner_instructions:
                 for _iix in _ig.instructions:
-                    _prog_idx = _iix.program_id_index
-                    _prog = account_keys[_prog_idx] if _prog_idx < len(account_keys) else ""
-                    if _prog != _PUMPSWAP_PROG:
+                    if account_keys.raw(_iix.program_id_index) != PUMPSWAP_PROGRAM_RAW:
                         continue
                     _iix_accs = list(_iix.accounts)
                     if _try_extract(_iix_accs, "INNER CPI"):
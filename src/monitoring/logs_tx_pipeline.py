@@ -0,0 +1,209 @@
+"""
+Fetch pipeline for logsSubscribe listeners (bonk.fun, bags.fm).
+
+The logs listeners used to handle one notification at a time: on a
+creation log they slept (2s bonk / 0.5s bags), opened a fresh AsyncClient
+for one getTransaction and only then read the next websocket frame, so a
+burst of launches queued up behind each other.
+
+Now the websocket reader only prefilters frames and submits candidate
+signatures; a pool of workers fetches them over one persistent client:
+
+    pipeline = TxFetchPipeline(rpc_endpoint, parse_tx, deliver, name="BONK")
+    await pipeline.start()
+    pipeline.submit(signature)   # non-blocking, deduped
+    pipeline.emit(token_info)    # already parsed (e.g. from logs)
+    await pipeline.stop()
+
+getTransaction is retried at "confirmed" with short backoff
+(FETCH_RETRY_DELAYS) until the node has the transaction, instead of a
+fixed sleep before one attempt. Transient RPC errors (429, timeouts,
+resets) use the same backoff instead of dropping the candidate.
+"""
+
+import asyncio
+import base64
+from collections.abc import Awaitable, Callable
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+
+from interfaces.core import TokenInfo
+from monitoring.dedup_cache import DedupCache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FETCH_WORKERS = 4
+QUEUE_SIZE = 256
+# Delay before each getTransaction attempt (seconds); ~6.5s total
+FETCH_RETRY_DELAYS = (0.15, 0.25, 0.5, 1.0, 1.5, 3.0)
+
+
+def decode_transaction(tx) -> VersionedTransaction | None:
+    """VersionedTransaction from a base64 getTransaction value."""
+    tx_data = tx.transaction
+    raw_tx = tx_data.transaction if hasattr(tx_data, "transaction") else tx_data
+    if isinstance(raw_tx, VersionedTransaction):
+        return raw_tx
+    if isinstance(raw_tx, str):
+        raw_tx = base64.b64decode(raw_tx)
+    elif hasattr(raw_tx, "__iter__") and not isinstance(raw_tx, bytes):
+        raw_tx = bytes(raw_tx)
+    try:
+        return VersionedTransaction.from_bytes(raw_tx)
+    except Exception:
+        logger.debug("Failed to parse as VersionedTransaction")
+        return None
+
+
+def parse_program_creation(
+    transaction: VersionedTransaction, program_id: str, event_parser
+) -> TokenInfo | None:
+    """First token creation parsed from program_id's top-level instructions."""
+    account_keys = list(transaction.message.account_keys)
+    account_keys_bytes = None
+    for ix in transaction.message.instructions:
+        if ix.program_id_index >= len(account_keys):
+            continue
+        if str(account_keys[ix.program_id_index]) != program_id:
+            continue
+        if account_keys_bytes is None:
+            account_keys_bytes = [bytes(key) for key in account_keys]
+        token_info = event_parser.parse_token_creation_from_instruction(
+            bytes(ix.data), list(ix.accounts), account_keys_bytes
+        )
+        if token_info:
+            return token_info
+    return None
+
+
+class TxFetchPipeline:
+    """Bounded queue of signatures -> worker pool -> parsed TokenInfo -> deliver."""
+
+    def __init__(
+        self,
+        rpc_endpoint: str,
+        parse_tx: Callable[[VersionedTransaction], TokenInfo | None],
+        deliver: Callable[[TokenInfo], Awaitable[None]],
+        workers: int = FETCH_WORKERS,
+        queue_size: int = QUEUE_SIZE,
+        retry_delays: tuple[float, ...] = FETCH_RETRY_DELAYS,
+        name: str = "LOGS",
+    ):
+        self.rpc_endpoint = rpc_endpoint
+        self.parse_tx = parse_tx
+        self.deliver = deliver
+        self.workers = workers
+        self.retry_delays = retry_delays
+        self.name = name
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self._seen = DedupCache(maxsize=5_000)
+        self._client: AsyncClient | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._deliveries: set[asyncio.Task] = set()
+        self._stats = {
+            "submitted": 0, "duplicates": 0, "dropped": 0, "fetched": 0,
+            "not_found": 0, "parsed": 0, "retries": 0, "rpc_errors": 0, "errors": 0,
+        }
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._client = AsyncClient(self.rpc_endpoint, commitment=Confirmed)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"{self.name.lower()}-fetch-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        pending = [*self._tasks, *self._deliveries]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+        self._deliveries.clear()
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+    def submit(self, signature: str) -> bool:
+        """Queue a candidate signature; False if already seen or the queue is full."""
+        if not self._seen.add(signature):
+            self._stats["duplicates"] += 1
+            return False
+        try:
+            self._queue.put_nowait(signature)
+        except asyncio.QueueFull:
+            self._stats["dropped"] += 1
+            logger.warning(f"[{self.name}] Fetch queue full, dropping {signature[:16]}...")
+            return False
+        self._stats["submitted"] += 1
+        return True
+
+    def emit(self, token_info: TokenInfo) -> None:
+        """Deliver an already parsed token without blocking the caller."""
+        self._stats["parsed"] += 1
+        task = asyncio.create_task(self._deliver(token_info))
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(self, token_info: TokenInfo) -> None:
+        try:
+            await self.deliver(token_info)
+        except Exception:
+            logger.exception(f"[{self.name}] Token callback failed for {token_info.symbol}")
+
+    async def _worker(self) -> None:
+        while True:
+            signature = await self._queue.get()
+            try:
+                token_info = await self.fetch_and_parse(signature)
+                if token_info:
+                    self._stats["parsed"] += 1
+                    await self._deliver(token_info)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._stats["errors"] += 1
+                logger.exception(f"[{self.name}] Failed to fetch/parse transaction: {signature[:16]}...")
+            finally:
+                self._queue.task_done()
+
+    async def fetch_and_parse(self, signature: str) -> TokenInfo | None:
+        """getTransaction with backoff until the node has it, then parse."""
+        sig = Signature.from_string(signature)
+        last_error: Exception | None = None
+        for attempt, delay in enumerate(self.retry_delays):
+            await asyncio.sleep(delay)
+            if attempt:
+                self._stats["retries"] += 1
+            try:
+                response = await self._client.get_transaction(
+                    sig, encoding="base64", max_supported_transaction_version=0
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 429 / timeout / connection reset: back off like a miss
+                self._stats["rpc_errors"] += 1
+                last_error = e
+                logger.debug(f"[{self.name}] getTransaction failed for {signature[:16]}...: {e!r}")
+                continue
+            last_error = None
+            if response.value:
+                self._stats["fetched"] += 1
+                transaction = decode_transaction(response.value)
+                return self.parse_tx(transaction) if transaction else None
+        if last_error is not None:
+            self._stats["errors"] += 1
+            logger.warning(f"[{self.name}] Giving up on {signature[:16]}... after RPC errors: {last_error!r}")
+            return None
+        self._stats["not_found"] += 1
+        logger.info(f"[{self.name}] Transaction not found: {signature[:16]}...")
+        return None
+
+    def get_stats(self) -> dict:
+        return {**self._stats, "queued": self._queue.qsize()}
@@ -21,7 +21,7 @@ import os
 import struct
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 import base58
 
@@ -61,6 +61,8 @@ class MoonbagGrpcMonitor:
         self._vault_to_mint: dict[str, str] = {}
         # Prices: mint -> (price, timestamp)
         self._prices: dict[str, tuple[float, float]] = {}
+        # Push listeners (PositionMonitorEngine.publish): fn(mint, price, source)
+        self._price_listeners: list[Callable[[str, float, str], object]] = []
 
         self._stream_task: Optional[asyncio.Task] = None
         self._running = False
@@ -145,6 +147,11 @@ class MoonbagGrpcMonitor:
             return None
         return price
 
+    def add_price_listener(self, listener: Callable[[str, float, str], object]) -> None:
+        """Push every vault price change to listener(mint, price, source)."""
+        if listener not in self._price_listeners:
+            self._price_listeners.append(listener)
+
     def has_subscription(self, mint: str) -> bool:
         return mint in self._subscriptions
 
@@ -274,6 +281,12 @@ class MoonbagGrpcMonitor:
                 old_price = sub.price
                 sub.price = sub.quote_reserve / sub.base_reserve
                 self._prices[mint] = (sub.price, time.time())
+                if sub.price != old_price:
+                    for listener in self._price_listeners:
+                        try:
+                            listener(mint, sub.price, "moonbag_grpc")
+                        except Exception as e:
+                            logger.error(f"[MOONBAG-GRPC] Price listener error: {e}")
 
                 if old_price <= 0:
                     logger.warning(
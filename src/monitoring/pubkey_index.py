@@ -0,0 +1,96 @@
+"""
+Raw 32-byte pubkey indexes for gRPC hot paths.
+
+Yellowstone delivers pubkeys as raw bytes. Matching them against base58
+strings forces a pure-Python base58 encode per key, which dominates CPU on a
+busy stream. These helpers keep a bytes-keyed view so lookups are a single
+hash probe and only matching keys are ever encoded.
+"""
+
+from collections.abc import Iterable
+from typing import Optional
+
+import base58
+
+
+def pubkey_bytes(address: str) -> Optional[bytes]:
+    """Decode a base58 address to 32 raw bytes, or None if it is not a pubkey."""
+    try:
+        raw = base58.b58decode(address)
+    except ValueError:
+        return None
+    return raw if len(raw) == 32 else None
+
+
+def build_pubkey_index(addresses: Iterable[str]) -> frozenset[bytes]:
+    """Decode base58 addresses into a frozenset of raw 32-byte keys.
+
+    Entries that are not valid base58 pubkeys are skipped (they can never
+    match a real on-chain key anyway).
+    """
+    raw_keys = set()
+    for address in addresses:
+        raw = pubkey_bytes(address)
+        if raw is not None:
+            raw_keys.add(raw)
+    return frozenset(raw_keys)
+
+
+class PubkeyMap(dict):
+    """``dict[str, V]`` keyed by base58 address with a raw-bytes mirror.
+
+    Behaves like the plain dict it replaces (subscribe requests, cleanup and
+    logging keep using base58 keys), while ``get_raw`` serves the gRPC
+    dispatch loop straight from ``bytes(acct.pubkey)``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._raw: dict[bytes, object] = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key: str, value) -> None:
+        super().__setitem__(key, value)
+        raw = pubkey_bytes(key)
+        if raw is not None:
+            self._raw[raw] = value
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        raw = pubkey_bytes(key)
+        if raw is not None:
+            self._raw.pop(raw, None)
+
+    def pop(self, key: str, *default):
+        if key in self:
+            raw = pubkey_bytes(key)
+            if raw is not None:
+                self._raw.pop(raw, None)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        raw = pubkey_bytes(key)
+        if raw is not None:
+            self._raw.pop(raw, None)
+        return key, value
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self) -> None:
+        super().clear()
+        self._raw.clear()
+
+    def get_raw(self, raw: bytes, default=None):
+        """Lookup by raw 32-byte pubkey without base58 encoding."""
+        return self._raw.get(raw, default)
+
+    def contains_raw(self, raw: bytes) -> bool:
+        return raw in self._raw
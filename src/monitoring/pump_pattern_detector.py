@@ -18,21 +18,35 @@ Pump Pattern Detector - отслеживает паттерны перед па
 import asyncio
 import logging
 import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Callable
 
 import aiohttp
 
+from utils.market_data import TokenBucket, get_market_data_client
+from utils.timeseries import RingSeries
+
 logger = logging.getLogger(__name__)
 
 # API URLs
 BIRDEYE_API_URL = "https://public-api.birdeye.so"
-DEXSCREENER_API_URL = "https://api.dexscreener.com"  # FREE, no API key needed!
 DEXCHECK_API_URL = "https://api.dexcheck.ai"
 CODEX_API_URL = "https://graph.codex.io/graphql"
 GOLDRUSH_API_URL = "https://api.covalenthq.com/v1"
 
+# Refresh scheduler: urgency = (seconds since refresh / update_interval) * weight
+WHALE_ACTIVITY_WEIGHT = 4.0  # extra weight while a whale buy is inside whale_window
+MAX_VOLATILITY_WEIGHT = 3.0  # extra weight from |5m price change| / momentum threshold
+SCHEDULER_TICK = 0.25  # seconds between scheduling passes when nothing wakes it
+
+# History windows (seconds) and ring capacities
+SHORT_HISTORY_WINDOW = 600.0
+SHORT_HISTORY_SIZE = 50
+TRADE_HISTORY_WINDOW = 3600.0
+TRADE_HISTORY_SIZE = 720  # 1h of snapshots at the default 5s update interval
+
 
 @dataclass
 class TokenMetrics:
@@ -56,11 +70,12 @@ class TokenMetrics:
     # 1-hour accumulated trade data (from 5-min snapshots)
     buys_1h: int = 0
     sells_1h: int = 0
-    trade_history_5m: list = field(default_factory=list)  # [(timestamp, buys, sells)]
+    # columns: buys, sells (monotonic timestamps)
+    trade_history_5m: RingSeries = field(default_factory=lambda: RingSeries(TRADE_HISTORY_SIZE, 2))
 
-    # History for pattern detection
-    price_history: list = field(default_factory=list)
-    volume_history: list = field(default_factory=list)
+    # History for pattern detection (monotonic timestamps)
+    price_history: RingSeries = field(default_factory=lambda: RingSeries(SHORT_HISTORY_SIZE))
+    volume_history: RingSeries = field(default_factory=lambda: RingSeries(SHORT_HISTORY_SIZE))
 
     # Whale buys from whale tracker
     whale_buys: list = field(default_factory=list)
@@ -108,7 +123,9 @@ class PumpPatternDetector:
         extreme_buy_pressure_max_sells_5m: int = 200,  # <= 200 sells in 5min
         # Signal settings
         min_patterns_to_signal: int = 1,
-        update_interval: float = 5.0,  # seconds between updates
+        update_interval: float = 5.0,  # seconds between updates of a quiet token
+        max_concurrent_updates: int = int(os.getenv("PATTERN_MAX_CONCURRENT_UPDATES", "8")),
+        birdeye_rps: float = float(os.getenv("BIRDEYE_RPS", "2")),  # global Birdeye request budget
         # Ignored params for compatibility
         volume_window_seconds: int = 60,
         holder_growth_threshold: float = 0.5,
@@ -133,6 +150,8 @@ class PumpPatternDetector:
         self.min_whale_amount = min_whale_amount
         self.min_patterns_to_signal = min_patterns_to_signal
         self.update_interval = update_interval
+        self.max_concurrent_updates = max_concurrent_updates
+        self._birdeye_bucket = TokenBucket(birdeye_rps, burst=max(1, int(birdeye_rps)))
 
         # High Volume Sideways thresholds
         self.high_volume_buys_1h = high_volume_buys_1h
@@ -149,6 +168,10 @@ class PumpPatternDetector:
         self._session: aiohttp.ClientSession | None = None
         self._update_task: asyncio.Task | None = None
         self._running = False
+        self._refreshed_at: dict[str, float] = {}  # mint -> monotonic time of last refresh
+        self._refreshing: set[str] = set()
+        self._refresh_tasks: dict[str, asyncio.Task] = {}  # mint -> in-flight refresh
+        self._wake = asyncio.Event()
 
         # Log available APIs
         apis = []
@@ -187,12 +210,21 @@ class PumpPatternDetector:
         """Остановить отслеживание."""
         if mint in self.tokens:
             del self.tokens[mint]
+        self._refreshed_at.pop(mint, None)
+        task = self._refresh_tasks.pop(mint, None)
+        if task:
+            task.cancel()
 
     async def stop(self):
         """Остановить детектор."""
         self._running = False
         if self._update_task:
             self._update_task.cancel()
+        tasks = list(self._refresh_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refresh_tasks.clear()
         if self._session:
             await self._session.close()
 
@@ -216,20 +248,78 @@ class PumpPatternDetector:
 
         await self._check_patterns(mint)
 
+        # Refresh market data for this token on the next scheduling pass
+        self._refreshed_at.pop(mint, None)
+        self._wake.set()
+
+    def _refresh_urgency(self, metrics: TokenMetrics, now: float, utc_now: datetime) -> float:
+        """How overdue a token's refresh is; >= 1.0 means due.
+
+        Quiet tokens are due every update_interval. Recent whale buys and a
+        large 5m price move shorten that, so active tokens stay fresh even
+        when hundreds are tracked.
+        """
+        refreshed_at = self._refreshed_at.get(metrics.mint)
+        if refreshed_at is None:
+            return float("inf")
+        weight = 1.0
+        if metrics.whale_buys and utc_now - metrics.whale_buys[-1][0] < self.whale_window:
+            weight += WHALE_ACTIVITY_WEIGHT
+        momentum_pct = self.price_momentum_threshold * 100
+        if momentum_pct > 0:
+            weight += min(abs(metrics.price_change_5m) / momentum_pct, MAX_VOLATILITY_WEIGHT)
+        return (now - refreshed_at) / self.update_interval * weight
+
+    def _due_tokens(self) -> list[str]:
+        """Due tokens not already refreshing, most urgent first."""
+        now, utc_now = time.monotonic(), datetime.utcnow()
+        due = []
+        for mint, metrics in self.tokens.items():
+            if mint in self._refreshing:
+                continue
+            urgency = self._refresh_urgency(metrics, now, utc_now)
+            if urgency >= 1.0:
+                due.append((urgency, mint))
+        due.sort(reverse=True)
+        return [mint for _, mint in due]
+
+    async def _refresh_token(self, mint: str):
+        try:
+            # Patterns are checked inside, as soon as this token's data lands
+            await self._update_token_data(mint)
+        except Exception as e:
+            logger.debug(f"Token refresh error for {mint[:8]}...: {e}")
+        finally:
+            # stop_tracking() may have dropped the token meanwhile: don't resurrect it
+            if mint in self.tokens:
+                self._refreshed_at[mint] = time.monotonic()
+            self._refreshing.discard(mint)
+            if self._refresh_tasks.get(mint) is asyncio.current_task():
+                del self._refresh_tasks[mint]
+            self._wake.set()
+
     async def _background_updater(self):
-        """Фоновое обновление данных из Birdeye."""
+        """Фоновое обновление данных: параллельно (max_concurrent_updates), по приоритету.
+
+        Birdeye requests share one token bucket (birdeye_rps); DexScreener
+        fallbacks go through the shared market-data client, which batches
+        concurrent refreshes into one request.
+        """
         self._session = aiohttp.ClientSession()
 
         while self._running:
             try:
-                # Update all tracked tokens
-                for mint in list(self.tokens.keys()):
-                    if not self._running:
+                self._wake.clear()
+                for mint in self._due_tokens():
+                    if len(self._refreshing) >= self.max_concurrent_updates:
                         break
-                    await self._update_token_data(mint)
-                    await asyncio.sleep(0.5)  # Rate limit
+                    self._refreshing.add(mint)
+                    self._refresh_tasks[mint] = asyncio.create_task(self._refresh_token(mint))
 
-                await asyncio.sleep(self.update_interval)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=SCHEDULER_TICK)
+                except asyncio.TimeoutError:
+                    pass
 
             except asyncio.CancelledError:
                 break
@@ -288,34 +378,31 @@ class PumpPatternDetector:
         metrics.buy_volume_5m = data.get("buy_volume_5m", 0) or 0
         metrics.sell_volume_5m = data.get("sell_volume_5m", 0) or 0
 
-        # Record history
-        now = datetime.utcnow()
+        # Record history (rings keep the last SHORT_HISTORY_SIZE / TRADE_HISTORY_SIZE samples)
+        ts = time.monotonic()
         if metrics.price > 0:
-            metrics.price_history.append((now, metrics.price))
+            metrics.price_history.append(ts, metrics.price)
         if metrics.volume_24h > 0:
-            metrics.volume_history.append((now, metrics.buy_volume_5m + metrics.sell_volume_5m))
+            metrics.volume_history.append(ts, metrics.buy_volume_5m + metrics.sell_volume_5m)
 
         # Record 5-min trade data for 1-hour accumulation
         if metrics.buys_5m > 0 or metrics.sells_5m > 0:
-            metrics.trade_history_5m.append((now, metrics.buys_5m, metrics.sells_5m))
+            metrics.trade_history_5m.append(ts, metrics.buys_5m, metrics.sells_5m)
 
-        # Cleanup old history (keep 1 hour for trade history)
-        cutoff_10m = now - timedelta(minutes=10)
-        cutoff_1h = now - timedelta(hours=1)
-        metrics.price_history = [(t, p) for t, p in metrics.price_history if t > cutoff_10m][-50:]
-        metrics.volume_history = [(t, v) for t, v in metrics.volume_history if t > cutoff_10m][-50:]
-        metrics.trade_history_5m = [(t, b, s) for t, b, s in metrics.trade_history_5m if t > cutoff_1h]
+        metrics.price_history.expire(ts - SHORT_HISTORY_WINDOW)
+        metrics.volume_history.expire(ts - SHORT_HISTORY_WINDOW)
+        metrics.trade_history_5m.expire(ts - TRADE_HISTORY_WINDOW)
 
         # Use direct 1h data from DexScreener if available, otherwise accumulate
         if data.get("buys_1h") is not None:
             metrics.buys_1h = data.get("buys_1h", 0) or 0
             metrics.sells_1h = data.get("sells_1h", 0) or 0
         else:
-            # Calculate 1-hour totals from accumulated 5-min snapshots
-            metrics.buys_1h = sum(b for _, b, _ in metrics.trade_history_5m)
-            metrics.sells_1h = sum(s for _, _, s in metrics.trade_history_5m)
+            # 1-hour totals from accumulated 5-min snapshots (running sums)
+            metrics.buys_1h = int(metrics.trade_history_5m.sum(0))
+            metrics.sells_1h = int(metrics.trade_history_5m.sum(1))
 
-        metrics.last_update = now
+        metrics.last_update = datetime.utcnow()
 
         # Check patterns
         await self._check_patterns(mint)
@@ -347,47 +434,37 @@ class PumpPatternDetector:
         - No API key required
         - No strict rate limits
         - Provides buy/sell counts and volume data
+        Goes through the shared market-data client (batched, cached, rate-limited).
         """
-        if not self._session:
-            return None
-
         try:
-            url = f"{DEXSCREENER_API_URL}/latest/dex/tokens/{mint}"
-
-            async with self._session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=5)
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    pairs = data.get("pairs", [])
-
-                    if not pairs:
-                        return None
-
-                    # Use the first (most liquid) pair
-                    pair = pairs[0]
-                    txns = pair.get("txns", {})
-                    m5 = txns.get("m5", {})
-                    h1 = txns.get("h1", {})
-                    volume = pair.get("volume", {})
-                    price_change = pair.get("priceChange", {})
-
-                    return {
-                        "price": float(pair.get("priceUsd", 0) or 0),
-                        "volume_24h": float(volume.get("h24", 0) or 0),
-                        "price_change_5m": float(price_change.get("m5", 0) or 0),
-                        "price_change_1h": float(price_change.get("h1", 0) or 0),
-                        "buys_5m": int(m5.get("buys", 0) or 0),
-                        "sells_5m": int(m5.get("sells", 0) or 0),
-                        "buy_volume_5m": float(volume.get("m5", 0) or 0) / 2,  # Approximate
-                        "sell_volume_5m": float(volume.get("m5", 0) or 0) / 2,
-                        # Extra data from DexScreener
-                        "buys_1h": int(h1.get("buys", 0) or 0),
-                        "sells_1h": int(h1.get("sells", 0) or 0),
-                        "liquidity": float(pair.get("liquidity", {}).get("usd", 0) or 0),
-                        "market_cap": float(pair.get("marketCap", 0) or 0),
-                    }
+            pairs = await get_market_data_client().dexscreener_pairs(mint)
+
+            if not pairs:
+                return None
+
+            # Use the first (most liquid) pair
+            pair = pairs[0]
+            txns = pair.get("txns", {})
+            m5 = txns.get("m5", {})
+            h1 = txns.get("h1", {})
+            volume = pair.get("volume", {})
+            price_change = pair.get("priceChange", {})
+
+            return {
+                "price": float(pair.get("priceUsd", 0) or 0),
+                "volume_24h": float(volume.get("h24", 0) or 0),
+                "price_change_5m": float(price_change.get("m5", 0) or 0),
+                "price_change_1h": float(price_change.get("h1", 0) or 0),
+                "buys_5m": int(m5.get("buys", 0) or 0),
+                "sells_5m": int(m5.get("sells", 0) or 0),
+                "buy_volume_5m": float(volume.get("m5", 0) or 0) / 2,  # Approximate
+                "sell_volume_5m": float(volume.get("m5", 0) or 0) / 2,
+                # Extra data from DexScreener
+                "buys_1h": int(h1.get("buys", 0) or 0),
+                "sells_1h": int(h1.get("sells", 0) or 0),
+                "liquidity": float(pair.get("liquidity", {}).get("usd", 0) or 0),
+                "market_cap": float(pair.get("marketCap", 0) or 0),
+            }
         except Exception as e:
             logger.debug(f"DexScreener error for {mint[:8]}...: {e}")
         return None
@@ -477,6 +554,7 @@ class PumpPatternDetector:
         if not self._session or not self.birdeye_api_key:
             return None
 
+        await self._birdeye_bucket.acquire()
         url = f"{BIRDEYE_API_URL}{endpoint}"
         headers = {
             "X-API-KEY": self.birdeye_api_key,
@@ -576,12 +654,9 @@ class PumpPatternDetector:
         if len(metrics.volume_history) < 3:
             return
 
-        volumes = [v for _, v in metrics.volume_history]
-        if not volumes:
-            return
-
-        avg_volume = sum(volumes[:-1]) / len(volumes[:-1]) if len(volumes) > 1 else volumes[0]
-        current_volume = volumes[-1]
+        history = metrics.volume_history
+        current_volume = history.last()
+        avg_volume = (history.sum() - current_volume) / (len(history) - 1)
 
         if avg_volume > 0 and current_volume > avg_volume * self.volume_spike_threshold:
             spike = current_volume / avg_volume
@@ -7,7 +7,8 @@ Dedup key: tx_signature (unique per blockchain transaction).
 """
 
 import logging
-import time
+
+from monitoring.dedup_cache import DedupCache
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +20,9 @@ class SignalDedup:
     Uses tx_signature as the dedup key — unique per blockchain transaction.
     """
 
-    def __init__(self, ttl_seconds: int = 300):
-        self._seen: dict[str, tuple[float, str]] = {}  # signature -> (timestamp, source)
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 50_000):
+        # signature -> source, FIFO/TTL-evicted in O(1) amortized
+        self._seen = DedupCache(maxsize=max_entries, ttl=ttl_seconds, track_source=True)
         self._ttl = ttl_seconds
         self._dedup_hits = 0
         self._dedup_passes = 0
@@ -30,29 +32,17 @@ class SignalDedup:
 
         First caller wins — subsequent calls with same signature return False.
         """
-        self._cleanup()
-        if signature in self._seen:
-            original_source = self._seen[signature][1]
+        if not self._seen.add(signature, source):
+            original_source = self._seen.source_of(signature)
             self._dedup_hits += 1
             logger.info(
                 f"[SIGNAL-DEDUP] Duplicate TX {signature[:16]}... "
                 f"(first from {original_source}, duplicate from {source})"
             )
             return False
-        self._seen[signature] = (time.monotonic(), source)
         self._dedup_passes += 1
         return True
 
-    def _cleanup(self):
-        """Remove expired entries (older than TTL)."""
-        if len(self._seen) < 50:
-            return
-        now = time.monotonic()
-        cutoff = now - self._ttl
-        expired = [sig for sig, (ts, _) in self._seen.items() if ts < cutoff]
-        for sig in expired:
-            del self._seen[sig]
-
     def get_stats(self) -> dict:
         """Return dedup statistics."""
         return {
@@ -3,20 +3,11 @@ Token Scorer - оценивает токены по паттернам для о
 Использует Dexscreener API для получения данных в реальном времени.
 """
 
-import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 
-import aiohttp
-
-try:
-    from core.redis_cache import cache_get, cache_set
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
-    cache_get = lambda k: None
-    cache_set = lambda k, v, t=60: False
+from utils.market_data import get_market_data_client
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +46,6 @@ class TokenScorer:
         self.liquidity_weight = liquidity_weight
         self.request_timeout = request_timeout
 
-        self._session: aiohttp.ClientSession | None = None
         self._cache: dict[str, TokenScore] = {}
         self._cache_ttl = 30  # секунд
 
@@ -65,17 +55,8 @@ class TokenScorer:
             f"mom:{momentum_weight}, liq:{liquidity_weight}]"
         )
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Получить или создать HTTP сессию."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.request_timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-        return self._session
-
     async def close(self):
-        """Закрыть сессию."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Сессия принадлежит общему market-data клиенту - закрывать нечего."""
 
     async def score_token(self, mint: str, symbol: str = "UNKNOWN", is_sniper_mode: bool = False) -> TokenScore:
         """Оценить токен по всем метрикам."""
@@ -107,10 +88,8 @@ class TokenScorer:
             self._cache[mint] = score
             return score
 
-        session = await self._get_session()
-
         # Получить данные с Dexscreener
-        dex_data = await self._fetch_dexscreener(session, mint)
+        dex_data = await self._fetch_dexscreener(mint)
 
         if not dex_data:
             # Нет данных на Dexscreener
@@ -354,51 +333,36 @@ class TokenScorer:
 
         return score
 
-    async def _fetch_dexscreener(self, session: aiohttp.ClientSession, mint: str) -> dict | None:
-        """Получить данные токена с Dexscreener."""
-        url = f"https://api.dexscreener.com/latest/dex/tokens/{mint}"
-        cache_key = f"dexscreener:{mint}"
-
+    async def _fetch_dexscreener(self, mint: str) -> dict | None:
+        """Получить данные токена с Dexscreener (общий батч-клиент, кэш 10с)."""
         try:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    logger.debug(f"Dexscreener returned {resp.status} for {mint[:8]}...")
-                    return None
-
-                data = await resp.json()
-                pairs = data.get("pairs", [])
-
-                if not pairs:
-                    return None
-
-                # Взять пару с наибольшей ликвидностью
-                pair = max(pairs, key=lambda p: p.get("liquidity", {}).get("usd", 0) or 0)
-
-                result = {
-                    "symbol": pair.get("baseToken", {}).get("symbol", "UNKNOWN"),
-                    "price_usd": float(pair.get("priceUsd", 0) or 0),
-                    "volume_5m": float(pair.get("volume", {}).get("m5", 0) or 0),
-                    "volume_1h": float(pair.get("volume", {}).get("h1", 0) or 0),
-                    "volume_24h": float(pair.get("volume", {}).get("h24", 0) or 0),
-                    "buys_5m": int(pair.get("txns", {}).get("m5", {}).get("buys", 0) or 0),
-                    "sells_5m": int(pair.get("txns", {}).get("m5", {}).get("sells", 0) or 0),
-                    "buys_1h": int(pair.get("txns", {}).get("h1", {}).get("buys", 0) or 0),
-                    "sells_1h": int(pair.get("txns", {}).get("h1", {}).get("sells", 0) or 0),
-                    "price_change_5m": float(pair.get("priceChange", {}).get("m5", 0) or 0),
-                    "price_change_1h": float(pair.get("priceChange", {}).get("h1", 0) or 0),
-                    "price_change_24h": float(pair.get("priceChange", {}).get("h24", 0) or 0),
-                    "liquidity_usd": float(pair.get("liquidity", {}).get("usd", 0) or 0),
-                    "fdv": float(pair.get("fdv", 0) or 0),
-                    "pair_created": pair.get("pairCreatedAt"),
-                }
-                # Cache in Redis for 30 seconds
-                if REDIS_AVAILABLE:
-                    cache_set(cache_key, result, 30)
-                return result
-
-        except asyncio.TimeoutError:
-            logger.debug(f"Dexscreener timeout for {mint[:8]}...")
-            return None
+            pairs = await get_market_data_client().dexscreener_pairs(mint)
+
+            if not pairs:
+                return None
+
+            # Взять пару с наибольшей ликвидностью
+            pair = max(pairs, key=lambda p: p.get("liquidity", {}).get("usd", 0) or 0)
+
+            result = {
+                "symbol": pair.get("baseToken", {}).get("symbol", "UNKNOWN"),
+                "price_usd": float(pair.get("priceUsd", 0) or 0),
+                "volume_5m": float(pair.get("volume", {}).get("m5", 0) or 0),
+                "volume_1h": float(pair.get("volume", {}).get("h1", 0) or 0),
+                "volume_24h": float(pair.get("volume", {}).get("h24", 0) or 0),
+                "buys_5m": int(pair.get("txns", {}).get("m5", {}).get("buys", 0) or 0),
+                "sells_5m": int(pair.get("txns", {}).get("m5", {}).get("sells", 0) or 0),
+                "buys_1h": int(pair.get("txns", {}).get("h1", {}).get("buys", 0) or 0),
+                "sells_1h": int(pair.get("txns", {}).get("h1", {}).get("sells", 0) or 0),
+                "price_change_5m": float(pair.get("priceChange", {}).get("m5", 0) or 0),
+                "price_change_1h": float(pair.get("priceChange", {}).get("h1", 0) or 0),
+                "price_change_24h": float(pair.get("priceChange", {}).get("h24", 0) or 0),
+                "liquidity_usd": float(pair.get("liquidity", {}).get("usd", 0) or 0),
+                "fdv": float(pair.get("fdv", 0) or 0),
+                "pair_created": pair.get("pairCreatedAt"),
+            }
+            return result
+
         except Exception as e:
             logger.debug(f"Dexscreener error for {mint[:8]}...: {e}")
             return None
@@ -12,6 +12,7 @@ Multi-Source Trending Token Scanner.
 import asyncio
 import logging
 import os
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -19,6 +20,8 @@ from enum import Enum
 
 import aiohttp
 
+from utils.timeseries import RingSeries
+
 logger = logging.getLogger(__name__)
 
 
@@ -90,10 +93,13 @@ class RateLimiter:
     # Daily budget (для экономии free tier)
     daily_budget: int = 0  # 0 = unlimited
     # State
-    requests: list = field(default_factory=list)
+    requests: RingSeries = field(init=False)  # monotonic timestamps of requests in the window
     daily_requests: int = field(default=0)
     last_reset_day: int = field(default=0)
 
+    def __post_init__(self) -> None:
+        self.requests = RingSeries(max(1, self.max_requests))
+
     def _reset_daily_if_needed(self) -> None:
         """Reset daily counter at midnight."""
         today = datetime.utcnow().timetuple().tm_yday
@@ -104,9 +110,8 @@ class RateLimiter:
     def can_request(self) -> bool:
         """Проверить можно ли делать запрос."""
         self._reset_daily_if_needed()
-        now = datetime.utcnow().timestamp()
         # Очистить старые запросы
-        self.requests = [t for t in self.requests if now - t < self.window_seconds]
+        self.requests.expire(time.monotonic() - self.window_seconds)
 
         # Check window limit
         if len(self.requests) >= self.max_requests:
@@ -121,17 +126,16 @@ class RateLimiter:
     def record_request(self) -> None:
         """Записать запрос."""
         self._reset_daily_if_needed()
-        self.requests.append(datetime.utcnow().timestamp())
+        self.requests.append(time.monotonic(), 1.0)
         self.daily_requests += 1
 
     def time_until_available(self) -> float:
         """Время до следующего доступного слота."""
         if self.can_request():
             return 0
-        now = datetime.utcnow().timestamp()
         if self.requests:
-            oldest = min(self.requests)
-            return max(0, self.window_seconds - (now - oldest))
+            oldest = self.requests.first_ts()
+            return max(0, self.window_seconds - (time.monotonic() - oldest))
         return 0
 
     def get_daily_remaining(self) -> int:
@@ -19,6 +19,8 @@ from enum import Enum
 
 import aiohttp
 
+from utils.market_data import get_market_data_client
+
 logger = logging.getLogger(__name__)
 
 DEXSCREENER_API = "https://api.dexscreener.com"
@@ -134,10 +136,6 @@ class VolumePatternAnalyzer:
         self._signal_cooldown: dict[str, float] = {}
         self._cooldown_seconds = 300  # 5 min cooldown per token
 
-        # Cache for token data
-        self._token_cache: dict[str, tuple[dict, float]] = {}
-        self._cache_ttl = 30  # 30 sec
-
         # Stats
         self._stats = {
             "scans": 0,
@@ -215,9 +213,13 @@ class VolumePatternAnalyzer:
         logger.info(f"[VOLUME] Found {len(token_addresses)} unique tokens to analyze")
         self._stats["tokens_checked"] += len(token_addresses)
 
-        # Fetch full data and analyze each token (limit to max_tokens_per_scan)
+        # Fetch full data and analyze each token (limit to max_tokens_per_scan).
+        # Prefetch concurrently: the market-data client batches 30 mints per request.
+        candidates = list(token_addresses)[: self.max_tokens_per_scan]
+        await asyncio.gather(*(self._fetch_token_data(mint) for mint in candidates))
+
         analyzed = 0
-        for mint in list(token_addresses)[: self.max_tokens_per_scan]:
+        for mint in candidates:
             # Check cooldown
             now = datetime.utcnow().timestamp()
             if mint in self._signal_cooldown:
@@ -236,9 +238,6 @@ class VolumePatternAnalyzer:
                 if analysis.is_opportunity:
                     await self._emit_opportunity(analysis)
 
-            # Small delay to avoid rate limits
-            await asyncio.sleep(0.1)
-
         logger.info(f"[VOLUME] Analyzed {analyzed} tokens this scan")
 
     async def _fetch_token_boosts(self) -> list[dict]:
@@ -280,38 +279,12 @@ class VolumePatternAnalyzer:
         return []
 
     async def _fetch_token_data(self, mint: str) -> dict | None:
-        """Fetch full token data from DexScreener."""
-        # Check cache
-        now = datetime.utcnow().timestamp()
-        if mint in self._token_cache:
-            data, ts = self._token_cache[mint]
-            if now - ts < self._cache_ttl:
-                return data
-
-        if not self._session:
+        """Fetch full token data from DexScreener (shared market-data client, cached)."""
+        pairs = await get_market_data_client().dexscreener_pairs(mint)
+        if not pairs:
             return None
-
-        try:
-            url = f"{DEXSCREENER_API}/latest/dex/tokens/{mint}"
-            self._stats["api_calls"] += 1
-
-            async with self._session.get(url) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    pairs = data.get("pairs", [])
-                    if pairs:
-                        # Get pair with highest liquidity
-                        best_pair = max(
-                            pairs,
-                            key=lambda p: float(
-                                p.get("liquidity", {}).get("usd", 0) or 0
-                            ),
-                        )
-                        self._token_cache[mint] = (best_pair, now)
-                        return best_pair
-        except Exception as e:
-            logger.debug(f"[VOLUME] Fetch token error for {mint[:8]}...: {e}")
-        return None
+        # Pairs come most liquid first
+        return pairs[0]
 
     async def analyze_token(self, pair_data: dict) -> TokenVolumeAnalysis | None:
         """Analyze token for volume patterns."""
@@ -32,7 +32,25 @@ try:
 except ImportError:
     LOCAL_PARSER_AVAILABLE = False
 
+from core.confirmation_service import get_confirmation_service, observe_signature
+from core.pda_cache import get_pda_cache_stats
+from core.priority_fee.streaming_fee import get_fee_estimator
+from interfaces.core import CurveSnapshot, Platform
+from monitoring.dedup_cache import DedupCache
+from monitoring.geyser_replay import GeyserRecorder
+from monitoring.geyser_subscriptions import (
+    SHARD_ALL,
+    SPLIT_SHARDS,
+    GeyserSubscriptionManager,
+    slice_offset,
+)
+from monitoring.pubkey_index import PubkeyMap, build_pubkey_index, pubkey_bytes
+from utils.logger import get_hot_logger
+from utils.market_data import get_market_data_client
+
 logger = logging.getLogger(__name__)
+# Per-event messages (per mint / per stream): at most once per 5s per key
+_hot_log = get_hot_logger(__name__, interval=5.0)
 
 TOKEN_BLACKLIST = {
     "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
@@ -46,6 +64,9 @@ TOKEN_BLACKLIST = {
 
 SOL_MINT = "So11111111111111111111111111111111111111112"
 
+# FIX S26-3 cleanup runs at most this often (it scans every trader position)
+CLEANUP_INTERVAL = 10.0
+
 
 
 @dataclass
@@ -61,6 +82,15 @@ class VaultSubscription:
     price: float = 0.0
     last_update: float = 0.0
     last_slot: int = 0
+    base_vault_raw: bytes = b""
+    quote_vault_raw: bytes = b""
+
+    def __post_init__(self):
+        # Raw keys let the gRPC handler match updates without base58 encoding
+        if not self.base_vault_raw:
+            self.base_vault_raw = pubkey_bytes(self.base_vault) or b""
+        if not self.quote_vault_raw:
+            self.quote_vault_raw = pubkey_bytes(self.quote_vault) or b""
 
 
 @dataclass
@@ -87,6 +117,7 @@ class CurveSubscription:
     price: float = 0.0
     last_update: float = 0.0
     last_slot: int = 0
+    snapshot: Optional[CurveSnapshot] = None  # Latest decoded curve state (no RPC needed)
 
 
 
@@ -106,6 +137,8 @@ class GrpcInstance:
     healthy: bool = False
     reconnect_event: object = None
     stats: dict = None
+    insecure: bool = False  # Plaintext channel, no auth (local replay server)
+    shard: str = SHARD_ALL  # Filter shard served by this stream (geyser_subscriptions)
 
     def __post_init__(self):
         if self.stats is None:
@@ -120,18 +153,13 @@ class GrpcInstance:
 
 async def _fetch_symbol_dexscreener(mint: str) -> str:
     """Fetch token symbol: DexScreener -> Jupiter Token API -> short mint fallback."""
-    # 1. Try DexScreener (fastest for established tokens)
+    # 1. Try DexScreener (fastest for established tokens; shared batched client)
     try:
-        url = f"https://api.dexscreener.com/latest/dex/tokens/{mint}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=2)) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    pairs = data.get("pairs", [])
-                    if pairs:
-                        sym = pairs[0].get("baseToken", {}).get("symbol", "")
-                        if sym:
-                            return sym
+        pairs = await asyncio.wait_for(get_market_data_client().dexscreener_pairs(mint), timeout=2)
+        if pairs:
+            sym = pairs[0].get("baseToken", {}).get("symbol", "")
+            if sym:
+                return sym
     except Exception:
         pass
     # 2. Fallback: Jupiter Token API V2 (indexes new tokens faster)
@@ -226,6 +254,15 @@ class WhaleGeyserReceiver:
                 endpoint=self.geyser_endpoint,
                 api_key=self.geyser_api_key,
             ))
+        # Dedicated streams per filter shard: whale tx / curve accounts / token accounts
+        # (GEYSER_SHARD_STREAMS=0 = legacy single stream per endpoint)
+        self._shard_streams = os.getenv("GEYSER_SHARD_STREAMS", "1") != "0"
+        self._grpc_instances = self._shard_instances(self._grpc_instances)
+        self._subscriptions = GeyserSubscriptionManager()
+        # Compute unit prices of landed txs -> PriorityFeeManager quotes without RPC
+        self._fee_estimator = get_fee_estimator()
+        self._last_cleanup: float = 0.0
+
         # Separate key for parsing (don't burn gRPC key credits)
         self.helius_parse_api_key = helius_parse_api_key or os.getenv(
             "GEYSER_PARSE_API_KEY", self.geyser_api_key
@@ -259,15 +296,15 @@ class WhaleGeyserReceiver:
         self.on_whale_buy: Optional[Callable] = None
 
         # Dedup
-        self._processed_sigs: set[str] = set()
-        self._emitted_tokens: set[str] = set()
+        self._processed_sigs = DedupCache(maxsize=10_000)
+        self._emitted_tokens = DedupCache(maxsize=500)
 
         # === FIX S47: Whale buy accumulator (aggregate small buys within window) ===
         self._whale_accumulator: dict[tuple, dict] = {}  # (whale, token) -> {total_sol, first_seen, ...}
         self._accumulator_window: float = 60.0  # seconds
         # === END FIX S47 INIT ===
         self._emit_lock = asyncio.Lock()  # S32: Prevent parallel emit for same TX
-        self._processed_sigs_emit: set[str] = set()  # S32: Sig dedup inside emit tasks
+        self._processed_sigs_emit = DedupCache(maxsize=10_000)  # S32: Sig dedup inside emit tasks
 
         # State
         self._channel = None  # Legacy — kept for compatibility, points to first instance channel
@@ -295,30 +332,49 @@ class WhaleGeyserReceiver:
             "ping_sent": 0,
             "ping_responded": 0,
             "pong_received": 0,
+            "prefiltered": 0,
         }
 
         # Latency tracking
         self._last_latency_ms: float = 0
 
+        # Raw update recorder for offline replay (monitoring/geyser_replay.py)
+        self._recorder: Optional[GeyserRecorder] = None
+        _record_file = os.getenv("GEYSER_RECORD_FILE", "")
+        if _record_file:
+            try:
+                self._recorder = GeyserRecorder(_record_file)
+                logger.warning(f"[GEYSER] Recording raw updates to {_record_file}")
+            except OSError as e:
+                logger.error(f"[GEYSER] Cannot open record file {_record_file}: {e}")
+
         # Watchdog integration (Phase 5.3)
         self._watchdog = None
         self._reconnect_event = asyncio.Event()
 
         # Vault tracking for price monitoring (Phase 4b)
         self._vault_subscriptions: dict[str, VaultSubscription] = {}  # mint -> VaultSubscription
-        self._vault_address_map: dict[str, str] = {}  # vault_address -> mint
+        self._vault_address_map: PubkeyMap = PubkeyMap()  # vault_address -> mint
         self._vault_prices: dict[str, tuple[float, float]] = {}  # mint -> (price, timestamp)
+        # Push listeners (PositionMonitorEngine.publish): fn(mint, price, source)
+        self._price_listeners: list[Callable[[str, float, str], object]] = []
         # Reactive SL/TP: mint -> {sl_price, tp_price, entry_price, symbol, triggered}
         self._sl_tp_triggers: dict[str, dict] = {}
 
         # Bonding curve tracking for price monitoring (Phase 4c)
         self._curve_subscriptions: dict[str, CurveSubscription] = {}  # mint -> CurveSubscription
-        self._curve_address_map: dict[str, str] = {}  # curve_address -> mint
+        self._curve_address_map: PubkeyMap = PubkeyMap()  # curve_address -> mint
 
         # ATA tracking — detect when tokens arrive on our wallet (Phase 6: instant confirmation)
-        self._ata_address_map: dict[str, str] = {}   # ata_address -> mint
+        self._ata_address_map: PubkeyMap = PubkeyMap()  # ata_address -> mint
         self._ata_pending: dict[str, str] = {}        # mint -> ata_address (pending confirmation)
         self._wallet_pubkey_str: str = ""              # Set by set_wallet_pubkey()
+        self._wallet_pubkey_raw: bytes = b""
+
+        # Raw-bytes pre-filter: whale pubkeys + our wallet. Fee payer bytes are
+        # checked against this before any base58 work on the gRPC hot loop.
+        self._tx_filter_raw: frozenset[bytes] = frozenset()
+        self._rebuild_tx_filter()
 
         _instance_names = [g.name for g in self._grpc_instances]
         logger.warning(
@@ -347,16 +403,46 @@ class WhaleGeyserReceiver:
         except Exception as e:
             logger.exception(f"[GEYSER] Error loading wallets: {e}")
 
+    def _rebuild_tx_filter(self):
+        """Refresh the raw-bytes fee payer pre-filter (whales + our wallet)."""
+        addresses = list(self.whale_wallets)
+        if self._wallet_pubkey_str:
+            addresses.append(self._wallet_pubkey_str)
+        self._tx_filter_raw = build_pubkey_index(addresses)
+
     def set_wallet_pubkey(self, pubkey_str: str):
         """Store our wallet pubkey for ATA derivation."""
         self._wallet_pubkey_str = pubkey_str
+        self._wallet_pubkey_raw = pubkey_bytes(pubkey_str) or b""
+        self._rebuild_tx_filter()
         logger.info(f"[GEYSER] Wallet pubkey set: {pubkey_str[:16]}...")
 
+    def _owner_trader(self, mint: str | None = None):
+        """Trader this receiver feeds (each in-process bot has its own receiver)."""
+        from trading.trader_registry import get_trader, get_traders
+
+        for trader in get_traders():
+            if getattr(trader, "whale_tracker", None) is self:
+                return trader
+        return get_trader(mint=mint, wallet=self._wallet_pubkey_str or None)
+
     def set_callback(self, callback: Callable):
         """Set callback for whale buy signals. Same interface as webhook."""
         self.on_whale_buy = callback
         logger.info("[GEYSER] Callback set")
 
+    def add_price_listener(self, listener: Callable[[str, float, str], object]):
+        """Push every curve/vault price change to listener(mint, price, source)."""
+        if listener not in self._price_listeners:
+            self._price_listeners.append(listener)
+
+    def _emit_price(self, mint: str, price: float, source: str) -> None:
+        for listener in self._price_listeners:
+            try:
+                listener(mint, price, source)
+            except Exception as e:
+                logger.error(f"[GEYSER] Price listener error: {e}")
+
     def set_watchdog(self, watchdog):
         self._watchdog = watchdog
         watchdog.set_reconnect_callback(self._trigger_reconnect)
@@ -395,9 +481,11 @@ class WhaleGeyserReceiver:
 
         logger.warning("=" * 70)
         logger.warning("[GEYSER] WHALE GEYSER TRACKER STARTED")
+        _endpoints = {inst.endpoint for inst in self._grpc_instances}
         for inst in self._grpc_instances:
-            _label = "PRIMARY" if inst.name == "chainstack" else "SECONDARY" if len(self._grpc_instances) > 1 else "PRIMARY"
-            logger.warning(f"[GEYSER] {_label}: {inst.name} ({inst.endpoint})")
+            _primary = inst.name.split(":")[0] == "chainstack" or len(_endpoints) == 1
+            _label = "PRIMARY" if _primary else "SECONDARY"
+            logger.warning(f"[GEYSER] {_label}: {inst.name} ({inst.endpoint}) shard={inst.shard}")
         logger.warning(f"[GEYSER] Tracking {len(self.whale_wallets)} whale wallets")
         logger.warning(f"[GEYSER] Min buy amount: {self.min_buy_amount} SOL")
         logger.warning(f"[GEYSER] Keepalive: bidirectional ping every 10s per instance")
@@ -405,7 +493,7 @@ class WhaleGeyserReceiver:
             logger.warning(f"[GEYSER] Mode: LOCAL PARSE (gRPC + local parser, Helius fallback)")
         else:
             logger.warning(f"[GEYSER] Mode: HYBRID (gRPC + Helius Enhanced API)")
-        if len(self._grpc_instances) > 1:
+        if len(_endpoints) > 1:
             logger.warning(f"[GEYSER] DUAL gRPC: signal dedup via shared _processed_sigs — first wins!")
         logger.warning("=" * 70)
 
@@ -438,6 +526,8 @@ class WhaleGeyserReceiver:
                     await inst.channel.close()
                 except Exception:
                     pass
+        if self._recorder is not None:
+            self._recorder.close()
         # Legacy cleanup
         if self._channel:
             try:
@@ -448,6 +538,12 @@ class WhaleGeyserReceiver:
 
     async def _create_channel_for(self, inst: GrpcInstance):
         """Create authenticated gRPC channel for a specific instance."""
+        if inst.insecure:
+            inst.channel = grpc_aio.insecure_channel(
+                inst.endpoint,
+                options=[("grpc.max_receive_message_length", 64 * 1024 * 1024)],
+            )
+            return geyser_pb2_grpc.GeyserStub(inst.channel)
         api_key = inst.api_key
         auth = grpc.metadata_call_credentials(
             lambda _, callback, _key=api_key: callback(
@@ -475,10 +571,12 @@ class WhaleGeyserReceiver:
     def _cleanup_dead_subscriptions(self):
         """FIX S26-3: Remove curve/vault/ATA for sold, moonbag, dust positions.
         Moonbag/dust use batch price (Jupiter HTTP) — they must NOT occupy gRPC slots.
-        Called before every _create_subscribe_request to keep Chainstack stream clean."""
+        Throttled: _create_subscribe_request and _resubscribe call it through
+        _maybe_cleanup_dead_subscriptions, at most once per CLEANUP_INTERVAL (10s),
+        so a request built in between may still carry a just-sold mint until
+        the next cleanup."""
         try:
-            from trading.trader_registry import get_trader
-            trader = get_trader()
+            trader = self._owner_trader()
             if not trader:
                 return
 
@@ -526,59 +624,83 @@ class WhaleGeyserReceiver:
         except Exception as e:
             logger.error(f'[GEYSER] CLEANUP error: {e}')
 
-    def _create_subscribe_request(self):
-        """Create gRPC subscribe request for whale wallets + vault accounts."""
-        # FIX S26-3: Clean dead subscriptions before building request
-        self._cleanup_dead_subscriptions()
-        request = geyser_pb2.SubscribeRequest()
-
-        # Subscribe to transactions involving ANY of the whale wallets
-        whale_addresses = list(self.whale_wallets.keys())
-
-        tx_filter = request.transactions["whale_tracker"]
-        for addr in whale_addresses:
-            tx_filter.account_include.append(addr)
-
-        # Only successful transactions
-
-        # Session 3: Subscribe to our own wallet for entry price correction
-        if self._wallet_pubkey_str and self._wallet_pubkey_str not in whale_addresses:
-            tx_filter.account_include.append(self._wallet_pubkey_str)
-
-        tx_filter.failed = False
-
-        # Vault account subscriptions for price tracking (Phase 4b)
-        vault_addresses = list(self._vault_address_map.keys())
-        if vault_addresses:
-            acct_filter = request.accounts["vault_tracker"]
-            for addr in vault_addresses:
-                acct_filter.account.append(addr)
-
-        # Bonding curve account subscriptions for price tracking (Phase 4c)
-        curve_addresses = list(self._curve_address_map.keys())
-        if curve_addresses:
-            curve_filter = request.accounts["curve_tracker"]
-            for addr in curve_addresses:
-                curve_filter.account.append(addr)
-
-        # ATA account subscriptions for token arrival detection (Phase 6)
-        ata_addresses = list(self._ata_address_map.keys())
-        if ata_addresses:
-            ata_filter = request.accounts["ata_tracker"]
-            for addr in ata_addresses:
-                ata_filter.account.append(addr)
+    def _shard_instances(self, instances: list[GrpcInstance]) -> list[GrpcInstance]:
+        """Split each endpoint into one stream per filter shard (tx stream keeps the name)."""
+        if not self._shard_streams:
+            return instances
+        sharded = []
+        for inst in instances:
+            for shard in SPLIT_SHARDS:
+                sharded.append(GrpcInstance(
+                    name=inst.name if shard == SPLIT_SHARDS[0] else f"{inst.name}:{shard}",
+                    endpoint=inst.endpoint,
+                    api_key=inst.api_key,
+                    insecure=inst.insecure,
+                    shard=shard,
+                ))
+        return sharded
+
+    def _maybe_cleanup_dead_subscriptions(self) -> None:
+        """Run _cleanup_dead_subscriptions at most once per CLEANUP_INTERVAL."""
+        now = time.monotonic()
+        if now - self._last_cleanup >= CLEANUP_INTERVAL:
+            self._last_cleanup = now
+            self._cleanup_dead_subscriptions()
+
+    def _current_filters(self) -> dict[str, frozenset]:
+        """Full filter set: whale/own-wallet transactions + vault/curve/ATA accounts."""
+        # Session 3: own wallet for entry price correction
+        whales = set(self.whale_wallets)
+        if self._wallet_pubkey_str:
+            whales.add(self._wallet_pubkey_str)
+        return {
+            "whale_tracker": frozenset(whales),
+            # Vault account subscriptions for price tracking (Phase 4b)
+            "vault_tracker": frozenset(self._vault_address_map.keys()),
+            # Bonding curve account subscriptions for price tracking (Phase 4c)
+            "curve_tracker": frozenset(self._curve_address_map.keys()),
+            # ATA account subscriptions for token arrival detection (Phase 6)
+            "ata_tracker": frozenset(self._ata_address_map.keys()),
+        }
 
-        # PROCESSED = fastest, see tx before full confirmation
-        request.commitment = geyser_pb2.CommitmentLevel.PROCESSED
+    def _create_subscribe_request(self, shard: str = SHARD_ALL):
+        """Create gRPC subscribe request for one shard (default: whale wallets + all accounts)."""
+        # FIX S26-3: Clean dead subscriptions before building request (throttled)
+        self._maybe_cleanup_dead_subscriptions()
+        filters = self._current_filters()
+        request = self._subscriptions.build_request(shard, filters)
 
         logger.info(
-            f"[GEYSER] Subscribe request: {len(whale_addresses)} wallets, "
-            f"{len(vault_addresses)} vault accounts, "
-            f"{len(self._curve_address_map)} curve accounts, "
-            f"{len(self._ata_address_map)} ATA accounts, commitment=PROCESSED"
+            f"[GEYSER] Subscribe request ({shard}): {len(self.whale_wallets)} wallets, "
+            f"{len(filters['vault_tracker'])} vault accounts, "
+            f"{len(filters['curve_tracker'])} curve accounts, "
+            f"{len(filters['ata_tracker'])} ATA accounts, commitment=PROCESSED"
         )
         return request
 
+    def _resubscribe(self) -> int:
+        """Push updated filters only to streams whose shard filter set changed.
+
+        Returns the number of streams a request was pushed to.
+        """
+        self._maybe_cleanup_dead_subscriptions()
+        filters = self._current_filters()
+        pushed = 0
+        for inst in self._grpc_instances:
+            if not inst.ping_queue:
+                continue
+            request = self._subscriptions.request_if_changed(inst.name, inst.shard, filters)
+            if request is None:
+                continue
+            try:
+                inst.ping_queue.put_nowait(request)
+                pushed += 1
+            except asyncio.QueueFull:
+                # Not delivered: make the next resubscribe retry this stream
+                self._subscriptions.forget(inst.name)
+                logger.warning(f"[GEYSER-{inst.name.upper()}] Ping queue full, resubscribe dropped")
+        return pushed
+
     async def _request_iterator(self, initial_request, inst: GrpcInstance = None):
         """Async generator for bidirectional gRPC stream.
 
@@ -633,7 +755,9 @@ class WhaleGeyserReceiver:
         while self.running:
             try:
                 stub = await self._create_channel_for(inst)
-                request = self._create_subscribe_request()
+                request = self._create_subscribe_request(inst.shard)
+                self._subscriptions.mark_sent(inst.name, inst.shard, self._current_filters())
+                data_base = slice_offset(inst.shard)  # account data arrives sliced from here
 
                 # FIX S19-6b: Re-enable BlockhashCache gRPC after channel reconnect
                 if inst.name == 'chainstack':
@@ -676,6 +800,10 @@ class WhaleGeyserReceiver:
                         inst.stats["grpc_messages"] += 1
                         inst.healthy = True
 
+                        # Record from the primary endpoint only (secondary would duplicate)
+                        if self._recorder is not None and inst.endpoint == self._grpc_instances[0].endpoint:
+                            self._recorder.record(update, data_offset=data_base)
+
                         # Touch watchdog on ANY gRPC activity
                         if self._watchdog:
                             self._watchdog.touch_grpc()
@@ -686,7 +814,7 @@ class WhaleGeyserReceiver:
                             inst.stats["pong_received"] += 1
                             inst.last_pong_time = time.monotonic()
                             self._last_pong_time = max(self._last_pong_time, inst.last_pong_time)
-                            logger.info(f"[{tag}] Pong received (id={update.pong.id})")
+                            logger.info("[%s] Pong received (id=%d)", tag, update.pong.id)
                             continue
 
                         if update.HasField("ping"):
@@ -699,23 +827,22 @@ class WhaleGeyserReceiver:
                                 inst.ping_queue.put_nowait(ping_req)
                                 self._stats["ping_responded"] += 1
                                 inst.stats["ping_responded"] += 1
-                                logger.info(f"[{tag}] Server ping received, responded with id={ping_id}")
+                                logger.info("[%s] Server ping received, responded with id=%d", tag, ping_id)
                             except asyncio.QueueFull:
-                                logger.warning(f"[{tag}] Ping queue full, could not respond")
+                                _hot_log.warning(inst.name, "[%s] Ping queue full, could not respond", tag)
                             continue
 
                         # --- Account updates (vaults + curves + ATA) ---
                         if update.HasField("account"):
                             acct = update.account.account
                             if acct:
-                                pk_bytes = bytes(acct.pubkey)
-                                pk_str = base58.b58encode(pk_bytes).decode()
-                                if pk_str in self._vault_address_map:
-                                    self._handle_vault_account_update(update.account, source=inst.name, slot=update.account.slot)
-                                elif pk_str in self._curve_address_map:
-                                    self._handle_curve_account_update(update.account, source=inst.name, slot=update.account.slot)
-                                elif pk_str in self._ata_address_map:
-                                    self._handle_ata_account_update(update.account)
+                                pk_bytes = acct.pubkey
+                                if self._vault_address_map.contains_raw(pk_bytes):
+                                    self._handle_vault_account_update(update.account, source=inst.name, slot=update.account.slot, base=data_base)
+                                elif self._curve_address_map.contains_raw(pk_bytes):
+                                    self._handle_curve_account_update(update.account, source=inst.name, slot=update.account.slot, base=data_base)
+                                elif self._ata_address_map.contains_raw(pk_bytes):
+                                    self._handle_ata_account_update(update.account, base=data_base)
                             continue
 
                         # --- Transactions ---
@@ -728,38 +855,49 @@ class WhaleGeyserReceiver:
                             tx_wrapper = update.transaction
                             tx = tx_wrapper.transaction
 
-                            sig_bytes = bytes(tx.signature)
-                            signature = base58.b58encode(sig_bytes).decode()
+                            if self._watchdog:
+                                self._watchdog.touch_grpc_data()
+
+                            msg = tx.transaction.message
+                            if not msg or len(msg.account_keys) == 0:
+                                continue
+
+                            # Fee feed: every landed tx on the stream, before the whale pre-filter
+                            self._fee_estimator.observe_transaction(msg, tx.meta, tx.signature)
+
+                            # PRE-FILTER: raw fee payer bytes vs whales + our wallet.
+                            # Non-matching traffic is dropped before any base58 work.
+                            fee_payer_bytes = msg.account_keys[0]
+                            if fee_payer_bytes not in self._tx_filter_raw:
+                                self._stats["prefiltered"] += 1
+                                continue
+
+                            signature = base58.b58encode(tx.signature).decode()
 
                             # DEDUP: shared across all instances — first wins!
-                            if signature in self._processed_sigs:
+                            if not self._processed_sigs.add(signature):
                                 self._stats["duplicates"] += 1
                                 continue
-                            self._processed_sigs.add(signature)
-                            if len(self._processed_sigs) > 10000:
-                                self._processed_sigs = set(
-                                    list(self._processed_sigs)[-5000:]
-                                )
 
                             self._stats["tx_detected"] += 1
                             inst.stats["tx_detected"] += 1
-                            if self._watchdog:
-                                self._watchdog.touch_grpc_data()
-
-                            msg = tx.transaction.message
-                            if not msg or len(msg.account_keys) == 0:
-                                continue
 
-                            fee_payer_bytes = bytes(msg.account_keys[0])
                             fee_payer = base58.b58encode(fee_payer_bytes).decode()
+                            is_own_tx = fee_payer_bytes == self._wallet_pubkey_raw
 
                             # Session 4: Diagnostic — detect our wallet in ANY account key
-                            if self._wallet_pubkey_str and fee_payer == self._wallet_pubkey_str:
+                            if is_own_tx:
                                 logger.warning(f"[GEYSER-SELF] OUR TX detected! sig={signature[:20]}... fee_payer=US")
+                                # Landed (PROCESSED): wake confirmation waiters before their next poll
+                                observe_signature(
+                                    signature,
+                                    tx.meta.err.err.hex() if tx.meta.HasField("err") else None,
+                                    tx_wrapper.slot,
+                                )
 
                             if fee_payer not in self.whale_wallets:
                                 # Session 3: Don't skip our own wallet — parse for entry fix
-                                if fee_payer == self._wallet_pubkey_str and self.local_parser:
+                                if is_own_tx and self.local_parser:
                                     try:
                                         parsed = self.local_parser.parse(tx, fee_payer)
                                         if parsed:
@@ -773,9 +911,8 @@ class WhaleGeyserReceiver:
                                 continue
 
                             logger.warning(
-                                f"[{tag}] TX from whale "
-                                f"{self.whale_wallets[fee_payer]['label']}: "
-                                f"{signature[:20]}..."
+                                "[%s] TX from whale %s: %.20s...",
+                                tag, self.whale_wallets[fee_payer]["label"], signature,
                             )
 
                             if self.local_parser:
@@ -788,9 +925,8 @@ class WhaleGeyserReceiver:
                                     )
                                 else:
                                     logger.info(
-                                        f"[{tag}] Local parse missed "
-                                        f"{signature[:16]}..., "
-                                        f"falling back to Helius"
+                                        "[%s] Local parse missed %.16s..., falling back to Helius",
+                                        tag, signature,
                                     )
                                     asyncio.create_task(
                                         self._parse_and_emit(
@@ -805,7 +941,7 @@ class WhaleGeyserReceiver:
                                 )
 
                         except Exception as e:
-                            logger.error(f"[{tag}] Error processing update: {e}")
+                            _hot_log.error(inst.name, "[%s] Error processing update: %s", tag, e)
 
                 finally:
                     if inst.ping_task:
@@ -816,6 +952,7 @@ class WhaleGeyserReceiver:
                             pass
                         inst.ping_task = None
                     inst.healthy = False
+                    self._subscriptions.forget(inst.name)
 
                 reconnect_delay = 1.0
 
@@ -896,8 +1033,7 @@ class WhaleGeyserReceiver:
                         f"real_entry={_real_entry:.10f}"
                     )
                     try:
-                        from trading.trader_registry import get_trader
-                        _trader = get_trader()
+                        _trader = self._owner_trader(_mint)
                         if _trader:
                             for _pos in _trader.active_positions:
                                 if str(_pos.mint) == _mint:
@@ -947,7 +1083,7 @@ class WhaleGeyserReceiver:
                                             pass
                                         try:
                                             from trading.position import save_positions
-                                            save_positions(_trader.active_positions)
+                                            save_positions(_trader.active_positions, scope=())
                                         except Exception:
                                             pass
                                     else:
@@ -965,7 +1101,7 @@ class WhaleGeyserReceiver:
                                             pass
                                         try:
                                             from trading.position import save_positions
-                                            save_positions(_trader.active_positions)
+                                            save_positions(_trader.active_positions, scope=())
                                         except Exception:
                                             pass
                                         logger.info(f"[GEYSER-SELF] {_pos.symbol}: entry ok ({_corr:+.1f}%), provisional=False, REACTIVE registered")
@@ -1003,12 +1139,9 @@ class WhaleGeyserReceiver:
                 return
 
             # S32 FIX: Signature-based dedup inside emit (catches gRPC same-stream duplicates)
-            if signature in self._processed_sigs_emit:
+            if not self._processed_sigs_emit.add(signature):
                 logger.info(f"[GEYSER-LOCAL] EMIT DEDUP: {signature[:20]}... already emitted")
                 return
-            self._processed_sigs_emit.add(signature)
-            if len(self._processed_sigs_emit) > 10000:
-                self._processed_sigs_emit = set(list(self._processed_sigs_emit)[-5000:])
 
             # Only process BUY signals
             if not parsed.is_buy:
@@ -1079,12 +1212,9 @@ class WhaleGeyserReceiver:
                 return
 
             # Anti-duplicate by token
-            if token_received in self._emitted_tokens:
+            if not self._emitted_tokens.add(token_received):
                 self._stats["duplicates"] += 1
                 return
-            self._emitted_tokens.add(token_received)
-            if len(self._emitted_tokens) > 500:
-                self._emitted_tokens = set(list(self._emitted_tokens)[-400:])
 
             # Check Redis for existing position
             try:
@@ -1178,8 +1308,7 @@ class WhaleGeyserReceiver:
                 logger.info(f"[SYMBOL] Resolved: {mint[:12]}... -> {symbol}")
                 # Update position symbol if trader has it
                 try:
-                    from trading.trader_registry import get_trader
-                    trader = get_trader()
+                    trader = self._owner_trader(mint)
                     if trader:
                         for p in trader.active_positions:
                             if str(p.mint) == mint and (not p.symbol or p.symbol == mint[:8]):
@@ -1329,12 +1458,9 @@ class WhaleGeyserReceiver:
                 return
 
             # Anti-duplicate by token
-            if token_received in self._emitted_tokens:
+            if not self._emitted_tokens.add(token_received):
                 self._stats["duplicates"] += 1
                 return
-            self._emitted_tokens.add(token_received)
-            if len(self._emitted_tokens) > 500:
-                self._emitted_tokens = set(list(self._emitted_tokens)[-400:])
 
             # Check Redis for existing position
             try:
@@ -1469,11 +1595,10 @@ class WhaleGeyserReceiver:
                 f'(curve={curve_address[:16]}...)'
             )
 
-            # Push updated subscribe request to ALL gRPC instances
-            new_request = self._create_subscribe_request()
-            _pushed = self._push_to_all_queues(new_request)
+            # Push updated filters to the streams whose shard changed (curve streams)
+            _pushed = self._resubscribe()
             logger.info(
-                f'[GEYSER] Pushed resubscribe to {_pushed} instances: '
+                f'[GEYSER] Pushed resubscribe to {_pushed} streams: '
                 f'{len(self.whale_wallets)} whales '
                 f'+ {len(self._vault_subscriptions)} vault pairs '
                 f'+ {len(self._curve_subscriptions)} curves '
@@ -1496,8 +1621,7 @@ class WhaleGeyserReceiver:
 
             logger.info(f'[GEYSER] -CURVE_UNSUBSCRIBE {sub.symbol} ({mint[:8]}...)')
 
-            new_request = self._create_subscribe_request()
-            self._push_to_all_queues(new_request)
+            self._resubscribe()
             return True
         except Exception as e:
             logger.error(f'[GEYSER] Failed to unsubscribe curve for {mint[:8]}: {e}')
@@ -1512,9 +1636,40 @@ class WhaleGeyserReceiver:
             return None
         return sub.price
 
-    def _handle_curve_account_update(self, account_update, source: str = "unknown", slot: int = 0) -> None:
+    def _index_migrated_pool(self, mint: str, symbol: str) -> None:
+        """Record the canonical PumpSwap pool of a just-migrated curve in the pool index.
+
+        The base vault depends on the mint's token program (Token / Token-2022),
+        which the curve stream does not carry - vault_resolver fills it from the
+        pool account with one getAccountInfo instead of getProgramAccounts.
+        """
+        try:
+            from core.pubkeys import SOL_MINT
+            from trading.pool_index import derive_pool_vault, derive_pumpswap_pool, get_pool_index
+
+            pool = derive_pumpswap_pool(mint)
+            get_pool_index().put(
+                mint, str(pool),
+                quote_vault=str(derive_pool_vault(pool, SOL_MINT)),
+                source="geyser_migration",
+            )
+            logger.info(f'[GEYSER] Indexed PumpSwap pool for {symbol}: {pool}')
+        except Exception as e:
+            logger.debug(f'[GEYSER] Pool index update failed for {symbol}: {e}')
+
+    def get_curve_snapshot(self, mint: str, max_age: float = 120.0) -> CurveSnapshot | None:
+        """Latest gRPC-decoded curve snapshot for quote/slippage math. None if no data or stale."""
+        sub = self._curve_subscriptions.get(mint)
+        if not sub or sub.snapshot is None:
+            return None
+        if time.time() - sub.last_update > max_age:
+            return None
+        return sub.snapshot
+
+    def _handle_curve_account_update(self, account_update, source: str = "unknown", slot: int = 0, base: int = 0) -> None:
         """Process bonding curve account update from gRPC stream.
         Decodes virtualTokenReserves and virtualSolReserves, calculates price.
+        base = account offset of data[0] (8 on the sliced curve stream, 0 for full data).
         Uses EXACT same formula as pumpfun/curve_manager.py:
           price = (vsr / vtr) * (10**TOKEN_DECIMALS) / LAMPORTS_PER_SOL
         Where TOKEN_DECIMALS=6, LAMPORTS_PER_SOL=1_000_000_000.
@@ -1524,10 +1679,7 @@ class WhaleGeyserReceiver:
             if not acct:
                 return
 
-            pubkey_bytes = bytes(acct.pubkey)
-            pubkey_str = base58.b58encode(pubkey_bytes).decode()
-
-            mint = self._curve_address_map.get(pubkey_str)
+            mint = self._curve_address_map.get_raw(acct.pubkey)
             if not mint:
                 return
 
@@ -1543,16 +1695,20 @@ class WhaleGeyserReceiver:
             if slot > 0:
                 sub.last_slot = slot
 
-            data = bytes(acct.data)
+            data = acct.data
             # Minimum size: 8 (discriminator) + 5*8 (reserves) + 1 (complete) = 49 bytes
-            if len(data) < 49:
-                logger.warning(f'[GEYSER] Curve data too short: {len(data)}b for {sub.symbol}')
+            if len(data) < 49 - base:
+                _hot_log.warning(mint, '[GEYSER] Curve data too short: %db for %s', len(data), sub.symbol)
                 return
 
             # Decode bonding curve fields (all little-endian u64)
-            virtual_token_reserves = struct.unpack('<Q', data[8:16])[0]
-            virtual_sol_reserves = struct.unpack('<Q', data[16:24])[0]
-            complete = bool(data[48])
+            (
+                virtual_token_reserves,
+                virtual_sol_reserves,
+                real_token_reserves,
+                real_sol_reserves,
+            ) = struct.unpack_from('<QQQQ', data, 8 - base)
+            complete = bool(data[48 - base])
 
             # If curve completed (migrated), auto-unsubscribe to free gRPC slot
             if complete and not sub.complete:
@@ -1560,12 +1716,12 @@ class WhaleGeyserReceiver:
                 logger.warning(f'[GEYSER] Curve COMPLETE (migrated): {sub.symbol} — AUTO-UNSUBSCRIBE to free gRPC slot')
                 # FIX S26-1: Remove from maps immediately — no point tracking dead curve
                 self._curve_subscriptions.pop(mint, None)
-                self._curve_address_map.pop(pubkey_str, None)
+                self._curve_address_map.pop(sub.curve_address, None)
                 self._vault_prices.pop(mint, None)
+                self._index_migrated_pool(mint, sub.symbol)
                 # Push updated request without this curve
                 try:
-                    new_request = self._create_subscribe_request()
-                    self._push_to_all_queues(new_request)
+                    self._resubscribe()
                     logger.warning(f'[GEYSER] Curve UNSUBSCRIBED on migration: {sub.symbol} — freed 1 gRPC slot')
                 except Exception as _e:
                     logger.error(f'[GEYSER] Failed to push unsubscribe after migration: {_e}')
@@ -1581,16 +1737,26 @@ class WhaleGeyserReceiver:
             sub.virtual_token_reserves = virtual_token_reserves
             sub.virtual_sol_reserves = virtual_sol_reserves
             sub.last_update = time.time()
+            sub.snapshot = CurveSnapshot(
+                platform=Platform.PUMP_FUN,
+                base_reserves=virtual_token_reserves,
+                quote_reserves=virtual_sol_reserves,
+                real_base_reserves=real_token_reserves,
+                real_quote_reserves=real_sol_reserves,
+                complete=complete,
+                slot=slot or sub.last_slot,
+                token_decimals=sub.decimals,  # 6 for pump.fun
+            )
 
-            # Price formula — EXACT same as pumpfun/curve_manager.py:
+            # Price formula — EXACT same as pumpfun/curve_manager.py (CurveSnapshot.price):
             # price = (virtual_sol_reserves / virtual_token_reserves) * (10**TOKEN_DECIMALS) / LAMPORTS_PER_SOL
-            TOKEN_DECIMALS = sub.decimals  # 6 for pump.fun
-            LAMPORTS_PER_SOL = 1_000_000_000
             old_price = sub.price
-            sub.price = (virtual_sol_reserves / virtual_token_reserves) * (10 ** TOKEN_DECIMALS) / LAMPORTS_PER_SOL
+            sub.price = sub.snapshot.price()
 
             # Store in shared vault_prices cache so get_vault_price() also returns it
             self._vault_prices[mint] = (sub.price, time.time())
+            if sub.price != old_price:
+                self._emit_price(mint, sub.price, "grpc_curve")
 
             # First curve price tick: sync entry_price for provisional positions (async, non-blocking)
             try:
@@ -1604,9 +1770,8 @@ class WhaleGeyserReceiver:
             # FIX S23-2: Skip reactive SL/TP if position no longer exists
             if _trigger:
                 try:
-                    from trading.trader_registry import get_trader
-                    _tr = get_trader()
-                    if _tr and not any(str(p.mint) == mint for p in _tr.active_positions):
+                    _tr = self._owner_trader(mint)
+                    if _tr and not _tr.has_active_position(mint):
                         logger.warning(f"[REACTIVE SKIP] {mint[:8]}: position gone — cleaning zombie trigger")
                         self._sl_tp_triggers.pop(mint, None)
                         _trigger = None
@@ -1734,11 +1899,10 @@ class WhaleGeyserReceiver:
                 f'(base={base_vault[:16]}..., quote={quote_vault[:16]}...)'
             )
 
-            # Push updated subscription request to ALL gRPC instances
-            new_request = self._create_subscribe_request()
-            _pushed = self._push_to_all_queues(new_request)
+            # Push updated filters to the streams whose shard changed (token streams)
+            _pushed = self._resubscribe()
             logger.warning(
-                f'[GEYSER] Pushed vault subscribe to {_pushed} instances: '
+                f'[GEYSER] Pushed vault subscribe to {_pushed} streams: '
                 f'{len(self.whale_wallets)} wallets '
                 f'+ {len(self._vault_subscriptions)} vault pairs '
                 f'({len(self._vault_address_map)} vault accounts)'
@@ -1763,8 +1927,7 @@ class WhaleGeyserReceiver:
 
             logger.info(f'[GEYSER] -VAULT_UNSUBSCRIBE {sub.symbol} ({mint[:8]}...)')
 
-            new_request = self._create_subscribe_request()
-            self._push_to_all_queues(new_request)
+            self._resubscribe()
 
             return True
 
@@ -1791,8 +1954,7 @@ class WhaleGeyserReceiver:
         # === END GUARD ===
         """Instant sell triggered by gRPC price tick. Bypasses monitor 1s delay."""
         try:
-            from trading.trader_registry import get_trader
-            trader = get_trader()
+            trader = self._owner_trader(mint)
             if not trader:
                 logger.error(f"[REACTIVE] No trader for {symbol} sell!")
                 return
@@ -1957,8 +2119,7 @@ class WhaleGeyserReceiver:
         if curve_price <= 0:
             return
         try:
-            from trading.trader_registry import get_trader
-            trader = get_trader()
+            trader = self._owner_trader(mint)
             if not trader:
                 return
             pos = None
@@ -2012,7 +2173,7 @@ class WhaleGeyserReceiver:
 
             try:
                 from trading.position import save_positions
-                save_positions(trader.active_positions)
+                save_positions(trader.active_positions, scope=())
             except Exception:
                 pass
 
@@ -2038,18 +2199,17 @@ class WhaleGeyserReceiver:
             return None
         return price
 
-    def _handle_vault_account_update(self, account_update, source: str = "unknown", slot: int = 0) -> None:
+    def _handle_vault_account_update(self, account_update, source: str = "unknown", slot: int = 0, base: int = 0) -> None:
         """Process vault account update from gRPC stream.
-        Decodes SPL Token Account balance and recalculates price."""
+        Decodes SPL Token Account balance and recalculates price.
+        base = account offset of data[0] (64 on the sliced token stream, 0 for full data)."""
         try:
             acct = account_update.account
             if not acct:
                 return
 
-            pubkey_bytes = bytes(acct.pubkey)
-            pubkey_str = base58.b58encode(pubkey_bytes).decode()
-
-            mint = self._vault_address_map.get(pubkey_str)
+            pk_raw = acct.pubkey
+            mint = self._vault_address_map.get_raw(pk_raw)
             if not mint:
                 return
 
@@ -2063,16 +2223,16 @@ class WhaleGeyserReceiver:
             if slot > 0:
                 sub.last_slot = slot
 
-            data = bytes(acct.data)
-            if len(data) < 72:
-                logger.warning(f'[GEYSER] Vault data too short: {len(data)}b for {sub.symbol}')
+            data = acct.data
+            if len(data) < 72 - base:
+                _hot_log.warning(mint, '[GEYSER] Vault data too short: %db for %s', len(data), sub.symbol)
                 return
 
-            raw_amount = struct.unpack('<Q', data[64:72])[0]
+            raw_amount = struct.unpack_from('<Q', data, 64 - base)[0]
 
-            if pubkey_str == sub.base_vault:
+            if pk_raw == sub.base_vault_raw:
                 sub.base_reserve = raw_amount / (10 ** sub.decimals)
-            elif pubkey_str == sub.quote_vault:
+            elif pk_raw == sub.quote_vault_raw:
                 sub.quote_reserve = raw_amount / (10 ** 9)
             else:
                 return
@@ -2083,21 +2243,22 @@ class WhaleGeyserReceiver:
                 old_price = sub.price
                 sub.price = sub.quote_reserve / sub.base_reserve
                 self._vault_prices[mint] = (sub.price, time.time())
+                if sub.price != old_price:
+                    self._emit_price(mint, sub.price, "grpc_vault")
 
                 if old_price <= 0:
                     logger.warning(
-                        f'[GEYSER] Vault FIRST price: {sub.symbol} '
-                        f'{sub.price:.10f} SOL '
-                        f'(base={sub.base_reserve:.2f}, quote={sub.quote_reserve:.6f})'
+                        '[GEYSER] Vault FIRST price: %s %.10f SOL (base=%.2f, quote=%.6f)',
+                        sub.symbol, sub.price, sub.base_reserve, sub.quote_reserve,
                     )
                 elif abs(sub.price - old_price) / max(old_price, 1e-15) > 0.05:
-                    logger.info(
-                        f'[GEYSER] Vault price move: {sub.symbol} '
-                        f'{sub.price:.10f} SOL ({((sub.price - old_price) / old_price * 100):+.1f}%)'
+                    _hot_log.info(
+                        mint, '[GEYSER] Vault price move: %s %.10f SOL (%+.1f%%)',
+                        sub.symbol, sub.price, (sub.price - old_price) / old_price * 100,
                     )
 
         except Exception as e:
-            logger.error(f'[GEYSER] Vault account update error: {e}')
+            _hot_log.error('vault', '[GEYSER] Vault account update error: %s', e)
 
 
     # ================================================================
@@ -2120,11 +2281,10 @@ class WhaleGeyserReceiver:
                 f"(ata={ata_address[:16]}...)"
             )
 
-            # Push updated subscribe request to ALL gRPC instances
-            new_request = self._create_subscribe_request()
-            _pushed = self._push_to_all_queues(new_request)
+            # Push updated filters to the streams whose shard changed (token streams)
+            _pushed = self._resubscribe()
             logger.info(
-                f"[GEYSER] Pushed ATA resubscribe to {_pushed} instances: "
+                f"[GEYSER] Pushed ATA resubscribe to {_pushed} streams: "
                 f"{len(self._ata_address_map)} ATA accounts"
             )
 
@@ -2139,35 +2299,32 @@ class WhaleGeyserReceiver:
                 self._ata_address_map.pop(ata_addr, None)
                 logger.info(f"[GEYSER] -ATA_UNSUBSCRIBE {mint[:8]}...")
 
-                new_request = self._create_subscribe_request()
-                self._push_to_all_queues(new_request)
+                self._resubscribe()
                 return True
             return False
         except Exception as e:
             logger.error(f"[GEYSER] Failed to unsubscribe ATA for {mint[:8]}: {e}")
             return False
 
-    def _handle_ata_account_update(self, account_update) -> None:
+    def _handle_ata_account_update(self, account_update, base: int = 0) -> None:
         """Process ATA account update from gRPC stream.
-        When balance > 0, tokens have arrived — mark position as ready to sell."""
+        When balance > 0, tokens have arrived — mark position as ready to sell.
+        base = account offset of data[0] (64 on the sliced token stream, 0 for full data)."""
         try:
             acct = account_update.account
             if not acct:
                 return
 
-            pubkey_bytes = bytes(acct.pubkey)
-            pubkey_str = base58.b58encode(pubkey_bytes).decode()
-
-            mint = self._ata_address_map.get(pubkey_str)
+            mint = self._ata_address_map.get_raw(acct.pubkey)
             if not mint:
                 return
 
-            data = bytes(acct.data)
+            data = acct.data
             # SPL Token Account layout: offset 64:72 = amount (u64 little-endian)
-            if len(data) < 72:
+            if len(data) < 72 - base:
                 return
 
-            raw_amount = struct.unpack('<Q', data[64:72])[0]
+            raw_amount = struct.unpack_from('<Q', data, 64 - base)[0]
 
             if raw_amount > 0:
                 logger.warning(
@@ -2177,8 +2334,7 @@ class WhaleGeyserReceiver:
 
                 # Mark position as tokens_arrived + buy_confirmed in trader
                 try:
-                    from trading.trader_registry import get_trader
-                    trader = get_trader()
+                    trader = self._owner_trader(mint)
                     if trader:
                         for pos in trader.active_positions:
                             if str(pos.mint) == mint:
@@ -2197,14 +2353,14 @@ class WhaleGeyserReceiver:
                                 )
                                 # Save to disk
                                 from trading.position import save_positions
-                                save_positions(trader.active_positions)
+                                save_positions(trader.active_positions, scope=())
                                 break
                 except Exception as e:
                     logger.error(f"[GEYSER] ATA trader update error: {e}")
 
                 # Cleanup — no longer need to watch this ATA
                 self._ata_pending.pop(mint, None)
-                self._ata_address_map.pop(pubkey_str, None)
+                self._ata_address_map.pop(base58.b58encode(acct.pubkey).decode(), None)
 
         except Exception as e:
             logger.error(f"[GEYSER] ATA account update error: {e}")
@@ -2215,6 +2371,7 @@ class WhaleGeyserReceiver:
             stats["last_pong_ago_s"] = round(
                 time.monotonic() - self._last_pong_time, 1
             )
+        stats["subscriptions"] = dict(self._subscriptions.stats)
         stats["curve_subscriptions"] = len(self._curve_subscriptions)
         stats["curve_accounts"] = len(self._curve_address_map)
         # Per-instance stats
@@ -2226,6 +2383,10 @@ class WhaleGeyserReceiver:
             stats["grpc_instances"][inst.name] = inst_stats
         if self.local_parser:
             stats["local_parser"] = self.local_parser.get_stats()
+        stats["priority_fee"] = self._fee_estimator.get_stats()
+        stats["pda_cache"] = get_pda_cache_stats()
+        stats["confirmations"] = get_confirmation_service().get_stats()
+        stats["market_data"] = get_market_data_client().get_stats()
         return stats
 
     def get_tracked_wallets(self) -> list[str]:
@@ -32,6 +32,8 @@ from typing import Callable, Optional
 
 import aiohttp
 
+from monitoring.dedup_cache import DedupCache
+
 logger = logging.getLogger(__name__)
 
 # Platform Program IDs
@@ -198,8 +200,8 @@ class WhalePoller:
         # State
         self.running = False
         self._session: Optional[aiohttp.ClientSession] = None
-        self._processed_sigs: set[str] = set()
-        self._emitted_tokens: set[str] = set()
+        self._processed_sigs = DedupCache(maxsize=5000)
+        self._emitted_tokens = DedupCache(maxsize=500)
         
         # Stats
         self._stats = {
@@ -403,12 +405,8 @@ class WhalePoller:
                 if age > self.max_tx_age:
                     continue
                     
-                # Mark as processed
+                # Mark as processed (FIFO-bounded, oldest evicted first)
                 self._processed_sigs.add(sig)
-                
-                # Cleanup old processed sigs (keep last 5000)
-                if len(self._processed_sigs) > 5000:
-                    self._processed_sigs = set(list(self._processed_sigs)[-2500:])
                     
                 # Process the transaction
                 await self._process_transaction(wallet, sig, age)
@@ -524,12 +522,8 @@ class WhalePoller:
         # Fetch token symbol from DexScreener
         token_symbol = await _fetch_token_symbol(token_mint)
         
-        # Mark token as emitted
+        # Mark token as emitted (FIFO-bounded, oldest evicted first)
         self._emitted_tokens.add(token_mint)
-        
-        # Cleanup old emitted tokens (keep last 500)
-        if len(self._emitted_tokens) > 500:
-            self._emitted_tokens = set(list(self._emitted_tokens)[-400:])
             
         whale_info = self.whale_wallets.get(wallet, {})
         whale_label = whale_info.get("label", "whale")
@@ -13,6 +13,10 @@ from typing import Callable, Optional
 from aiohttp import web
 
 import aiohttp
+
+from monitoring.dedup_cache import DedupCache
+from utils.market_data import get_market_data_client
+
 logger = logging.getLogger(__name__)
 
 TOKEN_BLACKLIST = {
@@ -30,18 +34,13 @@ SOL_MINT = "So11111111111111111111111111111111111111112"
 
 async def _fetch_symbol_dexscreener(mint: str) -> str:
     """Fetch token symbol: DexScreener -> Jupiter Token API -> short mint fallback."""
-    # 1. Try DexScreener (fastest for established tokens)
+    # 1. Try DexScreener (fastest for established tokens; shared batched client)
     try:
-        url = f"https://api.dexscreener.com/latest/dex/tokens/{mint}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=2)) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    pairs = data.get("pairs", [])
-                    if pairs:
-                        sym = pairs[0].get("baseToken", {}).get("symbol", "")
-                        if sym:
-                            return sym
+        pairs = await asyncio.wait_for(get_market_data_client().dexscreener_pairs(mint), timeout=2)
+        if pairs:
+            sym = pairs[0].get("baseToken", {}).get("symbol", "")
+            if sym:
+                return sym
     except Exception:
         pass
     # 2. Fallback: Jupiter Token API V2 (indexes new tokens faster)
@@ -102,8 +101,8 @@ class WhaleWebhookReceiver:
         self.on_whale_buy: Optional[Callable] = None
         
         # In-memory backup when Redis is down
-        self._processed_sigs: set[str] = set()
-        self._emitted_tokens: set[str] = set()
+        self._processed_sigs = DedupCache(maxsize=5000)
+        self._emitted_tokens = DedupCache(maxsize=500)
         
         self._stats = {
             "webhooks_received": 0,
@@ -275,12 +274,9 @@ class WhaleWebhookReceiver:
                 await state.mark_tx_processed(signature)
             else:
                 # Fallback to in-memory
-                if signature in self._processed_sigs:
+                if not self._processed_sigs.add(signature):
                     self._stats["duplicates"] += 1
                     return
-                self._processed_sigs.add(signature)
-                if len(self._processed_sigs) > 5000:
-                    self._processed_sigs = set(list(self._processed_sigs)[-2500:])
             # ==================== END IDEMPOTENCY ====================
             
             fee_payer = tx.get("feePayer", "")
@@ -340,13 +336,9 @@ class WhaleWebhookReceiver:
                 return
             
             # Anti-duplicate by token
-            if token_received in self._emitted_tokens:
+            if not self._emitted_tokens.add(token_received):
                 self._stats["duplicates"] += 1
                 return
-            self._emitted_tokens.add(token_received)
-            
-            if len(self._emitted_tokens) > 500:
-                self._emitted_tokens = set(list(self._emitted_tokens)[-400:])
             
             # Check if already have position
             if state and await state.is_connected():
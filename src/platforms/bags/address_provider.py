@@ -16,8 +16,8 @@ from dataclasses import dataclass
 from typing import Final
 
 from solders.pubkey import Pubkey
-from spl.token.instructions import get_associated_token_address
 
+from core.pda_cache import find_program_address, get_associated_token_address
 from core.pubkeys import SystemAddresses
 from interfaces.core import AddressProvider, Platform, TokenInfo
 
@@ -57,6 +57,9 @@ class BagsAddresses:
     MIGRATION_KEEPER_2: Final[Pubkey] = Pubkey.from_string(
         "DeQ8dPv6ReZNQ45NfiWwS5CchWpB2BVq1QMyNV8L2uSW"
     )
+    # Singleton PDAs, derived once at import
+    AUTHORITY: Final[Pubkey] = find_program_address([b"vault_auth_seed"], PROGRAM)[0]
+    EVENT_AUTHORITY: Final[Pubkey] = find_program_address([b"__event_authority"], PROGRAM)[0]
 
 
 class BagsAddressProvider(AddressProvider):
@@ -116,11 +119,11 @@ class BagsAddressProvider(AddressProvider):
         # This is a limitation - config must be known from token creation event
         if config is None:
             # Fallback: derive without config (may not match actual pool)
-            pool_state, _ = Pubkey.find_program_address(
+            pool_state, _ = find_program_address(
                 [b"pool", bytes(base_mint), bytes(quote_mint)], BagsAddresses.PROGRAM
             )
         else:
-            pool_state, _ = Pubkey.find_program_address(
+            pool_state, _ = find_program_address(
                 [bytes(base_mint), bytes(quote_mint), bytes(config)], BagsAddresses.PROGRAM
             )
         return pool_state
@@ -144,7 +147,7 @@ class BagsAddressProvider(AddressProvider):
         pool_state = self.derive_pool_address(base_mint, quote_mint)
 
         # Then derive the base vault using pool_vault seed
-        base_vault, _ = Pubkey.find_program_address(
+        base_vault, _ = find_program_address(
             [b"pool_vault", bytes(pool_state), bytes(base_mint)],
             BagsAddresses.PROGRAM,
         )
@@ -169,7 +172,7 @@ class BagsAddressProvider(AddressProvider):
         pool_state = self.derive_pool_address(base_mint, quote_mint)
 
         # Then derive the quote vault using pool_vault seed
-        quote_vault, _ = Pubkey.find_program_address(
+        quote_vault, _ = find_program_address(
             [b"pool_vault", bytes(pool_state), bytes(quote_mint)],
             BagsAddresses.PROGRAM,
         )
@@ -236,11 +239,7 @@ class BagsAddressProvider(AddressProvider):
         Returns:
             Authority PDA address
         """
-        AUTH_SEED = b"vault_auth_seed"
-        authority_pda, _ = Pubkey.find_program_address(
-            [AUTH_SEED], BagsAddresses.PROGRAM
-        )
-        return authority_pda
+        return BagsAddresses.AUTHORITY
 
     def derive_event_authority_pda(self) -> Pubkey:
         """Derive the event authority PDA for BAGS.
@@ -250,11 +249,7 @@ class BagsAddressProvider(AddressProvider):
         Returns:
             Event authority PDA address
         """
-        EVENT_AUTHORITY_SEED = b"__event_authority"
-        event_authority_pda, _ = Pubkey.find_program_address(
-            [EVENT_AUTHORITY_SEED], BagsAddresses.PROGRAM
-        )
-        return event_authority_pda
+        return BagsAddresses.EVENT_AUTHORITY
 
     def derive_creator_fee_vault(
         self, creator: Pubkey, quote_mint: Pubkey | None = None
@@ -273,7 +268,7 @@ class BagsAddressProvider(AddressProvider):
         if quote_mint is None:
             quote_mint = SystemAddresses.SOL_MINT
 
-        creator_fee_vault, _ = Pubkey.find_program_address(
+        creator_fee_vault, _ = find_program_address(
             [bytes(creator), bytes(quote_mint)], BagsAddresses.PROGRAM
         )
         return creator_fee_vault
@@ -15,9 +15,9 @@ from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
 from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS
-from interfaces.core import CurveManager, Platform
+from interfaces.core import CurveManager, CurveSnapshot, Platform
 from platforms.bags.address_provider import BagsAddressProvider
-from utils.idl_parser import IDLParser
+from utils.idl_parser import IDLParser, pubkey_str
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -61,50 +61,81 @@ class BagsCurveManager(CurveManager):
         """Get the current state of a BAGS VirtualPool.
 
         Args:
-            pool_address: Address of the VirtualPool account
+            pool_address: Address of the BAGS VirtualPool account
 
         Returns:
             Dictionary containing pool state data
         """
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.state
+
+    async def get_curve_snapshot(self, pool_address: Pubkey) -> CurveSnapshot:
+        """Read the BAGS VirtualPool account once and return an immutable snapshot.
+
+        Args:
+            pool_address: Address of the BAGS VirtualPool account
+
+        Returns:
+            CurveSnapshot with base_reserve/quote_reserve as base/quote reserves
+        """
         try:
             account = await self.client.get_account_info(pool_address)
             if not account.data:
                 raise ValueError(f"No data in pool state account {pool_address}")
 
-            # Decode pool state
-            if self._idl_parser:
-                pool_state_data = self._decode_pool_state_with_idl(account.data)
-            else:
-                pool_state_data = self._decode_pool_state_manual(account.data)
-
-            return pool_state_data
+            return self.snapshot_from_account_data(pool_address, account.data)
 
         except Exception as e:
             logger.exception("Failed to get pool state")
             raise ValueError(f"Invalid pool state: {e!s}")
 
-    async def calculate_price(self, pool_address: Pubkey) -> float:
-        """Calculate current token price from VirtualPool state.
+    def snapshot_from_account_data(
+        self, pool_address: Pubkey | None, data: bytes, slot: int = 0
+    ) -> CurveSnapshot:
+        """Build a snapshot from BAGS VirtualPool account bytes (no RPC).
 
         Args:
-            pool_address: Address of the VirtualPool
+            pool_address: Address of the BAGS VirtualPool account (if known)
+            data: Raw account data including the discriminator
+            slot: Slot the data was observed at (0 if unknown)
 
         Returns:
-            Current token price in SOL
+            CurveSnapshot decoded from data
         """
-        pool_state = await self.get_pool_state(pool_address)
+        if self._idl_parser:
+            pool_state = self._decode_pool_state_with_idl(data)
+        else:
+            pool_state = self._decode_pool_state_manual(data)
+        creator = pool_state.get("creator")
+        return CurveSnapshot(
+            platform=Platform.BAGS,
+            base_reserves=pool_state["base_reserve"],
+            quote_reserves=pool_state["quote_reserve"],
+            real_base_reserves=pool_state["base_reserve"],
+            real_quote_reserves=pool_state["quote_reserve"],
+            # status 0 = still trading on the curve
+            complete=pool_state.get("status", 0) != 0,
+            creator=str(creator) if creator else None,
+            pool_address=pool_address,
+            slot=slot,
+            state=pool_state,
+        )
 
-        base_reserve = pool_state["base_reserve"]
-        quote_reserve = pool_state["quote_reserve"]
+    async def calculate_price(self, pool_address: Pubkey) -> float:
+        """Calculate current token price from pool state.
 
-        if base_reserve <= 0 or quote_reserve <= 0:
-            raise ValueError("Invalid reserve state")
+        Args:
+            pool_address: Address of the BAGS VirtualPool
 
-        # Price = quote_reserves / base_reserves (how much SOL per token)
-        price_lamports = quote_reserve / base_reserve
-        price_sol = price_lamports * (10**TOKEN_DECIMALS) / LAMPORTS_PER_SOL
+        Returns:
+            Current token price in SOL
 
-        return price_sol
+        Raises:
+            ValueError: If reserves are not positive
+        """
+        # Price = quote_reserves / base_reserves (how much SOL per token)
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.price()
 
     async def calculate_buy_amount_out(
         self, pool_address: Pubkey, amount_in: int
@@ -114,26 +145,15 @@ class BagsCurveManager(CurveManager):
         Uses the constant product AMM formula.
 
         Args:
-            pool_address: Address of the VirtualPool
+            pool_address: Address of the BAGS VirtualPool
             amount_in: Amount of SOL to spend (in lamports)
 
         Returns:
             Expected amount of tokens to receive (in raw token units)
         """
-        pool_state = await self.get_pool_state(pool_address)
-
-        base_reserve = pool_state["base_reserve"]
-        quote_reserve = pool_state["quote_reserve"]
-
         # Constant product formula: tokens_out = (amount_in * base_reserve) / (quote_reserve + amount_in)
-        numerator = amount_in * base_reserve
-        denominator = quote_reserve + amount_in
-
-        if denominator == 0:
-            return 0
-
-        tokens_out = numerator // denominator
-        return tokens_out
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.buy_amount_out(amount_in)
 
     async def calculate_sell_amount_out(
         self, pool_address: Pubkey, amount_in: int
@@ -143,38 +163,27 @@ class BagsCurveManager(CurveManager):
         Uses the constant product AMM formula.
 
         Args:
-            pool_address: Address of the VirtualPool
+            pool_address: Address of the BAGS VirtualPool
             amount_in: Amount of tokens to sell (in raw token units)
 
         Returns:
             Expected amount of SOL to receive (in lamports)
         """
-        pool_state = await self.get_pool_state(pool_address)
-
-        base_reserve = pool_state["base_reserve"]
-        quote_reserve = pool_state["quote_reserve"]
-
         # Constant product formula: sol_out = (amount_in * quote_reserve) / (base_reserve + amount_in)
-        numerator = amount_in * quote_reserve
-        denominator = base_reserve + amount_in
-
-        if denominator == 0:
-            return 0
-
-        sol_out = numerator // denominator
-        return sol_out
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.sell_amount_out(amount_in)
 
     async def get_reserves(self, pool_address: Pubkey) -> tuple[int, int]:
         """Get current pool reserves.
 
         Args:
-            pool_address: Address of the VirtualPool
+            pool_address: Address of the BAGS VirtualPool
 
         Returns:
-            Tuple of (base_reserve, quote_reserve) in raw units
+            Tuple of (base_reserves, quote_reserves) in raw units
         """
-        pool_state = await self.get_pool_state(pool_address)
-        return (pool_state["base_reserve"], pool_state["quote_reserve"])
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.reserves
 
     def _decode_pool_state_with_idl(self, data: bytes) -> dict[str, Any]:
         """Decode VirtualPool state data using injected IDL parser.
@@ -190,7 +199,7 @@ class BagsCurveManager(CurveManager):
         """
         # Use injected IDL parser to decode VirtualPool account data
         decoded_pool_state = self._idl_parser.decode_account_data(
-            data, "VirtualPool", skip_discriminator=True
+            data, "VirtualPool", skip_discriminator=True, raw_pubkeys=True
         )
 
         if not decoded_pool_state:
@@ -198,12 +207,12 @@ class BagsCurveManager(CurveManager):
 
         # Extract the fields we need for trading calculations
         pool_data = {
-            "config": decoded_pool_state.get("config"),
-            "creator": decoded_pool_state.get("creator"),
-            "base_mint": decoded_pool_state.get("baseMint"),
-            "quote_mint": decoded_pool_state.get("quoteMint"),
-            "base_vault": decoded_pool_state.get("baseVault"),
-            "quote_vault": decoded_pool_state.get("quoteVault"),
+            "config": pubkey_str(decoded_pool_state.get("config")),
+            "creator": pubkey_str(decoded_pool_state.get("creator")),
+            "base_mint": pubkey_str(decoded_pool_state.get("baseMint")),
+            "quote_mint": pubkey_str(decoded_pool_state.get("quoteMint")),
+            "base_vault": pubkey_str(decoded_pool_state.get("baseVault")),
+            "quote_vault": pubkey_str(decoded_pool_state.get("quoteVault")),
             "sqrt_price": decoded_pool_state.get("sqrtPrice", 0),
             "base_reserve": decoded_pool_state.get("baseReserve", 0),
             "quote_reserve": decoded_pool_state.get("quoteReserve", 0),
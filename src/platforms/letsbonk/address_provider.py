@@ -9,8 +9,8 @@ from dataclasses import dataclass
 from typing import Final
 
 from solders.pubkey import Pubkey
-from spl.token.instructions import get_associated_token_address
 
+from core.pda_cache import find_program_address, get_associated_token_address
 from core.pubkeys import SystemAddresses
 from interfaces.core import AddressProvider, Platform, TokenInfo
 
@@ -40,6 +40,9 @@ class LetsBonkAddresses:
     PLATFORM_CONFIG: Final[Pubkey] = Pubkey.from_string(
         "5thqcDwKp5QQ8US4XRMoseGeGbmLKMmoKZmS6zHrQAsA"
     )
+    # Singleton PDAs, derived once at import
+    AUTHORITY: Final[Pubkey] = find_program_address([b"vault_auth_seed"], PROGRAM)[0]
+    EVENT_AUTHORITY: Final[Pubkey] = find_program_address([b"__event_authority"], PROGRAM)[0]
 
 
 class LetsBonkAddressProvider(AddressProvider):
@@ -92,7 +95,7 @@ class LetsBonkAddressProvider(AddressProvider):
         if quote_mint is None:
             quote_mint = SystemAddresses.SOL_MINT
 
-        pool_state, _ = Pubkey.find_program_address(
+        pool_state, _ = find_program_address(
             [b"pool", bytes(base_mint), bytes(quote_mint)], LetsBonkAddresses.PROGRAM
         )
         return pool_state
@@ -116,7 +119,7 @@ class LetsBonkAddressProvider(AddressProvider):
         pool_state = self.derive_pool_address(base_mint, quote_mint)
 
         # Then derive the base vault using pool_vault seed
-        base_vault, _ = Pubkey.find_program_address(
+        base_vault, _ = find_program_address(
             [b"pool_vault", bytes(pool_state), bytes(base_mint)],
             LetsBonkAddresses.PROGRAM,
         )
@@ -141,7 +144,7 @@ class LetsBonkAddressProvider(AddressProvider):
         pool_state = self.derive_pool_address(base_mint, quote_mint)
 
         # Then derive the quote vault using pool_vault seed
-        quote_vault, _ = Pubkey.find_program_address(
+        quote_vault, _ = find_program_address(
             [b"pool_vault", bytes(pool_state), bytes(quote_mint)],
             LetsBonkAddresses.PROGRAM,
         )
@@ -208,11 +211,7 @@ class LetsBonkAddressProvider(AddressProvider):
         Returns:
             Authority PDA address
         """
-        AUTH_SEED = b"vault_auth_seed"
-        authority_pda, _ = Pubkey.find_program_address(
-            [AUTH_SEED], LetsBonkAddresses.PROGRAM
-        )
-        return authority_pda
+        return LetsBonkAddresses.AUTHORITY
 
     def derive_event_authority_pda(self) -> Pubkey:
         """Derive the event authority PDA for Raydium LaunchLab.
@@ -222,11 +221,7 @@ class LetsBonkAddressProvider(AddressProvider):
         Returns:
             Event authority PDA address
         """
-        EVENT_AUTHORITY_SEED = b"__event_authority"
-        event_authority_pda, _ = Pubkey.find_program_address(
-            [EVENT_AUTHORITY_SEED], LetsBonkAddresses.PROGRAM
-        )
-        return event_authority_pda
+        return LetsBonkAddresses.EVENT_AUTHORITY
 
     def derive_creator_fee_vault(
         self, creator: Pubkey, quote_mint: Pubkey | None = None
@@ -245,7 +240,7 @@ class LetsBonkAddressProvider(AddressProvider):
         if quote_mint is None:
             quote_mint = SystemAddresses.SOL_MINT
 
-        creator_fee_vault, _ = Pubkey.find_program_address(
+        creator_fee_vault, _ = find_program_address(
             [bytes(creator), bytes(quote_mint)], LetsBonkAddresses.PROGRAM
         )
         return creator_fee_vault
@@ -270,7 +265,7 @@ class LetsBonkAddressProvider(AddressProvider):
         if quote_mint is None:
             quote_mint = SystemAddresses.SOL_MINT
 
-        platform_fee_vault, _ = Pubkey.find_program_address(
+        platform_fee_vault, _ = find_program_address(
             [bytes(platform_config), bytes(quote_mint)], LetsBonkAddresses.PROGRAM
         )
         return platform_fee_vault
@@ -11,9 +11,9 @@ from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
 from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS
-from interfaces.core import CurveManager, Platform
+from interfaces.core import CurveManager, CurveSnapshot, Platform
 from platforms.letsbonk.address_provider import LetsBonkAddressProvider
-from utils.idl_parser import IDLParser
+from utils.idl_parser import IDLParser, pubkey_str
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -44,48 +44,78 @@ class LetsBonkCurveManager(CurveManager):
         """Get the current state of a LetsBonk pool.
 
         Args:
-            pool_address: Address of the pool state account
+            pool_address: Address of the LetsBonk pool account
 
         Returns:
             Dictionary containing pool state data
         """
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.state
+
+    async def get_curve_snapshot(self, pool_address: Pubkey) -> CurveSnapshot:
+        """Read the LetsBonk pool account once and return an immutable snapshot.
+
+        Args:
+            pool_address: Address of the LetsBonk pool account
+
+        Returns:
+            CurveSnapshot with virtual_base/virtual_quote as base/quote reserves
+        """
         try:
             account = await self.client.get_account_info(pool_address)
             if not account.data:
                 raise ValueError(f"No data in pool state account {pool_address}")
 
-            # Decode pool state using injected IDL parser
-            pool_state_data = self._decode_pool_state_with_idl(account.data)
-
-            return pool_state_data
+            return self.snapshot_from_account_data(pool_address, account.data)
 
         except Exception as e:
             logger.exception("Failed to get pool state")
             raise ValueError(f"Invalid pool state: {e!s}")
 
-    async def calculate_price(self, pool_address: Pubkey) -> float:
-        """Calculate current token price from pool state.
+    def snapshot_from_account_data(
+        self, pool_address: Pubkey | None, data: bytes, slot: int = 0
+    ) -> CurveSnapshot:
+        """Build a snapshot from LetsBonk pool account bytes (no RPC).
 
         Args:
-            pool_address: Address of the pool state
+            pool_address: Address of the LetsBonk pool account (if known)
+            data: Raw account data including the discriminator
+            slot: Slot the data was observed at (0 if unknown)
 
         Returns:
-            Current token price in SOL
+            CurveSnapshot decoded from data
         """
-        pool_state = await self.get_pool_state(pool_address)
+        pool_state = self._decode_pool_state_with_idl(data)
+        creator = pool_state.get("creator")
+        return CurveSnapshot(
+            platform=Platform.LETS_BONK,
+            base_reserves=pool_state["virtual_base"],
+            quote_reserves=pool_state["virtual_quote"],
+            real_base_reserves=pool_state["real_base"],
+            real_quote_reserves=pool_state["real_quote"],
+            # status 0 = still trading on the curve
+            complete=pool_state.get("status", 0) != 0,
+            creator=str(creator) if creator else None,
+            pool_address=pool_address,
+            slot=slot,
+            state=pool_state,
+        )
 
-        # Use virtual reserves for price calculation
-        virtual_base = pool_state["virtual_base"]
-        virtual_quote = pool_state["virtual_quote"]
+    async def calculate_price(self, pool_address: Pubkey) -> float:
+        """Calculate current token price from pool state.
 
-        if virtual_base <= 0 or virtual_quote <= 0:
-            raise ValueError("Invalid reserve state")
+        Args:
+            pool_address: Address of the LetsBonk pool
 
-        # Price = quote_reserves / base_reserves (how much SOL per token)
-        price_lamports = virtual_quote / virtual_base
-        price_sol = price_lamports * (10**TOKEN_DECIMALS) / LAMPORTS_PER_SOL
+        Returns:
+            Current token price in SOL
 
-        return price_sol
+        Raises:
+            ValueError: If reserves are not positive
+        """
+        # Price = quote_reserves / base_reserves (how much SOL per token)
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.price()
 
     async def calculate_buy_amount_out(
         self, pool_address: Pubkey, amount_in: int
@@ -95,26 +125,15 @@ class LetsBonkCurveManager(CurveManager):
         Uses the constant product AMM formula.
 
         Args:
-            pool_address: Address of the pool state
+            pool_address: Address of the LetsBonk pool
             amount_in: Amount of SOL to spend (in lamports)
 
         Returns:
             Expected amount of tokens to receive (in raw token units)
         """
-        pool_state = await self.get_pool_state(pool_address)
-
-        virtual_base = pool_state["virtual_base"]
-        virtual_quote = pool_state["virtual_quote"]
-
         # Constant product formula: tokens_out = (amount_in * virtual_base) / (virtual_quote + amount_in)
-        numerator = amount_in * virtual_base
-        denominator = virtual_quote + amount_in
-
-        if denominator == 0:
-            return 0
-
-        tokens_out = numerator // denominator
-        return tokens_out
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.buy_amount_out(amount_in)
 
     async def calculate_sell_amount_out(
         self, pool_address: Pubkey, amount_in: int
@@ -124,38 +143,27 @@ class LetsBonkCurveManager(CurveManager):
         Uses the constant product AMM formula.
 
         Args:
-            pool_address: Address of the pool state
+            pool_address: Address of the LetsBonk pool
             amount_in: Amount of tokens to sell (in raw token units)
 
         Returns:
             Expected amount of SOL to receive (in lamports)
         """
-        pool_state = await self.get_pool_state(pool_address)
-
-        virtual_base = pool_state["virtual_base"]
-        virtual_quote = pool_state["virtual_quote"]
-
         # Constant product formula: sol_out = (amount_in * virtual_quote) / (virtual_base + amount_in)
-        numerator = amount_in * virtual_quote
-        denominator = virtual_base + amount_in
-
-        if denominator == 0:
-            return 0
-
-        sol_out = numerator // denominator
-        return sol_out
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.sell_amount_out(amount_in)
 
     async def get_reserves(self, pool_address: Pubkey) -> tuple[int, int]:
         """Get current pool reserves.
 
         Args:
-            pool_address: Address of the pool state
+            pool_address: Address of the LetsBonk pool
 
         Returns:
             Tuple of (base_reserves, quote_reserves) in raw units
         """
-        pool_state = await self.get_pool_state(pool_address)
-        return (pool_state["virtual_base"], pool_state["virtual_quote"])
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.reserves
 
     def _decode_pool_state_with_idl(self, data: bytes) -> dict[str, Any]:
         """Decode pool state data using injected IDL parser.
@@ -171,7 +179,7 @@ class LetsBonkCurveManager(CurveManager):
         """
         # Use injected IDL parser to decode PoolState account data
         decoded_pool_state = self._idl_parser.decode_account_data(
-            data, "PoolState", skip_discriminator=True
+            data, "PoolState", skip_discriminator=True, raw_pubkeys=True
         )
 
         if not decoded_pool_state:
@@ -186,11 +194,9 @@ class LetsBonkCurveManager(CurveManager):
             "real_quote": decoded_pool_state.get("real_quote", 0),
             "status": decoded_pool_state.get("status", 0),
             "supply": decoded_pool_state.get("supply", 0),
-            "creator": decoded_pool_state.get(
-                "creator"
-            ),  # Creator pubkey (as base58 string)
-            "base_vault": decoded_pool_state.get("base_vault"),  # Base vault pubkey
-            "quote_vault": decoded_pool_state.get("quote_vault"),  # Quote vault pubkey
+            "creator": pubkey_str(decoded_pool_state.get("creator")),  # Creator pubkey (as base58 string)
+            "base_vault": pubkey_str(decoded_pool_state.get("base_vault")),  # Base vault pubkey
+            "quote_vault": pubkey_str(decoded_pool_state.get("quote_vault")),  # Quote vault pubkey
         }
 
         # Calculate additional metrics
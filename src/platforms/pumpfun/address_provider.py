@@ -9,8 +9,8 @@ from dataclasses import dataclass
 from typing import Final
 
 from solders.pubkey import Pubkey
-from spl.token.instructions import get_associated_token_address
 
+from core.pda_cache import find_program_address, get_associated_token_address
 from core.pubkeys import SystemAddresses
 from interfaces.core import AddressProvider, Platform, TokenInfo
 
@@ -43,6 +43,13 @@ class PumpFunAddresses:
     FEE_PROGRAM: Final[Pubkey] = Pubkey.from_string(
         "pfeeUxB6jkeY1Hxd7CsFCAjcbHA9rWtchMGdZ6VojVZ"
     )
+    # Singleton PDAs, derived once at import
+    GLOBAL_VOLUME_ACCUMULATOR: Final[Pubkey] = find_program_address(
+        [b"global_volume_accumulator"], PROGRAM
+    )[0]
+    FEE_CONFIG: Final[Pubkey] = find_program_address(
+        [b"fee_config", bytes(PROGRAM)], FEE_PROGRAM
+    )[0]
 
     @staticmethod
     def find_global_volume_accumulator() -> Pubkey:
@@ -52,11 +59,7 @@ class PumpFunAddresses:
         Returns:
             Pubkey of the derived global volume accumulator account
         """
-        derived_address, _ = Pubkey.find_program_address(
-            [b"global_volume_accumulator"],
-            PumpFunAddresses.PROGRAM,
-        )
-        return derived_address
+        return PumpFunAddresses.GLOBAL_VOLUME_ACCUMULATOR
 
     @staticmethod
     def find_user_volume_accumulator(user: Pubkey) -> Pubkey:
@@ -69,7 +72,7 @@ class PumpFunAddresses:
         Returns:
             Pubkey of the derived user volume accumulator account
         """
-        derived_address, _ = Pubkey.find_program_address(
+        derived_address, _ = find_program_address(
             [b"user_volume_accumulator", bytes(user)],
             PumpFunAddresses.PROGRAM,
         )
@@ -83,11 +86,7 @@ class PumpFunAddresses:
         Returns:
             Pubkey of the derived fee config account
         """
-        derived_address, _ = Pubkey.find_program_address(
-            [b"fee_config", bytes(PumpFunAddresses.PROGRAM)],
-            PumpFunAddresses.FEE_PROGRAM,
-        )
-        return derived_address
+        return PumpFunAddresses.FEE_CONFIG
 
 
 class PumpFunAddressProvider(AddressProvider):
@@ -140,7 +139,7 @@ class PumpFunAddressProvider(AddressProvider):
         Returns:
             Bonding curve address
         """
-        bonding_curve, _ = Pubkey.find_program_address(
+        bonding_curve, _ = find_program_address(
             [b"bonding-curve", bytes(base_mint)], PumpFunAddresses.PROGRAM
         )
         return bonding_curve
@@ -213,7 +212,7 @@ class PumpFunAddressProvider(AddressProvider):
         if token_program_id is None:
             token_program_id = SystemAddresses.TOKEN_2022_PROGRAM
 
-        derived_address, _ = Pubkey.find_program_address(
+        derived_address, _ = find_program_address(
             [
                 bytes(bonding_curve),
                 bytes(token_program_id),
@@ -232,7 +231,7 @@ class PumpFunAddressProvider(AddressProvider):
         Returns:
             Creator vault address
         """
-        creator_vault, _ = Pubkey.find_program_address(
+        creator_vault, _ = find_program_address(
             [b"creator-vault", bytes(creator)], PumpFunAddresses.PROGRAM
         )
         return creator_vault
@@ -11,8 +11,8 @@ from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
 from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS
-from interfaces.core import CurveManager, Platform
-from utils.idl_parser import IDLParser
+from interfaces.core import CurveManager, CurveSnapshot, Platform
+from utils.idl_parser import IDLParser, pubkey_str
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -47,20 +47,56 @@ class PumpFunCurveManager(CurveManager):
         Returns:
             Dictionary containing bonding curve state data
         """
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.state
+
+    async def get_curve_snapshot(self, pool_address: Pubkey) -> CurveSnapshot:
+        """Read the bonding curve account once and return an immutable snapshot.
+
+        Args:
+            pool_address: Address of the bonding curve
+
+        Returns:
+            CurveSnapshot with virtual token/SOL reserves as base/quote
+        """
         try:
             account = await self.client.get_account_info(pool_address)
             if not account.data:
                 raise ValueError(f"No data in bonding curve account {pool_address}")
 
-            # Decode bonding curve state using injected IDL parser
-            curve_state_data = self._decode_curve_state_with_idl(account.data)
-
-            return curve_state_data
+            return self.snapshot_from_account_data(pool_address, account.data)
 
         except Exception as e:
             logger.exception("Failed to get curve state")
             raise ValueError(f"Invalid bonding curve state: {e!s}")
 
+    def snapshot_from_account_data(
+        self, pool_address: Pubkey | None, data: bytes, slot: int = 0
+    ) -> CurveSnapshot:
+        """Build a snapshot from BondingCurve account bytes (no RPC).
+
+        Args:
+            pool_address: Address of the bonding curve (if known)
+            data: Raw account data including the discriminator
+            slot: Slot the data was observed at (0 if unknown)
+
+        Returns:
+            CurveSnapshot decoded from data
+        """
+        curve_state = self._decode_curve_state_with_idl(data)
+        return CurveSnapshot(
+            platform=Platform.PUMP_FUN,
+            base_reserves=curve_state["virtual_token_reserves"],
+            quote_reserves=curve_state["virtual_sol_reserves"],
+            real_base_reserves=curve_state["real_token_reserves"],
+            real_quote_reserves=curve_state["real_sol_reserves"],
+            complete=bool(curve_state["complete"]),
+            creator=curve_state["creator"] or None,
+            pool_address=pool_address,
+            slot=slot,
+            state=curve_state,
+        )
+
     async def calculate_price(self, pool_address: Pubkey) -> float:
         """Calculate current token price from bonding curve state.
 
@@ -70,20 +106,14 @@ class PumpFunCurveManager(CurveManager):
         Returns:
             Current token price in SOL
         """
-        pool_state = await self.get_pool_state(pool_address)
-
-        # Use virtual reserves for price calculation
-        virtual_token_reserves = pool_state["virtual_token_reserves"]
-        virtual_sol_reserves = pool_state["virtual_sol_reserves"]
+        snapshot = await self.get_curve_snapshot(pool_address)
 
-        logger.debug(f"[CALC PRICE] pool={str(pool_address)[:16]}, vt={virtual_token_reserves}, vs={virtual_sol_reserves}")
+        logger.debug(f"[CALC PRICE] pool={str(pool_address)[:16]}, vt={snapshot.base_reserves}, vs={snapshot.quote_reserves}")
 
-        if virtual_token_reserves <= 0:
+        if snapshot.base_reserves <= 0:
             return 0.0
 
-        # Price = sol_reserves / token_reserves
-        price_lamports = virtual_sol_reserves / virtual_token_reserves
-        return price_lamports * (10**TOKEN_DECIMALS) / LAMPORTS_PER_SOL
+        return snapshot.price()
 
     async def calculate_buy_amount_out(
         self, pool_address: Pubkey, amount_in: int
@@ -99,21 +129,9 @@ class PumpFunCurveManager(CurveManager):
         Returns:
             Expected amount of tokens to receive (in raw token units)
         """
-        pool_state = await self.get_pool_state(pool_address)
-
-        virtual_token_reserves = pool_state["virtual_token_reserves"]
-        virtual_sol_reserves = pool_state["virtual_sol_reserves"]
-
-        # Use virtual reserves for bonding curve calculation
         # Formula: tokens_out = (amount_in * virtual_token_reserves) / (virtual_sol_reserves + amount_in)
-        numerator = amount_in * virtual_token_reserves
-        denominator = virtual_sol_reserves + amount_in
-
-        if denominator == 0:
-            return 0
-
-        tokens_out = numerator // denominator
-        return tokens_out
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.buy_amount_out(amount_in)
 
     async def calculate_sell_amount_out(
         self, pool_address: Pubkey, amount_in: int
@@ -129,21 +147,9 @@ class PumpFunCurveManager(CurveManager):
         Returns:
             Expected amount of SOL to receive (in lamports)
         """
-        pool_state = await self.get_pool_state(pool_address)
-
-        virtual_token_reserves = pool_state["virtual_token_reserves"]
-        virtual_sol_reserves = pool_state["virtual_sol_reserves"]
-
-        # Use virtual reserves for bonding curve calculation
         # Formula: sol_out = (amount_in * virtual_sol_reserves) / (virtual_token_reserves + amount_in)
-        numerator = amount_in * virtual_sol_reserves
-        denominator = virtual_token_reserves + amount_in
-
-        if denominator == 0:
-            return 0
-
-        sol_out = numerator // denominator
-        return sol_out
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.sell_amount_out(amount_in)
 
     async def get_reserves(self, pool_address: Pubkey) -> tuple[int, int]:
         """Get current bonding curve reserves.
@@ -154,11 +160,8 @@ class PumpFunCurveManager(CurveManager):
         Returns:
             Tuple of (token_reserves, sol_reserves) in raw units
         """
-        pool_state = await self.get_pool_state(pool_address)
-        return (
-            pool_state["virtual_token_reserves"],
-            pool_state["virtual_sol_reserves"],
-        )
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.reserves
 
     def _decode_curve_state_with_idl(self, data: bytes) -> dict[str, Any]:
         """Decode bonding curve state data using injected IDL parser.
@@ -174,7 +177,7 @@ class PumpFunCurveManager(CurveManager):
         """
         # Use injected IDL parser to decode BondingCurve account data
         decoded_curve_state = self._idl_parser.decode_account_data(
-            data, "BondingCurve", skip_discriminator=True
+            data, "BondingCurve", skip_discriminator=True, raw_pubkeys=True
         )
 
         if not decoded_curve_state:
@@ -191,7 +194,7 @@ class PumpFunCurveManager(CurveManager):
             "real_sol_reserves": decoded_curve_state.get("real_sol_reserves", 0),
             "token_total_supply": decoded_curve_state.get("token_total_supply", 0),
             "complete": decoded_curve_state.get("complete", False),
-            "creator": decoded_curve_state.get("creator", ""),
+            "creator": pubkey_str(decoded_curve_state.get("creator")) or "",
             "is_mayhem_mode": decoded_curve_state.get("is_mayhem_mode", False),
         }
 
@@ -277,38 +280,23 @@ class PumpFunCurveManager(CurveManager):
         Returns:
             True if curve is complete, False otherwise
         """
-        pool_state = await self.get_pool_state(pool_address)
-        return pool_state.get("complete", False)
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.complete
 
     async def get_curve_progress(self, pool_address: Pubkey) -> dict[str, Any]:
         """Get bonding curve completion progress information.
 
+        Progress is approximate: SOL raised vs the typical pump.fun
+        graduation target (the exact target isn't stored in the curve state).
+
         Args:
             pool_address: Address of the bonding curve
 
         Returns:
             Dictionary with progress information
         """
-        pool_state = await self.get_pool_state(pool_address)
-
-        # Calculate progress based on SOL raised vs target
-        # This is approximate since the exact target isn't stored in the curve state
-        sol_raised = pool_state["real_sol_reserves"] / LAMPORTS_PER_SOL
-
-        # Estimate progress based on typical pump.fun graduation requirements
-        # (This could be made more accurate with additional on-chain data)
-        estimated_target_sol = 85.0  # Typical pump.fun graduation target
-        progress_percentage = min((sol_raised / estimated_target_sol) * 100, 100.0)
-
-        return {
-            "complete": pool_state.get("complete", False),
-            "sol_raised": sol_raised,
-            "estimated_target_sol": estimated_target_sol,
-            "progress_percentage": progress_percentage,
-            "tokens_available": pool_state["virtual_token_reserves"]
-            / 10**TOKEN_DECIMALS,
-            "market_cap_sol": sol_raised,  # Approximate market cap
-        }
+        snapshot = await self.get_curve_snapshot(pool_address)
+        return snapshot.progress(target_quote_sol=85.0)
 
     def validate_curve_state_structure(self, pool_address: Pubkey) -> bool:
         """Validate that the curve state structure matches IDL expectations.
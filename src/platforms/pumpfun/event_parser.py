@@ -13,6 +13,7 @@ from typing import Any
 from solders.pubkey import Pubkey
 from solders.transaction import VersionedTransaction
 
+from core.pda_cache import find_program_address
 from core.pubkeys import SystemAddresses
 from interfaces.core import EventParser, Platform, TokenInfo
 from platforms.pumpfun.address_provider import PumpFunAddresses
@@ -587,7 +588,7 @@ class PumpFunEventParser(EventParser):
         Returns:
             Creator vault address
         """
-        derived_address, _ = Pubkey.find_program_address(
+        derived_address, _ = find_program_address(
             [b"creator-vault", bytes(creator)],
             PumpFunAddresses.PROGRAM,
         )
@@ -609,7 +610,7 @@ class PumpFunEventParser(EventParser):
         if token_program_id is None:
             token_program_id = SystemAddresses.TOKEN_PROGRAM
 
-        derived_address, _ = Pubkey.find_program_address(
+        derived_address, _ = find_program_address(
             [
                 bytes(bonding_curve),
                 bytes(token_program_id),
@@ -3,7 +3,6 @@ Dedup Store - дедупликация токенов для мультипро
 Поддерживает Redis (primary) и SQLite (fallback).
 """
 
-import asyncio
 import json
 import logging
 import time
@@ -13,6 +12,8 @@ from typing import Optional, Protocol
 from dataclasses import dataclass
 from enum import Enum
 
+from core.redis_pool import REDIS_AVAILABLE, REDIS_URL, AsyncRedis, get_async_redis
+
 logger = logging.getLogger(__name__)
 
 
@@ -101,35 +102,18 @@ class RedisDedupStore:
             return True
         
         try:
-            import redis.asyncio as aioredis
-            self._redis = aioredis.Redis(
-                host=self.host,
-                port=self.port,
-                db=self.db,
-                decode_responses=True
-            )
+            # Shared pooled client; every command is timed under "dedup"
+            if not REDIS_AVAILABLE:
+                logger.warning("[DEDUP] redis.asyncio not installed")
+                return False
+            url = f"redis://{self.host}:{self.port}/{self.db}"
+            facade = get_async_redis() if url == REDIS_URL else AsyncRedis(url)
+            self._redis = facade.client_for("dedup")
             # Проверяем соединение
             await self._redis.ping()
             self._connected = True
             logger.info(f"[DEDUP] Connected to Redis at {self.host}:{self.port}")
             return True
-        except ImportError:
-            logger.warning("[DEDUP] redis.asyncio not installed, falling back to sync redis")
-            try:
-                import redis
-                self._redis = redis.Redis(
-                    host=self.host,
-                    port=self.port,
-                    db=self.db,
-                    decode_responses=True
-                )
-                self._redis.ping()
-                self._connected = True
-                logger.info(f"[DEDUP] Connected to Redis (sync) at {self.host}:{self.port}")
-                return True
-            except Exception as e:
-                logger.error(f"[DEDUP] Redis connection failed: {e}")
-                return False
         except Exception as e:
             logger.error(f"[DEDUP] Redis connection failed: {e}")
             return False
@@ -268,39 +252,27 @@ class RedisDedupStore:
             logger.error(f"[DEDUP] get_status error: {e}")
             return None
     
-    # === Redis операции (поддержка sync и async) ===
+    # === Redis операции ===
     
     async def _set_nx(self, key: str, value: str, ttl: int) -> bool:
         """SET key value NX EX ttl"""
-        if asyncio.iscoroutinefunction(self._redis.set):
-            return await self._redis.set(key, value, nx=True, ex=ttl)
-        return self._redis.set(key, value, nx=True, ex=ttl)
+        return await self._redis.set(key, value, nx=True, ex=ttl)
     
     async def _set_ex(self, key: str, value: str, ttl: int) -> None:
         """SET key value EX ttl"""
-        if asyncio.iscoroutinefunction(self._redis.set):
-            await self._redis.set(key, value, ex=ttl)
-        else:
-            self._redis.set(key, value, ex=ttl)
+        await self._redis.set(key, value, ex=ttl)
     
     async def _get(self, key: str) -> Optional[str]:
         """GET key"""
-        if asyncio.iscoroutinefunction(self._redis.get):
-            return await self._redis.get(key)
-        return self._redis.get(key)
+        return await self._redis.get(key)
     
     async def _exists(self, key: str) -> bool:
         """EXISTS key"""
-        if asyncio.iscoroutinefunction(self._redis.exists):
-            return await self._redis.exists(key) > 0
-        return self._redis.exists(key) > 0
+        return await self._redis.exists(key) > 0
     
     async def _delete(self, key: str) -> None:
         """DEL key"""
-        if asyncio.iscoroutinefunction(self._redis.delete):
-            await self._redis.delete(key)
-        else:
-            self._redis.delete(key)
+        await self._redis.delete(key)
 
 
 class SQLiteDedupStore:
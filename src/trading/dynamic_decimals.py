@@ -110,15 +110,17 @@ class DecimalsResolver:
         try:
             from solders.pubkey import Pubkey
 
+            from core.account_coalescer import get_account_coalescer
+
             pubkey = Pubkey.from_string(mint)
 
-            # Используем getAccountInfo для получения данных Mint аккаунта
-            response = await self.rpc_client.get_account_info(pubkey)
+            # Mint аккаунт читается через общий батч getMultipleAccounts
+            account = await get_account_coalescer(self.rpc_client).get(pubkey)
 
-            if response.value is None:
+            if account is None:
                 return None
 
-            data = response.value.data
+            data = account.data
 
             # SPL Token Mint layout: decimals находится на позиции 44 (1 byte)
             # https://github.com/solana-labs/solana-program-library/blob/master/token/program/src/state.rs
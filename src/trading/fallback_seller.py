@@ -10,16 +10,18 @@ from typing import TYPE_CHECKING
 
 import aiohttp
 import base58
-from solana.rpc.commitment import Confirmed
-from solana.rpc.types import MemcmpOpts, TxOpts
+from solana.rpc.types import MemcmpOpts
 from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
 from solders.instruction import AccountMeta, Instruction
 from solders.message import Message
 from solders.pubkey import Pubkey
 from solders.signature import Signature
 from solders.transaction import VersionedTransaction
-from spl.token.instructions import get_associated_token_address
 
+from core.account_coalescer import get_account_coalescer
+from core.confirmation_service import get_confirmation_service
+from core.pda_cache import find_program_address, get_associated_token_address
+from core.send_fabric import get_send_fabric
 from utils.logger import get_logger
 from utils.retry import calculate_delay, classify_error, ErrorCategory
 
@@ -70,9 +72,9 @@ async def get_token_decimals(client, mint: "Pubkey") -> int:
     
     try:
         # Get mint account info
-        response = await asyncio.wait_for(client.get_account_info(mint, encoding="base64"), timeout=1.0)
-        if response and response.value:
-            data = response.value.data
+        account = await asyncio.wait_for(get_account_coalescer(client).get(mint), timeout=1.0)
+        if account:
+            data = account.data
             # Handle base64 encoded data
             if isinstance(data, tuple):
                 import base64
@@ -126,28 +128,20 @@ async def verify_transaction_success(rpc_client, signature: str, max_wait: float
     """
     Verify transaction was confirmed AND successful on-chain.
     Returns (success, error_message)
+
+    Waits on the shared ConfirmationService (batched status polling +
+    geyser early resolve) instead of polling this signature on its own.
     """
-    import asyncio
-    from solders.signature import Signature
-    
-    sig = Signature.from_string(signature) if isinstance(signature, str) else signature
-    start_time = asyncio.get_event_loop().time()
-    
-    while asyncio.get_event_loop().time() - start_time < max_wait:
-        try:
-            resp = await rpc_client.get_signature_statuses([sig])
-            if resp.value and resp.value[0]:
-                status = resp.value[0]
-                if status.err:
-                    # Transaction failed on-chain (6001, 6024, etc.)
-                    return False, f"TX failed: {status.err}"
-                if status.confirmation_status:
-                    # Confirmed successfully
-                    return True, None
-        except Exception:
-            pass
-        await asyncio.sleep(0.3)
-    
+    rpc_url = getattr(getattr(rpc_client, "_provider", None), "endpoint_uri", None)
+    # Any confirmation status counts (processed included), as before
+    outcome = await get_confirmation_service(rpc_url).wait(
+        str(signature), commitment="processed", timeout=max_wait
+    )
+    if outcome.success:
+        return True, None
+    if outcome.landed:
+        # Transaction failed on-chain (6001, 6024, etc.)
+        return False, outcome.error
     return False, "Confirmation timeout"
 
 
@@ -236,9 +230,6 @@ class FallbackSeller:
         self.jupiter_api_key = jupiter_api_key or os.getenv("JUPITER_TRADE_API_KEY")  # NO fallback to monitor key!
         self._alt_client = None
 
-        # S45: Persistent aiohttp session (saves ~58ms TCP+TLS per _send_tx_parallel)
-        self._persistent_session: aiohttp.ClientSession | None = None
-
     async def _get_rpc_client(self):
         """Get RPC client - uses dRPC/Chainstack/Alchemy.
         
@@ -269,249 +260,23 @@ class FallbackSeller:
         logger.info(f"[FALLBACK] Using RPC: {rpc_url[:60]}...")
         return self._alt_client
 
-    async def _get_persistent_session(self) -> aiohttp.ClientSession:
-        """S45: Reusable aiohttp session — avoids TCP+TLS handshake per call."""
-        if self._persistent_session is None or self._persistent_session.closed:
-            self._persistent_session = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(limit=50, keepalive_timeout=60),
-                timeout=aiohttp.ClientTimeout(total=10),
-            )
-        return self._persistent_session
-
-    async def close(self):
-        """S45: Cleanup persistent session."""
-        if self._persistent_session and not self._persistent_session.closed:
-            await self._persistent_session.close()
-            self._persistent_session = None
-
-
-
     async def _send_tx_parallel(self, signed_tx, rpc_client):
-        """S44-1: Send TX via ALL Jito endpoints + ALL RPC endpoints in parallel.
-        
-        Sends the same signed TX to 7-8 places simultaneously.
+        """S44-1: Send TX via the send fabric (core.send_fabric) in parallel.
+
+        The same signed TX goes to the primary RPC plus the best-performing
+        Jito / RPC / swQoS endpoints (learned per endpoint from ack latency
+        and success), over pre-warmed keep-alive connections.
         First successful signature wins. Solana deduplicates by signature.
-        More endpoints = higher chance of reaching current leader faster.
         """
-        import time as _time
-        _t0 = _time.monotonic()
-        
-        jito = get_jito_sender()
-        import base64
-        tx_bytes = bytes(signed_tx)
-        tx_base64 = base64.b64encode(tx_bytes).decode('utf-8')
-
-        # === S44-1: Collect ALL RPC endpoints ===
-        extra_rpc_urls = []
-        for env_key in (
-            "CHAINSTACK_RPC_ENDPOINT",
-            "DRPC_RPC_ENDPOINT",
-            "ALCHEMY_RPC_ENDPOINT",
-            "SOLANA_PUBLIC_RPC_ENDPOINT",
-        ):
-            url = os.getenv(env_key)
-            if url:
-                extra_rpc_urls.append((env_key.split("_")[0], url))
-        # Helius RPC from API key
-        _helius_key = os.getenv("HELIUS_API_KEY")
-        if _helius_key:
-            extra_rpc_urls.append(("Helius", f"https://mainnet.helius-rpc.com/?api-key={_helius_key}"))
-
-        # === S44-2: Multiple Jito block engines ===
-        jito_endpoints = []
-        if jito.enabled:
-            # Primary from .env
-            primary_jito = jito.block_engine_url
-            jito_endpoints.append(primary_jito)
-            # Add other regions (deduplicated)
-            for url in (
-                "https://frankfurt.mainnet.block-engine.jito.wtf",
-                "https://amsterdam.mainnet.block-engine.jito.wtf",
-                "https://ny.mainnet.block-engine.jito.wtf",
-                "https://tokyo.mainnet.block-engine.jito.wtf",
-            ):
-                if url != primary_jito:
-                    jito_endpoints.append(url)
-
-        # === Build tasks ===
-        async def _rpc_send_primary():
-            """Primary RPC client (already connected)."""
-            result = await rpc_client.send_transaction(
-                signed_tx,
-                opts=TxOpts(skip_preflight=True, preflight_commitment=Confirmed)
-            )
-            return str(result.value)
-
-        async def _rpc_send_raw(name: str, url: str):
-            """Send via raw HTTP POST to additional RPC endpoints."""
-            payload = {
-                "jsonrpc": "2.0", "id": 1,
-                "method": "sendTransaction",
-                "params": [tx_base64, {
-                    "encoding": "base64",
-                    "skipPreflight": True,
-                    "preflightCommitment": "processed",
-                    "maxRetries": 0
-                }]
-            }
-            sess = await self._get_persistent_session()
-            async with sess.post(url, json=payload) as resp:
-                    data = await resp.json()
-                    if "result" in data:
-                        return data["result"]
-                    err = data.get("error", {})
-                    raise RuntimeError(f"{name}: {err}")
-
-        async def _jito_send_to(url: str):
-            """Send via specific Jito block engine."""
-            payload = {
-                "jsonrpc": "2.0", "id": 1,
-                "method": "sendTransaction",
-                "params": [tx_base64, {"encoding": "base64"}]
-            }
-            sess = await self._get_persistent_session()
-            async with sess.post(f"{url}/api/v1/transactions", json=payload) as resp:
-                    data = await resp.json()
-                    if "result" in data:
-                        return data["result"]
-                    err = data.get("error", {})
-                    raise RuntimeError(f"Jito {url.split('.')[0].split('//')[1]}: {err}")
-
-        # Primary RPC (already-connected client)
-        tasks = [asyncio.create_task(_rpc_send_primary())]
-        
-        # Extra RPC endpoints
-        for name, url in extra_rpc_urls:
-            tasks.append(asyncio.create_task(_rpc_send_raw(name, url)))
-        
-        # Jito endpoints
-        for jito_url in jito_endpoints:
-            tasks.append(asyncio.create_task(_jito_send_to(jito_url)))
-
-        # === S44-3: bloXroute swQoS (staked connections, FREE tier) ===
-        _bloxroute_auth = os.getenv("BLOXROUTE_AUTH_HEADER")
-        if _bloxroute_auth:
-            async def _bloxroute_send(region_url: str):
-                """Send via bloXroute Trader API with swQoS staked connections."""
-                payload = {
-                    "transaction": {"content": tx_base64},
-                    "frontRunningProtection": False,
-                    "useStakedRPCs": True,
-                }
-                sess = await self._get_persistent_session()
-                async with sess.post(
-                    region_url,
-                    json=payload,
-                    headers={"Authorization": _bloxroute_auth, "Content-Type": "application/json"}
-                ) as resp:
-                        data = await resp.json()
-                        sig = data.get("signature")
-                        if sig:
-                            return sig
-                        raise RuntimeError(f"bloXroute: {str(data)[:100]}")
-
-            for bx_url in (
-                "https://ny.solana.dex.blxrbdn.com/api/v2/submit",
-                "https://uk.solana.dex.blxrbdn.com/api/v2/submit",
-            ):
-                tasks.append(asyncio.create_task(_bloxroute_send(bx_url)))
-
-        # === S44-5: Circular Fast (swQoS + Jito, free 25 RPS) ===
-        _circular_key = os.getenv("CIRCULAR_FAST_API_KEY")
-        if _circular_key:
-            async def _circular_send():
-                payload = {
-                    "jsonrpc": "2.0", "id": 1,
-                    "method": "sendTransaction",
-                    "params": [tx_base64, {"frontRunningProtection": False}]
-                }
-                sess = await self._get_persistent_session()
-                async with sess.post(
-                    "https://fast.circular.bot/transactions",
-                    json=payload,
-                    headers={"Content-Type": "application/json", "x-api-key": _circular_key}
-                ) as resp:
-                        data = await resp.json()
-                        result = data.get("result")
-                        if result:
-                            sig = result.get("signature") if isinstance(result, dict) else result
-                            if sig:
-                                return sig
-                        raise RuntimeError(f"Circular: {str(data.get('error',''))[:80]}")
-            tasks.append(asyncio.create_task(_circular_send()))
-
-        # === S44-4: TPU Penetrator (direct TPU access via swQoS, Frankfurt) ===
-        _tpu_endpoint = os.getenv("TPU_PENETRATOR_URL")
-        if _tpu_endpoint:
-            async def _tpu_send():
-                payload = {
-                    "jsonrpc": "2.0", "id": 1,
-                    "method": "sendTransaction",
-                    "params": [tx_base64, {"encoding": "base64", "skipPreflight": True}]
-                }
-                sess = await self._get_persistent_session()
-                async with sess.post(_tpu_endpoint, json=payload) as resp:
-                        data = await resp.json()
-                        if "result" in data:
-                            return data["result"]
-                        raise RuntimeError(f"TPU: {str(data.get('error',''))[:80]}")
-            tasks.append(asyncio.create_task(_tpu_send()))
-
-
-        # === S45: Helius Sender (swQoS + Jito, FREE, no API key needed) ===
-        async def _helius_sender(region_url: str, label: str):
-            """Send via Helius Sender — largest Solana validator, swQoS staked connections."""
-            payload = {
-                "jsonrpc": "2.0", "id": 1,
-                "method": "sendTransaction",
-                "params": [tx_base64, {
-                    "encoding": "base64",
-                    "skipPreflight": True,
-                    "maxRetries": 0
-                }]
-            }
-            sess = await self._get_persistent_session()
-            async with sess.post(region_url, json=payload) as resp:
-                data = await resp.json()
-                if "result" in data:
-                    return data["result"]
-                err = data.get("error", {})
-                raise RuntimeError(f"HeliusSender-{label}: {err}")
-
-        for _hs_label, _hs_url in (
-            ("fra", "http://fra-sender.helius-rpc.com/fast"),
-            ("ams", "http://ams-sender.helius-rpc.com/fast"),
-        ):
-            tasks.append(asyncio.create_task(_helius_sender(_hs_url, _hs_label)))
-
-        total_tasks = len(tasks)
-
-        # Race — first successful signature wins
-        sig = None
-        errors = []
-        for coro in asyncio.as_completed(tasks):
-            try:
-                result = await coro
-                if result:
-                    sig = result
-                    _elapsed = (_time.monotonic() - _t0) * 1000
-                    logger.info(
-                        f"[TX] S44 parallel send: {sig[:20]}... "
-                        f"({_elapsed:.0f}ms, {total_tasks} endpoints)"
-                    )
-                    break
-            except Exception as e:
-                errors.append(str(e)[:60])
-                continue
-
-        # Cancel remaining tasks (fire-and-forget — let them finish in background)
-        for t in tasks:
-            if not t.done():
-                t.cancel()
-
-        if not sig:
-            raise RuntimeError(f'All {total_tasks} send endpoints failed: {errors[:3]}')
-        return sig
+        primary_url = getattr(getattr(rpc_client, "_provider", None), "endpoint_uri", None)
+        result = await get_send_fabric(primary_url).send(bytes(signed_tx), primary_url=primary_url)
+        if not result.is_success:
+            raise RuntimeError(result.error)
+        logger.info(
+            f"[TX] S44 parallel send: {result.signature[:20]}... "
+            f"({result.latency_ms:.0f}ms via {result.provider})"
+        )
+        return result.signature
 
 
 
@@ -700,7 +465,7 @@ class FallbackSeller:
 
             # Get creator vault
             coin_creator = Pubkey.from_string(market_data["coin_creator"])
-            coin_creator_vault, _ = Pubkey.find_program_address(
+            coin_creator_vault, _ = find_program_address(
                 [b"creator_vault", bytes(coin_creator)], PUMP_AMM_PROGRAM_ID
             )
             coin_creator_vault_ata = get_associated_token_address(
@@ -708,19 +473,19 @@ class FallbackSeller:
             )
 
             # Fee config PDA
-            fee_config, _ = Pubkey.find_program_address(
+            fee_config, _ = find_program_address(
                 [b"fee_config", bytes(PUMP_AMM_PROGRAM_ID)], PUMP_FEE_PROGRAM
             )
 
             # Volume accumulator PDAs (required by IDL)
-            global_volume_accumulator, _ = Pubkey.find_program_address(
+            global_volume_accumulator, _ = find_program_address(
                 [b"global_volume_accumulator"], PUMP_AMM_PROGRAM_ID
             )
-            user_volume_accumulator, _ = Pubkey.find_program_address(
+            user_volume_accumulator, _ = find_program_address(
                 [b"user_volume_accumulator", bytes(self.wallet.pubkey)], PUMP_AMM_PROGRAM_ID
             )
             # S46: pool_v2 PDA (required since program upgrade)
-            pool_v2, _ = Pubkey.find_program_address(
+            pool_v2, _ = find_program_address(
                 [b"pool-v2", bytes(mint)], PUMP_AMM_PROGRAM_ID
             )
 
@@ -916,13 +681,13 @@ class FallbackSeller:
                 # MEDIUM #6: Check complete flag — curve may have migrated
                 # between whale TX and our TX. Fast check (~15ms), skip on timeout.
                 try:
-                    _cbc_resp = await asyncio.wait_for(
-                        rpc_client.get_account_info(bonding_curve, encoding="base64"),
+                    _cbc_account = await asyncio.wait_for(
+                        get_account_coalescer(rpc_client).get(bonding_curve),
                         timeout=0.10,
                     )
-                    if _cbc_resp and _cbc_resp.value and _cbc_resp.value.data:
+                    if _cbc_account and _cbc_account.data:
                         import base64 as _b64
-                        _cbc_raw = _cbc_resp.value.data
+                        _cbc_raw = _cbc_account.data
                         _cbc_bytes = _b64.b64decode(_cbc_raw[0]) if isinstance(_cbc_raw, list) else bytes(_cbc_raw)
                         if len(_cbc_bytes) > 48 and _cbc_bytes[48] != 0:
                             logger.info("[PUMPFUN-DIRECT] ZERO-RPC: complete=True (migrated since whale TX) — falling through")
@@ -935,10 +700,8 @@ class FallbackSeller:
                 # Fallback: fetch from RPC (~20ms)
                 logger.info("[PUMPFUN-DIRECT] No TX reserves, fetching via RPC...")
                 try:
-                    bc_resp = await asyncio.wait_for(
-                        rpc_client.get_account_info(
-                            bonding_curve, encoding="base64"
-                        ),
+                    bc_account = await asyncio.wait_for(
+                        get_account_coalescer(rpc_client).get(bonding_curve),
                         timeout=0.15,  # S12: was 0.5s
                     )
                 except asyncio.TimeoutError:
@@ -950,14 +713,14 @@ class FallbackSeller:
                 except Exception as e:
                     return False, None, f"BC RPC error: {e}", 0.0, 0.0
                 
-                if not bc_resp or not bc_resp.value:
+                if not bc_account:
                     elapsed = (_time.monotonic() - t_start) * 1000
                     logger.info(
                         f"[PUMPFUN-DIRECT] No bonding curve ({elapsed:.0f}ms)"
                     )
                     return False, None, "BC not found", 0.0, 0.0
                 
-                bc_data = bc_resp.value.data
+                bc_data = bc_account.data
                 if isinstance(bc_data, (tuple, list)):
                     bc_data = b64mod.b64decode(bc_data[0])
                 elif isinstance(bc_data, str):
@@ -1045,12 +808,12 @@ class FallbackSeller:
                 # RPC fallback: fetch BC to get creator (adds ~45ms)
                 if not creator_pubkey:
                     try:
-                        _bc_resp = await asyncio.wait_for(
-                            rpc_client.get_account_info(bonding_curve, encoding="base64"),
+                        _bc_account = await asyncio.wait_for(
+                            get_account_coalescer(rpc_client).get(bonding_curve),
                             timeout=0.2,
                         )
-                        if _bc_resp and _bc_resp.value:
-                            _bc_raw = _bc_resp.value.data
+                        if _bc_account:
+                            _bc_raw = _bc_account.data
                             if isinstance(_bc_raw, (tuple, list)):
                                 _bc_raw = b64mod.b64decode(_bc_raw[0])
                             elif isinstance(_bc_raw, str):
@@ -1609,10 +1372,10 @@ class FallbackSeller:
     async def _get_token_program_id(self, mint: Pubkey) -> Pubkey:
         """Determine if mint uses TokenProgram or Token2022Program."""
         rpc_client = await self._get_rpc_client()
-        mint_info = await rpc_client.get_account_info(mint)
-        if not mint_info.value:
+        mint_info = await get_account_coalescer(rpc_client).get(mint)
+        if not mint_info:
             raise ValueError(f"Could not fetch mint info for {mint}")
-        owner = mint_info.value.owner
+        owner = mint_info.owner
         if owner == SYSTEM_TOKEN_PROGRAM:
             return SYSTEM_TOKEN_PROGRAM
         elif owner == TOKEN_2022_PROGRAM:
@@ -1623,12 +1386,15 @@ class FallbackSeller:
         """Get token balance in raw units - works with both TokenProgram and Token2022Program.
         
         Token2022 accounts may not appear in getTokenAccountsByOwner with TokenProgram filter.
-        This function queries the ATA directly, which works for both program types.
+        This function reads the ATA directly (amount: u64 at offset 64, same in
+        both programs), batched with other account reads.
         """
         try:
             rpc_client = await self._get_rpc_client()
-            response = await rpc_client.get_token_account_balance(ata)
-            return int(response.value.amount) if response.value else 0
+            account = await get_account_coalescer(rpc_client).get(ata)
+            if not account or len(account.data) < 72:
+                return 0
+            return struct.unpack_from("<Q", bytes(account.data), 64)[0]
         except Exception as e:
             # If ATA doesn't exist or is empty, return 0
             logger.warning(f"[BALANCE] Could not get balance for {ata}: {e}")
@@ -1722,7 +1488,7 @@ class FallbackSeller:
 
             # Get creator vault
             coin_creator = Pubkey.from_string(market_data["coin_creator"])
-            coin_creator_vault, _ = Pubkey.find_program_address(
+            coin_creator_vault, _ = find_program_address(
                 [b"creator_vault", bytes(coin_creator)], PUMP_AMM_PROGRAM_ID
             )
             coin_creator_vault_ata = get_associated_token_address(
@@ -1730,11 +1496,11 @@ class FallbackSeller:
             )
 
             # Fee config PDA
-            fee_config, _ = Pubkey.find_program_address(
+            fee_config, _ = find_program_address(
                 [b"fee_config", bytes(PUMP_AMM_PROGRAM_ID)], PUMP_FEE_PROGRAM
             )
             # S46: pool_v2 PDA (required since program upgrade)
-            pool_v2, _ = Pubkey.find_program_address(
+            pool_v2, _ = find_program_address(
                 [b"pool-v2", bytes(mint)], PUMP_AMM_PROGRAM_ID
             )
 
@@ -2039,31 +1805,15 @@ class FallbackSeller:
 
 
     async def _confirm_transaction(self, sig: str, rpc_client, timeout: int = 15) -> bool:
-        """Poll getSignatureStatuses until confirmed or timeout."""
-        from solders.signature import Signature
-        import time
-        
-        start = time.time()
-        signature = Signature.from_string(sig)
-        
-        while time.time() - start < timeout:
-            try:
-                resp = await rpc_client.get_signature_statuses([signature])
-                if resp.value and resp.value[0]:
-                    status = resp.value[0]
-                    if status.err:
-                        logger.warning(f"[TX CONFIRM] TX {sig[:16]}... failed on-chain: {status.err}")
-                        return False
-                    if status.confirmation_status is not None:
-                        conf_str = str(status.confirmation_status)
-                        if "confirmed" in conf_str.lower() or "finalized" in conf_str.lower():
-                            logger.info(f"[TX CONFIRM] TX {sig[:16]}... confirmed on-chain")
-                            return True
-            except Exception as e:
-                logger.warning(f"[TX CONFIRM] Status check error: {e}")
-            
-            await asyncio.sleep(1)
-        
+        """Wait on the shared ConfirmationService until confirmed or timeout."""
+        rpc_url = getattr(getattr(rpc_client, "_provider", None), "endpoint_uri", None)
+        outcome = await get_confirmation_service(rpc_url).wait(sig, commitment="confirmed", timeout=timeout)
+        if outcome.success:
+            logger.info(f"[TX CONFIRM] TX {sig[:16]}... confirmed on-chain ({outcome.source}, {outcome.latency_ms:.0f}ms)")
+            return True
+        if outcome.landed:
+            logger.warning(f"[TX CONFIRM] TX {sig[:16]}... failed on-chain: {outcome.err}")
+            return False
         logger.warning(f"[TX CONFIRM] TX {sig[:16]}... not confirmed after {timeout}s")
         return False
 
@@ -1,85 +1,47 @@
 """
 Periodic purchase_history cleanup - runs every 24 hours.
-Removes entries older than 24h from purchased_tokens_history.json.
+Compacts the purchase history log (trading/purchase_history.py), dropping
+entries older than MAX_AGE_SECONDS.
 Also syncs trader._bought_tokens in-memory set.
 """
 
 import asyncio
-import json
 import logging
-import fcntl
-import time
-from datetime import datetime, timedelta
-from pathlib import Path
+
+from trading.purchase_history import get_purchase_index
 
 logger = logging.getLogger(__name__)
 
 CLEANUP_INTERVAL = 3600  # 1 hour (check every hour, remove > 3h old)
 MAX_AGE_SECONDS = 3600  # 1 hour (S47: was 3h)
-HISTORY_FILE = Path("/opt/pumpfun-bonkfun-bot/data/purchased_tokens_history.json")
 
 
 async def run_periodic_purchase_cleanup():
-    """Main purchase_history cleanup loop. Removes entries older than 24h."""
+    """Main purchase_history cleanup loop. Removes entries older than MAX_AGE_SECONDS."""
     logger.warning(f"[PURCHASE_CLEANUP] Periodic purchase_history cleanup scheduled (every {CLEANUP_INTERVAL // 3600}h, max age {MAX_AGE_SECONDS // 3600}h)")
     # FIX S28-5: Run first cleanup immediately on startup (was delayed 24h)
 
     while True:
         try:
-            if not HISTORY_FILE.exists():
-                logger.info("[PURCHASE_CLEANUP] No history file found, skipping")
-                await asyncio.sleep(CLEANUP_INTERVAL)
-                continue
-
-            with open(HISTORY_FILE, 'r') as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                try:
-                    data = json.load(f)
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-            tokens = data.get("purchased_tokens", {})
-            total = len(tokens)
-            cutoff = datetime.utcnow() - timedelta(seconds=MAX_AGE_SECONDS)
-            cutoff_str = cutoff.isoformat()
-
-            # Keep only entries newer than 24h
-            fresh = {}
-            removed = 0
-            for mint, info in tokens.items():
-                ts = info.get("timestamp", "")
-                if ts and ts > cutoff_str:
-                    fresh[mint] = info
-                else:
-                    removed += 1
-
-            if removed > 0:
-                data["purchased_tokens"] = fresh
-                # Atomic write
-                tmp = HISTORY_FILE.with_suffix('.tmp')
-                with open(tmp, 'w') as f:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                    try:
-                        json.dump(data, f, indent=2)
-                    finally:
-                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                tmp.rename(HISTORY_FILE)
+            # Compaction rewrites the log under its lock file — off the event loop
+            expired_mints, kept = await asyncio.to_thread(get_purchase_index().prune, MAX_AGE_SECONDS)
 
+            if expired_mints:
                 # Sync trader._bought_tokens in-memory
                 try:
-                    from trading.trader_registry import get_trader
-                    trader = get_trader()
-                    if trader and hasattr(trader, '_bought_tokens'):
-                        expired_mints = set(tokens.keys()) - set(fresh.keys())
+                    from trading.trader_registry import get_traders
+                    for trader in get_traders():  # every bot in this process
+                        if not hasattr(trader, '_bought_tokens'):
+                            continue
                         trader._bought_tokens -= expired_mints  # FIX S30-F: remove only expired, keep in-memory additions
-                        trader._bought_tokens |= set(fresh.keys())  # ensure file entries are present
+                        trader._bought_tokens |= get_purchase_index().mints()  # ensure file entries are present
                         logger.info(f"[PURCHASE_CLEANUP] Synced _bought_tokens: removed {len(expired_mints)} expired, total {len(trader._bought_tokens)}")
                 except Exception as sync_err:
                     logger.warning(f"[PURCHASE_CLEANUP] Could not sync _bought_tokens: {sync_err}")
 
-                logger.warning(f"[PURCHASE_CLEANUP] Removed {removed} entries older than 24h (was {total}, now {len(fresh)})")
+                logger.warning(f"[PURCHASE_CLEANUP] Removed {len(expired_mints)} expired entries (was {len(expired_mints) + kept}, now {kept})")
             else:
-                logger.info(f"[PURCHASE_CLEANUP] Nothing to clean (all {total} entries are < 24h old)")
+                logger.info(f"[PURCHASE_CLEANUP] Nothing to clean (all {kept} entries are fresh)")
         except Exception as e:
             logger.error(f"[PURCHASE_CLEANUP] Error: {e}")
 
@@ -9,7 +9,7 @@ import asyncio
 import logging
 import time
 
-import redis.asyncio as aioredis
+from core.redis_pool import get_async_redis
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +25,12 @@ async def run_periodic_sold_cleanup():
 
     while True:
         try:
-            r = aioredis.Redis()
-            total = await r.zcard(SOLD_MINTS_KEY)
-            cutoff = time.time() - MAX_AGE_SECONDS
-            removed = await r.zremrangebyscore(SOLD_MINTS_KEY, 0, cutoff)
-            remaining = await r.zcard(SOLD_MINTS_KEY)
-            await r.aclose()
+            r = get_async_redis().client_for("sold_cleanup")
+            pipe = r.pipeline(transaction=False)
+            pipe.zcard(SOLD_MINTS_KEY)
+            pipe.zremrangebyscore(SOLD_MINTS_KEY, 0, time.time() - MAX_AGE_SECONDS)
+            pipe.zcard(SOLD_MINTS_KEY)
+            total, removed, remaining = await pipe.execute()
 
             if removed > 0:
                 logger.warning(f"[SOLD_CLEANUP] Removed {removed} entries older than 24h (was {total}, now {remaining})")
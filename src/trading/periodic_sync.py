@@ -4,7 +4,6 @@ UPGRADED: Redis integration + RPC failure protection + buy_confirmed auto-fix.
 """
 
 import asyncio
-import json
 import logging
 import os
 from pathlib import Path
@@ -13,6 +12,9 @@ import aiohttp
 import base58
 from solders.keypair import Keypair
 
+from trading.position_journal import get_journal
+from trading.trader_registry import get_traders_for_wallet, positions_for_wallet
+
 logger = logging.getLogger(__name__)
 
 POSITIONS_FILE = Path("positions.json")
@@ -84,15 +86,22 @@ async def _get_redis_state():
         return None
 
 
-async def run_periodic_sync():
-    """Main sync loop."""
-    pk = os.getenv("SOLANA_PRIVATE_KEY")
-    if not pk:
-        logger.error("[SYNC] Missing SOLANA_PRIVATE_KEY")
-        return
-    kp = Keypair.from_bytes(base58.b58decode(pk))
-    wallet = str(kp.pubkey())
-    logger.warning(f"[SYNC] Periodic balance sync started (every {SYNC_INTERVAL}s)")
+async def run_periodic_sync(wallet: str | None = None, claim_untagged: bool = True):
+    """Main sync loop for one wallet (pubkey).
+
+    Only that wallet's positions are checked and saved (see
+    positions_for_wallet); bots trading from other wallets run their own
+    loop. claim_untagged: legacy positions without a wallet tag belong to
+    this wallet - only when the process trades from a single wallet.
+    Without wallet the one from SOLANA_PRIVATE_KEY is used (standalone run).
+    """
+    if wallet is None:
+        pk = os.getenv("SOLANA_PRIVATE_KEY")
+        if not pk:
+            logger.error("[SYNC] Missing SOLANA_PRIVATE_KEY")
+            return
+        wallet = str(Keypair.from_bytes(base58.b58decode(pk)).pubkey())
+    logger.warning(f"[SYNC] Periodic balance sync started for {wallet[:8]}... (every {SYNC_INTERVAL}s)")
 
     while True:
         await asyncio.sleep(SYNC_INTERVAL)
@@ -119,11 +128,11 @@ async def run_periodic_sync():
                     logger.info(f"[SYNC] Loaded {len(positions)} positions from Redis")
 
             if not positions:
-                if POSITIONS_FILE.exists():
-                    with open(POSITIONS_FILE) as f:
-                        positions = json.load(f)
+                positions = get_journal(POSITIONS_FILE).load()
+                if positions:
                     logger.info(f"[SYNC] Loaded {len(positions)} positions from JSON")
 
+            positions = positions_for_wallet(positions, wallet, claim_untagged)
             if not positions:
                 logger.info("[SYNC] No positions to check")
                 continue
@@ -145,10 +154,9 @@ async def run_periodic_sync():
                     logger.info(f"[SYNC] Skipping SOLD zombie: {sym} - removing and killing monitor")
                     # Try to kill monitor task via trader registry
                     try:
-                        from trading.trader_registry import get_trader
+                        from trading.trader_registry import get_traders
                         from trading.position import unregister_monitor
-                        trader = get_trader()
-                        if trader:
+                        for trader in get_traders():  # every bot in this process
                             # Set is_active=False on position in trader.active_positions
                             for p in trader.active_positions:
                                 if str(p.mint) == mint or p.get("mint", "") == mint if isinstance(p, dict) else False:
@@ -232,9 +240,12 @@ async def run_periodic_sync():
                         except Exception:
                             pass
 
-            # Always save current valid positions back
-            with open(POSITIONS_FILE, "w") as f:
-                json.dump(valid, f, indent=2)
+            # Always save current valid positions back (journal: only the checked
+            # mints are touched, positions bought meanwhile are kept)
+            get_journal(POSITIONS_FILE).sync(
+                {p["mint"]: p for p in valid if p.get("mint")},
+                scope=[p.get("mint") for p in positions],
+            )
 
             logger.info(f"[SYNC] Done: {len(valid)} valid, {len(phantoms)} phantoms removed, "
                         f"{fixed_confirmed} buy_confirmed fixed")
@@ -243,19 +254,17 @@ async def run_periodic_sync():
             # FIX S39-2: Sync in-memory active_positions -> Redis (preserves HWM, TSL trigger, entry_price)
             # Memory has latest values (updated by monitor loop), Redis may be stale
             try:
-                from trading.trader_registry import get_trader as _get_trader_s39
-                _trader_s39 = _get_trader_s39()
-                if _trader_s39 and hasattr(_trader_s39, "active_positions") and _trader_s39.active_positions:
-                    from trading.position import save_position_redis as _save_redis_s39
-                    _synced = 0
+                from trading.position import save_position_redis as _save_redis_s39
+                _synced = 0
+                for _trader_s39 in get_traders_for_wallet(wallet):  # every bot on this wallet
                     for _p in _trader_s39.active_positions:
                         try:
                             await _save_redis_s39(_p)
                             _synced += 1
                         except Exception:
                             pass
-                    if _synced > 0:
-                        logger.info(f"[SYNC] FIX S39-2: Synced {_synced} positions memory -> Redis (HWM/TSL/entry)")
+                if _synced > 0:
+                    logger.info(f"[SYNC] FIX S39-2: Synced {_synced} positions memory -> Redis (HWM/TSL/entry)")
             except Exception as _e_s39:
                 logger.warning(f"[SYNC] Redis sync failed: {_e_s39}")
             # FIX S30-E: REMOVED export_to_json — it overwrites clean JSON with stale Redis data
@@ -265,7 +274,7 @@ async def run_periodic_sync():
             logger.error(f"[SYNC] Periodic sync error: {e}", exc_info=True)
 
 
-def start_periodic_sync():
-    """Start periodic sync task."""
-    asyncio.create_task(run_periodic_sync())
+def start_periodic_sync(wallet: str | None = None, claim_untagged: bool = True):
+    """Start periodic sync task for one wallet."""
+    asyncio.create_task(run_periodic_sync(wallet, claim_untagged))
     logger.warning("[SYNC] Periodic balance sync task scheduled (every 5 min)")
@@ -4,16 +4,20 @@ Final cleanup removing all platform-specific hardcoding.
 """
 
 import asyncio
+import os
+
 from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
 from core.priority_fee.manager import PriorityFeeManager
 from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS, SystemAddresses
+from core.tx_template import TransactionTemplate, build_buy_template, get_tx_template_cache
 from core.wallet import Wallet
 from interfaces.core import AddressProvider, Platform, TokenInfo
 from platforms import get_platform_implementations
 from trading.base import Trader, TradeResult
 from trading.fallback_seller import FallbackSeller
+from trading.jito_sender import get_jito_sender
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,6 +37,7 @@ class PlatformAwareBuyer(Trader):
         extreme_fast_token_amount: int = 0,
         extreme_fast_mode: bool = False,
         compute_units: dict | None = None,
+        use_tx_templates: bool | None = None,
     ):
         """Initialize platform-aware token buyer."""
         self.client = client
@@ -44,6 +49,9 @@ class PlatformAwareBuyer(Trader):
         self.extreme_fast_mode = extreme_fast_mode
         self.extreme_fast_token_amount = extreme_fast_token_amount
         self.compute_units = compute_units or {}
+        if use_tx_templates is None:
+            use_tx_templates = os.getenv("TX_TEMPLATES", "true").lower() == "true"
+        self.use_tx_templates = use_tx_templates
 
     async def execute(self, token_info: TokenInfo) -> TradeResult:
         """Execute buy operation using platform-specific implementations."""
@@ -64,10 +72,11 @@ class PlatformAwareBuyer(Trader):
             # Quick check if pool account exists with retries (race condition fix)
             max_retries = 5
             pool_exists = False
+            pool_account = None
             for attempt in range(max_retries):
                 try:
                     logger.info(f"[CHECK] Checking pool account exists... (attempt {attempt+1}/{max_retries})")
-                    await self.client.get_account_info(pool_address)
+                    pool_account = await self.client.get_account_info(pool_address)
                     logger.info("[CHECK] Pool account exists [OK]")
                     pool_exists = True
                     break
@@ -99,10 +108,12 @@ class PlatformAwareBuyer(Trader):
                 token_amount = self.extreme_fast_token_amount
                 token_price_sol = self.amount / token_amount if token_amount > 0 else 0
             else:
-                # Regular behavior with RPC call
-                # Fetch pool state to get price and mayhem mode status
-                # (pool_address already obtained and validated above)
-                pool_state = await curve_manager.get_pool_state(pool_address)
+                # Decode the account fetched by the existence check above -
+                # one read gives price and mayhem mode status (no second RPC)
+                snapshot = curve_manager.snapshot_from_account_data(
+                    pool_address, pool_account.data
+                )
+                pool_state = snapshot.state
                 token_price_sol = pool_state.get("price_per_token")
 
                 # Validate price_per_token is present and positive
@@ -123,20 +134,42 @@ class PlatformAwareBuyer(Trader):
             # Calculate maximum SOL to spend with slippage
             max_amount_lamports = int(amount_lamports * (1 + self.slippage))
 
-            # Build buy instructions using platform-specific builder
-            instructions = await instruction_builder.build_buy_instruction(
-                token_info,
-                self.wallet.pubkey,
-                max_amount_lamports,  # amount_in (SOL)
-                minimum_token_amount_raw,  # minimum_amount_out (tokens)
-                address_provider,
+            compute_unit_limit = instruction_builder.get_buy_compute_unit_limit(
+                self._get_cu_override("buy", token_info.platform)
             )
-
-            # Get accounts for priority fee calculation
-            priority_accounts = instruction_builder.get_required_accounts_for_buy(
-                token_info, self.wallet.pubkey, address_provider
+            account_data_size_limit = self._get_cu_override(
+                "account_data_size", token_info.platform
             )
 
+            # Pre-compiled template: retries and repeat attempts only patch
+            # amounts/fee/blockhash and sign (no PDA or message rebuild)
+            template = None
+            if self.use_tx_templates:
+                template = await self._get_buy_template(
+                    token_info,
+                    instruction_builder,
+                    address_provider,
+                    compute_unit_limit,
+                    account_data_size_limit,
+                )
+
+            if template is not None:
+                priority_accounts = template.priority_accounts
+            else:
+                # Build buy instructions using platform-specific builder
+                instructions = await instruction_builder.build_buy_instruction(
+                    token_info,
+                    self.wallet.pubkey,
+                    max_amount_lamports,  # amount_in (SOL)
+                    minimum_token_amount_raw,  # minimum_amount_out (tokens)
+                    address_provider,
+                )
+
+                # Get accounts for priority fee calculation
+                priority_accounts = instruction_builder.get_required_accounts_for_buy(
+                    token_info, self.wallet.pubkey, address_provider
+                )
+
             logger.info(
                 f"Buying {token_amount:.6f} tokens at {token_price_sol:.8f} SOL per token on {token_info.platform.value}"
             )
@@ -147,21 +180,29 @@ class PlatformAwareBuyer(Trader):
             # Send transaction with preflight checks enabled for reliability
             try:
                 logger.info(f"[TX] Building and sending buy transaction for {token_info.symbol}...")
-                tx_signature = await self.client.build_and_send_transaction(
-                    instructions,
-                    self.wallet.keypair,
-                    skip_preflight=False,  # Enable preflight for better error detection
-                    max_retries=self.max_retries,
-                    priority_fee=await self.priority_fee_manager.calculate_priority_fee(
-                        priority_accounts
-                    ),
-                    compute_unit_limit=instruction_builder.get_buy_compute_unit_limit(
-                        self._get_cu_override("buy", token_info.platform)
-                    ),
-                    account_data_size_limit=self._get_cu_override(
-                        "account_data_size", token_info.platform
-                    ),
+                priority_fee = await self.priority_fee_manager.calculate_priority_fee(
+                    priority_accounts
                 )
+                if template is not None:
+                    tx_signature = await self.client.send_templated_transaction(
+                        template,
+                        self.wallet.keypair,
+                        max_amount_lamports,
+                        minimum_token_amount_raw,
+                        priority_fee=priority_fee,
+                        skip_preflight=False,
+                        max_retries=self.max_retries,
+                    )
+                else:
+                    tx_signature = await self.client.build_and_send_transaction(
+                        instructions,
+                        self.wallet.keypair,
+                        skip_preflight=False,  # Enable preflight for better error detection
+                        max_retries=self.max_retries,
+                        priority_fee=priority_fee,
+                        compute_unit_limit=compute_unit_limit,
+                        account_data_size_limit=account_data_size_limit,
+                    )
                 logger.info(f"[TX] Transaction sent: {tx_signature}")
             except ValueError as e:
                 # Insufficient funds - don't retry
@@ -399,6 +440,54 @@ class PlatformAwareBuyer(Trader):
         # Just check for operation override (buy/sell)
         return self.compute_units.get(operation)
 
+    async def _get_buy_template(
+        self,
+        token_info: TokenInfo,
+        instruction_builder,
+        address_provider: AddressProvider,
+        compute_unit_limit: int,
+        account_data_size_limit: int | None,
+    ) -> TransactionTemplate | None:
+        """Cached buy template for (platform, mint, wallet), compiled on miss.
+
+        Returns None if the template cannot be compiled - caller falls back
+        to the per-call instruction build.
+        """
+        jito = get_jito_sender()
+        # Everything that changes the account list or the fixed instructions
+        shape = (
+            compute_unit_limit,
+            account_data_size_limit,
+            jito.tip_lamports if jito.enabled else None,
+            token_info.is_mayhem_mode,
+            token_info.token_program_id,
+            token_info.creator,
+        )
+        key = (token_info.platform.value, str(token_info.mint), str(self.wallet.pubkey))
+        cache = get_tx_template_cache()
+        template = cache.get(key, shape)
+        if template is not None:
+            return template
+
+        try:
+            template = await build_buy_template(
+                instruction_builder,
+                address_provider,
+                token_info,
+                self.wallet.pubkey,
+                compute_unit_limit=compute_unit_limit,
+                account_data_size_limit=account_data_size_limit,
+                tip_instruction=(
+                    jito.create_tip_instruction(self.wallet.pubkey) if jito.enabled else None
+                ),
+                shape=shape,
+            )
+        except Exception as e:
+            logger.warning(f"[TX-TEMPLATE] Cannot compile buy template for {token_info.symbol}: {e}")
+            return None
+        cache.put(key, template)
+        return template
+
 
 class PlatformAwareSeller(Trader):
     """Platform-aware token seller that works with any supported platform."""
@@ -549,7 +638,7 @@ class PlatformAwareSeller(Trader):
             if success:
                 # VERIFY: Check token balance via transaction parsing (more reliable than RPC balance)
                 try:
-                    from spl.token.instructions import get_associated_token_address
+                    from core.pda_cache import get_associated_token_address
                     # TOKEN2022 FIX: Most pump.fun/bonk/bags tokens use Token2022
                     token_prog = token_info.token_program_id or SystemAddresses.TOKEN_2022_PROGRAM
                     ata = get_associated_token_address(self.wallet.pubkey, token_info.mint, token_prog)
@@ -0,0 +1,184 @@
+"""
+Pool index - persistent mint -> (pool, base_vault, quote_vault, decimals).
+
+Migrated pump.fun tokens land in a canonical PumpSwap pool whose address is
+a PDA of the mint, so most lookups need no RPC at all:
+
+    pool_authority = PDA(["pool-authority", mint], pump.fun)
+    pool           = PDA(["pool", u16 LE 0, pool_authority, mint, WSOL], PumpSwap)
+    quote_vault    = ATA(pool, WSOL)
+    base_vault     = ATA(pool, mint)   (Token or Token-2022 - read from pool)
+
+Entries are filled by vault_resolver, the Geyser curve-migration handler and
+BagsMigrationTracker, kept in SQLite (POOL_INDEX_DB, default
+data/pool_index.db) and mirrored in a dict, so reads are O(1) and local.
+An entry may be partial (pool known, vaults not yet) - vault_resolver
+completes it with a single getAccountInfo.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import Optional
+
+from solders.pubkey import Pubkey
+
+from core.pda_cache import find_program_address
+from core.pubkeys import ASSOCIATED_TOKEN_PROGRAM, SOL_MINT, TOKEN_PROGRAM
+
+logger = logging.getLogger(__name__)
+
+PUMP_FUN_PROGRAM = Pubkey.from_string("6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P")
+PUMP_AMM_PROGRAM = Pubkey.from_string("pAMMBay6oceH9fJKBRHGP5D4bD4sWpmSwMn52FMfXEA")
+
+DEX_PUMPSWAP = "pumpswap"
+DEX_METEORA_DAMM_V2 = "meteora_damm_v2"
+
+DEFAULT_DB_FILE = Path("data") / "pool_index.db"
+
+
+def derive_pumpswap_pool(mint: Pubkey | str) -> Pubkey:
+    """Canonical PumpSwap pool of a migrated pump.fun token (index 0, quote WSOL)."""
+    mint = Pubkey.from_string(mint) if isinstance(mint, str) else mint
+    pool_authority, _ = find_program_address(
+        [b"pool-authority", bytes(mint)], PUMP_FUN_PROGRAM
+    )
+    pool, _ = find_program_address(
+        [b"pool", (0).to_bytes(2, "little"), bytes(pool_authority), bytes(mint), bytes(SOL_MINT)],
+        PUMP_AMM_PROGRAM,
+    )
+    return pool
+
+
+def derive_pool_vault(pool: Pubkey, mint: Pubkey, token_program: Pubkey = TOKEN_PROGRAM) -> Pubkey:
+    """Pool-owned ATA holding mint (PumpSwap pool_base/quote_token_account)."""
+    vault, _ = find_program_address(
+        [bytes(pool), bytes(token_program), bytes(mint)], ASSOCIATED_TOKEN_PROGRAM
+    )
+    return vault
+
+
+@dataclass(frozen=True)
+class PoolEntry:
+    """Index row. base_vault / quote_vault / decimals are None until known."""
+
+    mint: str
+    pool: str
+    dex: str = DEX_PUMPSWAP
+    base_vault: Optional[str] = None
+    quote_vault: Optional[str] = None
+    decimals: Optional[int] = None
+    source: str = ""
+    updated_at: float = 0.0
+
+    @property
+    def has_vaults(self) -> bool:
+        return bool(self.base_vault and self.quote_vault)
+
+
+_COLUMNS = tuple(f.name for f in fields(PoolEntry))
+
+
+class PoolIndex:
+    """SQLite-backed mint -> PoolEntry index with an in-memory mirror."""
+
+    def __init__(self, db_path: str | os.PathLike | None = None):
+        self.db_path = Path(db_path or os.getenv("POOL_INDEX_DB") or DEFAULT_DB_FILE)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute('''CREATE TABLE IF NOT EXISTS pool_index (
+            mint TEXT PRIMARY KEY, pool TEXT NOT NULL, dex TEXT NOT NULL,
+            base_vault TEXT, quote_vault TEXT, decimals INTEGER,
+            source TEXT, updated_at REAL NOT NULL
+        )''')
+        self._conn.commit()
+        self._entries: dict[str, PoolEntry] = {
+            row[0]: PoolEntry(*row)
+            for row in self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM pool_index")
+        }
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+        logger.info(f"[POOL_INDEX] Loaded {len(self._entries)} pools from {self.db_path}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, mint: str) -> Optional[PoolEntry]:
+        """Indexed entry for mint (may be partial) or None."""
+        entry = self._entries.get(mint)
+        self.stats["hits" if entry else "misses"] += 1
+        return entry
+
+    def put(
+        self,
+        mint: str,
+        pool: str,
+        dex: str = DEX_PUMPSWAP,
+        base_vault: Optional[str] = None,
+        quote_vault: Optional[str] = None,
+        decimals: Optional[int] = None,
+        source: str = "",
+    ) -> PoolEntry:
+        """Insert or merge an entry.
+
+        Fields passed as None keep their indexed value while the pool is
+        unchanged; a different pool replaces the entry.
+        """
+        with self._lock:
+            old = self._entries.get(mint)
+            if old is not None and old.pool == pool and old.dex == dex:
+                entry = replace(
+                    old,
+                    base_vault=base_vault or old.base_vault,
+                    quote_vault=quote_vault or old.quote_vault,
+                    decimals=decimals if decimals is not None else old.decimals,
+                    source=source or old.source,
+                    updated_at=time.time(),
+                )
+                if entry == replace(old, updated_at=entry.updated_at):
+                    return old
+            else:
+                entry = PoolEntry(mint, pool, dex, base_vault, quote_vault, decimals, source, time.time())
+            self._entries[mint] = entry
+            try:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO pool_index ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    tuple(getattr(entry, c) for c in _COLUMNS),
+                )
+                self._conn.commit()
+                self.stats["writes"] += 1
+            except sqlite3.Error as e:
+                logger.warning(f"[POOL_INDEX] Persist failed for {mint[:12]}...: {e}")
+        return entry
+
+    def remove(self, mint: str) -> None:
+        with self._lock:
+            if self._entries.pop(mint, None) is None:
+                return
+            try:
+                self._conn.execute("DELETE FROM pool_index WHERE mint = ?", (mint,))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"[POOL_INDEX] Delete failed for {mint[:12]}...: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_pool_index: Optional[PoolIndex] = None
+
+
+def get_pool_index() -> PoolIndex:
+    """Process-wide PoolIndex."""
+    global _pool_index
+    if _pool_index is None:
+        _pool_index = PoolIndex()
+    return _pool_index
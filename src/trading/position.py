@@ -4,14 +4,12 @@ UPGRADED: Redis as primary storage, JSON as backup.
 """
 
 import asyncio
-import json
-import os
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from solders.pubkey import Pubkey
 
@@ -70,6 +68,7 @@ class Position:
     dca_first_buy_pct: float = 0.50  # Первая покупка 50%
     original_entry_price: float = 0.0
     whale_wallet: str | None = None
+    wallet: str | None = None  # Pubkey of the bot wallet holding it (None = legacy record)
     whale_label: str | None = None  # Цена первой покупки
     entry_price_provisional: bool = False
     entry_price_source: str = "unknown"
@@ -127,6 +126,7 @@ class Position:
             "dca_first_buy_pct": self.dca_first_buy_pct,
             "original_entry_price": self.original_entry_price,
             "whale_wallet": self.whale_wallet,
+            "wallet": self.wallet,
             "whale_label": self.whale_label,
             "entry_price_provisional": self.entry_price_provisional,
             "entry_price_source": self.entry_price_source,
@@ -173,6 +173,7 @@ class Position:
             dca_first_buy_pct=data.get("dca_first_buy_pct", 0.50),
             original_entry_price=data.get("original_entry_price", 0.0),
             whale_wallet=data.get("whale_wallet"),
+            wallet=data.get("wallet"),
             whale_label=data.get("whale_label"),
             entry_price_provisional=data.get("entry_price_provisional", False),
             entry_price_source=data.get("entry_price_source", "unknown"),
@@ -451,17 +452,10 @@ async def load_positions_async(filepath: Path = POSITIONS_FILE) -> list[Position
         logger.warning(f"[LOAD] Redis async load failed: {e}, trying JSON fallback")
 
     # Fallback to JSON
-    if not filepath.exists():
-        logger.info("[LOAD] No positions file found")
-        return []
-
     try:
-        with open(filepath, 'r') as f:
-            import json as _json_load
-            data = _json_load.load(f)
-        if not data:
+        positions = _load_positions_json(filepath)
+        if not positions:
             return []
-        positions = [Position.from_dict(p) for p in data if p.get("is_active", True)]
         logger.warning(f"[LOAD] Loaded {len(positions)} from JSON FALLBACK (Redis unavailable)")
         return positions
     except Exception as e:
@@ -470,66 +464,145 @@ async def load_positions_async(filepath: Path = POSITIONS_FILE) -> list[Position
 
 
 # ==================== SYNC FUNCTIONS (backward compatible) ====================
+# JSON persistence goes through the append-only PositionJournal: a save writes
+# one compact record per CHANGED position, not the whole portfolio. Redis
+# writes are coalesced into one pipelined batch per event-loop turn.
+
+# mint -> position dict to HSET, or None to HDEL
+_redis_pending: dict[str, Optional[dict]] = {}
+_redis_flush_task: Optional[asyncio.Task] = None
+
+
+def _merge_protect(new_data: dict, existing: Optional[dict]) -> dict:
+    """FIX S47-2: Never degrade moonbag/tp_partial_done from True->False.
+
+    This prevents stale in-memory data from corrupting Redis.
+    """
+    if not existing:
+        return new_data
+    _redis_moonbag = existing.get("is_moonbag", False)
+    _redis_tp_done = existing.get("tp_partial_done", False)
+    _redis_is_dust = existing.get("is_dust", False)
+    _mem_moonbag = new_data.get("is_moonbag", False)
+    _mem_tp_done = new_data.get("tp_partial_done", False)
+    # If Redis has moonbag=True but memory has False → KEEP Redis flags
+    if (_redis_moonbag and not _mem_moonbag) or (_redis_tp_done and not _mem_tp_done):
+        logger.warning(
+            f"[FIX S47-2] {new_data.get('symbol','?')}: MERGE PROTECT! "
+            f"Redis moonbag={_redis_moonbag}/tp_done={_redis_tp_done} "
+            f"vs memory moonbag={_mem_moonbag}/tp_done={_mem_tp_done}. "
+            f"Keeping Redis flags."
+        )
+        new_data = dict(new_data)
+        new_data["is_moonbag"] = _redis_moonbag or _mem_moonbag
+        new_data["tp_partial_done"] = _redis_tp_done or _mem_tp_done
+        new_data["is_dust"] = _redis_is_dust or new_data.get("is_dust", False)
+        # Also protect TP=None (moonbag should have no TP)
+        if new_data["is_moonbag"] and new_data.get("take_profit_price") is not None:
+            new_data["take_profit_price"] = None
+    return new_data
+
+
+async def _flush_redis() -> None:
+    """Drain _redis_pending: one HMGET (merge protect) + one pipelined HSET/HDEL per batch."""
+    while _redis_pending:
+        batch = dict(_redis_pending)
+        _redis_pending.clear()
+        puts = {m: d for m, d in batch.items() if d is not None}
+        dels = [m for m, d in batch.items() if d is None]
+        ok = False
+        try:
+            state = await _get_redis()
+            if state and await state.is_connected():
+                try:
+                    existing = await state.get_positions_many(list(puts))
+                except Exception:
+                    existing = {}  # On error, just save as-is
+                puts = {m: _merge_protect(d, existing.get(m)) for m, d in puts.items()}
+                ok = await state.save_positions_batch(puts, dels)
+        except Exception as e:
+            logger.warning(f"[SAVE] Redis batch save failed: {e}")
+        if not ok:
+            # Keep for the next save; never overwrite a newer pending write
+            for m, d in batch.items():
+                _redis_pending.setdefault(m, d)
+            return
+
+
+def _schedule_redis(changes: dict[str, Optional[dict]]) -> None:
+    """Queue Redis writes and make sure a flush task is running (needs a loop)."""
+    global _redis_flush_task
+    if not changes:
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return  # No loop, skip Redis
+    _redis_pending.update(changes)
+    if _redis_flush_task is None or _redis_flush_task.done():
+        _redis_flush_task = asyncio.create_task(_flush_redis())
+
+
+def save_positions(
+    positions: list[Position],
+    filepath: Path = POSITIONS_FILE,
+    scope: Optional[Iterable[str]] = None,
+) -> None:
+    """Save positions to Redis + JSON journal.
+
+    With scope=None positions is the whole portfolio: mints missing from it
+    are removed from the JSON state (not from Redis). Otherwise only the mints
+    in scope that are missing get removed - a trader passes scope=() to upsert
+    its own positions without dropping those of other bots sharing the file.
+    Only changed positions are written.
+    """
+    from trading.position_journal import get_journal
 
-def save_positions(positions: list[Position], filepath: Path = POSITIONS_FILE) -> None:
-    """Save positions to Redis + JSON backup."""
     unique_positions = {}
     for p in positions:
         if p.is_active:
             unique_positions[str(p.mint)] = p
-    active = [p.to_dict() for p in unique_positions.values()]
-    
-    # Always save JSON as backup (atomic: write tmp -> rename)
+    active = {mint: p.to_dict() for mint, p in unique_positions.items()}
+
     try:
-        tmp_path = str(filepath) + ".tmp"
-        with open(tmp_path, 'w') as f:
-            json.dump(active, f, indent=2)
-        os.replace(tmp_path, filepath)
-        logger.info(f"[SAVE] Saved {len(active)} positions to {filepath}")
+        changed = get_journal(filepath).sync(active, scope=scope)
+        if changed:
+            logger.info(f"[SAVE] Journaled {len(changed)}/{len(active)} positions for {filepath}")
     except Exception as e:
         logger.error(f"[SAVE] JSON save failed: {e}")
-    
-    # Save to Redis (async in background)
-    async def _save_redis():
-        state = await _get_redis()
-        if state and await state.is_connected():
-            for mint, pos in unique_positions.items():
-                # === FIX S47-2: Merge-protect moonbag flags ===
-                # Never degrade moonbag/tp_partial_done from True→False
-                # This prevents stale in-memory data from corrupting Redis
-                new_data = pos.to_dict()
-                try:
-                    existing = await state.get_position(mint)
-                    if existing:
-                        _redis_moonbag = existing.get("is_moonbag", False)
-                        _redis_tp_done = existing.get("tp_partial_done", False)
-                        _redis_is_dust = existing.get("is_dust", False)
-                        _mem_moonbag = new_data.get("is_moonbag", False)
-                        _mem_tp_done = new_data.get("tp_partial_done", False)
-                        # If Redis has moonbag=True but memory has False → KEEP Redis flags
-                        if (_redis_moonbag and not _mem_moonbag) or (_redis_tp_done and not _mem_tp_done):
-                            logger.warning(
-                                f"[FIX S47-2] {new_data.get('symbol','?')}: MERGE PROTECT! "
-                                f"Redis moonbag={_redis_moonbag}/tp_done={_redis_tp_done} "
-                                f"vs memory moonbag={_mem_moonbag}/tp_done={_mem_tp_done}. "
-                                f"Keeping Redis flags."
-                            )
-                            new_data["is_moonbag"] = _redis_moonbag or _mem_moonbag
-                            new_data["tp_partial_done"] = _redis_tp_done or _mem_tp_done
-                            new_data["is_dust"] = _redis_is_dust or new_data.get("is_dust", False)
-                            # Also protect TP=None (moonbag should have no TP)
-                            if new_data["is_moonbag"] and new_data.get("take_profit_price") is not None:
-                                new_data["take_profit_price"] = None
-                except Exception as _s47e:
-                    pass  # On error, just save as-is
-                # === END FIX S47-2 ===
-                await state.save_position(mint, new_data)
-    
+        changed = active
+
+    _schedule_redis(changed)
+
+
+def save_position(position: Position, filepath: Path = POSITIONS_FILE) -> None:
+    """Save ONE position (upsert) to Redis + JSON journal. Cost independent of portfolio size."""
+    from trading.position_journal import get_journal
+
+    if not position.is_active:
+        return
+    mint = str(position.mint)
+    data = position.to_dict()
     try:
-        loop = asyncio.get_running_loop()
-        asyncio.create_task(_save_redis())
-    except RuntimeError:
-        pass  # No loop, skip Redis
+        if not get_journal(filepath).put(mint, data):
+            return  # Unchanged since last save
+        logger.info(f"[SAVE] Journaled {position.symbol} for {filepath}")
+    except Exception as e:
+        logger.error(f"[SAVE] JSON save failed: {e}")
+
+    _schedule_redis({mint: data})
+
+
+def _load_positions_json(filepath: Path) -> list[Position]:
+    """JSON fallback: snapshot + journal replay."""
+    from trading.position_journal import get_journal
+
+    journal = get_journal(filepath)
+    if not filepath.exists() and not journal.journal_path.exists():
+        logger.info("[LOAD] No positions file found")
+        return []
+    data = journal.load()
+    return [Position.from_dict(p) for p in data if p.get("is_active", True)]
 
 
 def load_positions(filepath: Path = POSITIONS_FILE) -> list[Position]:
@@ -559,19 +632,10 @@ def load_positions(filepath: Path = POSITIONS_FILE) -> list[Position]:
         logger.warning(f"[LOAD] Redis load failed: {e}")
     
     # Fallback to JSON
-    if not filepath.exists():
-        logger.info("[LOAD] No positions file found")
-        return []
-    
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        
-        if not data:
-            return []
-        
-        positions = [Position.from_dict(p) for p in data if p.get("is_active", True)]
-        logger.info(f"[LOAD] Loaded {len(positions)} positions from {filepath}")
+        positions = _load_positions_json(filepath)
+        if positions:
+            logger.info(f"[LOAD] Loaded {len(positions)} positions from {filepath}")
         return positions
     except Exception as e:
         logger.error(f"[LOAD] Failed to load positions: {e}")
@@ -580,38 +644,32 @@ def load_positions(filepath: Path = POSITIONS_FILE) -> list[Position]:
 
 def remove_position(mint: str, filepath: Path = POSITIONS_FILE) -> None:
     """Remove position by mint from both Redis and JSON."""
-    # Remove from JSON
+    from trading.position_journal import get_journal
+
+    # Remove from JSON (one "del" journal record)
     try:
-        positions = load_positions(filepath)
-        positions = [p for p in positions if str(p.mint) != mint]
-        save_positions(positions, filepath)
+        get_journal(filepath).delete([mint])
     except Exception as e:
         logger.error(f"[REMOVE] JSON remove failed: {e}")
     
-    # Remove from Redis (async)
-    async def _remove():
-        await remove_position_redis(mint)
-    
+    # Remove from Redis: queued behind (and cancelling) any pending save for this mint
     try:
-        loop = asyncio.get_running_loop()
-        asyncio.create_task(_remove())
+        asyncio.get_running_loop()
+        _schedule_redis({mint: None})
     except RuntimeError:
+        _redis_pending.pop(mint, None)
         try:
-            asyncio.run(_remove())
-        except:
+            asyncio.run(remove_position_redis(mint))
+        except Exception:
             pass
-    # Direct Redis cleanup via CLI (fallback)
-    try:
-        import subprocess
-        subprocess.run(["redis-cli", "HDEL", "whale:positions", mint], capture_output=True, timeout=2)
-    except:
-        pass
     
     logger.info(f"[REMOVE] Removed position {mint[:12]}...")
 
 
 def is_token_in_positions(mint_str: str, filepath: Path = POSITIONS_FILE) -> bool:
     """Check if token is in positions."""
+    from trading.position_journal import get_journal
+
     # Try Redis first
     async def _check():
         state = await _get_redis()
@@ -629,13 +687,11 @@ def is_token_in_positions(mint_str: str, filepath: Path = POSITIONS_FILE) -> boo
         except:
             pass
     
-    # Fallback to JSON check
+    # Fallback to JSON check: snapshot + on-disk journal tail, so positions
+    # other bot processes journaled are seen too (cross-bot duplicate guard)
     try:
-        if not filepath.exists():
-            return False
-        with open(filepath, 'r') as f:
-            positions = json.load(f)
-        return any(p.get("mint") == mint_str and p.get("is_active", True) for p in positions)
+        data = get_journal(filepath).get(mint_str)
+        return bool(data) and data.get("is_active", True)
     except:
         return False
 
@@ -0,0 +1,341 @@
+"""
+Columnar position book: TP/SL/TSL for all open positions in one NumPy pass.
+
+``Position.update_price`` / ``Position.should_exit`` run one object at a time
+in Python. The book mirrors the fields they read into parallel NumPy arrays
+(one row per mint) and evaluates a whole batch of prices at once:
+
+    book = PositionBook()
+    book.load(active_positions)
+    changed = book.apply_prices(mints, prices)        # == Position.update_price
+    exits = book.exit_decisions(mints, prices)         # == Position.should_exit
+    # -> [(mint, ExitReason.STOP_LOSS), ...]
+
+Decision order is exactly the one in ``Position.should_exit``:
+inactive / is_selling (120s watchdog) -> dynamic SL window or config SL ->
+TSL -> dust SL -> moonbag SL -> TP (blocked while entry is provisional, which
+also suppresses max hold) -> max hold time.
+
+Positions in the post-restore TSL grace period (``_restore_pending`` set or
+``restore_time`` not yet cleared) are routed through the old path: the book
+never reports an exit for them, and their monitor decides with
+``Position.should_exit`` on its own price/heartbeat wakeups. The row is
+re-mirrored after each evaluation, so it rejoins the sweep once
+should_exit has cleared the grace state.
+
+The book is a read-mostly MIRROR. It never writes back into Position objects
+and has none of should_exit's side effects (tsl_triggered, watchdog reset,
+logging); the caller that acts on a decision still goes through the Position.
+Rows are refreshed with ``upsert(position)`` whenever the owner may have
+changed the Position.
+
+Time is seconds since the Unix epoch in UTC, measured the same way as
+``datetime.utcnow()`` in position.py (naive UTC datetimes).
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+from trading.position import ExitReason, Position
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Decision codes in the int8 result column
+NO_EXIT = 0
+_REASONS = (
+    None,
+    ExitReason.STOP_LOSS,
+    ExitReason.TRAILING_STOP,
+    ExitReason.TAKE_PROFIT,
+    ExitReason.MAX_HOLD_TIME,
+)
+_SL, _TSL, _TP, _MAX_HOLD = 1, 2, 3, 4
+
+# Same constants as Position.update_price / Position.should_exit
+TSL_COOLDOWN_S = 30.0
+SELLING_WATCHDOG_S = 120.0
+
+_FLOAT_COLS = (
+    "entry", "sl", "tp", "hwm", "trigger", "qty",
+    "activation_pct", "trail_pct", "max_hold",
+    "dsl_pct", "dsl_dur", "entry_ts", "selling_since", "price",
+)
+_BOOL_COLS = (
+    "active", "tsl_enabled", "tsl_active", "tsl_triggered",
+    "moonbag", "dust", "selling", "provisional", "dsl_enabled", "no_sl",
+    "restoring",
+)
+
+
+def utc_ts(dt: Optional[datetime]) -> float:
+    """Naive-UTC datetime -> epoch seconds (NaN for None)."""
+    if dt is None:
+        return float("nan")
+    return (dt - _EPOCH).total_seconds()
+
+
+def utc_now_ts() -> float:
+    return utc_ts(datetime.utcnow())
+
+
+class PositionBook:
+    """Struct-of-arrays mirror of Position TP/SL/TSL state, indexed by mint.
+
+    Args:
+        capacity: Initial row capacity; grows by doubling.
+        no_sl_mints: Mints whose exits are always blocked (NO_SL_MINTS guard).
+    """
+
+    def __init__(self, capacity: int = 64, no_sl_mints: Iterable[str] = ()):
+        self._cap = max(1, capacity)
+        self._n = 0
+        self._rows: dict[str, int] = {}
+        self._mints: list[str] = []
+        self._no_sl = frozenset(no_sl_mints)
+        for name in _FLOAT_COLS:
+            setattr(self, name, np.zeros(self._cap, dtype=np.float64))
+        for name in _BOOL_COLS:
+            setattr(self, name, np.zeros(self._cap, dtype=np.bool_))
+        self.price[:] = np.nan
+
+    # ------------------------------------------------------------------ rows
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __contains__(self, mint: str) -> bool:
+        return mint in self._rows
+
+    @property
+    def mints(self) -> list[str]:
+        return list(self._mints)
+
+    def set_no_sl_mints(self, mints: Iterable[str]) -> None:
+        self._no_sl = frozenset(mints)
+        for mint, row in self._rows.items():
+            self.no_sl[row] = mint in self._no_sl
+
+    def load(self, positions: Iterable[Position]) -> None:
+        """Replace the book contents with positions (last one per mint wins)."""
+        self.clear()
+        for position in positions:
+            self.upsert(position)
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self._mints.clear()
+        self._n = 0
+
+    def upsert(self, position: Position) -> int:
+        """Insert or refresh the row for position. Returns row index."""
+        mint = str(position.mint)
+        row = self._rows.get(mint)
+        if row is None:
+            if self._n == self._cap:
+                self._grow()
+            row = self._n
+            self._n += 1
+            self._rows[mint] = row
+            self._mints.append(mint)
+            self.price[row] = np.nan
+        p = position
+        self.entry[row] = p.entry_price
+        self.sl[row] = p.stop_loss_price or 0.0
+        self.tp[row] = p.take_profit_price or 0.0
+        self.hwm[row] = p.high_water_mark
+        self.trigger[row] = p.tsl_trigger_price
+        self.qty[row] = p.quantity
+        self.activation_pct[row] = p.tsl_activation_pct
+        self.trail_pct[row] = p.tsl_trail_pct
+        self.max_hold[row] = p.max_hold_time or 0.0
+        self.dsl_enabled[row] = bool(getattr(p, "dynamic_sl_enabled", True))
+        self.dsl_pct[row] = getattr(p, "dynamic_sl_percentage", 0.30)
+        self.dsl_dur[row] = getattr(p, "dynamic_sl_duration", 60)
+        self.entry_ts[row] = utc_ts(p.entry_time)
+        self.active[row] = p.is_active
+        self.tsl_enabled[row] = p.tsl_enabled
+        self.tsl_active[row] = p.tsl_active
+        self.tsl_triggered[row] = p.tsl_triggered
+        self.moonbag[row] = p.is_moonbag
+        self.dust[row] = p.is_dust
+        self.selling[row] = bool(getattr(p, "is_selling", False))
+        self.selling_since[row] = utc_ts(getattr(p, "_is_selling_since", None))
+        self.provisional[row] = bool(getattr(p, "entry_price_provisional", False))
+        self.no_sl[row] = mint in self._no_sl
+        self.restoring[row] = bool(getattr(p, "_restore_pending", False)) or (
+            getattr(p, "restore_time", None) is not None
+        )
+        return row
+
+    def remove(self, mint: str) -> bool:
+        """Drop mint's row (swap-with-last, O(1))."""
+        row = self._rows.pop(mint, None)
+        if row is None:
+            return False
+        last = self._n - 1
+        if row != last:
+            for name in _FLOAT_COLS + _BOOL_COLS:
+                col = getattr(self, name)
+                col[row] = col[last]
+            moved = self._mints[last]
+            self._mints[row] = moved
+            self._rows[moved] = row
+        self._mints.pop()
+        self._n = last
+        return True
+
+    def set_price(self, mint: str, price: float) -> bool:
+        """Record the latest price for mint (used by ``exit_decisions()``)."""
+        row = self._rows.get(mint)
+        if row is None:
+            return False
+        self.price[row] = price
+        return True
+
+    def tsl_state(self, mint: str) -> Optional[tuple[bool, float, float]]:
+        """(tsl_active, high_water_mark, tsl_trigger_price) for mint."""
+        row = self._rows.get(mint)
+        if row is None:
+            return None
+        return bool(self.tsl_active[row]), float(self.hwm[row]), float(self.trigger[row])
+
+    def _grow(self) -> None:
+        new_cap = self._cap * 2
+        for name in _FLOAT_COLS + _BOOL_COLS:
+            old = getattr(self, name)
+            new = np.zeros(new_cap, dtype=old.dtype)
+            new[: self._cap] = old
+            setattr(self, name, new)
+        self.price[self._cap:] = np.nan
+        self._cap = new_cap
+
+    def _select(
+        self, mints: Optional[Sequence[str]], prices
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Row indices + price vector for a batch (or the whole book)."""
+        if mints is None:
+            rows = np.arange(self._n)
+            if prices is None:
+                return rows, self.price[: self._n].copy()
+            return rows, np.asarray(prices, dtype=np.float64)
+        get = self._rows.get
+        idx = [get(m, -1) for m in mints]
+        rows = np.fromiter(idx, dtype=np.intp, count=len(idx))
+        price = np.asarray(prices, dtype=np.float64)
+        known = rows >= 0
+        if not known.all():
+            rows, price = rows[known], price[known]
+        return rows, price
+
+    # ------------------------------------------------------------ evaluation
+
+    def apply_prices(
+        self,
+        mints: Optional[Sequence[str]],
+        prices,
+        now: Optional[float] = None,
+    ) -> list[str]:
+        """Vectorized ``Position.update_price``: TSL activation + HWM ratchet.
+
+        Also stores the prices as each row's latest price. Returns mints
+        whose TSL state changed (what update_price reports as "needs save").
+        """
+        rows, price = self._select(mints, prices)
+        if rows.size == 0:
+            return []
+        if now is None:
+            now = utc_now_ts()
+        self.price[rows] = price
+
+        entry = self.entry[rows]
+        live = self.active[rows] & self.tsl_enabled[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            profit = (price - entry) / entry
+        age = now - self.entry_ts[rows]
+        tsl_active = self.tsl_active[rows]
+        trail = self.trail_pct[rows]
+
+        activate = live & ~tsl_active & (profit >= self.activation_pct[rows]) & (age >= TSL_COOLDOWN_S)
+        hwm = np.where(activate, price, self.hwm[rows])
+        trigger = np.where(activate, price * (1 - trail), self.trigger[rows])
+        tsl_active = tsl_active | activate
+
+        ratchet = live & tsl_active & (price > hwm)
+        hwm = np.where(ratchet, price, hwm)
+        trigger = np.where(ratchet, price * (1 - trail), trigger)
+
+        changed = activate | ratchet
+        if changed.any():
+            sel = rows[changed]
+            self.tsl_active[sel] = True
+            self.hwm[sel] = hwm[changed]
+            self.trigger[sel] = trigger[changed]
+        mints_all = self._mints
+        return [mints_all[r] for r in rows[changed]]
+
+    def decide(
+        self,
+        mints: Optional[Sequence[str]] = None,
+        prices=None,
+        now: Optional[float] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized ``Position.should_exit``. Returns (rows, codes int8).
+
+        With mints=None the whole book is evaluated against ``prices`` (or
+        the stored latest prices); rows without a price never exit.
+        """
+        rows, price = self._select(mints, prices)
+        if rows.size == 0:
+            return rows, np.zeros(0, dtype=np.int8)
+        if now is None:
+            now = utc_now_ts()
+
+        entry = self.entry[rows]
+        sl = self.sl[rows]
+        tp = self.tp[rows]
+        moonbag = self.moonbag[rows]
+        has_price = ~np.isnan(price)
+
+        # is_selling blocks unless the 120s watchdog would force-reset it
+        selling_age = now - self.selling_since[rows]
+        blocked = self.selling[rows] & ~(selling_age > SELLING_WATCHDOG_S)
+        blocked |= ~self.active[rows] | self.no_sl[rows] | ~has_price
+        # Restore grace period: left to Position.should_exit (see module docstring)
+        blocked |= self.restoring[rows]
+
+        # Dynamic SL window replaces the config SL for the first N seconds
+        age = now - self.entry_ts[rows]
+        age = np.where(np.isnan(age), 999.0, age)
+        sl_set = (sl != 0) & ~moonbag
+        in_window = self.dsl_enabled[rows] & (age < self.dsl_dur[rows])
+        dyn_sl = entry * (1 - self.dsl_pct[rows])
+        sl_hit = sl_set & np.where(in_window, price <= dyn_sl, price <= sl)
+
+        tsl_hit = self.tsl_active[rows] & ((price <= self.trigger[rows]) | self.tsl_triggered[rows])
+        dust_hit = self.dust[rows] & (entry > 0) & (price <= entry)
+        moonbag_hit = moonbag & (sl != 0) & (price <= sl)
+        tp_hit = (tp != 0) & (price >= tp) & ~moonbag
+        tp_blocked = tp_hit & self.provisional[rows]
+        max_hold = self.max_hold[rows]
+        hold_hit = (max_hold != 0) & ((now - self.entry_ts[rows]) >= max_hold)
+
+        codes = np.select(
+            [blocked, sl_hit, tsl_hit, dust_hit, moonbag_hit, tp_blocked, tp_hit, hold_hit],
+            [NO_EXIT, _SL, _TSL, _SL, _SL, NO_EXIT, _TP, _MAX_HOLD],
+            default=NO_EXIT,
+        ).astype(np.int8)
+        return rows, codes
+
+    def exit_decisions(
+        self,
+        mints: Optional[Sequence[str]] = None,
+        prices=None,
+        now: Optional[float] = None,
+    ) -> list[tuple[str, ExitReason]]:
+        """Mints to sell and why, for a batch of prices (or the whole book)."""
+        rows, codes = self.decide(mints, prices, now)
+        hit = np.flatnonzero(codes)
+        mints_all = self._mints
+        return [(mints_all[rows[i]], _REASONS[codes[i]]) for i in hit]
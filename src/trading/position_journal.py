@@ -0,0 +1,374 @@
+"""
+Append-only journal for positions.json.
+
+Before: every ``save_positions`` call re-serialized the WHOLE portfolio with
+``json.dump(indent=2)`` and rewrote positions.json, and ``remove_position``
+reloaded, filtered and rewrote it again. Persistence cost per trade grew with
+the number of open positions (moonbags included).
+
+Now positions.json is a periodically compacted SNAPSHOT and every change is
+one compact line appended to ``positions.json.journal``:
+
+    <crc32 hex> {"op":"put","mint":"...","data":{...},"ts":<ns>}
+    <crc32 hex> {"op":"del","mint":"...","ts":<ns>}
+
+Only positions whose serialized dict actually changed are appended, so a
+trade on one position writes one line no matter how many others are open.
+
+Replay = snapshot + the journal records stamped at or after the snapshot's
+mtime, applied in order. Records are idempotent full-position puts/deletes,
+so a crash between snapshot replace and journal truncate just replays them
+again. A torn or corrupt tail (crash mid-append) fails its CRC and is cut off.
+
+Several bot processes share one snapshot + journal: append, compaction and
+truncate run under an flock on ``positions.json.lock``, and every read first
+catches up on the journal tail other processes appended, so cross-bot
+duplicate checks see their positions. When positions.json is replaced (our
+own or another process's compaction, or a legacy tool rewriting it) the
+state is rebuilt from the new snapshot plus the journal records newer than
+it - nothing is unlinked.
+
+Compaction (atomic tmp + os.replace of positions.json, then journal truncate)
+runs once COMPACT_RECORDS records are pending, on a timer COMPACT_INTERVAL
+seconds after the first pending record, and at exit, so positions.json never
+stays stale for long after the last trade.
+"""
+
+import atexit
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal"
+LOCK_SUFFIX = ".lock"
+
+# Compact after this many pending records, or this many seconds after the first one
+COMPACT_RECORDS = 256
+COMPACT_INTERVAL = 30.0
+
+
+def _encode(record: dict) -> str:
+    body = json.dumps(record, separators=(",", ":"))
+    return f"{zlib.crc32(body.encode()):08x} {body}\n"
+
+
+def _decode(line: bytes) -> Optional[dict]:
+    """Decode one journal line, None if torn or corrupt."""
+    if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+        return None
+    body = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(body):
+            return None
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+class PositionJournal:
+    """Snapshot + append-only journal for one positions file, shared across processes."""
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        compact_records: int = COMPACT_RECORDS,
+        compact_interval: float = COMPACT_INTERVAL,
+    ):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_name(self.snapshot_path.name + JOURNAL_SUFFIX)
+        self.lock_path = self.snapshot_path.with_name(self.snapshot_path.name + LOCK_SUFFIX)
+        self.compact_records = compact_records
+        self.compact_interval = compact_interval
+        self._state: Optional[dict[str, dict]] = None
+        self._snapshot_sig: Optional[tuple] = None
+        self._offset = 0  # journal bytes already applied to _state
+        self._fd: Optional[int] = None
+        self._lock_fh = None
+        self._lock_depth = 0
+        self._pending = 0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        self._stats = {"appended": 0, "skipped": 0, "compactions": 0, "torn": 0, "reloads": 0}
+
+    @contextmanager
+    def _locked(self):
+        """Thread lock + exclusive flock on the lock file (reentrant)."""
+        with self._lock:
+            if self._lock_depth == 0:
+                if self._lock_fh is None:
+                    self._lock_fh = open(self.lock_path, "a")
+                fcntl.flock(self._lock_fh, fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    fcntl.flock(self._lock_fh, fcntl.LOCK_UN)
+
+    # ==================== REPLAY ====================
+
+    def _snapshot_signature(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.snapshot_path)
+            return (st.st_mtime_ns, st.st_size, st.st_ino)
+        except FileNotFoundError:
+            return None
+
+    def _read_snapshot(self) -> dict[str, dict]:
+        state: dict[str, dict] = {}
+        if not self.snapshot_path.exists():
+            return state
+        try:
+            with open(self.snapshot_path, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"[JOURNAL] Failed to read snapshot {self.snapshot_path}: {e}")
+            return state
+        for p in data or []:
+            if p.get("mint") and p.get("is_active", True):
+                state[p["mint"]] = p
+        return state
+
+    def _replay(self, state: dict[str, dict], offset: int, since_ns: int) -> int:
+        """Apply journal records from offset that are not older than since_ns.
+
+        Cuts off a torn tail. Advances self._offset, returns records applied.
+        """
+        if not self.journal_path.exists():
+            self._offset = 0
+            return 0
+        applied = 0
+        good_offset = offset
+        with open(self.journal_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                record = _decode(line)
+                if record is None:
+                    break
+                good_offset += len(line)
+                if record.get("ts", since_ns) < since_ns:
+                    continue  # Already folded into the snapshot
+                mint = record.get("mint")
+                if record.get("op") == "put" and mint:
+                    state[mint] = record["data"]
+                elif record.get("op") == "del" and mint:
+                    state.pop(mint, None)
+                applied += 1
+            size = f.seek(0, os.SEEK_END)
+        if good_offset < size:
+            self._stats["torn"] += 1
+            logger.warning(
+                f"[JOURNAL] Dropping {size - good_offset} torn/corrupt bytes "
+                f"at end of {self.journal_path}"
+            )
+            os.truncate(self.journal_path, good_offset)
+        self._offset = good_offset
+        return applied
+
+    def _journal_size(self) -> int:
+        try:
+            return os.stat(self.journal_path).st_size
+        except FileNotFoundError:
+            return 0
+
+    def _ensure_loaded(self) -> dict[str, dict]:
+        """Bring _state up to date with the files on disk. Call under _locked()."""
+        sig = self._snapshot_signature()
+        if self._state is not None and sig == self._snapshot_sig:
+            size = self._journal_size()
+            if size > self._offset:
+                self._replay(self._state, self._offset, 0)  # Other processes' appends
+            elif size < self._offset:
+                self._offset = size
+            return self._state
+        # First load, or positions.json was replaced (compaction here or in another
+        # process, or a legacy tool rewrite): rebuild from the new base plus the
+        # journal records newer than it
+        first = self._state is None
+        if not first:
+            self._stats["reloads"] += 1
+        state = self._read_snapshot()
+        applied = self._replay(state, 0, sig[0] if sig else 0)
+        self._state = state
+        self._snapshot_sig = sig
+        if first and applied:
+            logger.info(f"[JOURNAL] Replayed {applied} records from {self.journal_path}")
+            self._mark_pending(applied)
+        return self._state
+
+    def load(self) -> list[dict]:
+        """Current positions (snapshot + journal), in insertion order."""
+        with self._locked():
+            return list(self._ensure_loaded().values())
+
+    def get(self, mint: str) -> Optional[dict]:
+        with self._locked():
+            return self._ensure_loaded().get(mint)
+
+    def __contains__(self, mint: str) -> bool:
+        with self._locked():
+            return mint in self._ensure_loaded()
+
+    # ==================== WRITES ====================
+
+    def _append(self, records: list[dict]) -> None:
+        if self._fd is None:
+            self._fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        ts = time.time_ns()
+        buf = "".join(_encode({**r, "ts": ts}) for r in records).encode()
+        while buf:
+            buf = buf[os.write(self._fd, buf):]
+        # We hold the flock, so everything up to EOF is applied to _state
+        self._offset = os.fstat(self._fd).st_size
+        self._stats["appended"] += len(records)
+        self._mark_pending(len(records))
+
+    def _mark_pending(self, count: int) -> None:
+        self._pending += count
+        if self._pending >= self.compact_records:
+            self.compact()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.compact_interval, self._compact_due)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def sync(self, active: dict[str, dict], scope: Optional[Iterable[str]] = None) -> dict[str, dict]:
+        """Upsert active, appending only differences, and delete what went missing.
+
+        Mints not in active are deleted: all of them when scope is None (the
+        caller passed the whole portfolio), else only those in scope. Returns
+        {mint: data} that changed.
+        """
+        with self._locked():
+            state = self._ensure_loaded()
+            changed = {m: d for m, d in active.items() if state.get(m) != d}
+            candidates = state if scope is None else dict.fromkeys(scope)
+            removed = [m for m in candidates if m in state and m not in active]
+            self._stats["skipped"] += len(active) - len(changed)
+            if changed or removed:
+                state.update(changed)
+                for m in removed:
+                    del state[m]
+                self._append(
+                    [{"op": "put", "mint": m, "data": d} for m, d in changed.items()]
+                    + [{"op": "del", "mint": m} for m in removed]
+                )
+            return changed
+
+    def put(self, mint: str, data: dict) -> bool:
+        """Upsert one position. Returns False if it was already stored as-is."""
+        with self._locked():
+            state = self._ensure_loaded()
+            if state.get(mint) == data:
+                self._stats["skipped"] += 1
+                return False
+            state[mint] = data
+            self._append([{"op": "put", "mint": mint, "data": data}])
+            return True
+
+    def delete(self, mints: Iterable[str]) -> int:
+        """Delete positions by mint. Returns how many were present."""
+        with self._locked():
+            state = self._ensure_loaded()
+            present = [m for m in dict.fromkeys(mints) if m in state]
+            if present:
+                for m in present:
+                    del state[m]
+                self._append([{"op": "del", "mint": m} for m in present])
+            return len(present)
+
+    # ==================== COMPACTION ====================
+
+    def _compact_due(self) -> None:
+        """Timer callback: fold pending records into positions.json."""
+        try:
+            with self._locked():
+                self._timer = None
+                if self._pending:
+                    self.compact()
+        except Exception as e:
+            logger.error(f"[JOURNAL] Timed compaction failed: {e}")
+
+    def compact(self) -> None:
+        """Write the full state to positions.json atomically, then truncate the journal."""
+        with self._locked():
+            state = self._ensure_loaded()  # Includes other processes' records
+            tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(list(state.values()), f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            self._snapshot_sig = self._snapshot_signature()
+            # Crash here is fine: records not older than the new snapshot replay idempotently
+            if self.journal_path.exists():
+                os.truncate(self.journal_path, 0)
+            self._offset = 0
+            self._pending = 0
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._stats["compactions"] += 1
+            logger.info(f"[JOURNAL] Compacted {len(state)} positions into {self.snapshot_path}")
+
+    def _close(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def close(self) -> None:
+        """Compact pending records (if any) and close the journal file."""
+        with self._lock:
+            try:
+                if self._pending:
+                    self.compact()
+            except Exception as e:
+                logger.error(f"[JOURNAL] Final compaction failed: {e}")
+            self._close()
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "pending": self._pending,
+            "positions": len(self._state) if self._state is not None else 0,
+        }
+
+
+# One journal per positions file
+_journals: dict[str, PositionJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_journal(snapshot_path: Path) -> PositionJournal:
+    """Get or create the PositionJournal for a positions file."""
+    key = os.path.abspath(snapshot_path)
+    journal = _journals.get(key)
+    if journal is None:
+        with _journals_lock:
+            journal = _journals.get(key)
+            if journal is None:
+                journal = PositionJournal(Path(snapshot_path))
+                _journals[key] = journal
+    return journal
+
+
+@atexit.register
+def _close_journals() -> None:
+    for journal in list(_journals.values()):
+        journal.close()
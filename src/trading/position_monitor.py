@@ -0,0 +1,268 @@
+"""
+Event-driven price fan-out for position monitors.
+
+Before: every ``_monitor_position_until_exit`` coroutine woke up once per
+``price_check_interval``, pulled the price waterfall and went back to sleep,
+whether or not anything had moved. With dozens of moonbags that is dozens of
+wakeups per second doing nothing.
+
+Now price sources PUSH into one engine:
+- whale_geyser curve / vault account updates  (published as "grpc_curve" / "grpc_vault")
+- MoonbagGrpcMonitor vault updates             (published as "moonbag_grpc")
+- BatchPriceService batch refresh               (published as "batch_cache")
+
+The monitor loop labels the price it reads back from those caches
+"grpc_stream" / "grpc_retry", "moonbag_grpc" and "batch_cache" /
+"batch_retry"; those labels are PUSH_SOURCES. Any other label (Jupiter,
+curve RPC, last known) means the monitor still has to poll.
+
+``publish(mint, price)`` is a dict lookup by mint plus a float compare. Only
+when the price for a monitored mint actually CHANGES is the waiting monitor
+woken up, so TP/SL/TSL (``Position.should_exit`` + NO_SL guard in the
+monitor loop) are evaluated once per price change instead of once per tick,
+and idle positions cost nothing. Bursts coalesce: the monitor reads the
+latest price when it wakes, not every intermediate one.
+
+A heartbeat timeout on ``wait_for_price`` still lets the monitor run its
+time-based checks (max hold, is_selling watchdog, sold_mints, stale price)
+for positions whose price is quiet.
+
+When NumPy is available the engine also mirrors every watched position into
+a columnar PositionBook. A 1s sweeper evaluates TP/SL/TSL/max-hold for ALL
+positions in one vectorized pass against their last pushed prices and kicks
+only the monitors that have an exit due (e.g. max hold expiring on a quiet
+price) instead of waiting for their heartbeat.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+
+from utils.logger import get_logger
+
+try:
+    from trading.position_book import PositionBook
+except ImportError:  # numpy not installed - engine works without the sweeper
+    PositionBook = None
+
+logger = get_logger(__name__)
+
+# Max time a monitor sleeps without a price push. Keeps time-based checks
+# (max hold, is_selling watchdog, sold_mints, stale price) running.
+HEARTBEAT_INTERVAL = 5.0
+
+# Price sources that push into the engine. A position whose last price came
+# from one of these can wait for the next push; anything else (Jupiter,
+# curve RPC, last known) still has to be polled.
+PUSH_SOURCES = frozenset({
+    "grpc_stream", "grpc_retry", "moonbag_grpc", "batch_cache", "batch_retry",
+})
+
+
+class PriceTick(NamedTuple):
+    """Latest pushed price for a mint."""
+    price: float
+    source: str
+    version: int
+
+
+@dataclass(slots=True)
+class _MintWatch:
+    """Per-mint state: the monitored position and its last pushed price."""
+    position: object
+    price: float = 0.0
+    source: str = ""
+    updated_at: float = 0.0
+    version: int = 0
+    event: Optional[asyncio.Event] = field(default=None)
+
+
+class PositionMonitorEngine:
+    """Mint-indexed price fan-out that wakes monitors only on price change.
+
+    Usage (monitor side):
+        version = engine.register(position)
+        while position.is_active:
+            ...evaluate...
+            tick = await engine.wait_for_price(mint, version, timeout=5.0)
+            if tick:
+                version = tick.version
+        engine.unregister(mint, position)
+
+    Usage (price source side):
+        source.add_price_listener(engine.publish)
+    """
+
+    def __init__(self):
+        self._watches: dict[str, _MintWatch] = {}
+        self._book = PositionBook() if PositionBook is not None else None
+        self._sweeper_task: Optional[asyncio.Task] = None
+        self._stats = {
+            "published": 0,
+            "changed": 0,
+            "unchanged": 0,
+            "unwatched": 0,
+            "wakeups": 0,
+            "timeouts": 0,
+            "sweeps": 0,
+            "sweep_kicks": 0,
+        }
+
+    def register(self, position) -> int:
+        """Start fanning prices out to this position. Returns current version."""
+        mint = str(position.mint)
+        if self._book is not None:
+            self._book.upsert(position)
+        watch = self._watches.get(mint)
+        if watch is not None:
+            # Re-register (restore / re-buy of a moonbag): keep last price,
+            # just point the watch at the live Position object.
+            watch.position = position
+            return watch.version
+        self._watches[mint] = _MintWatch(position=position)
+        return 0
+
+    def unregister(self, mint: str, position=None) -> None:
+        """Stop tracking mint. If position is given, only remove its own watch."""
+        watch = self._watches.get(mint)
+        if watch is None:
+            return
+        if position is not None and watch.position is not position:
+            return  # A newer monitor owns this mint now
+        del self._watches[mint]
+        if self._book is not None:
+            self._book.remove(mint)
+        if watch.event is not None:
+            watch.event.set()  # Release a waiter so it can notice and exit
+
+    def __contains__(self, mint: str) -> bool:
+        return mint in self._watches
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    def publish(self, mint: str, price: float, source: str = "") -> bool:
+        """Push a price. Returns True if it changed and monitors were woken.
+
+        Safe to call from synchronous gRPC/HTTP handlers: never blocks and
+        never raises for unknown mints.
+        """
+        self._stats["published"] += 1
+        watch = self._watches.get(mint)
+        if watch is None:
+            self._stats["unwatched"] += 1
+            return False
+        if not price or price <= 0 or price == watch.price:
+            self._stats["unchanged"] += 1
+            return False
+        watch.price = price
+        watch.source = source
+        watch.updated_at = time.monotonic()
+        watch.version += 1
+        self._stats["changed"] += 1
+        if self._book is not None:
+            self._book.set_price(mint, price)
+        event = watch.event
+        if event is not None:
+            watch.event = None
+            event.set()
+        return True
+
+    def latest(self, mint: str, max_age: Optional[float] = None) -> Optional[PriceTick]:
+        """Last pushed price for mint, or None if none / older than max_age."""
+        watch = self._watches.get(mint)
+        if watch is None or watch.version == 0:
+            return None
+        if max_age is not None and time.monotonic() - watch.updated_at > max_age:
+            return None
+        return PriceTick(watch.price, watch.source, watch.version)
+
+    async def wait_for_price(
+        self, mint: str, seen_version: int, timeout: float
+    ) -> Optional[PriceTick]:
+        """Wait until mint has a price newer than seen_version.
+
+        Returns the latest PriceTick immediately if one already arrived,
+        otherwise blocks up to timeout seconds. Returns None on timeout or
+        if the mint was unregistered meanwhile. A sweeper kick returns the
+        current tick even if its version is unchanged.
+        """
+        watch = self._watches.get(mint)
+        if watch is None:
+            await asyncio.sleep(timeout)
+            return None
+        if self._book is not None:
+            # The caller just finished evaluating: mirror its Position state
+            self._book.upsert(watch.position)
+        if watch.version == seen_version:
+            if watch.event is None:
+                watch.event = asyncio.Event()
+            try:
+                await asyncio.wait_for(watch.event.wait(), timeout)
+            except asyncio.TimeoutError:
+                self._stats["timeouts"] += 1
+                return None
+            watch = self._watches.get(mint)
+            if watch is None:
+                return None
+        self._stats["wakeups"] += 1
+        return PriceTick(watch.price, watch.source, watch.version)
+
+    def set_no_sl_mints(self, mints) -> None:
+        """Mints the sweeper must never kick for an exit (NO_SL_MINTS guard)."""
+        if self._book is not None:
+            self._book.set_no_sl_mints(mints)
+
+    def sweep(self, now: Optional[float] = None) -> list:
+        """Evaluate every watched position at once, wake those with an exit due.
+
+        Returns [(mint, ExitReason), ...]. The woken monitor re-checks with
+        the live Position (should_exit + NO_SL guard) before selling.
+        """
+        if self._book is None or not self._watches:
+            return []
+        self._stats["sweeps"] += 1
+        decisions = self._book.exit_decisions(now=now)
+        for mint, _reason in decisions:
+            watch = self._watches.get(mint)
+            if watch is not None and watch.event is not None:
+                event, watch.event = watch.event, None
+                event.set()
+                self._stats["sweep_kicks"] += 1
+        return decisions
+
+    async def _sweep_loop(self, interval: float) -> None:
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                self.sweep()
+            except asyncio.CancelledError:
+                return
+            except Exception as e:
+                logger.warning(f"[MONITOR] Sweep error: {e}")
+
+    def start_sweeper(self, interval: float = 1.0) -> bool:
+        """Start the vectorized exit sweeper (no-op without NumPy)."""
+        if self._book is None:
+            logger.info("[MONITOR] numpy not available - vectorized sweeper disabled")
+            return False
+        if self._sweeper_task is not None and not self._sweeper_task.done():
+            return False
+        self._sweeper_task = asyncio.create_task(self._sweep_loop(interval))
+        return True
+
+    def get_stats(self) -> dict:
+        return {**self._stats, "watched": len(self._watches)}
+
+
+# Global singleton
+_engine: Optional[PositionMonitorEngine] = None
+
+
+def get_position_monitor() -> PositionMonitorEngine:
+    """Get or create the global PositionMonitorEngine instance."""
+    global _engine
+    if _engine is None:
+        _engine = PositionMonitorEngine()
+    return _engine
@@ -1,21 +1,29 @@
 import json
-import redis
 import logging
 from pathlib import Path
 from datetime import datetime
 from solders.pubkey import Pubkey
 
+from core.redis_pool import get_async_redis
+
 logger = logging.getLogger(__name__)
 
-REDIS_CLIENT = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
+POSITION_TTL = 7 * 24 * 3600
+
+
+def _client():
+    """Shared pooled client; commands are timed under "position_redis"."""
+    return get_async_redis().client_for("position_redis")
 
-def save_positions_to_redis(positions: list) -> bool:
-    """Save all positions to Redis with TTL"""
+
+async def save_positions_to_redis(positions: list) -> bool:
+    """Save all positions to Redis with TTL (one pipeline)"""
     try:
         if not positions:
             logger.info("[REDIS] No positions to save")
             return True
 
+        pipe = _client().pipeline(transaction=False)
         for pos in positions:
             mint_str = str(pos.mint)
 
@@ -41,24 +49,26 @@ def save_positions_to_redis(positions: list) -> bool:
             }
 
             redis_key = f"position:{mint_str}"
-            REDIS_CLIENT.setex(redis_key, 7 * 24 * 3600, json.dumps(pos_dict))
-            logger.debug(f"[REDIS] Saved position {mint_str}")
+            pipe.setex(redis_key, POSITION_TTL, json.dumps(pos_dict))
 
         position_mints = [str(pos.mint) for pos in positions]
-        REDIS_CLIENT.setex("positions:all", 7 * 24 * 3600, json.dumps(position_mints))
+        pipe.setex("positions:all", POSITION_TTL, json.dumps(position_mints))
+        pipe.bgsave()
+        await pipe.execute()
 
         logger.warning(f"[REDIS] Saved {len(positions)} positions to Redis")
-        REDIS_CLIENT.bgsave()
         return True
 
     except Exception as e:
         logger.error(f"[REDIS] Failed to save positions: {e}")
         return False
 
-def load_positions_from_redis() -> list:
+
+async def load_positions_from_redis() -> list:
     """Load all positions from Redis"""
     try:
-        position_mints_str = REDIS_CLIENT.get("positions:all")
+        r = _client()
+        position_mints_str = await r.get("positions:all")
         if not position_mints_str:
             logger.info("[REDIS] No positions in Redis")
             return []
@@ -66,10 +76,9 @@ def load_positions_from_redis() -> list:
         position_mints = json.loads(position_mints_str)
         positions = []
 
-        for mint_str in position_mints:
-            redis_key = f"position:{mint_str}"
-            pos_str = REDIS_CLIENT.get(redis_key)
+        pos_strs = await r.mget([f"position:{mint_str}" for mint_str in position_mints]) if position_mints else []
 
+        for pos_str in pos_strs:
             if pos_str:
                 pos_dict = json.loads(pos_str)
                 from src.trading.position import Position
@@ -1,18 +1,36 @@
 """
 Global purchase history - prevents buying same token twice EVER.
 Shared across all bots, persisted to disk.
+
+Storage: append-only JSONL log (one purchase record per line) next to the
+legacy JSON file, which is imported once and renamed to *.migrated.
+
+Every process keeps the whole history in a PurchaseHistoryIndex (dict by
+mint), so ``was_token_purchased`` is a set lookup plus one ``os.stat``:
+when another bot appended to the log, only the new bytes are read; when the
+periodic cleanup compacted it (new inode / shorter file), it is reloaded.
+
+``add_to_purchase_history`` is write-behind: the mint is in the index
+immediately and a background thread appends the line under an flock on
+``<log>.lock`` (the same lock compaction takes).
 """
+import atexit
+import fcntl
 import json
 import os
-import fcntl
-from datetime import datetime
+import queue
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
+
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 # Global history file - shared by ALL bots
 HISTORY_FILE = Path("/opt/pumpfun-bonkfun-bot/data/purchased_tokens_history.json")
+HISTORY_LOG = HISTORY_FILE.with_suffix(".jsonl")
 
 
 def _ensure_data_dir():
@@ -20,35 +38,242 @@ def _ensure_data_dir():
     HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
 
 
+class PurchaseHistoryIndex:
+    """In-memory mint -> purchase record index over an append-only JSONL log."""
+
+    def __init__(self, log_path: Path, legacy_json: Optional[Path] = None):
+        self.log_path = Path(log_path)
+        self.lock_path = self.log_path.with_name(self.log_path.name + ".lock")
+        self.legacy_json = legacy_json
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._records: dict[str, dict] = {}
+        self._mutex = threading.RLock()
+        self._ino = 0
+        self._offset = 0
+        self._size = -1
+
+        self._pending: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="purchase-history-writer", daemon=True)
+        self._writer.start()
+
+        self._migrate_legacy()
+        self.refresh()
+        logger.info(f"[HISTORY] Loaded {len(self._records)} tokens from purchase history")
+
+    # --- reads -----------------------------------------------------------
+
+    def __contains__(self, mint: str) -> bool:
+        self.refresh()
+        return mint in self._records
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._records)
+
+    def mints(self) -> set[str]:
+        self.refresh()
+        with self._mutex:
+            return set(self._records)
+
+    def records(self) -> dict[str, dict]:
+        self.refresh()
+        with self._mutex:
+            return dict(self._records)
+
+    def refresh(self) -> None:
+        """Pick up appends (tail) or compaction (reload) by other processes."""
+        try:
+            st = os.stat(self.log_path)
+        except FileNotFoundError:
+            return
+        if st.st_ino == self._ino and st.st_size == self._size:
+            return
+        with self._mutex:
+            if st.st_ino != self._ino or st.st_size < self._offset:
+                self._load(reset=True)
+            else:
+                self._load(reset=False)
+
+    def _load(self, reset: bool) -> None:
+        try:
+            with open(self.log_path, "rb") as f:
+                ino = os.fstat(f.fileno()).st_ino
+                if reset:
+                    records: dict[str, dict] = {}
+                    offset = 0
+                else:
+                    records = self._records
+                    offset = self._offset
+                f.seek(offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return
+        # A concurrent append may have left a partial last line: stop at the last newline
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                records[entry.pop("mint")] = entry
+            except (ValueError, KeyError) as e:
+                logger.warning(f"[HISTORY] Skipping bad history line: {e}")
+        if reset:
+            # Write-behind entries not yet on disk stay visible
+            for mint, entry in self._records.items():
+                if entry.get("_pending"):
+                    records.setdefault(mint, entry)
+        self._records = records
+        self._ino = ino
+        self._offset = offset + end
+        self._size = offset + len(chunk)
+
+    def _migrate_legacy(self) -> None:
+        """Import the legacy purchased_tokens JSON once."""
+        legacy = self.legacy_json
+        if not legacy or not legacy.exists() or self.log_path.exists():
+            return
+        try:
+            with open(legacy, "r") as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+                try:
+                    tokens = json.load(f).get("purchased_tokens", {})
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            with self._locked():
+                if not self.log_path.exists():
+                    self._rewrite(tokens)
+                    legacy.rename(legacy.with_name(legacy.name + ".migrated"))
+                    logger.warning(f"[HISTORY] Migrated {len(tokens)} tokens from {legacy.name} to {self.log_path.name}")
+        except Exception as e:
+            logger.error(f"[HISTORY] Legacy purchase history migration failed: {e}")
+
+    # --- writes ----------------------------------------------------------
+
+    def add(self, mint: str, entry: dict) -> None:
+        """Index now, append to the log in the background."""
+        with self._mutex:
+            self._records[mint] = {**entry, "_pending": True}
+        self._pending.put((mint, entry))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until queued appends are on disk."""
+        done = threading.Event()
+        self._pending.put(done)
+        return done.wait(timeout)
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._pending.get()
+            batch = [item]
+            while True:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            for pending in batch:
+                if isinstance(pending, threading.Event):
+                    continue
+                mint, entry = pending
+                lines.append(json.dumps({"mint": mint, **entry}, separators=(",", ":")) + "\n")
+            if lines:
+                try:
+                    with self._locked():
+                        with open(self.log_path, "a") as f:
+                            f.write("".join(lines))
+                            f.flush()
+                    with self._mutex:
+                        for pending in batch:
+                            if not isinstance(pending, threading.Event):
+                                self._records.get(pending[0], {}).pop("_pending", None)
+                except Exception as e:
+                    logger.error(f"[HISTORY] Failed to persist {len(lines)} purchase(s): {e}")
+            for pending in batch:
+                if isinstance(pending, threading.Event):
+                    pending.set()
+
+    def prune(self, max_age_seconds: float) -> tuple[set[str], int]:
+        """Compact the log to entries newer than max_age. Returns (expired mints, kept)."""
+        cutoff_str = (datetime.utcnow() - timedelta(seconds=max_age_seconds)).isoformat()
+        self.flush()
+        with self._locked(), self._mutex:
+            self._load(reset=True)
+            fresh = {m: e for m, e in self._records.items() if e.get("timestamp", "") > cutoff_str}
+            expired = set(self._records) - set(fresh)
+            if expired:
+                self._rewrite(fresh)
+                self._records = fresh
+                st = os.stat(self.log_path)
+                self._ino, self._offset, self._size = st.st_ino, st.st_size, st.st_size
+        return expired, len(fresh)
+
+    def _rewrite(self, tokens: dict[str, dict]) -> None:
+        """Atomically replace the log (caller holds the lock file)."""
+        tmp = self.log_path.with_name(self.log_path.name + ".tmp")
+        with open(tmp, "w") as f:
+            for mint, entry in tokens.items():
+                clean = {k: v for k, v in entry.items() if k != "_pending"}
+                f.write(json.dumps({"mint": mint, **clean}, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.log_path)
+
+    def _locked(self):
+        return _FileLock(self.lock_path)
+
+
+class _FileLock:
+    """Exclusive flock on a sidecar lock file (survives log replacement)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fh = None
+
+    def __enter__(self):
+        self._fh = open(self.path, "a")
+        fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+        self._fh.close()
+        self._fh = None
+        return False
+
+
+_index: Optional[PurchaseHistoryIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_purchase_index() -> PurchaseHistoryIndex:
+    """Process-wide purchase history index."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _ensure_data_dir()
+                _index = PurchaseHistoryIndex(HISTORY_LOG, legacy_json=HISTORY_FILE)
+                atexit.register(_index.flush)
+    return _index
+
+
 def load_purchase_history() -> set[str]:
-    """Load all previously purchased token mints from disk.
+    """Load all previously purchased token mints.
 
     Returns:
         Set of token mint addresses that were ever purchased.
     """
-    _ensure_data_dir()
-
-    if not HISTORY_FILE.exists():
-        return set()
-
     try:
-        with open(HISTORY_FILE, 'r') as f:
-            # Use file locking for safe concurrent access
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-            try:
-                data = json.load(f)
-                tokens = set(data.get("purchased_tokens", {}).keys())
-                logger.info(f"[HISTORY] Loaded {len(tokens)} tokens from purchase history")
-                return tokens
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return get_purchase_index().mints()
     except Exception as e:
         logger.error(f"[HISTORY] Failed to load purchase history: {e}")
         return set()
 
 
 def was_token_purchased(mint: str) -> bool:
-    """Check if token was ever purchased.
+    """Check if token was ever purchased (by any bot).
 
     Args:
         mint: Token mint address
@@ -56,8 +281,7 @@ def was_token_purchased(mint: str) -> bool:
     Returns:
         True if token was purchased before, False otherwise.
     """
-    history = load_purchase_history()
-    return mint in history
+    return mint in get_purchase_index()
 
 
 def add_to_purchase_history(
@@ -83,24 +307,9 @@ def add_to_purchase_history(
     Returns:
         True if added successfully, False otherwise.
     """
-    _ensure_data_dir()
-
     try:
-        # Load existing data
-        data = {"purchased_tokens": {}}
-        if HISTORY_FILE.exists():
-            with open(HISTORY_FILE, 'r') as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                try:
-                    data = json.load(f)
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-        # Add new token
-        if "purchased_tokens" not in data:
-            data["purchased_tokens"] = {}
-
-        data["purchased_tokens"][mint] = {
+        index = get_purchase_index()
+        index.add(mint, {
             "symbol": symbol,
             "bot_name": bot_name,
             "platform": platform,
@@ -109,19 +318,11 @@ def add_to_purchase_history(
             "whale_wallet": whale_wallet,
             "whale_label": whale_label,
             "timestamp": datetime.utcnow().isoformat(),
-        }
-
-        # Save with exclusive lock
-        with open(HISTORY_FILE, 'w') as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                json.dump(data, f, indent=2)
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        })
 
         logger.warning(
             f"[HISTORY] Added {symbol} ({mint[:8]}...) to purchase history "
-            f"(total: {len(data['purchased_tokens'])} tokens)"
+            f"(total: {len(index)} tokens)"
         )
         return True
 
@@ -130,46 +331,49 @@ def add_to_purchase_history(
         return False
 
 
-def get_purchase_history_stats() -> dict:
-    """Get statistics about purchase history."""
-    _ensure_data_dir()
+def update_purchase_amount(mint: str, amount: float) -> bool:
+    """Record a new token amount for an already purchased mint (e.g. after a partial sell).
+
+    Returns:
+        True if the mint was in the history and got updated, False otherwise.
+    """
+    try:
+        index = get_purchase_index()
+        entry = index.records().get(mint)
+        if entry is None:
+            return False
+        entry = {k: v for k, v in entry.items() if k != "_pending"}
+        index.add(mint, {**entry, "amount": amount})
+        return True
+    except Exception as e:
+        logger.error(f"[HISTORY] Failed to update amount for {mint[:8]}...: {e}")
+        return False
 
-    if not HISTORY_FILE.exists():
-        return {"total_tokens": 0, "file_exists": False}
 
+def get_purchase_history_stats() -> dict:
+    """Get statistics about purchase history."""
     try:
-        with open(HISTORY_FILE, 'r') as f:
-            data = json.load(f)
-            tokens = data.get("purchased_tokens", {})
-            return {
-                "total_tokens": len(tokens),
-                "file_exists": True,
-                "file_path": str(HISTORY_FILE),
-            }
+        index = get_purchase_index()
+        return {
+            "total_tokens": len(index),
+            "file_exists": index.log_path.exists(),
+            "file_path": str(index.log_path),
+        }
     except Exception as e:
-        return {"total_tokens": 0, "file_exists": True, "error": str(e)}
+        return {"total_tokens": 0, "file_exists": HISTORY_LOG.exists(), "error": str(e)}
 
 
 def load_purchase_history_full() -> dict:
     """Load full purchase history with prices and amounts.
-    
+
     Returns:
         Dict mapping mint -> {symbol, price, amount, timestamp, ...}
     """
-    _ensure_data_dir()
-    
-    if not HISTORY_FILE.exists():
-        return {}
-    
     try:
-        with open(HISTORY_FILE, 'r') as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-            try:
-                data = json.load(f)
-                return data.get("purchased_tokens", {})
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return {
+            mint: {k: v for k, v in entry.items() if k != "_pending"}
+            for mint, entry in get_purchase_index().records().items()
+        }
     except Exception as e:
         logger.error(f"[HISTORY] Failed to load full purchase history: {e}")
         return {}
-
@@ -8,9 +8,10 @@ import asyncio
 import json
 import logging
 import os
+from pathlib import Path
 from typing import Optional
 
-import redis.asyncio as aioredis
+from core.redis_pool import REDIS_URL, AsyncRedis, get_async_redis
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +34,7 @@ class RedisStateManager:
     
     def __init__(self, redis_url: str = "redis://localhost:6379/0"):
         self.redis_url = redis_url
-        self._redis: Optional[aioredis.Redis] = None
+        self._redis = None
         self._connected = False
         
     @classmethod
@@ -48,13 +49,9 @@ class RedisStateManager:
     async def connect(self) -> bool:
         """Connect to Redis."""
         try:
-            self._redis = await aioredis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-                socket_timeout=5.0,
-                socket_connect_timeout=5.0,
-            )
+            # Shared pooled client; every command is timed under "redis_state"
+            facade = get_async_redis() if self.redis_url == REDIS_URL else AsyncRedis(self.redis_url)
+            self._redis = facade.client_for("redis_state")
             await self._redis.ping()
             self._connected = True
             logger.info("[REDIS] Connected successfully")
@@ -102,6 +99,41 @@ class RedisStateManager:
             logger.error(f"[REDIS] get_position failed: {e}")
             return None
     
+    async def get_positions_many(self, mints: list[str]) -> dict[str, dict]:
+        """Get several positions in one HMGET round trip. Missing mints are omitted."""
+        if not self._connected or not mints:
+            return {}
+        try:
+            values = await self._redis.hmget(POSITIONS_KEY, mints)
+            result = {}
+            for mint, pos_json in zip(mints, values):
+                if pos_json:
+                    try:
+                        result[mint] = json.loads(pos_json)
+                    except json.JSONDecodeError:
+                        logger.warning(f"[REDIS] Invalid JSON for {mint}")
+            return result
+        except Exception as e:
+            logger.error(f"[REDIS] get_positions_many failed: {e}")
+            return {}
+
+    async def save_positions_batch(self, positions: dict[str, dict], remove: list[str] = ()) -> bool:
+        """Save/remove several positions in one pipelined round trip."""
+        if not self._connected or not (positions or remove):
+            return False
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            if positions:
+                pipe.hset(POSITIONS_KEY, mapping={m: json.dumps(d) for m, d in positions.items()})
+            if remove:
+                pipe.hdel(POSITIONS_KEY, *remove)
+            await pipe.execute()
+            logger.info(f"[REDIS] Batch saved {len(positions)} / removed {len(remove)} positions")
+            return True
+        except Exception as e:
+            logger.error(f"[REDIS] save_positions_batch failed: {e}")
+            return False
+
     async def get_all_positions(self) -> list[dict]:
         """Get all active positions."""
         if not self._connected:
@@ -246,14 +278,15 @@ class RedisStateManager:
     
     async def import_from_json(self, json_path: str = "positions.json") -> int:
         """Import positions from JSON file to Redis."""
-        import os
-        if not os.path.exists(json_path):
+        from trading.position_journal import get_journal
+
+        journal = get_journal(Path(json_path))
+        if not journal.snapshot_path.exists() and not journal.journal_path.exists():
             logger.info(f"[REDIS] No JSON file to import: {json_path}")
             return 0
         
         try:
-            with open(json_path) as f:
-                positions = json.load(f)
+            positions = journal.load()
             
             if not positions:
                 return 0
@@ -274,9 +307,10 @@ class RedisStateManager:
     async def export_to_json(self, json_path: str = "positions.json") -> int:
         """Export positions from Redis to JSON file."""
         try:
+            from trading.position_journal import get_journal
+
             positions = await self.get_all_positions()
-            with open(json_path, "w") as f:
-                json.dump(positions, f, indent=2)
+            get_journal(Path(json_path)).sync({p["mint"]: p for p in positions if p.get("mint")})
             logger.info(f"[REDIS] Exported {len(positions)} positions to {json_path}")
             return len(positions)
         except Exception as e:
@@ -340,6 +374,10 @@ async def add_sold_mint(mint: str) -> bool:
         pass
     return False
 
+async def remove_sold_mint(mint: str) -> bool:
+    """Remove mint from sold set (re-buy / stale entry). True if it was there."""
+    return await get_async_redis().zrem(SOLD_MINTS_KEY, mint, caller="sold_mints") > 0
+
 async def is_sold_mint(mint: str) -> bool:
     """Check if mint was already sold."""
     try:
@@ -1,6 +1,11 @@
 """
 Global trader registry - allows tx_callbacks to access trader instance
 and start position monitors for new purchases.
+
+Several bots may run in one process (bot_runner.run_bots). Callers that act
+on one position or transaction pass its mint/wallet/platform to get_trader()
+so they reach the bot that owns it; the first one registered is the primary
+trader used when nothing more specific matches.
 """
 import asyncio
 import logging
@@ -11,37 +16,118 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-_trader_instance: Optional["UniversalTrader"] = None
+_traders: list["UniversalTrader"] = []
 _monitor_callback: Optional[Callable] = None
 
 
 def register_trader(trader: "UniversalTrader") -> None:
     """Register trader instance for global access."""
-    global _trader_instance
-    _trader_instance = trader
-    logger.info("[REGISTRY] Trader registered for position monitoring")
+    if trader not in _traders:
+        _traders.append(trader)
+    logger.info(f"[REGISTRY] Trader registered for position monitoring ({len(_traders)} in process)")
+
+
+def _platform_value(trader: "UniversalTrader") -> Optional[str]:
+    platform = getattr(trader, "platform", None)
+    return getattr(platform, "value", platform)
+
+
+def _holder(mint: str) -> Optional["UniversalTrader"]:
+    """The trader holding mint in its active positions."""
+    for trader in _traders:
+        has_position = getattr(trader, "has_active_position", None)
+        if has_position is not None and has_position(mint):
+            return trader
+    return None
+
+
+def get_trader(
+    mint: Optional[str] = None,
+    wallet: Optional[str] = None,
+    platform: Optional[str] = None,
+) -> Optional["UniversalTrader"]:
+    """Get the trader a caller should act on.
+
+    The one holding mint in its active positions, else the one trading from
+    wallet, else the one on platform, else the primary (first registered).
+    """
+    if not _traders:
+        return None
+    if mint:
+        holder = _holder(mint)
+        if holder is not None:
+            return holder
+    if wallet:
+        for trader in _traders:
+            if trader_wallet(trader) == wallet:
+                return trader
+    if platform:
+        for trader in _traders:
+            if _platform_value(trader) == platform:
+                return trader
+    return _traders[0]
+
 
+def get_traders() -> list["UniversalTrader"]:
+    """All traders registered in this process, primary first."""
+    return list(_traders)
 
-def get_trader() -> Optional["UniversalTrader"]:
-    """Get registered trader instance."""
-    return _trader_instance
 
+def trader_wallet(trader: "UniversalTrader") -> Optional[str]:
+    """Pubkey of the wallet trader trades from."""
+    wallet = getattr(trader, "wallet", None)
+    return str(wallet.pubkey) if wallet is not None else None
 
-def unregister_trader() -> None:
-    """Unregister trader instance."""
-    global _trader_instance
-    _trader_instance = None
+
+def get_traders_for_wallet(wallet: str) -> list["UniversalTrader"]:
+    """Traders in this process trading from wallet."""
+    return [t for t in _traders if trader_wallet(t) == wallet]
+
+
+def positions_for_wallet(
+    positions: list[dict], wallet: str, claim_untagged: bool = False
+) -> list[dict]:
+    """Stored positions (dicts) that belong to wallet.
+
+    A position belongs to its "wallet" tag; an untagged (legacy) one to the
+    bot holding it in memory, else to wallet only if claim_untagged (the
+    process trades from a single wallet).
+    """
+    owned = []
+    for pos in positions:
+        owner = pos.get("wallet")
+        if not owner:
+            holder = _holder(pos.get("mint", ""))
+            owner = trader_wallet(holder) if holder else (wallet if claim_untagged else None)
+        if owner == wallet:
+            owned.append(pos)
+    return owned
+
+
+def unregister_trader(trader: Optional["UniversalTrader"] = None) -> None:
+    """Unregister one trader instance, or all of them."""
+    if trader is None:
+        _traders.clear()
+    elif trader in _traders:
+        _traders.remove(trader)
     logger.info("[REGISTRY] Trader unregistered")
 
 
-async def start_monitor_for_position(mint: str, symbol: str, position_data: dict) -> bool:
+async def start_monitor_for_position(
+    mint: str,
+    symbol: str,
+    position_data: dict,
+    wallet: Optional[str] = None,
+    platform: Optional[str] = None,
+) -> bool:
     """
     Start position monitor for newly bought token.
     Called from tx_callback after successful buy.
-    
+
+    The monitor runs on the bot that owns the position (see get_trader).
     Returns True if monitor started successfully.
     """
-    trader = _trader_instance
+    trader = get_trader(mint=mint, wallet=wallet, platform=platform)
     if not trader:
         logger.error(f"[REGISTRY] Cannot start monitor for {symbol} - no trader registered!")
         return False
@@ -71,6 +157,7 @@ async def start_monitor_for_position(mint: str, symbol: str, position_data: dict
         # Add to trader's active_positions
         if position not in trader.active_positions:
             trader.active_positions.append(position)
+            trader.invalidate_active_positions()
             logger.info(f"[REGISTRY] Added {symbol} to active_positions")
         
         # Create TokenInfo for monitoring
@@ -19,7 +19,9 @@ from cleanup.modes import (
     handle_cleanup_after_sell,
     handle_cleanup_post_session,
 )
-from core.client import SolanaClient
+from core.client import acquire_solana_client, release_solana_client
+from core.pda_cache import find_program_address
+from core.redis_pool import get_async_redis
 from core.priority_fee.manager import PriorityFeeManager
 from core.wallet import Wallet
 from interfaces.core import Platform, TokenInfo
@@ -72,7 +74,8 @@ from monitoring.volume_pattern_analyzer import VolumePatternAnalyzer, TokenVolum
 from platforms import get_platform_implementations
 from trading.base import TradeResult
 from trading.platform_aware import PlatformAwareBuyer, PlatformAwareSeller
-from trading.position import Position, save_positions, load_positions, load_positions_async, remove_position, ExitReason, register_monitor, unregister_monitor
+from trading.position import Position, save_position, save_positions, load_positions, load_positions_async, remove_position, ExitReason, register_monitor, unregister_monitor
+from trading.position_monitor import HEARTBEAT_INTERVAL, PUSH_SOURCES, get_position_monitor
 from security.token_vetter import TokenVetter, VetResult
 from trading.purchase_history import (
     was_token_purchased,
@@ -90,9 +93,10 @@ from trading.dedup_store import (
 from analytics.trace_context import TraceContext, get_current_trace
 from analytics.trace_recorder import init_trace_recorder, shutdown_trace_recorder
 from trading.position import is_token_in_positions
-from utils.logger import get_logger
+from utils.logger import get_hot_logger, get_logger
 # Batch price service for rate-limit-safe price fetching
 from utils.batch_price_service import (
+    get_batch_price_service,
     init_batch_price_service,
     watch_token,
     unwatch_token,
@@ -102,6 +106,9 @@ from utils.batch_price_service import (
 asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 logger = get_logger(__name__)
+# Monitor-loop lines that repeat every tick while a condition holds (keyed by mint)
+_monitor_log = get_hot_logger(__name__, interval=10.0)
+_nosl_log = get_hot_logger(__name__, interval=60.0)
 
 # === ТОКЕНЫ БЕЗ STOP-LOSS (даже emergency) ===
 NO_SL_MINTS = {
@@ -282,7 +289,7 @@ class UniversalTrader:
 
         # Core components
         logger.warning("=== INIT: Creating core components ===")
-        self.solana_client = SolanaClient(rpc_endpoint)
+        self.solana_client = acquire_solana_client(rpc_endpoint)  # shared by in-process bots
         self.wallet = Wallet(private_key)
         self.min_sol_balance = min_sol_balance
         self.priority_fee_manager = PriorityFeeManager(
@@ -707,6 +714,11 @@ class UniversalTrader:
         # Load existing positions from file at startup (CRITICAL FIX!)
         self.active_positions: list[Position] = load_positions()
         logger.warning(f"[INIT] Loaded {len(self.active_positions)} existing positions from file")  # Active positions for persistence
+        # Event-driven monitor: price sources push here, monitors wake on change
+        self._position_monitor = get_position_monitor()
+        # has_active_position() index; invalidated by the active_positions setter and
+        # by invalidate_active_positions() after every in-place change
+        self._active_mints: set[str] | None = None
 
         # ANTI-DUPLICATE PROTECTION (CRITICAL!)
         # Single lock for ALL buy operations to prevent race conditions
@@ -1223,10 +1235,9 @@ class UniversalTrader:
                         try:
                             from trading.position import save_position_redis, remove_position as _rem_pos
                             _rem_pos(mint_str)
-                            import redis.asyncio as _r474
-                            _rc474 = _r474.Redis(host='localhost', port=6379, db=0)
-                            await _rc474.hdel("whale:positions", mint_str)
-                            await _rc474.aclose()
+                            from core.redis_pool import get_async_redis
+                            from trading.redis_state import POSITIONS_KEY
+                            await get_async_redis().hdel(POSITIONS_KEY, mint_str, caller="fix_s47_4")
                         except Exception as _e474:
                             logger.warning(f"[FIX S47-4] Redis cleanup failed: {_e474}")
                         # Remove from _bought_tokens so buy proceeds
@@ -1380,7 +1391,7 @@ class UniversalTrader:
                 # CRITICAL: Derive bonding_curve for fast sell path (avoid fallback)
                 from solders.pubkey import Pubkey as SoldersPubkey
                 PUMP_PROGRAM_ID = SoldersPubkey.from_string("6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P")
-                bonding_curve_derived, _ = SoldersPubkey.find_program_address(
+                bonding_curve_derived, _ = find_program_address(
                     [b"bonding-curve", bytes(mint)],
                     PUMP_PROGRAM_ID
                 )
@@ -1404,7 +1415,7 @@ class UniversalTrader:
                         _TOKEN_PROG = _Pk.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
                         _ATA_PROG = _Pk.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")
                         _wallet_pk = self.wallet.pubkey
-                        _ata_addr, _ = _Pk.find_program_address(
+                        _ata_addr, _ = find_program_address(
                             [bytes(_wallet_pk), bytes(_TOKEN_PROG), bytes(mint)],
                             _ATA_PROG
                         )
@@ -1463,17 +1474,16 @@ class UniversalTrader:
                     position.entry_price_provisional = False
                     logger.warning(f"[SIGNAL] {whale_buy.token_symbol}: Instant confirm (external signal)")
                 self.active_positions.append(position)
+                self.invalidate_active_positions()
                 # FIX S23-6: Remove from sold_mints on new buy (prevent ZOMBIE KILL on re-bought tokens)
                 try:
-                    import redis as _redis_sync
-                    _r = _redis_sync.Redis()
-                    _removed = _r.zrem("sold_mints", str(position.mint))
-                    _r.close()
+                    from trading.redis_state import remove_sold_mint
+                    _removed = await remove_sold_mint(str(position.mint))
                     if _removed:
                         logger.warning(f"[BUY] Cleared stale sold_mint for {whale_buy.token_symbol}")
                 except Exception:
                     pass
-                _save_pos(self.active_positions)
+                _save_pos(self.active_positions, scope=())
                 _watch(str(position.mint))
                 _display_symbol = whale_buy.token_symbol or mint_str[:8]
                 logger.warning(f"[WHALE] ⚡ INSTANT Position created for {_display_symbol}")
@@ -1526,7 +1536,7 @@ class UniversalTrader:
                     from core.pubkeys import SystemAddresses
                     
                     # Derive associated_bonding_curve  
-                    associated_bonding_curve_derived, _ = SoldersPubkey.find_program_address(
+                    associated_bonding_curve_derived, _ = find_program_address(
                         [bytes(bonding_curve_derived), bytes(SystemAddresses.TOKEN_PROGRAM), bytes(mint)],
                         SoldersPubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")
                     )
@@ -1687,7 +1697,7 @@ class UniversalTrader:
         """
         try:
             from platforms.pumpfun.address_provider import PumpFunAddresses
-            _bc, _ = Pubkey.find_program_address(
+            _bc, _ = find_program_address(
                 [b"bonding-curve", bytes(Pubkey.from_string(mint_str))],
                 PumpFunAddresses.PROGRAM
             )
@@ -1752,7 +1762,7 @@ class UniversalTrader:
                     )
                     try:
                         from trading.position import save_positions
-                        save_positions(self.active_positions)
+                        save_positions(self.active_positions, scope=())
                     except Exception:
                         pass
                 else:
@@ -1855,7 +1865,7 @@ class UniversalTrader:
                 from platforms.pumpfun.address_provider import PumpFunAddresses
 
                 # Derive bonding curve
-                bonding_curve, _ = Pubkey.find_program_address(
+                bonding_curve, _ = find_program_address(
                     [b"bonding-curve", bytes(mint)],
                     PumpFunAddresses.PROGRAM
                 )
@@ -2131,7 +2141,7 @@ class UniversalTrader:
             logger.info(f"[CHECK] [2.5/4] Trying pump.fun DIRECT bonding curve for {symbol}...")
             
             from platforms.pumpfun.address_provider import PumpFunAddresses as _PFA
-            _bc_direct, _ = Pubkey.find_program_address(
+            _bc_direct, _ = find_program_address(
                 [b"bonding-curve", bytes(mint)], _PFA.PROGRAM,
             )
             
@@ -2228,7 +2238,7 @@ class UniversalTrader:
             # Jupiter returns 5 values: success, sig, error, token_amount, price
             # Derive bonding_curve PDA for curve tracking (pump.fun tokens)
             from platforms.pumpfun.address_provider import PumpFunAddresses
-            _bc_for_ctx, _ = Pubkey.find_program_address(
+            _bc_for_ctx, _ = find_program_address(
                 [b"bonding-curve", bytes(mint)],
                 PumpFunAddresses.PROGRAM,
             )
@@ -2364,14 +2374,14 @@ class UniversalTrader:
             # Derive addresses
             token_program_id = SystemAddresses.TOKEN_2022_PROGRAM
 
-            associated_bonding_curve, _ = Pubkey.find_program_address(
+            associated_bonding_curve, _ = find_program_address(
                 [bytes(bonding_curve), bytes(token_program_id), bytes(mint)],
                 SystemAddresses.ASSOCIATED_TOKEN_PROGRAM
             )
 
             creator_vault = None
             if creator:
-                creator_vault, _ = Pubkey.find_program_address(
+                creator_vault, _ = find_program_address(
                     [b"creator-vault", bytes(creator)],
                     PumpFunAddresses.PROGRAM
                 )
@@ -2725,10 +2735,9 @@ class UniversalTrader:
                         try:
                             from trading.position import remove_position as _rem_pos
                             _rem_pos(mint_str)
-                            import redis.asyncio as _r474
-                            _rc474 = _r474.Redis(host='localhost', port=6379, db=0)
-                            await _rc474.hdel("whale:positions", mint_str)
-                            await _rc474.aclose()
+                            from core.redis_pool import get_async_redis
+                            from trading.redis_state import POSITIONS_KEY
+                            await get_async_redis().hdel(POSITIONS_KEY, mint_str, caller="fix_s47_4")
                         except Exception as _e474:
                             logger.warning(f"[FIX S47-4] Redis cleanup failed: {_e474}")
                         self._bought_tokens.discard(mint_str)
@@ -2813,19 +2822,19 @@ class UniversalTrader:
 
             if target_platform == Platform.PUMP_FUN:
                 from platforms.pumpfun.address_provider import PumpFunAddresses
-                bonding_curve, _ = Pubkey.find_program_address(
+                bonding_curve, _ = find_program_address(
                     [b"bonding-curve", bytes(mint)],
                     PumpFunAddresses.PROGRAM
                 )
             elif target_platform == Platform.LETS_BONK:
                 from platforms.letsbonk.address_provider import LetsBonkAddresses
-                bonding_curve, _ = Pubkey.find_program_address(
+                bonding_curve, _ = find_program_address(
                     [b"bonding-curve", bytes(mint)],
                     LetsBonkAddresses.PROGRAM
                 )
             elif target_platform == Platform.BAGS:
                 from platforms.bags.address_provider import BagsAddresses
-                bonding_curve, _ = Pubkey.find_program_address(
+                bonding_curve, _ = find_program_address(
                     [b"pool", bytes(mint)],
                     BagsAddresses.DBC_PROGRAM
                 )
@@ -2930,14 +2939,14 @@ class UniversalTrader:
                 from platforms.bags.address_provider import BagsAddresses
                 program_address = BagsAddresses.DBC_PROGRAM
 
-            associated_bonding_curve, _ = Pubkey.find_program_address(
+            associated_bonding_curve, _ = find_program_address(
                 [bytes(bonding_curve), bytes(token_program_id), bytes(mint)],
                 SystemAddresses.ASSOCIATED_TOKEN_PROGRAM
             )
 
             creator_vault = None
             if creator and program_address:
-                creator_vault, _ = Pubkey.find_program_address(
+                creator_vault, _ = find_program_address(
                     [b"creator-vault", bytes(creator)],
                     program_address
                 )
@@ -3042,6 +3051,14 @@ class UniversalTrader:
         except Exception as e:
             logger.warning(f"RPC warm-up failed: {e!s}")
 
+        # Pre-open keep-alive connections to every send endpoint (S44 fan-out),
+        # including our primary RPC (our sends always include it, see send(primary_url=))
+        try:
+            from core.send_fabric import get_send_fabric
+            await get_send_fabric(self.rpc_endpoint).start()
+        except Exception as e:
+            logger.warning(f"[FABRIC] Send endpoint warm-up failed: {e!s}")
+
         try:
             # Start whale tracker BEFORE choosing operating mode
             # Whale tracker should run in ALL modes if enabled
@@ -3154,6 +3171,8 @@ class UniversalTrader:
                 logger.warning(f"[MOONBAG-GRPC] Init failed (non-critical): {_mge}")
                 self._moonbag_monitor = None
 
+            self._wire_price_push()
+
             # Choose operating mode based on yolo_mode
             if not self.yolo_mode:
                 # Single token mode: process one token and exit
@@ -3339,7 +3358,7 @@ class UniversalTrader:
         for key in old_keys:
             self.token_timestamps.pop(key, None)
 
-        await self.solana_client.close()
+        await release_solana_client(self.solana_client)
 
     async def _queue_token(self, token_info: TokenInfo) -> None:
         """Queue a token for processing if not already processed.
@@ -4121,7 +4140,23 @@ class UniversalTrader:
 
         If price cannot be fetched (e.g., token migrated), will attempt
         fallback sell via PumpSwap/Jupiter after MAX_PRICE_ERRORS consecutive failures.
+
+        EVENT-DRIVEN: the position is registered with PositionMonitorEngine,
+        so the loop wakes when a pushed price (gRPC curve/vault, moonbag gRPC,
+        batch) changes instead of sleeping price_check_interval every tick.
         """
+        mint_str = str(token_info.mint)
+        tick_version = self._position_monitor.register(position)
+        try:
+            await self._monitor_position_loop(token_info, position, tick_version)
+        finally:
+            self._position_monitor.unregister(mint_str, position)
+            _monitor_log.forget(mint_str)
+
+    async def _monitor_position_loop(
+        self, token_info: TokenInfo, position: Position, tick_version: int
+    ) -> None:
+        """Body of _monitor_position_until_exit: evaluate on each price tick."""
         logger.warning(
             f"[MONITOR] Starting position monitoring for {token_info.symbol} on {self.platform.value}"
         )
@@ -4147,7 +4182,7 @@ class UniversalTrader:
         _batch_anomaly_count = 0  # Session 4: separate counter for BATCH PRICE GUARD
         _entry_corrected = False  # Session 3: one-time entry price correction flag
         _entry_fix_ts = 0  # FIX 7-3: timestamp of ENTRY FIX REACTIVE registration
-        _stale_count = 0  # PATCH 9A: consecutive ticks with same price
+        _price_changed_ts = monotonic()  # PATCH 9A: when the price last moved
         _prev_price = 0.0
         check_count = 0
 
@@ -4159,26 +4194,29 @@ class UniversalTrader:
         # Счётчик неудачных попыток продажи для агрессивного retry
         sell_retry_count = 0
 
-        # CRITICAL: Track total monitor iterations to detect stuck loops
-        max_iterations = 36000  # Max 24 hours of 1-second checks
-        total_iterations = 0
+        # CRITICAL: Wall-clock cap to detect stuck monitors. Passes are event-driven
+        # (price push or heartbeat), so counting them no longer measures time
+        MAX_MONITOR_SECONDS = 24 * 3600
+        FAST_RETRY_WINDOW = 10.0  # PATCH 13B: first seconds of monitoring
+        STALE_PRICE_SECONDS = 5.0  # PATCH 9A: unchanged price this long -> Jupiter refresh
+        _monitor_started = monotonic()
         MAX_SELL_RETRIES = 2
         pending_stop_loss = False  # Флаг что нужно продать по SL
+        _sold_check_ts = monotonic()  # sold_mints Redis check, every 10s
 
         while position.is_active:
-            total_iterations += 1
             check_count += 1
 
             # FIX S12-2: Zombie monitor detection — stop if position removed or in sold_mints
             mint_str_check = str(token_info.mint)
-            _still_active = any(str(p.mint) == mint_str_check for p in self.active_positions)
-            if not _still_active:
+            if not self.has_active_position(mint_str_check):
                 logger.warning(f"[ZOMBIE KILL] {token_info.symbol}: not in active_positions — stopping monitor")
                 position.is_active = False
                 unregister_monitor(mint_str_check)
                 break
-            # Async sold_mints check (every 10 ticks to avoid Redis spam)
-            if check_count % 10 == 0:
+            # Async sold_mints check (every 10s to avoid Redis spam; ticks are event-driven now)
+            if monotonic() - _sold_check_ts >= 10:
+                _sold_check_ts = monotonic()
                 try:
                     from trading.redis_state import is_sold_mint
                     if await is_sold_mint(mint_str_check):
@@ -4187,10 +4225,8 @@ class UniversalTrader:
                         if _is_mb:
                             logger.warning(f"[ZOMBIE SKIP] {token_info.symbol}: in sold_mints but is MOONBAG — removing from sold_mints, keeping alive")
                             try:
-                                import redis as _redis_sync
-                                _r = _redis_sync.Redis()
-                                _r.zrem("sold_mints", mint_str_check)
-                                _r.close()
+                                from trading.redis_state import remove_sold_mint
+                                await remove_sold_mint(mint_str_check)
                             except Exception:
                                 pass
                         else:
@@ -4199,10 +4235,8 @@ class UniversalTrader:
                             if _pos_age < 120:
                                 logger.warning(f"[ZOMBIE SKIP] {token_info.symbol}: in sold_mints but age={_pos_age:.0f}s < 120s — removing stale sold_mint, keeping alive")
                                 try:
-                                    import redis as _redis_sync
-                                    _r = _redis_sync.Redis()
-                                    _r.zrem("sold_mints", mint_str_check)
-                                    _r.close()
+                                    from trading.redis_state import remove_sold_mint
+                                    await remove_sold_mint(mint_str_check)
                                 except Exception:
                                     pass
                             else:
@@ -4215,13 +4249,13 @@ class UniversalTrader:
 
             # Safety check: prevent infinite loops
             # PATCH 13: removed redundant 0.1s sleep (main sleep is at end of loop)
-            if total_iterations > max_iterations:
+            if monotonic() - _monitor_started > MAX_MONITOR_SECONDS:
                 skip_sl_iter = str(token_info.mint) in NO_SL_MINTS
                 if skip_sl_iter:
-                    logger.warning(f"[NO_SL] {token_info.symbol}: max iterations but NO_SL - NOT selling!")
+                    logger.warning(f"[NO_SL] {token_info.symbol}: max monitor time but NO_SL - NOT selling!")
                     break
                 logger.error(
-                    f"[CRITICAL] Monitor exceeded {max_iterations} iterations for {token_info.symbol}! "
+                    f"[CRITICAL] Monitor exceeded {MAX_MONITOR_SECONDS // 3600}h for {token_info.symbol}! "
                     f"Forcing emergency sell..."
                 )
                 await self._emergency_fallback_sell(token_info, position, last_known_price)
@@ -4250,7 +4284,7 @@ class UniversalTrader:
                     current_price = get_cached_price(mint_str)
 
                 # === PATCH 13B: Fast gRPC retry for first ticks (avoid 3s Jupiter timeout) ===
-                if (not current_price or current_price <= 0) and check_count <= 10:
+                if (not current_price or current_price <= 0) and monotonic() - _monitor_started <= FAST_RETRY_WINDOW:
                     # gRPC may not have delivered first update yet — wait briefly and retry
                     for _grpc_retry in range(3):
                         await asyncio.sleep(0.2)
@@ -4354,10 +4388,9 @@ class UniversalTrader:
                 last_known_price = current_price
 
                 # === PATCH 9A: STALE PRICE DETECTION ===
-                # If price unchanged for 5+ ticks, force Jupiter refresh
+                # If price unchanged for STALE_PRICE_SECONDS, force Jupiter refresh
                 if current_price == _prev_price and current_price > 0:
-                    _stale_count += 1
-                    if _stale_count >= 5:
+                    if monotonic() - _price_changed_ts >= STALE_PRICE_SECONDS:
                         try:
                             from utils.jupiter_price import get_token_price
                             fresh_price, _ = await asyncio.wait_for(
@@ -4391,11 +4424,11 @@ class UniversalTrader:
                                 else:
                                     # <5% deviation — cache is fine, just stale RPC
                                     pass
-                            _stale_count = 0
+                            _price_changed_ts = monotonic()
                         except Exception as e:
                             logger.debug(f"[STALE] Jupiter refresh failed: {e}")
                 else:
-                    _stale_count = 0
+                    _price_changed_ts = monotonic()
                 _prev_price = current_price
                 # === END PATCH 9A ===
 
@@ -4411,7 +4444,11 @@ class UniversalTrader:
                                 f"[PRICE GUARD] {token_info.symbol}: batch price {current_price:.10f} "
                                 f"looks anomalous ({_batch_pnl*100:+.1f}% vs entry), skipping tick #{_batch_anomaly_count}/2"
                             )
-                            await asyncio.sleep(self.price_check_interval)
+                            _tick = await self._position_monitor.wait_for_price(
+                                mint_str, tick_version, self.price_check_interval
+                            )
+                            if _tick:
+                                tick_version = _tick.version
                             continue
                         elif _batch_anomaly_count == 3:
                             logger.warning(
@@ -4563,7 +4600,7 @@ class UniversalTrader:
                                 if self.take_profit_percentage is not None:
                                     position.take_profit_price = _corrected * (1 + self.take_profit_percentage)
                                 position.high_water_mark = _corrected
-                                save_positions(self.active_positions)
+                                save_positions(self.active_positions, scope=())
                         position.dca_pending = False
                         position.dca_bought = True
                         continue
@@ -4684,12 +4721,12 @@ class UniversalTrader:
                                     pnl_pct = ((current_price - position.entry_price) / position.entry_price) * 100
                                     logger.warning(f"[DCA] New PnL: {pnl_pct:+.1f}%")
 
-                                    save_positions(self.active_positions)
+                                    save_positions(self.active_positions, scope=())
                                 else:
                                     logger.error(f"[DCA] \u274c TX NOT CONFIRMED for {token_info.symbol} \u2014 quantity UNCHANGED at {position.quantity:.2f}")
                                     position.dca_bought = True
                                     position.dca_pending = False
-                                    save_positions(self.active_positions)
+                                    save_positions(self.active_positions, scope=())
                             else:
                                 logger.error(f"[DCA] \u274c FAILED to buy more {token_info.symbol}")
                         except Exception as e:
@@ -4708,7 +4745,7 @@ class UniversalTrader:
                 # UPDATE: Call update_price() for TSL (Trailing Stop-Loss) support
                 if position.update_price(current_price):
                     # HWM changed - save to file (every update to prevent loss on restart)
-                    save_positions(self.active_positions)
+                    save_positions(self.active_positions, scope=())
                 should_exit, exit_reason = position.should_exit(current_price)
                 # ============================================
                 # NO_SL MASTER BLOCK - BLOCKS ALL SELL PATHS
@@ -4717,15 +4754,10 @@ class UniversalTrader:
                 mint_str_nosl = str(token_info.mint)
                 if mint_str_nosl in NO_SL_MINTS:
                     if should_exit:
-                        import time as _time
-                        _nosl_key = f"nosl_warn_{mint_str_nosl}"
-                        _nosl_now = _time.monotonic()
-                        _nosl_last = getattr(self, '_nosl_warn_times', {}).get(_nosl_key, 0)
-                        if _nosl_now - _nosl_last >= 60:
-                            if not hasattr(self, '_nosl_warn_times'):
-                                self._nosl_warn_times = {}
-                            self._nosl_warn_times[_nosl_key] = _nosl_now
-                            logger.warning(f"[NO_SL] {token_info.symbol}: EXIT BLOCKED (reason: {exit_reason}, pnl: {pnl_pct:+.1f}%)")
+                        _nosl_log.warning(
+                            mint_str_nosl, "[NO_SL] %s: EXIT BLOCKED (reason: %s, pnl: %+.1f%%)",
+                            token_info.symbol, exit_reason, pnl_pct,
+                        )
                         should_exit = False
                         exit_reason = None
                         # Reset TSL flags to prevent spam loop
@@ -4742,15 +4774,11 @@ class UniversalTrader:
                 # CRITICAL: Log when approaching SL threshold
                 # ============================================
                 if position.stop_loss_price and current_price <= position.stop_loss_price * 1.1:
-                    # Throttle: log SL warning max once per 30s, skip NO_SL tokens
-                    _sl_warn_key = f"sl_warn_{token_info.symbol}"
-                    _sl_warn_last = getattr(position, "_sl_warn_ts", 0)
-                    import time as _time_mod
-                    if _time_mod.monotonic() - _sl_warn_last >= 10 and str(token_info.mint) not in NO_SL_MINTS:
-                        position._sl_warn_ts = _time_mod.monotonic()
-                        logger.warning(
-                            f"[SL WARNING] {token_info.symbol}: Price {current_price:.10f} approaching "
-                            f"SL {position.stop_loss_price:.10f} (PnL: {pnl_pct:+.2f}%)"
+                    # Throttle: log SL warning max once per 10s per mint, skip NO_SL tokens
+                    if mint_str_nosl not in NO_SL_MINTS:
+                        _monitor_log.warning(
+                            mint_str_nosl, "[SL WARNING] %s: Price %.10f approaching SL %.10f (PnL: %+.2f%%)",
+                            token_info.symbol, current_price, position.stop_loss_price, pnl_pct,
                         )
 
                 # Check NO_SL list BEFORE any SL logic
@@ -4839,15 +4867,13 @@ class UniversalTrader:
                             should_exit = True
                             exit_reason = ExitReason.STOP_LOSS
                             pending_stop_loss = True
-                # Log ALL positions as WARNING every check
-                if check_count % 10 == 0:  # Log every ~10s
-                    _tp_str = f"{position.take_profit_price:.10f}" if position.take_profit_price else "OFF"
-                    logger.warning(
-                        f"[MONITOR] {token_info.symbol}: {current_price:.10f} SOL "
-                        f"({pnl_pct:+.2f}%) | TP: {_tp_str} | "
-                        f"SL: {(position.stop_loss_price or 0):.10f} | "
-                        f"HARD_SL: -{HARD_STOP_LOSS_PCT:.0f}%"
-                    )
+                # Log ALL positions as WARNING every ~10s
+                _monitor_log.warning(
+                    mint_str_nosl, "[MONITOR] %s: %.10f SOL (%+.2f%%) | TP: %s | SL: %.10f | HARD_SL: -%.0f%%",
+                    token_info.symbol, current_price, pnl_pct,
+                    "%.10f" % position.take_profit_price if position.take_profit_price else "OFF",
+                    position.stop_loss_price or 0, HARD_STOP_LOSS_PCT,
+                )
 
                 # FIX 7-3: Block TP for 1.5s after ENTRY FIX REACTIVE registration
                 if should_exit and exit_reason == ExitReason.TAKE_PROFIT and _entry_fix_ts > 0:
@@ -4860,9 +4886,9 @@ class UniversalTrader:
 
                 # FIX S15-2: Moonbag CANNOT exit via TP — safety net in monitor loop
                 if should_exit and exit_reason == ExitReason.TAKE_PROFIT and (position.is_moonbag or getattr(position, 'tp_partial_done', False)):
-                    logger.warning(
-                        f"[TP BLOCKED] {token_info.symbol}: moonbag={position.is_moonbag} tp_partial={position.tp_partial_done} "
-                        f"— TP exit BLOCKED, forcing TP=None (FIX S15-2)"
+                    _monitor_log.warning(
+                        mint_str_nosl, "[TP BLOCKED] %s: moonbag=%s tp_partial=%s — TP exit BLOCKED, forcing TP=None (FIX S15-2)",
+                        token_info.symbol, position.is_moonbag, position.tp_partial_done,
                     )
                     position.take_profit_price = None
                     should_exit = False
@@ -4873,9 +4899,9 @@ class UniversalTrader:
                 # Monitor loop must NOT launch a second sell — it causes double-sell
                 # and _remove_position with skip_cleanup=False killing the moonbag
                 if should_exit and exit_reason and getattr(position, 'is_selling', False):
-                    logger.warning(
-                        f"[SELL SKIP] {token_info.symbol}: is_selling=True — "
-                        f"REACTIVE path already selling, monitor skip (FIX S17-3)"
+                    _monitor_log.warning(
+                        mint_str_nosl, "[SELL SKIP] %s: is_selling=True — REACTIVE path already selling, monitor skip (FIX S17-3)",
+                        token_info.symbol,
                     )
                     should_exit = False
                     exit_reason = None
@@ -5238,8 +5264,12 @@ class UniversalTrader:
                         await asyncio.sleep(backoff)
                         continue
 
-                # Wait before next price check
-                await asyncio.sleep(1)  # 1s price check, logs throttled
+                # Wait for next price change (pushed), heartbeat for time-based checks.
+                # Pull-only sources (Jupiter/curve/last_known) still poll every interval.
+                _wait = HEARTBEAT_INTERVAL if price_source in PUSH_SOURCES else self.price_check_interval
+                _tick = await self._position_monitor.wait_for_price(mint_str, tick_version, _wait)
+                if _tick:
+                    tick_version = _tick.version
 
             except Exception as e:
                 consecutive_price_errors += 1
@@ -5265,7 +5295,7 @@ class UniversalTrader:
                             # Calculate PnL and check SL/TP
                             pnl_pct = ((current_price - position.entry_price) / position.entry_price) * 100
                             if position.update_price(current_price):
-                                save_positions(self.active_positions)
+                                save_positions(self.active_positions, scope=())
                             should_exit, exit_reason = position.should_exit(current_price)
                             
                             logger.info(
@@ -5596,7 +5626,7 @@ class UniversalTrader:
                         position.tokens_arrived = True
                         position.buy_confirmed = True
                         position.entry_price_provisional = False
-                        save_positions(self.active_positions)
+                        save_positions(self.active_positions, scope=())
                     else:
                         logger.warning(f"[FAST SELL] HARD BLOCK: {token_info.symbol} tokens_arrived=False, age={_pos_age_fix:.0f}s, no on-chain balance — cannot sell")
                         return False
@@ -5868,6 +5898,60 @@ class UniversalTrader:
         except OSError:
             logger.exception("Failed to log trade information")
 
+    @property
+    def active_positions(self) -> list[Position]:
+        return self._active_positions
+
+    @active_positions.setter
+    def active_positions(self, positions: list[Position]) -> None:
+        self._active_positions = positions
+        self._active_mints = None
+        self._claim_positions()
+
+    def invalidate_active_positions(self) -> None:
+        """Call after changing active_positions in place (append, clear, item assignment)."""
+        self._active_mints = None
+        self._claim_positions()
+
+    def _claim_positions(self) -> None:
+        """Tag positions with this bot's wallet so per-wallet syncs only touch their own."""
+        wallet = getattr(self, "wallet", None)
+        if wallet is None:
+            return
+        owner = str(wallet.pubkey)
+        for p in self._active_positions:
+            if isinstance(p, Position) and p.wallet is None:
+                p.wallet = owner
+
+    def has_active_position(self, mint: str) -> bool:
+        """O(1) check that mint is still in active_positions.
+
+        The mint set is rebuilt lazily after the list is replaced (setter) or
+        changed in place (invalidate_active_positions).
+        """
+        if self._active_mints is None:
+            self._active_mints = {str(p.mint) for p in self._active_positions}
+        return mint in self._active_mints
+
+    def _wire_price_push(self) -> None:
+        """Connect every push price source to the position monitor engine."""
+        publish = self._position_monitor.publish
+        _sources = []
+        for _src in (self.whale_tracker, self.whale_tracker_secondary, self._moonbag_monitor):
+            if _src is not None and hasattr(_src, 'add_price_listener'):
+                _src.add_price_listener(publish)
+                _sources.append(type(_src).__name__)
+        try:
+            get_batch_price_service().add_price_listener(publish)
+            _sources.append("BatchPriceService")
+        except Exception as e:
+            logger.warning(f"[MONITOR] Batch price push not wired: {e}")
+        logger.warning(f"[MONITOR] Event-driven price push: {', '.join(_sources) or 'none'}")
+        self._position_monitor.set_no_sl_mints(NO_SL_MINTS)
+        if self._position_monitor.start_sweeper():
+            logger.warning("[MONITOR] Vectorized exit sweeper started (PositionBook)")
+        get_async_redis().start_stats_logger()
+
     def _save_position(self, position: Position) -> None:
         """Save position to active positions list and persist to file."""
         # FIX S12-7: Don't append if already in list or if position is inactive
@@ -5883,7 +5967,8 @@ class UniversalTrader:
                 break
         if not found:
             self.active_positions.append(position)
-        save_positions(self.active_positions)
+        self.invalidate_active_positions()
+        save_position(position)
         # Add to batch price monitoring
         watch_token(str(position.mint))
         # Phase 4b/4c: Subscribe to price tracking via whale_geyser (shared gRPC stream)
@@ -6111,10 +6196,8 @@ class UniversalTrader:
     async def _remove_from_sold_mints(self, mint_str: str, symbol: str):
         """Helper to remove mint from sold_mints Redis set."""
         try:
-            import redis.asyncio as redis
-            r = redis.Redis(host='localhost', port=6379, db=0)
-            removed = await r.zrem("sold_mints", mint_str)
-            await r.aclose()
+            from trading.redis_state import remove_sold_mint
+            removed = await remove_sold_mint(mint_str)
             if removed:
                 logger.info(f"[VERIFY] {symbol}: Removed from sold_mints")
         except Exception as e:
@@ -6133,7 +6216,8 @@ class UniversalTrader:
             for p in self.active_positions if str(p.mint) == mint
         )
         self.active_positions = [p for p in self.active_positions if str(p.mint) != mint]
-        save_positions(self.active_positions)
+        # Scoped: other in-process bots share the positions file, drop only this mint
+        save_positions(self.active_positions, scope=[mint])
         if not _is_moonbag_rm:
             unwatch_token(mint)
         else:
@@ -6181,6 +6265,7 @@ class UniversalTrader:
         logger.info("[RESTORE] Checking for saved positions to restore...")
         # FIX S28-2: Clear positions loaded by __init__ to prevent duplicates
         self.active_positions.clear()
+        self.invalidate_active_positions()
         positions = await load_positions_async()
 
         if not positions:
@@ -6212,10 +6297,8 @@ class UniversalTrader:
                 if position.is_active:
                     # Position is in Redis AND active — sold_mints is STALE, remove it
                     try:
-                        import redis.asyncio as _r114
-                        _rc = _r114.Redis(host='localhost', port=6379, db=0)
-                        await _rc.zrem("sold_mints", mint_str)
-                        await _rc.aclose()
+                        from trading.redis_state import remove_sold_mint
+                        await remove_sold_mint(mint_str)
                         logger.warning(f"[RESTORE] {position.symbol}: ACTIVE in Redis but in sold_mints — REMOVED from sold_mints (FIX 11-4)")
                     except Exception as _e114:
                         logger.warning(f"[RESTORE] {position.symbol}: Failed to remove from sold_mints: {_e114}")
@@ -6537,6 +6620,7 @@ class UniversalTrader:
             # === END FIX S15-1 ===
 
             self.active_positions.append(position)
+            self.invalidate_active_positions()
 
             # Get creator from bonding curve state for proper sell instruction
             creator = None
@@ -6650,7 +6734,7 @@ class UniversalTrader:
                         position.pool_base_vault = vault_result[0]
                         position.pool_quote_vault = vault_result[1]
                         position.pool_address = vault_result[2]
-                        save_positions(self.active_positions)
+                        save_positions(self.active_positions, scope=())
                         logger.warning(
                             f"[RESTORE] ✅ VAULTS RESOLVED for {position.symbol}: "
                             f"base={vault_result[0][:12]}..., quote={vault_result[1][:12]}..."
@@ -4,7 +4,10 @@ Vault resolver — finds PumpSwap pool vault addresses for a token mint.
 Used after Jupiter buy to resolve pool_base_vault / pool_quote_vault
 for gRPC price stream subscription (Phase 4).
 
-Logic reused from buy.py: get_program_accounts + DexScreener fallback.
+Lookup order: pool index (local) -> canonical pool PDA (one getAccountInfo)
+-> get_program_accounts -> DexScreener. Every hit is written back to the
+pool index, so getProgramAccounts only runs for mints never seen before
+that are not in a canonical pool.
 """
 
 import asyncio
@@ -19,6 +22,9 @@ from solana.rpc.async_api import AsyncClient
 from solana.rpc.types import MemcmpOpts
 from solders.pubkey import Pubkey
 
+from core.pubkeys import TOKEN_DECIMALS
+from trading.pool_index import DEX_PUMPSWAP, derive_pumpswap_pool, get_pool_index
+
 logger = logging.getLogger(__name__)
 
 # PumpSwap constants
@@ -52,6 +58,37 @@ def _parse_pool_data(data: bytes) -> dict:
     return parsed
 
 
+async def _resolve_via_pda(
+    mint_str: str, rpc_url: str, pool_hint: Optional[str] = None
+) -> Optional[Tuple[str, str, str]]:
+    """Read the canonical PumpSwap pool (or an indexed pool) with one getAccountInfo.
+
+    Returns (pool_base_vault, pool_quote_vault, pool_address) or None.
+    """
+    try:
+        pool_pubkey = Pubkey.from_string(pool_hint) if pool_hint else derive_pumpswap_pool(mint_str)
+        async with AsyncClient(rpc_url, timeout=15) as client:
+            response = await client.get_account_info(pool_pubkey, encoding="base64")
+        account = response.value
+        if not account or not account.data or account.owner != PUMP_AMM_PROGRAM_ID:
+            return None
+
+        parsed = _parse_pool_data(bytes(account.data))
+        if parsed.get("base_mint") != mint_str:
+            return None
+        base_vault = parsed.get("pool_base_token_account")
+        quote_vault = parsed.get("pool_quote_token_account")
+        if base_vault and quote_vault:
+            logger.info(
+                f"[VAULT_RESOLVER] PDA resolved PumpSwap pool for {mint_str[:12]}...: "
+                f"pool={pool_pubkey}, base={base_vault[:12]}..., quote={quote_vault[:12]}..."
+            )
+            return base_vault, quote_vault, str(pool_pubkey)
+    except Exception as e:
+        logger.warning(f"[VAULT_RESOLVER] PDA resolve failed for {mint_str[:12]}...: {e}")
+    return None
+
+
 async def _resolve_via_rpc(mint_str: str, rpc_url: str) -> Optional[Tuple[str, str, str]]:
     """Find PumpSwap pool via get_program_accounts.
     
@@ -160,11 +197,18 @@ async def resolve_vaults(mint_str: str) -> Optional[Tuple[str, str, str]]:
     """Resolve pool vault addresses for a token.
     
     Tries:
-    1. RPC get_program_accounts (PumpSwap)
-    2. DexScreener + RPC fallback
+    1. Pool index (local, no RPC)
+    2. Canonical pool PDA / indexed pool + one getAccountInfo
+    3. RPC get_program_accounts (PumpSwap)
+    4. DexScreener + RPC fallback
     
     Returns (pool_base_vault, pool_quote_vault, pool_address) or None.
     """
+    index = get_pool_index()
+    entry = index.get(mint_str)
+    if entry and entry.dex == DEX_PUMPSWAP and entry.has_vaults:
+        return entry.base_vault, entry.quote_vault, entry.pool
+
     # Pick best RPC (avoid Helius to save credits)
     rpc_url = (
         os.getenv("DRPC_RPC_ENDPOINT")
@@ -174,16 +218,36 @@ async def resolve_vaults(mint_str: str) -> Optional[Tuple[str, str, str]]:
         or "https://api.mainnet-beta.solana.com"
     )
     
-    # Method 1: Direct RPC lookup
+    # Method 1: Canonical pool PDA (or pool indexed without vaults, e.g. from Geyser migration)
+    pool_hint = entry.pool if entry and entry.dex == DEX_PUMPSWAP else None
+    result = await _resolve_via_pda(mint_str, rpc_url, pool_hint)
+    if result:
+        # Canonical pools only exist for migrated pump.fun tokens (6 decimals)
+        _remember(mint_str, result, "pda", TOKEN_DECIMALS)
+        return result
+
+    # Method 2: Direct RPC lookup
     result = await _resolve_via_rpc(mint_str, rpc_url)
     if result:
+        _remember(mint_str, result, "gpa")
         return result
     
-    # Method 2: DexScreener fallback
+    # Method 3: DexScreener fallback
     logger.info(f"[VAULT_RESOLVER] RPC found nothing, trying DexScreener for {mint_str[:12]}...")
     result = await _resolve_via_dexscreener(mint_str, rpc_url)
     if result:
+        _remember(mint_str, result, "dexscreener")
         return result
     
     logger.warning(f"[VAULT_RESOLVER] Could not resolve vaults for {mint_str[:12]}...")
     return None
+
+
+def _remember(
+    mint_str: str, result: Tuple[str, str, str], source: str, decimals: Optional[int] = None
+) -> None:
+    base_vault, quote_vault, pool = result
+    get_pool_index().put(
+        mint_str, pool, DEX_PUMPSWAP,
+        base_vault=base_vault, quote_vault=quote_vault, decimals=decimals, source=source,
+    )
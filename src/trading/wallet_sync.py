@@ -18,6 +18,9 @@ from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 import base58
 
+from trading.position_journal import get_journal
+from trading.trader_registry import positions_for_wallet
+
 POSITIONS_FILE = Path("positions.json")
 
 # Import real entry price finder
@@ -51,41 +54,25 @@ _STRAT = _load_strategy_config()
 
 # DexScreener для получения цен и символов
 async def get_token_info_dexscreener(mint: str, max_retries: int = 3) -> dict | None:
-    """Получить информацию о токене с DexScreener с retry."""
-    url = f"https://api.dexscreener.com/latest/dex/tokens/{mint}"
-    
+    """Получить информацию о токене с DexScreener с retry (общий батч-клиент)."""
+    from utils.market_data import get_market_data_client
+
     for attempt in range(max_retries):
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=15) as resp:
-                    if resp.status == 429:
-                        wait = 2 ** attempt
-                        print(f"[DEXSCREENER] Rate limited, waiting {wait}s...")
-                        await asyncio.sleep(wait)
-                        continue
-                    if resp.status != 200:
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(1)
-                            continue
-                        return None
-                    data = await resp.json()
-                    pairs = data.get("pairs", [])
-                    if not pairs:
-                        return await _get_token_info_birdeye(mint)
-                    pair = pairs[0]
-                    return {
-                        "symbol": pair.get("baseToken", {}).get("symbol", "UNKNOWN"),
-                        "name": pair.get("baseToken", {}).get("name", "Unknown"),
-                        "price_sol": float(pair.get("priceNative", 0) or 0),
-                        "dex": pair.get("dexId", "unknown"),
-                    }
-        except asyncio.TimeoutError:
-            print(f"[DEXSCREENER] Timeout, retry {attempt+1}")
-            await asyncio.sleep(1)
-        except Exception as e:
-            print(f"[DEXSCREENER] Error: {e}")
+        pairs = await get_market_data_client().dexscreener_pairs(mint)
+        if pairs is None:
+            # Request failed (rate limit is handled by the client's token bucket)
             if attempt < max_retries - 1:
-                await asyncio.sleep(1)
+                await asyncio.sleep(2 ** attempt)
+            continue
+        if not pairs:
+            return await _get_token_info_birdeye(mint)
+        pair = pairs[0]
+        return {
+            "symbol": pair.get("baseToken", {}).get("symbol", "UNKNOWN"),
+            "name": pair.get("baseToken", {}).get("name", "Unknown"),
+            "price_sol": float(pair.get("priceNative", 0) or 0),
+            "dex": pair.get("dexId", "unknown"),
+        }
     return None
 
 
@@ -166,38 +153,44 @@ async def get_wallet_tokens(rpc: str, wallet: str) -> list[dict]:
 
 
 def load_positions() -> list[dict]:
-    """Загрузить текущие позиции."""
-    if not POSITIONS_FILE.exists():
-        return []
+    """Загрузить текущие позиции (snapshot + journal)."""
     try:
-        with open(POSITIONS_FILE) as f:
-            return json.load(f)
-    except:
+        return get_journal(POSITIONS_FILE).load()
+    except Exception:
         return []
 
 
-def save_positions(positions: list[dict]):
-    """Сохранить позиции."""
-    with open(POSITIONS_FILE, "w") as f:
-        json.dump(positions, f, indent=2)
+def save_positions(positions: list[dict], scope: set[str] | None = None):
+    """Сохранить позиции через journal.
+
+    Удаляются только mint из scope, которых нет в positions
+    (scope=None - positions это весь портфель).
+    """
+    get_journal(POSITIONS_FILE).sync(
+        {p["mint"]: p for p in positions if p.get("mint")}, scope=scope
+    )
+
 
+async def sync_wallet(wallet: str | None = None, claim_untagged: bool = True):
+    """Основная функция синхронизации для одного кошелька (pubkey).
 
-async def sync_wallet():
-    """Основная функция синхронизации."""
+    Проверяются и сохраняются только позиции этого кошелька
+    (positions_for_wallet); claim_untagged - старые позиции без тега
+    wallet считаются нашими (в процессе один кошелёк).
+    Без wallet берётся SOLANA_PRIVATE_KEY (запуск как скрипт).
+    """
     print("=" * 60)
     print("[WALLET SYNC] Starting wallet synchronization...")
     print("=" * 60)
     
     # Получаем креды из env
     rpc = os.getenv("ALCHEMY_RPC_ENDPOINT") or os.getenv("SOLANA_NODE_RPC_ENDPOINT")
-    pk = os.getenv("SOLANA_PRIVATE_KEY")
-    
-    if not pk:
-        print("[ERROR] SOLANA_PRIVATE_KEY not set")
-        return
-    
-    kp = Keypair.from_bytes(base58.b58decode(pk))
-    wallet = str(kp.pubkey())
+    if wallet is None:
+        pk = os.getenv("SOLANA_PRIVATE_KEY")
+        if not pk:
+            print("[ERROR] SOLANA_PRIVATE_KEY not set")
+            return
+        wallet = str(Keypair.from_bytes(base58.b58decode(pk)).pubkey())
     
     print(f"[WALLET] {wallet}")
     print(f"[RPC] {rpc.split(chr(47))[2]}...")
@@ -207,9 +200,12 @@ async def sync_wallet():
     wallet_tokens = await get_wallet_tokens(rpc, wallet)
     print(f"[WALLET] Found {len(wallet_tokens)} tokens with balance")
     
-    # Загружаем текущие позиции
-    positions = load_positions()
+    # Загружаем текущие позиции (только этого кошелька)
+    all_positions = load_positions()
+    positions = positions_for_wallet(all_positions, wallet, claim_untagged)
+    other_mints = {p.get("mint") for p in all_positions} - {p.get("mint") for p in positions}
     position_mints = {p.get("mint") for p in positions}
+    loaded_mints = set(position_mints)
     print(f"[POSITIONS] Current: {len(positions)} positions")
 
     # === CLEANUP: Удаляем фантомные позиции (токенов нет на кошельке) ===
@@ -271,7 +267,7 @@ async def sync_wallet():
                 print(f"  [UPDATE] {p.get('symbol', mint[:8]+'...')} qty: {old_qty:.2f} -> {real_qty:.2f}")
     if updated:
         print(f"[UPDATED] {updated} positions with new quantities")
-        save_positions(positions)
+        save_positions(positions, scope=loaded_mints)
 
     if not lost_tokens:
         # Sync Redis even if no new tokens
@@ -369,6 +365,7 @@ async def sync_wallet():
             "platform": platform,
             "bonding_curve": None,  # Will be derived when selling
             "is_moonbag": next((p.get("is_moonbag", False) for p in positions if p.get("mint") == mint), False),
+            "wallet": wallet,
         }
         
         positions.append(new_position)
@@ -391,7 +388,7 @@ async def sync_wallet():
         await asyncio.sleep(0.5)
     
     # Сохраняем
-    save_positions(positions)
+    save_positions(positions, scope=loaded_mints)
     
     print("=" * 60)
     print(f"[DONE] Added {added} positions")
@@ -425,7 +422,7 @@ async def sync_wallet():
     # Remove phantoms from Redis
     redis_keys_raw = subprocess.run(["redis-cli", "HKEYS", "whale:positions"], capture_output=True, text=True)
     redis_mints = set(redis_keys_raw.stdout.strip().split("\n")) if redis_keys_raw.stdout.strip() else set()
-    json_mints = {p.get("mint") for p in positions if p.get("mint")}
+    json_mints = {p.get("mint") for p in positions if p.get("mint")} | other_mints  # other wallets' are not orphans
     for orphan in redis_mints - json_mints:
         if orphan:
             subprocess.run(["redis-cli", "HDEL", "whale:positions", orphan], capture_output=True)
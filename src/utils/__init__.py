@@ -1,7 +1,9 @@
 """Utility modules for the trading bot."""
 
 from .logger import (
+    get_hot_logger,
     get_logger,
+    set_subsystem_levels,
     setup_file_logging,
     setup_console_logging,
     setup_json_logging,
@@ -12,7 +14,9 @@ from .logger import (
 )
 
 __all__ = [
+    "get_hot_logger",
     "get_logger",
+    "set_subsystem_levels",
     "setup_file_logging",
     "setup_console_logging",
     "setup_json_logging",
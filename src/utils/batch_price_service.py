@@ -14,16 +14,16 @@ import os
 import time
 import base58
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Callable, Dict, List, Optional, Set
 from dotenv import load_dotenv
 
 load_dotenv(Path(__file__).parent.parent.parent / ".env")
 
 from utils.logger import get_logger
+from utils.market_data import MarketDataError, get_market_data_client
 
 logger = get_logger(__name__)
 
-JUPITER_PRICE_V3_URL = "https://api.jup.ag/price/v3"
 SOL_MINT = "So11111111111111111111111111111111111111112"
 
 
@@ -42,6 +42,8 @@ class BatchPriceService:
         self._api_key = os.getenv("JUPITER_API_KEY")
         self._consecutive_errors = 0
         self._last_success_time = 0.0
+        # Push listeners (PositionMonitorEngine.publish): fn(mint, price, source)
+        self._listeners: List[Callable[[str, float, str], object]] = []
         
         if self._api_key:
             logger.info(f"[BATCH] API key loaded: {self._api_key[:12]}...")
@@ -72,6 +74,18 @@ class BatchPriceService:
         for mint in mints:
             self.watch(mint)
     
+    def add_price_listener(self, listener: Callable[[str, float, str], object]) -> None:
+        """Push every changed SOL price to listener(mint, price, source)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+    
+    def _emit_price(self, mint: str, sol_price: float) -> None:
+        for listener in self._listeners:
+            try:
+                listener(mint, sol_price, "batch_cache")
+            except Exception as e:
+                logger.error(f"[BATCH] Price listener error: {e}")
+    
     def get_price(self, mint: str) -> Optional[float]:
         """Get cached price in SOL (instant, no API call)."""
         return self._prices.get(mint)
@@ -143,28 +157,19 @@ class BatchPriceService:
         self._stats["requests"] += 1
         
         try:
-            headers = {"Accept": "application/json"}
-            if self._api_key:
-                headers["x-api-key"] = self._api_key
-            
-            url = f"{JUPITER_PRICE_V3_URL}?ids={','.join(mints_to_fetch)}"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status == 429:
-                        logger.warning("[BATCH] Rate limited!")
-                        self._consecutive_errors += 1
-                        self._stats["failures"] += 1
-                        return
-                    
-                    if resp.status != 200:
-                        text = await resp.text()
-                        logger.warning(f"[BATCH] HTTP {resp.status}: {text[:100]}")
-                        self._stats["failures"] += 1
-                        return
-                    
-                    data = await resp.json()
-            
+            # Shared client: same Jupiter rate budget as every other price lookup,
+            # and the response refreshes its cache for single-mint callers
+            try:
+                data = await get_market_data_client().fetch_jupiter_prices(mints_to_fetch)
+            except MarketDataError as e:
+                if e.status == 429:
+                    logger.warning("[BATCH] Rate limited!")
+                    self._consecutive_errors += 1
+                else:
+                    logger.warning(f"[BATCH] {e}")
+                self._stats["failures"] += 1
+                return
+
             now = time.time()
             tokens_updated = 0
             
@@ -183,9 +188,12 @@ class BatchPriceService:
                     
                     if self._sol_price_usd > 0:
                         sol_price = usd_price / self._sol_price_usd
+                        old_price = self._prices.get(mint)
                         self._prices[mint] = sol_price
                         self._last_update[mint] = now
                         tokens_updated += 1
+                        if sol_price != old_price:
+                            self._emit_price(mint, sol_price)
             
             self._stats["successes"] += 1
             self._stats["tokens_fetched"] += tokens_updated
@@ -351,6 +359,7 @@ def update_cached_price(mint: str, sol_price: float) -> None:
     if sol_price and sol_price > 0:
         service._prices[mint] = sol_price
         service._last_update[mint] = time.time()
+        # No push here: S12-5 defers the decision on this price to the NEXT tick
         logger.info(f"[BATCH] Manual price update for {mint[:12]}...: {sol_price:.10f} SOL")
 
 
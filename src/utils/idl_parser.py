@@ -1,6 +1,12 @@
 """
 IDL Parser module for Solana programs.
 Provides functionality to load and parse Anchor IDL files and decode instruction data and events.
+
+Structs and events are compiled once at load time into a flat ``struct.Struct``
+layout (plus a pubkey-slice plan), so decoding a bonding curve account or a
+``Program data:`` log is one ``unpack_from`` per fixed-size run of fields
+instead of a recursive walk of the JSON IDL. Types the compiler does not
+support (data-carrying enums, vec, u128, ...) keep using the interpreter.
 """
 
 import base64
@@ -9,6 +15,7 @@ import struct
 from typing import Any
 
 import base58
+from solders.pubkey import Pubkey
 
 # Constants for Anchor data layout
 DISCRIMINATOR_SIZE = 8
@@ -16,6 +23,78 @@ PUBLIC_KEY_SIZE = 32
 STRING_LENGTH_PREFIX_SIZE = 4
 ENUM_DISCRIMINATOR_SIZE = 1
 
+PROGRAM_DATA_PREFIX = "Program data: "
+# base64 chars fully determined by the 8-byte discriminator (60 of 64 bits)
+_B64_DISCRIMINATOR_CHARS = 10
+_U32 = struct.Struct("<I")
+
+
+def pubkey_str(raw: bytes | str | None) -> str | None:
+    """Base58 of a raw 32-byte pubkey (as returned with raw_pubkeys=True)."""
+    if raw is None or isinstance(raw, str):
+        return raw
+    return str(Pubkey.from_bytes(raw))
+
+
+class _FixedRun:
+    """A run of fixed-size fields decoded by one struct.unpack_from."""
+
+    __slots__ = ("struct", "names", "pubkey_idx", "builders")
+
+    def __init__(self, fmt: str, names: list, pubkey_idx: list, builders: list | None):
+        self.struct = struct.Struct("<" + fmt)
+        self.names = tuple(names)
+        self.pubkey_idx = tuple(pubkey_idx)
+        # None: one value per field. Else per field (name, start, width, build)
+        self.builders = builders
+
+
+class CompiledLayout:
+    """Precompiled decoder for one IDL struct.
+
+    steps is a list of _FixedRun or field names of strings (length-prefixed).
+    """
+
+    __slots__ = ("name", "steps", "size")
+
+    def __init__(self, name: str, steps: list):
+        self.name = name
+        self.steps = steps
+        self.size = sum(st.struct.size if isinstance(st, _FixedRun) else STRING_LENGTH_PREFIX_SIZE for st in steps)
+
+    def decode(self, data: bytes, offset: int = 0, raw_pubkeys: bool = False) -> tuple[dict[str, Any], int]:
+        """Decode at offset. Pubkeys are base58 str, or raw bytes with raw_pubkeys."""
+        out: dict[str, Any] = {}
+        for step in self.steps:
+            if type(step) is str:
+                length = _U32.unpack_from(data, offset)[0]
+                offset += STRING_LENGTH_PREFIX_SIZE
+                if offset + length > len(data):
+                    raise ValueError(f"string field {step} overruns data")
+                out[step] = bytes(data[offset : offset + length]).decode("utf-8")
+                offset += length
+                continue
+            values = step.struct.unpack_from(data, offset)
+            offset += step.struct.size
+            if step.builders is None:
+                out.update(zip(step.names, values))
+                if not raw_pubkeys:
+                    for i in step.pubkey_idx:
+                        out[step.names[i]] = str(Pubkey.from_bytes(values[i]))
+            else:
+                for name, start, width, build in step.builders:
+                    out[name] = build(values[start : start + width], raw_pubkeys)
+        return out, offset
+
+
+def _build_pubkey(values: tuple, raw: bool):
+    return values[0] if raw else str(Pubkey.from_bytes(values[0]))
+
+
+def _build_scalar(values: tuple, raw: bool):
+    return values[0]
+
+
 
 class IDLParser:
     """Parser for automatically decoding instructions and events using IDL definitions."""
@@ -55,10 +134,12 @@ class IDLParser:
         self.events: dict[bytes, dict[str, Any]] = {}
         self.types: dict[str, dict[str, Any]] = {}
         self.instruction_min_sizes: dict[bytes, int] = {}
+        self.compiled_types: dict[str, CompiledLayout] = {}
         self._build_instruction_map()
         self._build_event_map()
         self._build_type_map()
         self._calculate_instruction_sizes()
+        self._compile_types()
 
     # --------------------------------------------------------------------------
     # Public Methods (External API) - Instructions
@@ -157,7 +238,10 @@ class IDLParser:
         return [event["name"] for event in self.events.values()]
 
     def decode_event_data(
-        self, event_data: bytes, event_name: str | None = None
+        self,
+        event_data: bytes,
+        event_name: str | None = None,
+        raw_pubkeys: bool = False,
     ) -> dict[str, Any] | None:
         """
         Decode event data using IDL event definitions.
@@ -165,6 +249,7 @@ class IDLParser:
         Args:
             event_data: Raw event data bytes (typically from base64 decoded log data)
             event_name: Optional event name to decode as. If None, will try to match discriminator.
+            raw_pubkeys: Return pubkey fields as raw 32-byte values (see pubkey_str).
 
         Returns:
             Decoded event data as a dictionary, or None if decoding fails.
@@ -197,6 +282,14 @@ class IDLParser:
                 print(f"Event type {event_name_actual} not found in types section")
             return None
 
+        compiled = self.compiled_types.get(event_name_actual)
+        if compiled is not None:
+            try:
+                fields, _ = compiled.decode(event_data, DISCRIMINATOR_SIZE, raw_pubkeys)
+                return {"event_name": event_name_actual, "fields": fields}
+            except Exception:
+                pass  # Truncated/odd data: the interpreter keeps the fields it can
+
         type_def = self.types[event_name_actual]
         event_type = type_def.get("type", {})
 
@@ -244,6 +337,8 @@ class IDLParser:
                     # Don't return None here, continue with other fields
                     continue
 
+            if raw_pubkeys:
+                self._pubkeys_to_raw(event_fields, fields)
             return {"event_name": event_name_actual, "fields": event_fields}
 
         except Exception as e:
@@ -264,11 +359,20 @@ class IDLParser:
         Returns:
             Decoded event data if found, None otherwise
         """
+        # Skip logs whose base64 discriminator prefix can't be a wanted event
+        # (no base64 decode at all for other programs' events)
+        if target_event_name is None:
+            prefixes = self._event_b64_prefixes
+        else:
+            prefixes = self._event_b64_prefixes_by_name.get(target_event_name, ())
         for log in logs:
-            if "Program data:" in log:
+            start = log.find(PROGRAM_DATA_PREFIX)
+            if start != -1:
                 try:
                     # Extract base64 encoded data
-                    encoded_data = log.split("Program data: ")[1].strip()
+                    encoded_data = log[start + len(PROGRAM_DATA_PREFIX) :].strip()
+                    if encoded_data[:_B64_DISCRIMINATOR_CHARS] not in prefixes:
+                        continue
                     decoded_data = base64.b64decode(encoded_data)
 
                     # Try to decode as event
@@ -292,6 +396,7 @@ class IDLParser:
         account_data: bytes,
         account_type_name: str,
         skip_discriminator: bool = True,
+        raw_pubkeys: bool = False,
     ) -> dict[str, Any] | None:
         """
         Decode account data using a specific account type from the IDL.
@@ -302,6 +407,8 @@ class IDLParser:
             skip_discriminator: Whether to skip the first 8 bytes, which Anchor uses as a
                                 type discriminator for account data. Set to False if your
                                 data does not have this prefix.
+            raw_pubkeys: Return pubkey fields as raw 32-byte values, so callers
+                         base58-encode only the ones they use (see pubkey_str).
 
         Returns:
             Decoded account data as a dictionary, or None if decoding fails.
@@ -312,7 +419,7 @@ class IDLParser:
                     print(f"Account type '{account_type_name}' not found in IDL")
                 return None
 
-            data = account_data
+            offset = 0
             if skip_discriminator:
                 if len(account_data) < DISCRIMINATOR_SIZE:
                     if self.verbose:
@@ -320,9 +427,16 @@ class IDLParser:
                             f"Account data too short to contain a discriminator: {len(account_data)} bytes"
                         )
                     return None
-                data = account_data[DISCRIMINATOR_SIZE:]
+                offset = DISCRIMINATOR_SIZE
 
-            decoded_data, _ = self._decode_defined_type(data, 0, account_type_name)
+            compiled = self.compiled_types.get(account_type_name)
+            if compiled is not None:
+                decoded_data, _ = compiled.decode(account_data, offset, raw_pubkeys)
+                return decoded_data
+
+            decoded_data, _ = self._decode_defined_type(account_data[offset:], 0, account_type_name)
+            if raw_pubkeys:
+                self._pubkeys_to_raw(decoded_data, self.types[account_type_name]["type"].get("fields", []))
             return decoded_data
 
         except Exception as e:
@@ -343,10 +457,13 @@ class IDLParser:
 
     def _build_event_map(self):
         """Build a map of discriminators to event definitions."""
+        self._event_b64_prefixes_by_name: dict[str, frozenset[str]] = {}
         for event in self.idl.get("events", []):
             # The discriminator from the JSON IDL is a list of u8 integers.
             discriminator = bytes(event["discriminator"])
             self.events[discriminator] = event
+            prefix = base64.b64encode(discriminator + b"\0")[:_B64_DISCRIMINATOR_CHARS].decode()
+            self._event_b64_prefixes_by_name[event["name"]] = frozenset((prefix,))
             if self.verbose:
                 print(
                     f"📅 Loaded event: {event['name']} with discriminator {discriminator.hex()}"
@@ -356,6 +473,102 @@ class IDLParser:
         """Build a map of type names to their definitions."""
         for type_def in self.idl.get("types", []):
             self.types[type_def["name"]] = type_def
+        self._event_b64_prefixes = frozenset().union(*self._event_b64_prefixes_by_name.values())
+
+    def _compile_types(self):
+        """Compile every struct type the compiler supports into a CompiledLayout."""
+        for type_name, type_def in self.types.items():
+            if type_def.get("type", {}).get("kind") != "struct":
+                continue
+            try:
+                self.compiled_types[type_name] = self._compile_struct(type_name)
+            except (ValueError, KeyError, TypeError) as e:
+                if self.verbose:
+                    print(f"[COMPILE] {type_name} uses the interpreter: {e}")
+
+    def _compile_struct(self, type_name: str) -> CompiledLayout:
+        steps: list = []
+        fmt, names, pubkey_idx, builders, width = [], [], [], [], 0
+        simple = True
+
+        def flush():
+            nonlocal fmt, names, pubkey_idx, builders, width, simple
+            if names:
+                steps.append(_FixedRun("".join(fmt), names, pubkey_idx, None if simple else builders))
+            fmt, names, pubkey_idx, builders, width, simple = [], [], [], [], 0, True
+
+        for field in self.types[type_name]["type"]["fields"]:
+            if field["type"] == "string":
+                flush()
+                steps.append(field["name"])
+                continue
+            field_fmt, field_width, build, is_pubkey = self._compile_fixed(field["type"])
+            if is_pubkey:
+                pubkey_idx.append(len(names))
+            if build is not _build_scalar and build is not _build_pubkey:
+                simple = False
+            fmt.append(field_fmt)
+            names.append(field["name"])
+            builders.append((field["name"], width, field_width, build))
+            width += field_width
+        flush()
+        return CompiledLayout(type_name, steps)
+
+    def _compile_fixed(self, type_def: str | dict):
+        """Compile a fixed-size type. Returns (fmt, value_count, build(values, raw), is_pubkey)."""
+        if isinstance(type_def, str):
+            if type_def == "pubkey":
+                return "32s", 1, _build_pubkey, True
+            info = self._PRIMITIVE_TYPE_INFO.get(type_def)
+            if info is None or info[0] is None:
+                raise ValueError(f"not a fixed-size primitive: {type_def}")
+            return info[0][1:], 1, _build_scalar, False
+
+        if "array" in type_def:
+            element_type, length = type_def["array"]
+            elem_fmt, elem_width, elem_build, _ = self._compile_fixed(element_type)
+            if elem_build is _build_scalar:
+                return f"{length}{elem_fmt}", length, lambda v, raw: list(v), False
+            return (
+                elem_fmt * length,
+                elem_width * length,
+                lambda v, raw: [elem_build(v[i : i + elem_width], raw) for i in range(0, len(v), elem_width)],
+                False,
+            )
+
+        if "defined" in type_def:
+            name = self._get_defined_type_name(type_def)
+            inner = self.types[name]["type"]
+            if inner["kind"] == "enum":
+                variants = inner["variants"]
+                if any(v.get("fields") for v in variants):
+                    raise ValueError(f"enum {name} carries data")
+                variant_names = [v["name"] for v in variants]
+
+                def build_enum(v, raw):
+                    if v[0] >= len(variant_names):
+                        raise ValueError(f"Invalid enum variant index {v[0]} for type {name}")
+                    return {"variant": variant_names[v[0]]}
+                return "B", 1, build_enum, False
+            if inner["kind"] == "struct":
+                parts = [(f["name"], *self._compile_fixed(f["type"])) for f in inner["fields"]]
+                nested_fmt = "".join(p[1] for p in parts)
+                plan, start = [], 0
+                for fname, _, fwidth, fbuild, _ in parts:
+                    plan.append((fname, start, fwidth, fbuild))
+                    start += fwidth
+
+                def build_struct(v, raw):
+                    return {fname: fbuild(v[s : s + w], raw) for fname, s, w, fbuild in plan}
+                return nested_fmt, start, build_struct, False
+
+        raise ValueError(f"unsupported type: {type_def}")
+
+    def _pubkeys_to_raw(self, decoded: dict[str, Any], fields: list) -> None:
+        """Interpreter results -> raw_pubkeys form for top-level pubkey fields."""
+        for field in fields:
+            if field["type"] == "pubkey" and isinstance(decoded.get(field["name"]), str):
+                decoded[field["name"]] = bytes(Pubkey.from_string(decoded[field["name"]]))
 
     def _calculate_instruction_sizes(self):
         """Calculate minimum data sizes for each instruction."""
@@ -10,6 +10,7 @@ import aiohttp
 import os
 import time
 from utils.logger import get_logger
+from utils.market_data import get_market_data_client
 
 logger = get_logger(__name__)
 
@@ -26,20 +27,12 @@ async def _get_sol_usd(session: aiohttp.ClientSession) -> float | None:
         return _sol_cache["price"]
 
     try:
-        url = f"https://api.jup.ag/price/v3?ids={SOL_MINT}"
-        headers = {"Accept": "application/json"}
-        api_key = os.getenv("JUPITER_API_KEY")
-        if api_key:
-            headers["x-api-key"] = api_key
-
-        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                price = data.get(SOL_MINT, {}).get("usdPrice")
-                if price:
-                    _sol_cache["price"] = float(price)
-                    _sol_cache["ts"] = now
-                    return float(price)
+        entry = await get_market_data_client().jupiter_price(SOL_MINT)
+        price = (entry or {}).get("usdPrice")
+        if price:
+            _sol_cache["price"] = float(price)
+            _sol_cache["ts"] = now
+            return float(price)
     except Exception:
         pass
     return _sol_cache.get("price")
@@ -130,25 +123,16 @@ async def get_price_quote_api(mint: str, session: aiohttp.ClientSession) -> floa
 
 
 async def get_price_jupiter(mint: str, session: aiohttp.ClientSession) -> float | None:
-    """Jupiter Price API V3 - returns price in SOL."""
+    """Jupiter Price API V3 - returns price in SOL (shared batched client)."""
     try:
-        url = f"https://api.jup.ag/price/v3?ids={mint}"
-        headers = {"Accept": "application/json"}
-        api_key = os.getenv("JUPITER_API_KEY")
-        if api_key:
-            headers["x-api-key"] = api_key
-
-        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-            if resp.status != 200:
-                return None
-            data = await resp.json()
-            usd_price = data.get(mint, {}).get("usdPrice")
-            if not usd_price:
-                return None
+        entry = await get_market_data_client().jupiter_price(mint)
+        usd_price = (entry or {}).get("usdPrice")
+        if not usd_price:
+            return None
 
-            sol_usd = await _get_sol_usd(session)
-            if sol_usd and sol_usd > 0:
-                return float(usd_price) / sol_usd
+        sol_usd = await _get_sol_usd(session)
+        if sol_usd and sol_usd > 0:
+            return float(usd_price) / sol_usd
     except Exception as e:
         logger.debug(f"[JUP] {mint[:8]}: {e}")
     return None
@@ -178,18 +162,12 @@ async def get_price_birdeye(mint: str, session: aiohttp.ClientSession) -> float
 
 
 async def get_price_dexscreener(mint: str, session: aiohttp.ClientSession) -> float | None:
-    """DexScreener - returns priceNative (SOL)."""
+    """DexScreener - returns priceNative (SOL) (shared batched client)."""
     try:
-        url = f"https://api.dexscreener.com/latest/dex/tokens/{mint}"
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-            if resp.status != 200:
-                return None
-            data = await resp.json()
-            pairs = data.get("pairs", [])
-            for pair in pairs:
-                price = pair.get("priceNative")
-                if price:
-                    return float(price)
+        for pair in await get_market_data_client().dexscreener_pairs(mint) or []:
+            price = pair.get("priceNative")
+            if price:
+                return float(price)
     except Exception as e:
         logger.debug(f"[DEX] {mint[:8]}: {e}")
     return None
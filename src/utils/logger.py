@@ -1,12 +1,35 @@
 """
 Unified logging system - FIXED duplicate handlers.
+
+Non-blocking pipeline (setup_file_logging, LOG_QUEUE=1 default):
+
+    logger.x(...) -> QueueHandler (caller thread: level check, trace_id, enqueue)
+                  -> QueueListener thread -> format -> stdout -> systemd/journald
+
+The event loop never writes to stdout itself, so a backed-up journald stalls
+the listener thread, not uvloop. When the queue is full (LOG_QUEUE_SIZE)
+records are dropped and counted instead of blocking. %-style args are
+formatted on the listener thread, so hot paths should use
+``logger.info("... %s", value)`` rather than f-strings.
+
+Per-subsystem levels: LOG_LEVELS="monitoring.whale_geyser=WARNING,trading=INFO"
+(set_subsystem_levels). Records below a subsystem's level are rejected by
+``isEnabledFor`` before a LogRecord is even created.
+
+Hot paths that repeat per event (per mint) use get_hot_logger(), which logs a
+message at most once per interval per key and reports how many were
+suppressed.
 """
 
 import logging
 import logging.handlers
+import atexit
 import json
 import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -18,8 +41,12 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 MAX_LOG_SIZE_MB = 10
 BACKUP_COUNT = 5
 
+LOG_QUEUE_SIZE = 100_000
+
 _loggers: Dict[str, logging.Logger] = {}
 _file_handler_added = False
+_listener: Optional[logging.handlers.QueueListener] = None
+_subsystem_levels: Dict[str, int] = {}
 
 
 class TraceIdFilter(logging.Filter):
@@ -55,24 +82,191 @@ class JSONFormatter(logging.Formatter):
 _trace_filter = TraceIdFilter()
 
 
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks the caller and formats lazily.
+
+    The stdlib prepare() renders msg % args on the calling thread; here the
+    record is handed over as is and the listener's formatter does it.
+    Exception text is still rendered up front (the traceback's frames keep
+    changing after the handler returns).
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_exc_formatter = logging.Formatter()
+
+
+def build_queue_handler(
+    handlers: list[logging.Handler], queue_size: int = LOG_QUEUE_SIZE
+) -> tuple[NonBlockingQueueHandler, logging.handlers.QueueListener]:
+    """Queue handler for the caller side plus a started listener writing to handlers."""
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return queue_handler, listener
+
+
+def stop_logging() -> None:
+    """Flush and stop the listener thread (registered atexit by setup_file_logging)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _parse_levels(spec: str) -> Dict[str, int]:
+    levels = {}
+    for item in spec.split(","):
+        name, sep, level = item.partition("=")
+        if not sep:
+            continue
+        value = logging.getLevelName(level.strip().upper())
+        if isinstance(value, int):
+            levels[name.strip()] = value
+    return levels
+
+
+def _level_for(name: str, default: int) -> int:
+    """Most specific LOG_LEVELS entry covering logger name, else default."""
+    best, best_len = default, -1
+    for prefix, level in _subsystem_levels.items():
+        if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > best_len:
+            best, best_len = level, len(prefix)
+    return best
+
+
+def set_subsystem_levels(spec: str | Dict[str, int]) -> None:
+    """Apply per-subsystem levels ("pkg.module=LEVEL,..." or {name: level})."""
+    levels = _parse_levels(spec) if isinstance(spec, str) else dict(spec)
+    _subsystem_levels.update(levels)
+    for prefix, level in levels.items():
+        logging.getLogger(prefix).setLevel(level)
+    # Loggers created with an explicit level (get_logger) do not inherit
+    for name, existing in list(logging.root.manager.loggerDict.items()):
+        if isinstance(existing, logging.Logger) and existing.level != logging.NOTSET:
+            existing.setLevel(_level_for(name, existing.level))
+
+
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """Get or create a logger."""
     global _loggers
     if name in _loggers:
         return _loggers[name]
     logger = logging.getLogger(name)
-    logger.setLevel(level)
+    logger.setLevel(_level_for(name, level))
     _loggers[name] = logger
     return logger
 
 
+class HotPathLogger:
+    """Logs a repeated message at most once per interval per key (e.g. mint).
+
+    Messages are keyed by (key, msg template), so use %-style args:
+    ``hot.warning(mint, "[SL WARNING] %s: price %.10f", symbol, price)``.
+    The first message after a quiet interval carries "(+N suppressed)".
+    """
+
+    def __init__(self, logger: logging.Logger, interval: float = 10.0, max_keys: int = 10_000):
+        self.logger = logger
+        self.interval = interval
+        self.max_keys = max_keys
+        # (key, msg) -> [last emitted monotonic, suppressed since]
+        self._last: Dict[tuple, list] = {}
+        self.suppressed = 0
+
+    def log(self, level: int, key, msg: str, *args, **kwargs) -> bool:
+        """Emit unless (key, msg) was emitted within interval. Returns True if emitted."""
+        if not self.logger.isEnabledFor(level):
+            return False
+        now = time.monotonic()
+        slot = self._last.get((key, msg))
+        if slot is not None:
+            if now - slot[0] < self.interval:
+                slot[1] += 1
+                self.suppressed += 1
+                return False
+            if slot[1]:
+                args = (*args, slot[1])
+                suppressed_msg = msg + " (+%d suppressed)"
+            else:
+                suppressed_msg = msg
+            slot[0], slot[1] = now, 0
+        else:
+            if len(self._last) >= self.max_keys:
+                self._prune(now)
+            self._last[(key, msg)] = [now, 0]
+            suppressed_msg = msg
+        kwargs.setdefault("stacklevel", 3)
+        self.logger.log(level, suppressed_msg, *args, **kwargs)
+        return True
+
+    def _prune(self, now: float) -> None:
+        stale = [k for k, (ts, _) in self._last.items() if now - ts >= self.interval]
+        for k in stale:
+            del self._last[k]
+        if len(self._last) >= self.max_keys:
+            self._last.clear()
+
+    def forget(self, key) -> None:
+        """Drop rate-limit state for key (e.g. position closed)."""
+        for k in [k for k in self._last if k[0] == key]:
+            del self._last[k]
+
+    def debug(self, key, msg: str, *args, **kwargs) -> bool:
+        return self.log(logging.DEBUG, key, msg, *args, **kwargs)
+
+    def info(self, key, msg: str, *args, **kwargs) -> bool:
+        return self.log(logging.INFO, key, msg, *args, **kwargs)
+
+    def warning(self, key, msg: str, *args, **kwargs) -> bool:
+        return self.log(logging.WARNING, key, msg, *args, **kwargs)
+
+    def error(self, key, msg: str, *args, **kwargs) -> bool:
+        return self.log(logging.ERROR, key, msg, *args, **kwargs)
+
+
+_hot_loggers: Dict[tuple, HotPathLogger] = {}
+_hot_lock = threading.Lock()
+
+
+def get_hot_logger(name: str, interval: float = 10.0) -> HotPathLogger:
+    """Get or create a rate-limited hot-path logger for name."""
+    with _hot_lock:
+        hot = _hot_loggers.get((name, interval))
+        if hot is None:
+            hot = _hot_loggers[(name, interval)] = HotPathLogger(logging.getLogger(name), interval)
+        return hot
+
+
 def setup_file_logging(
     filename: str = "pump_trading.log",
     level: int = logging.INFO,
-    use_rotation: bool = True
+    use_rotation: bool = True,
+    use_queue: Optional[bool] = None,
 ) -> None:
-    """Set up file logging - PREVENTS DUPLICATES."""
-    global _file_handler_added
+    """Set up file logging - PREVENTS DUPLICATES.
+
+    use_queue: write through a QueueListener thread (default: LOG_QUEUE env, on).
+    Per-subsystem levels come from LOG_LEVELS.
+    """
+    global _file_handler_added, _listener
     
     if _file_handler_added:
         return  # Already set up, skip
@@ -103,7 +297,22 @@ def setup_file_logging(
     stdout_handler.setLevel(level)
     stdout_handler.setFormatter(formatter)
     stdout_handler.addFilter(_trace_filter)
-    root_logger.addHandler(stdout_handler)
+
+    if use_queue is None:
+        use_queue = os.getenv("LOG_QUEUE", "1") != "0"
+    if use_queue:
+        # trace_id is a contextvar: resolve it on the caller thread, before the queue
+        queue_size = int(os.getenv("LOG_QUEUE_SIZE", str(LOG_QUEUE_SIZE)))
+        queue_handler, _listener = build_queue_handler([stdout_handler], queue_size)
+        queue_handler.setLevel(level)
+        queue_handler.addFilter(_trace_filter)
+        root_logger.addHandler(queue_handler)
+        atexit.register(stop_logging)
+    else:
+        root_logger.addHandler(stdout_handler)
+
+    if os.getenv("LOG_LEVELS"):
+        set_subsystem_levels(os.getenv("LOG_LEVELS"))
     
     _file_handler_added = True
 
@@ -133,10 +342,15 @@ def setup_trace_logging() -> None:
         root_logger.addFilter(_trace_filter)
     
     formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-    for handler in root_logger.handlers:
+    handlers = list(root_logger.handlers)
+    if _listener is not None:
+        handlers.extend(_listener.handlers)
+    for handler in handlers:
         if _trace_filter not in handler.filters:
             handler.addFilter(_trace_filter)
-        handler.setFormatter(formatter)
+        # Queue handlers pass records through unformatted; the listener formats
+        if not isinstance(handler, logging.handlers.QueueHandler):
+            handler.setFormatter(formatter)
 
 
 def setup_json_logging(filename: str = "critical_events.jsonl") -> logging.Logger:
@@ -0,0 +1,214 @@
+"""
+Shared market-data client for DexScreener and Jupiter Price v3.
+
+Token scoring, pattern detection, the volume analyzer, wallet sync and the
+whale listeners each looked up one mint at a time, every one with its own
+aiohttp session (new TLS handshake per call) and ad-hoc cache. This client
+is the single place those lookups go through:
+
+    - batching: lookups issued within a few ms are sent as one request
+      (DexScreener tokens endpoint: 30 mints, Jupiter price v3: 50 ids)
+    - coalescing: concurrent lookups of the same mint share one request
+    - shared TTL cache per source (MARKET_DATA_DEX_TTL / MARKET_DATA_PRICE_TTL)
+    - one token bucket per API across all callers
+      (MARKET_DATA_DEX_RPS / MARKET_DATA_JUP_RPS)
+    - one keep-alive session
+
+Usage:
+    from utils.market_data import get_market_data_client
+
+    pairs = await get_market_data_client().dexscreener_pairs(mint)   # list | None on error
+    price = await get_market_data_client().jupiter_price(mint)       # {"usdPrice": ...} | None
+"""
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+import aiohttp
+
+from core.account_coalescer import AccountCoalescer
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEXSCREENER_TOKENS_URL = "https://api.dexscreener.com/latest/dex/tokens/"
+JUPITER_PRICE_V3_URL = "https://api.jup.ag/price/v3"
+DEXSCREENER_MAX_MINTS = 30
+JUPITER_MAX_IDS = 50
+EMPTY_RESULT_TTL = 1.0
+
+
+class MarketDataError(Exception):
+    """Non-200 response from a market-data API."""
+
+    def __init__(self, source: str, status: int, text: str = ""):
+        super().__init__(f"{source} HTTP {status}: {text[:100]}")
+        self.source = source
+        self.status = status
+
+
+class TokenBucket:
+    """Async token bucket: `rate` requests/s sustained, up to `burst` at once."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waited = 0.0
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
+
+
+class MarketDataClient:
+    """Batched, coalesced, cached, rate-limited DexScreener + Jupiter price lookups."""
+
+    def __init__(
+        self,
+        dexscreener_rps: float = float(os.getenv("MARKET_DATA_DEX_RPS", "4")),
+        jupiter_rps: float = float(os.getenv("MARKET_DATA_JUP_RPS", "1")),
+        dexscreener_ttl: float = float(os.getenv("MARKET_DATA_DEX_TTL", "10")),
+        price_ttl: float = float(os.getenv("MARKET_DATA_PRICE_TTL", "1.5")),
+        window: float = 0.005,
+        request_timeout: float = 5.0,
+    ):
+        self.dexscreener_ttl = dexscreener_ttl
+        self.price_ttl = price_ttl
+        self.request_timeout = request_timeout
+        self.dexscreener_bucket = TokenBucket(dexscreener_rps, burst=max(1, int(dexscreener_rps)))
+        self.jupiter_bucket = TokenBucket(jupiter_rps, burst=max(1, int(jupiter_rps)))
+        self._dexscreener = AccountCoalescer(
+            self._fetch_dexscreener, window, max_batch=DEXSCREENER_MAX_MINTS, name="dexscreener"
+        )
+        self._jupiter = AccountCoalescer(
+            self._fetch_jupiter, window, max_batch=JUPITER_MAX_IDS, name="jupiter_price"
+        )
+        self._cache: dict[tuple[str, str], tuple[float, object]] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._api_key = os.getenv("JUPITER_API_KEY")
+        self._stats = {"cache_hits": 0, "http_requests": 0, "http_errors": 0}
+
+    # --- Public API ---------------------------------------------------------
+
+    async def dexscreener_pairs(self, mint: str) -> Optional[list[dict]]:
+        """DexScreener pairs for mint, most liquid first ([] = not listed, None = request failed)."""
+        return await self._lookup("dexscreener", self._dexscreener, mint, self.dexscreener_ttl)
+
+    async def jupiter_price(self, mint: str) -> Optional[dict]:
+        """Jupiter price v3 entry for mint ({"usdPrice": ...}), None if unknown or failed."""
+        return await self._lookup("jupiter", self._jupiter, mint, self.price_ttl)
+
+    async def fetch_jupiter_prices(self, mints: list[str]) -> dict[str, dict]:
+        """Uncached Jupiter price v3 call for up to 50 ids; refreshes the shared cache.
+
+        Raises:
+            MarketDataError: On a non-200 response (status 429 when rate limited).
+        """
+        data = await self._get_json(
+            "jupiter",
+            f"{JUPITER_PRICE_V3_URL}?ids={','.join(mints[:JUPITER_MAX_IDS])}",
+            self.jupiter_bucket,
+            self._jupiter_headers(),
+        )
+        expires = time.monotonic() + self.price_ttl
+        for mint in mints:
+            entry = data.get(mint)
+            self._cache[("jupiter", mint)] = (expires, entry if isinstance(entry, dict) else None)
+        return data
+
+    # --- Internals ----------------------------------------------------------
+
+    async def _lookup(self, source: str, coalescer: AccountCoalescer, mint: str, ttl: float):
+        cached = self._cache.get((source, mint))
+        if cached is not None and cached[0] > time.monotonic():
+            self._stats["cache_hits"] += 1
+            return cached[1]
+        try:
+            value = await coalescer.get(mint)
+        except Exception as e:
+            logger.debug(f"[MARKET] {source} lookup failed for {mint[:8]}...: {e}")
+            return None
+        # Empty results (not listed / no price yet) expire sooner: new tokens get indexed
+        self._cache[(source, mint)] = (time.monotonic() + (ttl if value else min(ttl, EMPTY_RESULT_TTL)), value)
+        if len(self._cache) > 10_000:
+            now = time.monotonic()
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+        return value
+
+    async def _fetch_dexscreener(self, mints: list[str]) -> list[list[dict]]:
+        data = await self._get_json(
+            "dexscreener", DEXSCREENER_TOKENS_URL + ",".join(mints), self.dexscreener_bucket
+        )
+        by_mint: dict[str, list[dict]] = {mint: [] for mint in mints}
+        for pair in data.get("pairs") or []:
+            # The single-mint endpoint also lists pairs where the mint is the quote side
+            for side in ("baseToken", "quoteToken"):
+                address = (pair.get(side) or {}).get("address")
+                if address in by_mint:
+                    by_mint[address].append(pair)
+                    break
+        for pairs in by_mint.values():
+            pairs.sort(key=lambda p: float((p.get("liquidity") or {}).get("usd", 0) or 0), reverse=True)
+        return [by_mint[mint] for mint in mints]
+
+    async def _fetch_jupiter(self, mints: list[str]) -> list[Optional[dict]]:
+        data = await self._get_json(
+            "jupiter", f"{JUPITER_PRICE_V3_URL}?ids={','.join(mints)}", self.jupiter_bucket, self._jupiter_headers()
+        )
+        return [data.get(mint) if isinstance(data.get(mint), dict) else None for mint in mints]
+
+    def _jupiter_headers(self) -> dict:
+        headers = {"Accept": "application/json"}
+        if self._api_key:
+            headers["x-api-key"] = self._api_key
+        return headers
+
+    async def _get_json(self, source: str, url: str, bucket: TokenBucket, headers: dict | None = None):
+        await bucket.acquire()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.request_timeout))
+        self._stats["http_requests"] += 1
+        async with self._session.get(url, headers=headers) as resp:
+            if resp.status != 200:
+                self._stats["http_errors"] += 1
+                raise MarketDataError(source, resp.status, await resp.text())
+            return await resp.json(content_type=None)
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "cache_size": len(self._cache),
+            "dexscreener": self._dexscreener.get_stats(),
+            "jupiter": self._jupiter.get_stats(),
+            "rate_limit_wait_s": round(self.dexscreener_bucket.waited + self.jupiter_bucket.waited, 2),
+        }
+
+
+_client: Optional[MarketDataClient] = None
+
+
+def get_market_data_client() -> MarketDataClient:
+    """Process-wide market-data client."""
+    global _client
+    if _client is None:
+        _client = MarketDataClient()
+    return _client
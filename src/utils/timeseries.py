@@ -0,0 +1,120 @@
+"""
+Fixed-capacity ring-buffer time series for per-token metric histories.
+
+Pattern and trending code kept histories as lists of (datetime, value)
+tuples, rebuilt with a filter comprehension on every update and summed
+with a full pass for windowed totals. ``RingSeries`` stores the same data
+in preallocated ``array('d')`` columns (8 bytes per value, no per-sample
+objects) with ``time.monotonic()`` float timestamps:
+
+    series = RingSeries(capacity=50, columns=2)
+    series.append(time.monotonic(), buys, sells)   # O(1), evicts oldest when full
+    series.expire(time.monotonic() - 3600)         # O(expired)
+    series.sum(0), series.last(1), series.values(0)
+
+Running sums are kept per column, so windowed totals are O(1). They are
+recomputed when the series empties, so float drift cannot accumulate.
+"""
+
+import time
+from array import array
+from typing import Iterator, Optional
+
+
+class RingSeries:
+    """Time-ordered samples of `columns` floats, at most `capacity` of them."""
+
+    __slots__ = ("capacity", "_ts", "_cols", "_sums", "_head", "_size")
+
+    def __init__(self, capacity: int, columns: int = 1):
+        if capacity < 1 or columns < 1:
+            raise ValueError("capacity and columns must be >= 1")
+        self.capacity = capacity
+        self._ts = array("d", bytes(8 * capacity))
+        self._cols = [array("d", bytes(8 * capacity)) for _ in range(columns)]
+        self._sums = [0.0] * columns
+        self._head = 0  # index of the oldest sample
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[tuple]:
+        """(ts, v0, v1, ...) oldest first."""
+        for i in range(self._size):
+            j = (self._head + i) % self.capacity
+            yield (self._ts[j], *(col[j] for col in self._cols))
+
+    def append(self, ts: Optional[float] = None, *values: float) -> None:
+        """Add a sample (ts defaults to time.monotonic()); evicts the oldest when full."""
+        if len(values) != len(self._cols):
+            raise ValueError(f"expected {len(self._cols)} values, got {len(values)}")
+        if self._size == self.capacity:
+            self._pop_oldest()
+        j = (self._head + self._size) % self.capacity
+        self._ts[j] = time.monotonic() if ts is None else ts
+        for k, value in enumerate(values):
+            self._cols[k][j] = value
+            self._sums[k] += value
+        self._size += 1
+
+    def expire(self, cutoff: float) -> int:
+        """Drop samples with ts <= cutoff; returns how many were dropped."""
+        dropped = 0
+        while self._size and self._ts[self._head] <= cutoff:
+            self._pop_oldest()
+            dropped += 1
+        return dropped
+
+    def clear(self) -> None:
+        self._head = self._size = 0
+        self._sums = [0.0] * len(self._cols)
+
+    def _pop_oldest(self) -> None:
+        j = self._head
+        for k, col in enumerate(self._cols):
+            self._sums[k] -= col[j]
+        self._head = (j + 1) % self.capacity
+        self._size -= 1
+        if not self._size:
+            self.clear()
+
+    def sum(self, column: int = 0) -> float:
+        """Running sum of a column over the samples currently held."""
+        return self._sums[column]
+
+    def last(self, column: int = 0) -> Optional[float]:
+        if not self._size:
+            return None
+        return self._cols[column][(self._head + self._size - 1) % self.capacity]
+
+    def last_ts(self) -> Optional[float]:
+        if not self._size:
+            return None
+        return self._ts[(self._head + self._size - 1) % self.capacity]
+
+    def first_ts(self) -> Optional[float]:
+        return self._ts[self._head] if self._size else None
+
+    def values(self, column: int = 0) -> list[float]:
+        """Column values oldest first."""
+        col, cap, head = self._cols[column], self.capacity, self._head
+        return [col[(head + i) % cap] for i in range(self._size)]
+
+    def timestamps(self) -> list[float]:
+        cap, head = self.capacity, self._head
+        return [self._ts[(head + i) % cap] for i in range(self._size)]
+
+    def count_since(self, cutoff: float) -> int:
+        """Samples with ts > cutoff (binary search; timestamps are non-decreasing)."""
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._ts[(self._head + mid) % self.capacity] > cutoff:
+                hi = mid
+            else:
+                lo = mid + 1
+        return self._size - lo
@@ -0,0 +1,224 @@
+"""
+Geyser protobuf fixtures shared by the unit tests and offline benchmarks.
+
+Fixture files are a stream of length-prefixed protobuf messages:
+    [u32 little-endian length][serialized message] ...
+
+If no recorded file is given, representative transactions are synthesized:
+pump.fun direct buys, PumpSwap swaps resolved by balance diff, and
+non-DEX noise with large ALT account lists (the common case on a busy stream).
+"""
+
+import os
+import random
+import struct
+from typing import Iterator
+
+import base58
+
+from geyser.generated import geyser_pb2, solana_storage_pb2
+from monitoring.local_tx_parser import (
+    PUMP_FUN_BUY_DISCRIMINATOR,
+    PUMP_FUN_GLOBAL,
+    PUMP_FUN_PROGRAM,
+    PUMPSWAP_PROGRAM,
+    SOL_MINT,
+)
+
+_LEN = struct.Struct("<I")
+
+SYSTEM_PROGRAM = "11111111111111111111111111111111"
+TOKEN_PROGRAM = "TokenkegQfeZyiNwAJbNbGMxUZ7qnpPiW8VQ5DA"
+COMPUTE_BUDGET_PROGRAM = "ComputeBudget111111111111111111111111111111"
+
+
+def _raw(address: str) -> bytes:
+    return base58.b58decode(address)
+
+
+def random_pubkey(rng: random.Random) -> bytes:
+    return bytes(rng.getrandbits(8) for _ in range(32))
+
+
+def write_messages(path: str | os.PathLike, messages) -> int:
+    """Write protobuf messages as a length-prefixed stream. Returns count."""
+    count = 0
+    with open(path, "wb") as f:
+        for message in messages:
+            payload = message.SerializeToString()
+            f.write(_LEN.pack(len(payload)))
+            f.write(payload)
+            count += 1
+    return count
+
+
+def iter_payloads(path: str | os.PathLike) -> Iterator[bytes]:
+    """Yield raw serialized payloads from a length-prefixed stream."""
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(_LEN.size)
+            if len(header) < _LEN.size:
+                return
+            (size,) = _LEN.unpack(header)
+            payload = f.read(size)
+            if len(payload) < size:
+                return
+            yield payload
+
+
+def load_tx_infos(path: str | os.PathLike) -> list:
+    """Load SubscribeUpdateTransactionInfo fixtures.
+
+    Accepts files of SubscribeUpdateTransactionInfo or full SubscribeUpdate
+    messages (transaction updates are unwrapped, everything else skipped).
+    """
+    infos = []
+    for payload in iter_payloads(path):
+        update = geyser_pb2.SubscribeUpdate()
+        try:
+            update.ParseFromString(payload)
+        except Exception:
+            update = None
+        if update is not None and update.HasField("transaction"):
+            infos.append(update.transaction.transaction)
+            continue
+        info = geyser_pb2.SubscribeUpdateTransactionInfo()
+        info.ParseFromString(payload)
+        infos.append(info)
+    return infos
+
+
+def _token_balance(index: int, mint: str, owner: str, amount: int, decimals: int = 6):
+    return solana_storage_pb2.TokenBalance(
+        account_index=index,
+        mint=mint,
+        owner=owner,
+        program_id=TOKEN_PROGRAM,
+        ui_token_amount=solana_storage_pb2.UiTokenAmount(
+            amount=str(amount),
+            decimals=decimals,
+            ui_amount=amount / 10 ** decimals,
+            ui_amount_string=str(amount / 10 ** decimals),
+        ),
+    )
+
+
+def make_pump_buy(rng: random.Random, n_alt: int = 8):
+    """pump.fun direct buy: outer instruction carries the buy discriminator."""
+    payer = random_pubkey(rng)
+    mint = random_pubkey(rng)
+    curve = random_pubkey(rng)
+    assoc_curve = random_pubkey(rng)
+    keys = [
+        payer,                      # 0 fee payer / user
+        _raw(PUMP_FUN_GLOBAL),      # 1
+        random_pubkey(rng),         # 2 fee recipient
+        mint,                       # 3
+        curve,                      # 4
+        assoc_curve,                # 5
+        random_pubkey(rng),         # 6 user ata
+        _raw(SYSTEM_PROGRAM),       # 7
+        _raw(TOKEN_PROGRAM),        # 8
+        random_pubkey(rng),         # 9 creator vault
+        random_pubkey(rng),         # 10 event authority
+        _raw(PUMP_FUN_PROGRAM),     # 11
+        _raw(COMPUTE_BUDGET_PROGRAM),  # 12
+    ]
+    sol_lamports = rng.randint(10_000_000, 5_000_000_000)
+    tokens = rng.randint(1_000_000, 50_000_000_000_000)
+    data = (
+        PUMP_FUN_BUY_DISCRIMINATOR
+        + mint
+        + struct.pack("<QQ?", sol_lamports, tokens, True)
+        + payer
+        + struct.pack("<qQQ", 1_700_000_000, 30_000_000_000, 1_000_000_000_000_000)
+    )
+    accounts = bytes([1, 2, 3, 4, 5, 6, 0, 7, 8, 9, 10, 11, 11, 11, 11, 11])
+    message = solana_storage_pb2.Message(
+        account_keys=keys,
+        instructions=[
+            solana_storage_pb2.CompiledInstruction(
+                program_id_index=12, accounts=b"", data=bytes([3]) + struct.pack("<Q", 100_000)
+            ),
+            solana_storage_pb2.CompiledInstruction(
+                program_id_index=11, accounts=accounts, data=data
+            ),
+        ],
+    )
+    meta = solana_storage_pb2.TransactionStatusMeta(
+        fee=5000,
+        pre_balances=[sol_lamports * 2] + [0] * (len(keys) - 1),
+        post_balances=[sol_lamports - 5000] + [0] * (len(keys) - 1),
+        loaded_readonly_addresses=[random_pubkey(rng) for _ in range(n_alt)],
+    )
+    return _wrap(rng, message, meta)
+
+
+def make_pumpswap_swap(rng: random.Random, n_alt: int = 16):
+    """PumpSwap buy routed through an aggregator: parsed by balance diff."""
+    payer = random_pubkey(rng)
+    payer_str = base58.b58encode(payer).decode()
+    mint_str = base58.b58encode(random_pubkey(rng)).decode()
+    keys = [payer] + [random_pubkey(rng) for _ in range(10)] + [_raw(PUMPSWAP_PROGRAM)]
+    alt = [random_pubkey(rng) for _ in range(n_alt)]
+    sol_lamports = rng.randint(10_000_000, 5_000_000_000)
+    tokens = rng.randint(1_000_000, 50_000_000_000)
+    message = solana_storage_pb2.Message(
+        account_keys=keys,
+        instructions=[
+            solana_storage_pb2.CompiledInstruction(
+                program_id_index=11, accounts=bytes(range(1, 11)) + bytes([11, 1]), data=b"\x00" * 24
+            ),
+        ],
+    )
+    meta = solana_storage_pb2.TransactionStatusMeta(
+        fee=5000,
+        pre_balances=[sol_lamports * 2] + [0] * (len(keys) - 1),
+        post_balances=[sol_lamports - 5000] + [0] * (len(keys) - 1),
+        pre_token_balances=[_token_balance(3, SOL_MINT, payer_str, 0, 9)],
+        post_token_balances=[_token_balance(4, mint_str, payer_str, tokens, 6)],
+        loaded_writable_addresses=alt[: n_alt // 2],
+        loaded_readonly_addresses=alt[n_alt // 2:],
+    )
+    return _wrap(rng, message, meta)
+
+
+def make_noise(rng: random.Random, n_static: int = 12, n_alt: int = 48):
+    """Non-swap transaction with many keys (votes-like / arbitrage noise)."""
+    keys = [random_pubkey(rng) for _ in range(n_static)]
+    message = solana_storage_pb2.Message(
+        account_keys=keys,
+        instructions=[
+            solana_storage_pb2.CompiledInstruction(
+                program_id_index=n_static - 1, accounts=bytes(range(4)), data=b"\x02" * 12
+            ),
+        ],
+    )
+    meta = solana_storage_pb2.TransactionStatusMeta(
+        fee=5000,
+        pre_balances=[1_000_000_000] * n_static,
+        post_balances=[999_995_000] + [1_000_000_000] * (n_static - 1),
+        loaded_writable_addresses=[random_pubkey(rng) for _ in range(n_alt // 2)],
+        loaded_readonly_addresses=[random_pubkey(rng) for _ in range(n_alt // 2)],
+    )
+    return _wrap(rng, message, meta)
+
+
+def _wrap(rng: random.Random, message, meta):
+    signature = bytes(rng.getrandbits(8) for _ in range(64))
+    return geyser_pb2.SubscribeUpdateTransactionInfo(
+        signature=signature,
+        transaction=solana_storage_pb2.Transaction(signatures=[signature], message=message),
+        meta=meta,
+    )
+
+
+def synthesize_tx_infos(count: int = 1000, seed: int = 7) -> list:
+    """Mixed workload: ~20% pump.fun buys, ~20% PumpSwap swaps, ~60% noise."""
+    rng = random.Random(seed)
+    makers = [make_pump_buy, make_pumpswap_swap, make_noise, make_noise, make_noise]
+    return [makers[i % len(makers)](rng) for i in range(count)]
+
+
+def fee_payer_of(tx_info) -> str:
+    return base58.b58encode(bytes(tx_info.transaction.message.account_keys[0])).decode()
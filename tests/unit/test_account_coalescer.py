@@ -0,0 +1,57 @@
+"""Account read coalescer: windowed batching, in-flight dedup, error fan-out"""
+import asyncio
+
+import pytest
+
+from core.account_coalescer import AccountCoalescer
+
+
+class _FakeRpc:
+    def __init__(self, delay: float = 0.01, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls: list[list] = []
+
+    async def fetch_many(self, keys: list) -> list:
+        self.calls.append(list(keys))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("429 Too Many Requests")
+        return [None if key.startswith("missing") else f"acc-{key}" for key in keys]
+
+
+async def test_burst_is_batched_chunked_and_deduped():
+    rpc = _FakeRpc()
+    coalescer = AccountCoalescer(rpc.fetch_many, window=0.002, max_batch=100)
+    keys = [f"k{i}" for i in range(250)] + ["k3", "k3", "missing1"]
+
+    values = await asyncio.gather(*(coalescer.get(k) for k in keys))
+
+    assert values[:250] == [f"acc-k{i}" for i in range(250)]
+    assert values[250:] == ["acc-k3", "acc-k3", None]
+    assert sorted(len(c) for c in rpc.calls) == [51, 100, 100]  # 251 unique keys
+    assert coalescer.get_stats()["deduped"] == 2
+
+    # A read issued while the key is in flight joins that request
+    first = asyncio.create_task(coalescer.get("late"))
+    await asyncio.sleep(0.005)  # window elapsed, fetch in flight
+    assert await asyncio.gather(first, coalescer.get("late")) == ["acc-late", "acc-late"]
+    assert rpc.calls[-1] == ["late"]
+
+
+async def test_errors_reach_every_waiter_and_timeouts_do_not_cancel_batch():
+    rpc = _FakeRpc(delay=0.02, fail=True)
+    coalescer = AccountCoalescer(rpc.fetch_many, window=0.001)
+    results = await asyncio.gather(coalescer.get("a"), coalescer.get("b"), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(rpc.calls) == 1
+
+    rpc.fail = False
+    impatient = asyncio.wait_for(coalescer.get("c"), timeout=0.005)
+    patient = coalescer.get("c")
+    impatient_result, patient_result = await asyncio.gather(impatient, patient, return_exceptions=True)
+    assert isinstance(impatient_result, asyncio.TimeoutError)
+    assert patient_result == "acc-c"
+    with pytest.raises(RuntimeError):
+        rpc.fail = True
+        await coalescer.get("d")
@@ -0,0 +1,85 @@
+"""Confirmation service: batched status polling and geyser early resolve"""
+import asyncio
+
+from aiohttp import web
+
+from core.confirmation_service import ConfirmationService
+
+
+class _StatusStub:
+    """getSignatureStatuses stub; `statuses` maps signature -> status dict (missing = not found)."""
+
+    def __init__(self):
+        self.statuses: dict[str, dict] = {}
+        self.batch_sizes: list[int] = []
+        self.runner = None
+        self.url = ""
+
+    async def handle(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        assert body["method"] == "getSignatureStatuses"
+        signatures = body["params"][0]
+        self.batch_sizes.append(len(signatures))
+        value = [self.statuses.get(sig) for sig in signatures]
+        return web.json_response({"jsonrpc": "2.0", "id": 1, "result": {"context": {"slot": 1}, "value": value}})
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+
+def _status(commitment: str, err=None) -> dict:
+    return {"slot": 42, "confirmations": None, "err": err, "confirmationStatus": commitment}
+
+
+async def test_pending_signatures_share_batched_polls():
+    async with _StatusStub() as stub:
+        service = ConfirmationService([stub.url], interval=0.02)
+        signatures = [f"sig{i}" for i in range(300)]
+        for sig in signatures:
+            stub.statuses[sig] = _status("confirmed")
+        stub.statuses["sig7"] = _status("processed", err={"InstructionError": [2, {"Custom": 6001}]})
+        stub.statuses["sig8"] = _status("processed")
+
+        waits = [service.wait(sig, "confirmed", timeout=2) for sig in signatures if sig != "sig8"]
+        slow = asyncio.create_task(service.wait("sig8", "confirmed", timeout=2))
+        outcomes = await asyncio.gather(*waits)
+
+        assert stub.batch_sizes[:2] == [256, 44]  # one tick = ceil(300 / 256) calls
+        assert sum(o.success for o in outcomes) == 298
+        failed = next(o for o in outcomes if o.signature == "sig7")
+        assert failed.landed and not failed.success and "6001" in failed.error
+
+        assert not slow.done()  # processed is below the requested commitment
+        stub.statuses["sig8"] = _status("finalized")
+        assert (await slow).success
+        assert service.get_stats()["pending"] == 0
+        await service.close()
+
+
+async def test_geyser_observe_resolves_before_poll():
+    service = ConfirmationService([], interval=10.0)  # the poll would never come in time
+    processed = asyncio.create_task(service.wait("a", "processed", timeout=1))
+    confirmed = asyncio.create_task(service.wait("a", "confirmed", timeout=0.1))
+    failing = asyncio.create_task(service.wait("b", "confirmed", timeout=1))
+    await asyncio.sleep(0)
+
+    assert service.observe("a", None, 7) == 1
+    assert service.observe("b", "0102", 7) == 1
+    assert service.observe("unknown", None, 7) == 0
+
+    assert (await processed).success and (await processed).source == "geyser"
+    assert not (await failing).success  # on-chain error is final at any commitment
+    timed_out = await confirmed
+    assert not timed_out.landed and "timeout" in timed_out.error
+    assert service.get_stats()["pending"] == 0
+    await service.close()
@@ -0,0 +1,93 @@
+"""CurveSnapshot math and single-read CurveManager snapshots"""
+import random
+import struct
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from solders.pubkey import Pubkey
+
+from interfaces.core import CurveSnapshot, Platform
+from platforms.pumpfun.curve_manager import PumpFunCurveManager
+from utils.idl_parser import IDLParser
+
+IDL_DIR = Path(__file__).resolve().parents[2] / "idl"
+
+
+class _CountingClient:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.reads = 0
+
+    async def get_account_info(self, pubkey):
+        self.reads += 1
+        return SimpleNamespace(data=self.data)
+
+
+def _bonding_curve(vt: int, vs: int, rt: int, rs: int, complete: bool = False) -> bytes:
+    creator = bytes(Pubkey.new_unique())
+    return b"\0" * 8 + struct.pack("<QQQQQ?", vt, vs, rt, rs, 10**15, complete) + creator + b"\1"
+
+
+def _manager(data: bytes) -> tuple[PumpFunCurveManager, _CountingClient]:
+    client = _CountingClient(data)
+    return PumpFunCurveManager(client, IDLParser(str(IDL_DIR / "pump_fun_idl.json"))), client
+
+
+def test_snapshot_math_matches_constant_product():
+    rng = random.Random(9)
+    for _ in range(200):
+        snap = CurveSnapshot(
+            platform=Platform.PUMP_FUN,
+            base_reserves=rng.randint(1, 10**15),
+            quote_reserves=rng.randint(1, 10**12),
+        )
+        amount = rng.randint(0, 10**11)
+        base, quote = snap.reserves
+        assert snap.buy_amount_out(amount) == amount * base // (quote + amount)
+        assert snap.sell_amount_out(amount) == amount * quote // (base + amount)
+        assert snap.price() == pytest.approx(quote / base * 10**6 / 10**9)
+
+
+def test_snapshot_is_immutable_and_validates_reserves():
+    snap = CurveSnapshot(platform=Platform.BAGS, base_reserves=0, quote_reserves=5)
+    with pytest.raises(AttributeError):
+        snap.base_reserves = 1
+    with pytest.raises(ValueError):
+        snap.price()
+    assert snap.buy_amount_out(0) == 0
+
+
+async def test_pumpfun_snapshot_single_read():
+    data = _bonding_curve(800 * 10**12, 40 * 10**9, 700 * 10**12, 10 * 10**9)
+    manager, client = _manager(data)
+    snap = await manager.get_curve_snapshot(Pubkey.new_unique())
+    assert client.reads == 1
+    assert snap.reserves == (800 * 10**12, 40 * 10**9)
+    assert snap.price() == snap.state["price_per_token"]
+    assert snap.creator == snap.state["creator"]
+    assert snap.state["is_mayhem_mode"] is True
+    progress = snap.progress()
+    assert progress["sol_raised"] == 10.0
+    assert progress["progress_percentage"] == pytest.approx(10 / 85 * 100)
+
+    # Wrappers keep their results, one read each
+    assert await manager.calculate_buy_amount_out(snap.pool_address, 10**9) == snap.buy_amount_out(10**9)
+    assert await manager.get_curve_progress(snap.pool_address) == progress
+    assert client.reads == 3
+
+
+def test_snapshot_from_account_data_no_rpc():
+    data = _bonding_curve(10**15, 30 * 10**9, 0, 0, complete=True)
+    manager, client = _manager(data)
+    snap = manager.snapshot_from_account_data(None, data, slot=42)
+    assert client.reads == 0
+    assert snap.complete is True and snap.slot == 42
+    with pytest.raises(ValueError):
+        manager.snapshot_from_account_data(None, _bonding_curve(0, 1, 0, 0))
+
+
+async def test_get_curve_snapshot_wraps_errors():
+    manager, _ = _manager(b"\0" * 8)
+    with pytest.raises(ValueError, match="Invalid bonding curve state"):
+        await manager.get_curve_snapshot(Pubkey.new_unique())
@@ -0,0 +1,62 @@
+"""Unit tests for DedupCache and SignalDedup"""
+import time
+
+import pytest
+
+from monitoring.dedup_cache import DedupCache
+from monitoring.signal_dedup import SignalDedup
+
+
+class TestDedupCache:
+    def test_add_returns_new_flag(self):
+        cache = DedupCache(maxsize=10)
+        assert cache.add("sig1") is True
+        assert cache.add("sig1") is False
+        assert "sig1" in cache
+        assert cache.hits == 1
+
+    def test_fifo_eviction_drops_oldest(self):
+        cache = DedupCache(maxsize=3)
+        for sig in ("a", "b", "c", "d"):
+            cache.add(sig)
+        assert len(cache) == 3
+        assert "a" not in cache
+        assert all(sig in cache for sig in ("b", "c", "d"))
+        assert cache.evicted == 1
+
+    def test_duplicate_does_not_refresh_position(self):
+        cache = DedupCache(maxsize=2)
+        cache.add("a")
+        cache.add("b")
+        cache.add("a")
+        cache.add("c")
+        assert "a" not in cache
+        assert "b" in cache
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        cache = DedupCache(maxsize=100, ttl=10)
+        cache.add("old")
+        now[0] += 5
+        cache.add("new")
+        now[0] += 6
+        assert "old" not in cache
+        assert "new" in cache
+        assert cache.expired == 1
+        assert cache.add("old") is True
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            DedupCache(maxsize=0)
+
+
+class TestSignalDedup:
+    def test_first_source_wins(self):
+        dedup = SignalDedup(ttl_seconds=300)
+        assert dedup.is_new("sig", source="grpc") is True
+        assert dedup.is_new("sig", source="webhook") is False
+        assert dedup._seen.source_of("sig") == "grpc"
+        stats = dedup.get_stats()
+        assert stats["seen_count"] == 1
+        assert stats["dedup_hits"] == 1
@@ -67,3 +67,49 @@ class TestSQLiteDedupStore:
         
         await store.try_acquire(mint, "bot1")
         assert await store.is_processed(mint) is True
+
+
+class _StubRedis:
+    """Minimal async SET NX/GET/EXISTS/DEL."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def ping(self):
+        return True
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+
+class TestRedisDedupStore:
+    @pytest.mark.asyncio
+    async def test_uses_shared_pooled_client(self, monkeypatch):
+        import core.redis_pool as redis_pool
+
+        facade = redis_pool.AsyncRedis()
+        facade._client = _StubRedis()
+        facade._loop = asyncio.get_running_loop()
+        monkeypatch.setattr(redis_pool, "_async_redis", facade)
+        store = RedisDedupStore()
+
+        mint = "TestMintRedis"
+        assert await store.try_acquire(mint, "bot1") is True
+        assert await store.try_acquire(mint, "bot2") is False
+        await store.mark_bought(mint, "bot1")
+        assert await store.get_status(mint) == TokenStatus.BOUGHT
+
+        callers = facade.get_stats()["callers"]
+        assert callers["dedup.set"]["calls"] == 3 and "dedup.ping" in callers
@@ -0,0 +1,90 @@
+"""Sharded, diffed Geyser subscriptions and sliced account decoding"""
+import asyncio
+import json
+import os
+import struct
+
+import base58
+import pytest
+
+from geyser.generated import geyser_pb2
+from monitoring.geyser_subscriptions import (
+    SHARD_ALL,
+    SHARD_CURVE,
+    SHARD_TOKEN,
+    SHARD_TX,
+    GeyserSubscriptionManager,
+)
+from monitoring.whale_geyser import CurveSubscription, WhaleGeyserReceiver
+
+
+def _address() -> str:
+    return base58.b58encode(os.urandom(32)).decode()
+
+
+@pytest.fixture
+def receiver(tmp_path, monkeypatch):
+    monkeypatch.setenv("GEYSER_SHARD_STREAMS", "1")
+    wallets_file = tmp_path / "wallets.json"
+    wallets_file.write_text(json.dumps({"whales": [{"wallet": _address(), "label": "w1"}]}))
+    r = WhaleGeyserReceiver(wallets_file=str(wallets_file))
+    for inst in r._grpc_instances:
+        inst.ping_queue = asyncio.Queue(maxsize=100)
+    return r
+
+
+def _drain(inst) -> list:
+    out = []
+    while not inst.ping_queue.empty():
+        out.append(inst.ping_queue.get_nowait())
+    return out
+
+
+def test_shard_requests_and_slices():
+    manager = GeyserSubscriptionManager()
+    filters = {
+        "whale_tracker": frozenset({"w"}),
+        "curve_tracker": frozenset({"c"}),
+        "vault_tracker": frozenset({"v"}),
+        "ata_tracker": frozenset(),
+    }
+    tx = manager.build_request(SHARD_TX, filters)
+    assert list(tx.transactions) == ["whale_tracker"] and not tx.accounts
+    curve = manager.build_request(SHARD_CURVE, filters)
+    assert list(curve.accounts) == ["curve_tracker"] and not curve.transactions
+    assert [(s.offset, s.length) for s in curve.accounts_data_slice] == [(8, 41)]
+    token = manager.build_request(SHARD_TOKEN, filters)
+    assert list(token.accounts) == ["vault_tracker"]
+    assert [(s.offset, s.length) for s in token.accounts_data_slice] == [(64, 8)]
+    legacy = manager.build_request(SHARD_ALL, filters)
+    assert set(legacy.accounts) == {"curve_tracker", "vault_tracker"} and not legacy.accounts_data_slice
+
+
+async def test_curve_subscribe_only_touches_curve_streams(receiver):
+    shards = {inst.shard for inst in receiver._grpc_instances}
+    assert shards == {SHARD_TX, SHARD_CURVE, SHARD_TOKEN}
+    filters = receiver._current_filters()
+    for inst in receiver._grpc_instances:
+        receiver._subscriptions.mark_sent(inst.name, inst.shard, filters)
+
+    await receiver.subscribe_bonding_curve(_address(), _address(), "SYM")
+    pushed = {inst.shard: _drain(inst) for inst in receiver._grpc_instances}
+    assert len(pushed[SHARD_CURVE]) == 1 and not pushed[SHARD_TX] and not pushed[SHARD_TOKEN]
+
+    # Same filter set again: nothing is pushed
+    assert receiver._resubscribe() == 0
+    assert receiver.get_stats()["subscriptions"]["skipped"] >= 3
+
+
+async def test_sliced_updates_decode_like_full_data(receiver):
+    mint, curve = _address(), _address()
+    receiver._curve_subscriptions[mint] = CurveSubscription(mint=mint, symbol="S", curve_address=curve)
+    receiver._curve_address_map[curve] = mint
+    full = b"\0" * 8 + struct.pack("<QQQQQ?", 10**15, 30 * 10**9, 1, 2, 10**15, False) + b"\0" * 40
+    update = geyser_pb2.SubscribeUpdateAccount(
+        slot=5,
+        account=geyser_pb2.SubscribeUpdateAccountInfo(pubkey=base58.b58decode(curve), data=full[8:49]),
+    )
+    receiver._handle_curve_account_update(update, slot=5, base=8)
+    snap = receiver.get_curve_snapshot(mint)
+    assert snap.reserves == (10**15, 30 * 10**9) and snap.real_quote_reserves == 2
@@ -0,0 +1,90 @@
+"""Compiled IDL decoders must match the IDLParser interpreter byte for byte"""
+import base64
+import random
+import struct
+from pathlib import Path
+
+import pytest
+
+from utils.idl_parser import DISCRIMINATOR_SIZE, IDLParser, pubkey_str
+
+IDL_DIR = Path(__file__).resolve().parents[2] / "idl"
+IDLS = ["pump_fun_idl.json", "raydium_launchlab_idl.json", "bags.json", "pump_swap_idl.json"]
+
+_INT_FORMATS = {
+    "u8": "<B", "u16": "<H", "u32": "<I", "u64": "<Q",
+    "i8": "<b", "i16": "<h", "i32": "<i", "i64": "<q",
+}
+
+
+def _encode(parser: IDLParser, type_def, rng: random.Random) -> bytes:
+    """Random valid encoding of an IDL type."""
+    if isinstance(type_def, str):
+        if type_def in _INT_FORMATS:
+            fmt = _INT_FORMATS[type_def]
+            bits = struct.calcsize(fmt) * 8
+            lo, hi = (0, 2**bits - 1) if fmt[1].isupper() else (-(2 ** (bits - 1)), 2 ** (bits - 1) - 1)
+            return struct.pack(fmt, rng.randint(lo, hi))
+        if type_def == "bool":
+            return bytes([rng.randint(0, 1)])
+        if type_def == "pubkey":
+            return rng.randbytes(32)
+        if type_def == "string":
+            text = "".join(rng.choice("abcXYZ123 ") for _ in range(rng.randint(0, 20)))
+            return struct.pack("<I", len(text)) + text.encode()
+    if "array" in type_def:
+        element, length = type_def["array"]
+        return b"".join(_encode(parser, element, rng) for _ in range(length))
+    inner = parser.types[parser._get_defined_type_name(type_def)]["type"]
+    if inner["kind"] == "enum":
+        return bytes([rng.randrange(len(inner["variants"]))])
+    return b"".join(_encode(parser, f["type"], rng) for f in inner["fields"])
+
+
+@pytest.mark.parametrize("idl", IDLS)
+def test_compiled_matches_interpreter(idl):
+    parser = IDLParser(str(IDL_DIR / idl))
+    rng = random.Random(idl)
+    assert parser.compiled_types
+    for name, layout in parser.compiled_types.items():
+        for _ in range(20):
+            data = _encode(parser, {"defined": name}, rng) + rng.randbytes(rng.randint(0, 4))
+            expected, expected_end = parser._decode_defined_type(data, 0, name)
+            got, end = layout.decode(data, 0)
+            assert (got, end) == (expected, expected_end), name
+
+
+def test_raw_pubkeys_are_bytes():
+    parser = IDLParser(str(IDL_DIR / "pump_fun_idl.json"))
+    rng = random.Random(1)
+    data = b"\0" * DISCRIMINATOR_SIZE + _encode(parser, {"defined": "BondingCurve"}, rng)
+    decoded = parser.decode_account_data(data, "BondingCurve")
+    raw = parser.decode_account_data(data, "BondingCurve", raw_pubkeys=True)
+    assert isinstance(raw["creator"], bytes)
+    assert pubkey_str(raw["creator"]) == decoded["creator"]
+
+
+def test_find_event_in_logs_skips_foreign_data():
+    parser = IDLParser(str(IDL_DIR / "pump_fun_idl.json"))
+    rng = random.Random(2)
+    disc = parser.get_event_discriminators()["TradeEvent"]
+    payload = disc + _encode(parser, {"defined": "TradeEvent"}, rng)
+    logs = [
+        "Program log: Instruction: Buy",
+        "Program data: " + base64.b64encode(rng.randbytes(120)).decode(),
+        "Program data: " + base64.b64encode(payload).decode(),
+    ]
+    event = parser.find_event_in_logs(logs, "TradeEvent")
+    assert event["event_name"] == "TradeEvent"
+    assert event["fields"] == parser._decode_defined_type(payload[DISCRIMINATOR_SIZE:], 0, "TradeEvent")[0]
+    assert parser.find_event_in_logs(logs, "CreateEvent") is None
+
+
+def test_truncated_event_falls_back_to_interpreter():
+    parser = IDLParser(str(IDL_DIR / "pump_fun_idl.json"))
+    rng = random.Random(3)
+    disc = parser.get_event_discriminators()["TradeEvent"]
+    payload = disc + _encode(parser, {"defined": "TradeEvent"}, rng)
+    event = parser.decode_event_data(payload[:60])
+    assert event["event_name"] == "TradeEvent"
+    assert "mint" in event["fields"]  # partial decode, as before
@@ -0,0 +1,88 @@
+"""Unit tests for LocalTxParser zero-decode fast path"""
+import random
+
+import pytest
+
+from tests.unit.geyser_fixtures import (
+    fee_payer_of,
+    make_noise,
+    make_pump_buy,
+    make_pumpswap_swap,
+    synthesize_tx_infos,
+)
+from monitoring.local_tx_parser import AccountKeys, LocalTxParser
+from monitoring.pubkey_index import PubkeyMap, build_pubkey_index
+
+
+class TestAccountKeys:
+    def test_lazy_encoding(self):
+        tx = make_noise(random.Random(1))
+        keys = AccountKeys(tx.transaction.message, tx.meta)
+        assert len(keys) == 12 + 48
+        assert keys.encoded_count == 0
+        assert keys[0] == fee_payer_of(tx)
+        assert keys.encoded_count == 1
+
+    def test_raw_out_of_range(self):
+        tx = make_noise(random.Random(1))
+        keys = AccountKeys(tx.transaction.message, tx.meta)
+        assert keys.raw(len(keys)) == b""
+        assert keys.raw(-1) == b""
+
+
+class TestPubkeyIndex:
+    def test_skips_invalid_entries(self):
+        index = build_pubkey_index([
+            "So11111111111111111111111111111111111111112",
+            "not-base58-0OIl",
+            "abc",
+        ])
+        assert len(index) == 1
+
+
+class TestPubkeyMap:
+    def test_raw_mirror_follows_mutations(self):
+        address = "So11111111111111111111111111111111111111112"
+        raw = build_pubkey_index([address]).__iter__().__next__()
+        m = PubkeyMap()
+        m[address] = "mint"
+        assert m.get_raw(raw) == "mint"
+        assert list(m.keys()) == [address]
+        m.pop(address)
+        assert m.get_raw(raw) is None
+        m[address] = "mint2"
+        m.clear()
+        assert not m.contains_raw(raw)
+
+
+class TestZeroDecodeParity:
+    def test_matches_legacy_path(self):
+        legacy = LocalTxParser(zero_decode=False)
+        fast = LocalTxParser(zero_decode=True)
+        for tx in synthesize_tx_infos(50):
+            fee_payer = fee_payer_of(tx)
+            assert fast.parse(tx, fee_payer) == legacy.parse(tx, fee_payer)
+        assert fast.get_stats() == legacy.get_stats()
+
+    def test_pump_buy(self):
+        tx = make_pump_buy(random.Random(3))
+        parsed = LocalTxParser().parse(tx, fee_payer_of(tx))
+        assert parsed is not None
+        assert parsed.platform == "pump_fun"
+        assert parsed.is_buy is True
+        assert len(parsed.signature) > 80
+
+    def test_pumpswap_accounts(self):
+        tx = make_pumpswap_swap(random.Random(4))
+        parsed = LocalTxParser().parse(tx, fee_payer_of(tx))
+        assert parsed is not None
+        assert parsed.platform == "pumpswap"
+        assert parsed.whale_pumpswap_pool_base_vault
+
+    def test_blacklisted_mint_by_bytes(self):
+        tx = make_pump_buy(random.Random(5))
+        fee_payer = fee_payer_of(tx)
+        mint = LocalTxParser().parse(tx, fee_payer).token_mint
+        parser = LocalTxParser(extra_blacklist={mint})
+        assert parser.parse(tx, fee_payer) is None
+        assert parser.stats.blacklisted_skipped == 1
@@ -0,0 +1,65 @@
+"""Queue logging pipeline, per-subsystem levels and the hot-path logger"""
+import logging
+import queue
+
+from utils import logger as log_utils
+from utils.logger import HotPathLogger, NonBlockingQueueHandler, build_queue_handler, set_subsystem_levels
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+def _logger(name: str, handler: logging.Handler) -> logging.Logger:
+    log = logging.getLogger(name)
+    log.handlers[:] = [handler]
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    return log
+
+
+def test_hot_logger_rate_limits_per_key(monkeypatch):
+    sink = _ListHandler()
+    hot = HotPathLogger(_logger("test.hot", sink), interval=10.0)
+    now = [100.0]
+    monkeypatch.setattr(log_utils.time, "monotonic", lambda: now[0])
+
+    assert hot.warning("A", "price %s", 1)
+    assert not hot.warning("A", "price %s", 2)
+    assert hot.warning("B", "price %s", 3)  # other mint is independent
+    now[0] += 11
+    assert hot.warning("A", "price %s", 4)
+    assert sink.messages == ["price 1", "price 3", "price 4 (+1 suppressed)"]
+    hot.forget("A")
+    assert hot.warning("A", "price %s", 5)
+
+
+def test_queue_handler_formats_on_listener_and_never_blocks():
+    sink = _ListHandler()
+    queue_handler, listener = build_queue_handler([sink])
+    log = _logger("test.queue", queue_handler)
+    args = ["late"]
+    log.info("value=%s", args)
+    listener.stop()
+    assert sink.messages == ["value=['late']"]
+
+    full = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    log = _logger("test.queue.full", full)
+    log.info("one")
+    log.info("two")
+    assert full.dropped == 1
+
+
+def test_subsystem_levels_override_explicit_logger_levels():
+    child = log_utils.get_logger("testsub.module", logging.INFO)
+    set_subsystem_levels("testsub=WARNING,testsub.other=DEBUG")
+    try:
+        assert not child.isEnabledFor(logging.INFO)
+        assert log_utils.get_logger("testsub.other.deep").isEnabledFor(logging.DEBUG)
+    finally:
+        log_utils._subsystem_levels.clear()
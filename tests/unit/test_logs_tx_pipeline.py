@@ -0,0 +1,139 @@
+"""Logs listener fetch pipeline: parallel workers, retry until the tx is available"""
+import asyncio
+import base64
+import time
+
+from aiohttp import web
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.keypair import Keypair
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+
+from monitoring.logs_tx_pipeline import TxFetchPipeline, parse_program_creation
+
+PROGRAM = Pubkey.new_unique()
+
+
+def _tx_b64() -> str:
+    payer = Keypair()
+    ix = Instruction(PROGRAM, b"\x01" * 8, [])
+    message = MessageV0.try_compile(payer.pubkey(), [ix], [], Hash.default())
+    return base64.b64encode(bytes(VersionedTransaction(message, [payer]))).decode()
+
+
+class _RpcStub:
+    """getTransaction stub: each signature fails with HTTP 429 for its first `errors`
+    calls, then is "not found" for the next `misses` calls."""
+
+    def __init__(self, misses: int, delay: float, errors: int = 0):
+        self.misses = misses
+        self.errors = errors
+        self.delay = delay
+        self.calls: dict[str, int] = {}
+        self.tx = _tx_b64()
+        self.runner = None
+        self.url = ""
+
+    async def handle(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        sig = body["params"][0]
+        self.calls[sig] = self.calls.get(sig, 0) + 1
+        await asyncio.sleep(self.delay)
+        if self.calls[sig] <= self.errors:
+            return web.Response(status=429, text="Too Many Requests")
+        result = None
+        if self.calls[sig] > self.errors + self.misses:
+            result = {"slot": 1, "blockTime": None, "version": 0, "meta": None,
+                      "transaction": [self.tx, "base64"]}
+        return web.json_response({"jsonrpc": "2.0", "id": body["id"], "result": result})
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+
+class _Parser:
+    def parse_token_creation_from_instruction(self, data, accounts, keys):
+        return f"token-{data.hex()[:4]}"
+
+
+async def test_burst_is_fetched_in_parallel_with_retries():
+    async with _RpcStub(misses=1, delay=0.05) as rpc:
+        delivered = []
+
+        async def deliver(token):
+            delivered.append(token)
+
+        pipeline = TxFetchPipeline(
+            rpc.url,
+            lambda tx: parse_program_creation(tx, str(PROGRAM), _Parser()),
+            deliver,
+            workers=4,
+            retry_delays=(0.01, 0.02, 0.02),
+        )
+        await pipeline.start()
+        signatures = [str(Keypair().sign_message(bytes([i]))) for i in range(4)]
+        t0 = time.monotonic()
+        assert all(pipeline.submit(sig) for sig in signatures)
+        assert not pipeline.submit(signatures[0])  # duplicate notification
+
+        while len(delivered) < 4 and time.monotonic() - t0 < 3:
+            await asyncio.sleep(0.01)
+        elapsed = time.monotonic() - t0
+        await pipeline.stop()
+
+    assert delivered == ["token-0101"] * 4
+    assert all(calls == 2 for calls in rpc.calls.values())  # one miss, then found
+    assert elapsed < 4 * 2 * 0.05  # serial fetching would take at least 0.4s
+    stats = pipeline.get_stats()
+    assert stats["retries"] == 4 and stats["duplicates"] == 1 and stats["parsed"] == 4
+
+
+async def test_gives_up_after_retry_budget():
+    async with _RpcStub(misses=10, delay=0) as rpc:
+        pipeline = TxFetchPipeline(rpc.url, lambda tx: "x", lambda t: None, retry_delays=(0, 0.01))
+        await pipeline.start()
+        sig = str(Keypair().sign_message(b"x"))
+        assert await pipeline.fetch_and_parse(sig) is None
+        await pipeline.stop()
+    assert rpc.calls[sig] == 2 and pipeline.get_stats()["not_found"] == 1
+
+
+async def test_transient_rpc_errors_are_retried():
+    async with _RpcStub(misses=1, delay=0, errors=2) as rpc:
+        pipeline = TxFetchPipeline(
+            rpc.url, lambda tx: "token", lambda t: None, retry_delays=(0, 0.01, 0.01, 0.01)
+        )
+        await pipeline.start()
+        sig = str(Keypair().sign_message(b"y"))
+        assert await pipeline.fetch_and_parse(sig) == "token"
+        await pipeline.stop()
+    stats = pipeline.get_stats()
+    assert rpc.calls[sig] == 4 and stats["rpc_errors"] == 2 and stats["errors"] == 0
+
+
+async def test_stop_cancels_pending_deliveries():
+    started = asyncio.Event()
+
+    async def deliver(token):
+        started.set()
+        await asyncio.sleep(60)
+
+    pipeline = TxFetchPipeline("http://127.0.0.1:1/", lambda tx: None, deliver)
+    await pipeline.start()
+    pipeline.emit("token")
+    await started.wait()
+    (delivery,) = pipeline._deliveries
+    await pipeline.stop()
+    assert delivery.cancelled() and not pipeline._deliveries
@@ -0,0 +1,89 @@
+"""Shared market-data client: batching, coalescing, caching, rate budget"""
+import asyncio
+import time
+
+from aiohttp import web
+
+from utils.market_data import MarketDataClient, TokenBucket
+
+
+class _ApiStub:
+    """DexScreener tokens + Jupiter price v3 stub that records each request."""
+
+    def __init__(self):
+        self.requests: list[str] = []
+        self.runner = None
+        self.base = ""
+
+    async def dexscreener(self, request: web.Request) -> web.Response:
+        mints = request.match_info["mints"].split(",")
+        self.requests.append(f"dex:{len(mints)}")
+        pairs = []
+        for mint in mints:
+            if mint.startswith("unlisted"):
+                continue
+            pairs.append({"baseToken": {"address": mint, "symbol": "LOW"}, "liquidity": {"usd": 10}})
+            pairs.append({"baseToken": {"address": mint, "symbol": "HIGH"}, "liquidity": {"usd": 500}})
+        pairs.append({"baseToken": {"address": "other"}, "quoteToken": {"address": mints[0]}, "liquidity": {"usd": 1}})
+        return web.json_response({"pairs": pairs})
+
+    async def jupiter(self, request: web.Request) -> web.Response:
+        ids = request.query["ids"].split(",")
+        self.requests.append(f"jup:{len(ids)}")
+        return web.json_response({mint: {"usdPrice": 1.5} for mint in ids if not mint.startswith("unlisted")})
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_get("/dex/{mints}", self.dexscreener)
+        app.router.add_get("/price", self.jupiter)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.base = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+
+async def test_lookups_batch_coalesce_and_cache(monkeypatch):
+    async with _ApiStub() as stub:
+        monkeypatch.setattr("utils.market_data.DEXSCREENER_TOKENS_URL", f"{stub.base}/dex/")
+        monkeypatch.setattr("utils.market_data.JUPITER_PRICE_V3_URL", f"{stub.base}/price")
+        client = MarketDataClient(dexscreener_rps=100, jupiter_rps=100)
+
+        mints = [f"mint{i}" for i in range(34)] + ["unlisted1"]
+        results = await asyncio.gather(*(client.dexscreener_pairs(m) for m in mints + mints[:5]))
+
+        assert sorted(stub.requests) == ["dex:30", "dex:5"]  # 35 unique mints, 40 lookups
+        by_mint = dict(zip(mints, results))
+        assert [p["baseToken"]["symbol"] for p in by_mint["mint3"][:2]] == ["HIGH", "LOW"]
+        assert by_mint["unlisted1"] == []
+        assert any(p["baseToken"]["address"] == "other" for p in results[0] + results[30])  # quote side
+
+        assert (await client.dexscreener_pairs("mint3"))[0]["baseToken"]["symbol"] == "HIGH"
+        assert len(stub.requests) == 2  # served from the shared cache
+
+        prices = await asyncio.gather(*(client.jupiter_price(m) for m in ("a", "b", "unlisted2")))
+        assert prices == [{"usdPrice": 1.5}, {"usdPrice": 1.5}, None]
+        await client.fetch_jupiter_prices(["c", "d"])
+        assert await client.jupiter_price("d") == {"usdPrice": 1.5}
+        assert stub.requests[2:] == ["jup:3", "jup:2"]
+        await client.close()
+
+
+async def test_failed_request_is_not_cached(monkeypatch):
+    monkeypatch.setattr("utils.market_data.DEXSCREENER_TOKENS_URL", "http://127.0.0.1:1/dex/")
+    client = MarketDataClient(dexscreener_rps=100)
+    assert await client.dexscreener_pairs("mint") is None
+    assert client.get_stats()["cache_size"] == 0
+    await client.close()
+
+
+async def test_token_bucket_enforces_rate():
+    bucket = TokenBucket(rate=50, burst=2)
+    t0 = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    assert time.monotonic() - t0 >= 4 / 50 * 0.9  # 2 burst + 4 at 50/s
@@ -0,0 +1,41 @@
+"""Memoized PDA/ATA derivation and precomputed platform singletons"""
+import pytest
+from solders.pubkey import Pubkey
+from spl.token.instructions import get_associated_token_address as spl_ata
+
+from core import pda_cache
+from core.pubkeys import TOKEN_2022_PROGRAM
+from platforms.bags.address_provider import BagsAddresses
+from platforms.letsbonk.address_provider import LetsBonkAddresses
+from platforms.pumpfun.address_provider import PumpFunAddresses, PumpFunAddressProvider
+
+
+def test_memoized_derivations_match_solders_and_count_hits():
+    pda_cache.clear_pda_cache()
+    mint, owner = Pubkey.new_unique(), Pubkey.new_unique()
+    seeds = [b"bonding-curve", bytes(mint)]
+    expected = Pubkey.find_program_address(seeds, PumpFunAddresses.PROGRAM)
+
+    assert pda_cache.find_program_address(seeds, PumpFunAddresses.PROGRAM) == expected
+    assert pda_cache.find_program_address(tuple(seeds), PumpFunAddresses.PROGRAM) == expected
+    assert pda_cache.get_associated_token_address(owner, mint, TOKEN_2022_PROGRAM) == spl_ata(owner, mint, TOKEN_2022_PROGRAM)
+    assert pda_cache.get_associated_token_address(owner, mint) == spl_ata(owner, mint)
+    with pytest.raises(ValueError):
+        pda_cache.get_associated_token_address(owner, mint, PumpFunAddresses.PROGRAM)
+
+    stats = pda_cache.get_pda_cache_stats()
+    assert (stats["pda"]["hits"], stats["pda"]["misses"]) == (1, 1)
+    assert stats["ata"]["misses"] == 2
+
+
+def test_precomputed_singletons_match_derivation():
+    provider = PumpFunAddressProvider()
+    assert provider.derive_global_volume_accumulator() == Pubkey.find_program_address(
+        [b"global_volume_accumulator"], PumpFunAddresses.PROGRAM
+    )[0]
+    assert provider.derive_fee_config() == Pubkey.find_program_address(
+        [b"fee_config", bytes(PumpFunAddresses.PROGRAM)], PumpFunAddresses.FEE_PROGRAM
+    )[0]
+    for addresses in (LetsBonkAddresses, BagsAddresses):
+        assert addresses.AUTHORITY == Pubkey.find_program_address([b"vault_auth_seed"], addresses.PROGRAM)[0]
+        assert addresses.EVENT_AUTHORITY == Pubkey.find_program_address([b"__event_authority"], addresses.PROGRAM)[0]
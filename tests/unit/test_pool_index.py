@@ -0,0 +1,107 @@
+"""Pool index persistence and PDA-first vault resolution"""
+import os
+import struct
+from types import SimpleNamespace
+
+import pytest
+from solders.pubkey import Pubkey
+
+from core.pubkeys import SOL_MINT, TOKEN_PROGRAM
+from trading import pool_index, vault_resolver
+from trading.pool_index import (
+    DEX_METEORA_DAMM_V2,
+    PUMP_AMM_PROGRAM,
+    PoolIndex,
+    derive_pool_vault,
+    derive_pumpswap_pool,
+)
+
+
+def _key() -> Pubkey:
+    return Pubkey.from_bytes(os.urandom(32))
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    idx = PoolIndex(tmp_path / "pool_index.db")
+    monkeypatch.setattr(pool_index, "_pool_index", idx)
+    yield idx
+    idx.close()
+
+
+def _pool_account(mint: Pubkey, base_vault: Pubkey, quote_vault: Pubkey) -> bytes:
+    return (
+        b"\0" * 8 + bytes([255]) + struct.pack("<H", 0)
+        + bytes(_key()) + bytes(mint) + bytes(SOL_MINT) + bytes(_key())
+        + bytes(base_vault) + bytes(quote_vault)
+        + struct.pack("<Q", 1) + bytes(_key())
+    )
+
+
+class _FakeClient:
+    """AsyncClient stand-in serving getAccountInfo from a dict; gPA is an error."""
+
+    def __init__(self, accounts: dict, calls: list):
+        self.accounts = accounts
+        self.calls = calls
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get_account_info(self, pubkey, encoding="base64"):
+        self.calls.append(("get_account_info", pubkey))
+        data = self.accounts.get(pubkey)
+        value = SimpleNamespace(data=data, owner=PUMP_AMM_PROGRAM) if data else None
+        return SimpleNamespace(value=value)
+
+    async def get_program_accounts(self, *args, **kwargs):
+        self.calls.append(("get_program_accounts", None))
+        raise AssertionError("getProgramAccounts must not run")
+
+
+def test_derivation_is_deterministic():
+    mint = _key()
+    pool = derive_pumpswap_pool(mint)
+    assert pool == derive_pumpswap_pool(str(mint))
+    assert pool != derive_pumpswap_pool(_key())
+    assert derive_pool_vault(pool, SOL_MINT) == derive_pool_vault(pool, SOL_MINT, TOKEN_PROGRAM)
+
+
+def test_index_merges_partial_entries_and_persists(index, tmp_path):
+    mint, pool = str(_key()), str(_key())
+    index.put(mint, pool, quote_vault="Q", source="geyser_migration")
+    assert not index.get(mint).has_vaults
+    index.put(mint, pool, base_vault="B", decimals=6, source="pda")
+    entry = index.get(mint)
+    assert (entry.base_vault, entry.quote_vault, entry.decimals, entry.source) == ("B", "Q", 6, "pda")
+
+    reopened = PoolIndex(tmp_path / "pool_index.db")
+    assert reopened.get(mint) == entry
+    # A different pool replaces the entry outright
+    reopened.put(mint, "other", DEX_METEORA_DAMM_V2)
+    assert reopened.get(mint).base_vault is None
+    reopened.close()
+
+
+async def test_resolve_vaults_prefers_index_then_pda(index, monkeypatch):
+    mint = _key()
+    pool = derive_pumpswap_pool(mint)
+    base_vault, quote_vault = _key(), derive_pool_vault(pool, SOL_MINT)
+    calls: list = []
+    client = _FakeClient({pool: _pool_account(mint, base_vault, quote_vault)}, calls)
+    monkeypatch.setattr(vault_resolver, "AsyncClient", client)
+
+    expected = (str(base_vault), str(quote_vault), str(pool))
+    assert await vault_resolver.resolve_vaults(str(mint)) == expected
+    assert calls == [("get_account_info", pool)]
+    assert index.get(str(mint)).decimals == 6
+
+    calls.clear()
+    assert await vault_resolver.resolve_vaults(str(mint)) == expected
+    assert calls == []
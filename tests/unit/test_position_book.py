@@ -0,0 +1,153 @@
+"""Property tests: PositionBook decisions == Position.update_price/should_exit"""
+import copy
+import logging
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from solders.pubkey import Pubkey
+
+import trading.position as position_mod
+from trading.position import ExitReason, Position
+from trading.position_book import PositionBook, utc_ts
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def utcnow(cls):
+        return NOW
+
+
+@pytest.fixture(autouse=True)
+def frozen_time(monkeypatch):
+    monkeypatch.setattr(position_mod, "datetime", _FrozenDatetime)
+    logging.getLogger("trading.position").setLevel(logging.CRITICAL)
+
+
+def _random_position(rng: random.Random) -> Position:
+    entry = rng.choice([1e-8, 2.5e-7, 3.3e-5, 0.01])
+    age = rng.choice([0, 10, 15, 29.9, 30, 59, 60, 61, 300, 4000])
+    pos = Position(
+        mint=Pubkey(bytes(rng.getrandbits(8) for _ in range(32))),
+        symbol="T",
+        entry_price=entry,
+        quantity=rng.uniform(1, 1e6),
+        entry_time=NOW - timedelta(seconds=age),
+        take_profit_price=rng.choice([None, entry * 1.5, entry * 3]),
+        stop_loss_price=rng.choice([None, entry * 0.8, entry * 0.5]),
+        max_hold_time=rng.choice([None, None, 60, 3600]),
+        tsl_enabled=rng.random() < 0.6,
+        tsl_activation_pct=rng.choice([0.1, 0.15, 0.5]),
+        tsl_trail_pct=rng.choice([0.1, 0.3]),
+        is_active=rng.random() < 0.95,
+        is_moonbag=rng.random() < 0.25,
+        is_dust=rng.random() < 0.15,
+        entry_price_provisional=rng.random() < 0.15,
+    )
+    if rng.random() < 0.4:
+        pos.tsl_active = True
+        pos.high_water_mark = entry * rng.choice([1.0, 1.2, 2.0])
+        pos.tsl_trigger_price = pos.high_water_mark * (1 - pos.tsl_trail_pct)
+        pos.tsl_triggered = rng.random() < 0.2
+    if rng.random() < 0.1:
+        pos.is_selling = True
+        if rng.random() < 0.7:
+            pos._is_selling_since = NOW - timedelta(seconds=rng.choice([5, 120, 121, 600]))
+    if rng.random() < 0.1:
+        pos._restore_pending = True  # restored: never decided by the book
+    if rng.random() < 0.3:
+        pos.dynamic_sl_enabled = rng.random() < 0.7
+        pos.dynamic_sl_percentage = rng.choice([0.2, 0.3, 0.45])
+        pos.dynamic_sl_duration = rng.choice([15, 60, 120])
+    return pos
+
+
+def _random_price(rng: random.Random, pos: Position) -> float:
+    # Hit every threshold exactly as often as the space in between
+    levels = [
+        pos.entry_price,
+        pos.entry_price * rng.uniform(0.05, 4.0),
+        pos.stop_loss_price or pos.entry_price,
+        pos.take_profit_price or pos.entry_price,
+        pos.tsl_trigger_price or pos.entry_price,
+        pos.entry_price * (1 - getattr(pos, "dynamic_sl_percentage", 0.30)),
+        pos.entry_price * (1 + pos.tsl_activation_pct),
+        pos.high_water_mark * 1.01,
+    ]
+    return rng.choice(levels)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_decisions_match_should_exit(seed):
+    rng = random.Random(seed)
+    positions = [_random_position(rng) for _ in range(100)]
+    prices = [_random_price(rng, p) for p in positions]
+
+    book = PositionBook()
+    book.load([copy.copy(p) for p in positions])
+    mints = [str(p.mint) for p in positions]
+    changed = set(book.apply_prices(mints, prices, now=utc_ts(NOW)))
+    got = dict(book.exit_decisions(mints, prices, now=utc_ts(NOW)))
+
+    for pos, price in zip(positions, prices):
+        mint = str(pos.mint)
+        restoring = getattr(pos, "_restore_pending", False)
+        assert pos.update_price(price) == (mint in changed), mint
+        should, reason = pos.should_exit(price)
+        if restoring:
+            assert mint not in got  # old path decides
+            continue
+        assert got.get(mint) == (reason if should else None), (mint, vars(pos), price)
+        assert book.tsl_state(mint) == (pos.tsl_active, pos.high_water_mark, pos.tsl_trigger_price)
+
+
+def test_no_sl_mints_never_exit():
+    rng = random.Random(1)
+    pos = _random_position(rng)
+    pos.is_active, pos.is_selling = True, False
+    pos.stop_loss_price = pos.entry_price * 0.8
+    mint = str(pos.mint)
+    book = PositionBook(no_sl_mints={mint})
+    book.upsert(pos)
+    assert book.exit_decisions([mint], [pos.entry_price * 0.1], now=utc_ts(NOW)) == []
+
+
+def test_remove_and_whole_book_sweep():
+    rng = random.Random(2)
+    book = PositionBook(capacity=2)
+    positions = []
+    for _ in range(5):
+        pos = _random_position(rng)
+        pos.is_active, pos.is_selling, pos.is_moonbag = True, False, False
+        pos.tsl_active = False
+        pos.stop_loss_price = pos.entry_price * 0.8
+        pos.entry_time = NOW - timedelta(seconds=600)
+        positions.append(pos)
+        book.upsert(pos)
+    assert len(book) == 5
+    assert book.remove(str(positions[0].mint))
+    assert str(positions[0].mint) not in book
+    for pos in positions[1:]:
+        book.set_price(str(pos.mint), pos.entry_price * 0.5)
+    decisions = dict(book.exit_decisions(now=utc_ts(NOW)))
+    assert decisions == {str(p.mint): ExitReason.STOP_LOSS for p in positions[1:]}
+
+
+def test_restored_position_rejoins_sweep_after_grace():
+    rng = random.Random(3)
+    pos = _random_position(rng)
+    pos.is_active, pos.is_selling, pos.is_moonbag = True, False, False
+    pos.stop_loss_price = pos.entry_price * 0.8
+    pos.entry_time = NOW - timedelta(seconds=600)
+    pos.restore_time = NOW
+    mint = str(pos.mint)
+    book = PositionBook()
+    book.upsert(pos)
+    low = pos.entry_price * 0.5
+    assert book.exit_decisions([mint], [low], now=utc_ts(NOW)) == []
+
+    pos.restore_time = None  # should_exit ended the grace period
+    book.upsert(pos)
+    assert book.exit_decisions([mint], [low], now=utc_ts(NOW)) == [(mint, ExitReason.STOP_LOSS)]
@@ -0,0 +1,200 @@
+"""Unit tests for the append-only PositionJournal and journaled save/remove"""
+import json
+import os
+import time
+from datetime import datetime
+
+import pytest
+from solders.pubkey import Pubkey
+
+import trading.position as position_mod
+from trading.position import Position, load_positions, remove_position, save_position, save_positions
+from trading.position_journal import PositionJournal, _encode
+
+MINT_A = "4k3Dyjzvzp8eMZWUXbBCjEvwSkkk59S5iCNLY3QrkX6R"
+MINT_B = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+
+
+def _position(mint: str, price: float = 1.0) -> Position:
+    return Position(
+        mint=Pubkey.from_string(mint), symbol="T", entry_price=price,
+        quantity=100.0, entry_time=datetime(2026, 1, 1),
+    )
+
+
+def _journal_lines(journal: PositionJournal) -> list[str]:
+    return journal.journal_path.read_text().splitlines()
+
+
+class TestJournal:
+    def test_only_changes_are_appended(self, tmp_path):
+        journal = PositionJournal(tmp_path / "positions.json")
+        a, b = {"mint": MINT_A, "v": 1}, {"mint": MINT_B, "v": 1}
+        assert journal.sync({MINT_A: a, MINT_B: b}) == {MINT_A: a, MINT_B: b}
+        assert journal.sync({MINT_A: a, MINT_B: {"mint": MINT_B, "v": 2}}) == {
+            MINT_B: {"mint": MINT_B, "v": 2}
+        }
+        assert journal.sync({MINT_A: a, MINT_B: {"mint": MINT_B, "v": 2}}) == {}
+        assert len(_journal_lines(journal)) == 3
+
+    def test_replay_matches_state(self, tmp_path):
+        path = tmp_path / "positions.json"
+        journal = PositionJournal(path)
+        journal.sync({MINT_A: {"mint": MINT_A, "v": 1}, MINT_B: {"mint": MINT_B, "v": 1}})
+        journal.put(MINT_A, {"mint": MINT_A, "v": 2})
+        journal.delete([MINT_B])
+        journal._close()
+        assert PositionJournal(path).load() == [{"mint": MINT_A, "v": 2}]
+
+    def test_torn_tail_is_dropped(self, tmp_path):
+        path = tmp_path / "positions.json"
+        journal = PositionJournal(path)
+        journal.put(MINT_A, {"mint": MINT_A, "v": 1})
+        journal._close()
+        with open(journal.journal_path, "a") as f:
+            f.write('deadbeef {"op":"put","mint":"' + MINT_B)  # crash mid-append
+        replayed = PositionJournal(path)
+        assert replayed.load() == [{"mint": MINT_A, "v": 1}]
+        assert replayed.get_stats()["torn"] == 1
+        replayed.put(MINT_B, {"mint": MINT_B, "v": 1})  # appends after the cut
+        replayed._close()
+        assert [p["mint"] for p in PositionJournal(path).load()] == [MINT_A, MINT_B]
+
+    def test_corrupt_record_fails_crc(self, tmp_path):
+        path = tmp_path / "positions.json"
+        journal = PositionJournal(path)
+        journal.put(MINT_A, {"mint": MINT_A, "v": 1})
+        journal.put(MINT_A, {"mint": MINT_A, "v": 2})
+        journal._close()
+        lines = journal.journal_path.read_text().splitlines(keepends=True)
+        lines[1] = lines[1].replace('"v":2', '"v":9')
+        journal.journal_path.write_text("".join(lines))
+        assert PositionJournal(path).load() == [{"mint": MINT_A, "v": 1}]
+
+    def test_compaction_writes_snapshot_and_truncates(self, tmp_path):
+        path = tmp_path / "positions.json"
+        journal = PositionJournal(path, compact_records=3)
+        for v in range(3):
+            journal.put(MINT_A, {"mint": MINT_A, "v": v})
+        assert json.loads(path.read_text()) == [{"mint": MINT_A, "v": 2}]
+        assert _journal_lines(journal) == []
+        journal.put(MINT_B, {"mint": MINT_B, "v": 0})
+        journal._close()
+        assert [p["mint"] for p in PositionJournal(path).load()] == [MINT_A, MINT_B]
+
+    def test_external_rewrite_keeps_newer_records(self, tmp_path):
+        path = tmp_path / "positions.json"
+        journal = PositionJournal(path)
+        journal.put(MINT_A, {"mint": MINT_A, "v": 1})
+        path.write_text(json.dumps([{"mint": MINT_B, "v": 7}]))  # e.g. a legacy tool
+        later = time.time_ns() + 10**9
+        os.utime(path, ns=(later, later))
+        assert journal.load() == [{"mint": MINT_B, "v": 7}]  # older record folded away
+        assert journal.journal_path.exists()
+        assert journal.get_stats()["reloads"] == 1
+
+        path.write_text(json.dumps([{"mint": MINT_B, "v": 8}]))
+        os.utime(path, ns=(later - 10**9, later - 10**9))  # rewrite OLDER than a record
+        journal._close()
+        with open(journal.journal_path, "a") as f:
+            f.write(_encode({"op": "put", "mint": MINT_A, "data": {"mint": MINT_A, "v": 2}, "ts": later}))
+        assert PositionJournal(path).load() == [{"mint": MINT_B, "v": 8}, {"mint": MINT_A, "v": 2}]
+
+    def test_compaction_timer_after_last_write(self, tmp_path):
+        path = tmp_path / "positions.json"
+        journal = PositionJournal(path, compact_interval=0.05)
+        journal.put(MINT_A, {"mint": MINT_A, "v": 1})
+        assert not path.exists()
+        time.sleep(0.3)
+        assert json.loads(path.read_text()) == [{"mint": MINT_A, "v": 1}]
+        assert _journal_lines(journal) == []
+        journal._close()
+
+    def test_processes_share_journal(self, tmp_path):
+        path = tmp_path / "positions.json"
+        bot_a, bot_b = PositionJournal(path), PositionJournal(path)
+        bot_a.put(MINT_A, {"mint": MINT_A, "v": 1})
+        assert MINT_A in bot_b  # Cross-bot check sees the other journal tail
+        bot_b.put(MINT_B, {"mint": MINT_B, "v": 1})
+        bot_b.compact()  # Must not drop bot_a's record
+        assert json.loads(path.read_text()) == [{"mint": MINT_A, "v": 1}, {"mint": MINT_B, "v": 1}]
+        bot_a.delete([MINT_B])
+        assert bot_b.load() == [{"mint": MINT_A, "v": 1}]
+        bot_a._close()
+        bot_b._close()
+        assert PositionJournal(path).load() == [{"mint": MINT_A, "v": 1}]
+
+    def test_scoped_sync_keeps_other_mints(self, tmp_path):
+        journal = PositionJournal(tmp_path / "positions.json")
+        journal.sync({MINT_A: {"mint": MINT_A}, MINT_B: {"mint": MINT_B}})
+        journal.sync({}, scope=[MINT_A])
+        assert journal.load() == [{"mint": MINT_B}]
+
+
+class TestJournaledSaves:
+    @pytest.fixture(autouse=True)
+    def _no_redis(self, monkeypatch):
+        async def _none():
+            return None
+        monkeypatch.setattr(position_mod, "_get_redis", _none)
+
+    def test_save_remove_load_roundtrip(self, tmp_path):
+        path = tmp_path / "positions.json"
+        save_positions([_position(MINT_A), _position(MINT_B)], path)
+        save_position(_position(MINT_A, price=2.0), path)
+        remove_position(MINT_B, path)
+        loaded = load_positions(path)
+        assert [(str(p.mint), p.entry_price) for p in loaded] == [(MINT_A, 2.0)]
+
+    def test_scoped_save_keeps_other_bots_positions(self, tmp_path):
+        path = tmp_path / "positions.json"
+        save_positions([_position(MINT_A)], path, scope=())  # bot 1
+        save_positions([_position(MINT_B)], path, scope=())  # bot 2
+        assert {str(p.mint) for p in load_positions(path)} == {MINT_A, MINT_B}
+        save_positions([], path, scope=[MINT_A])  # bot 1 closes its position
+        assert [str(p.mint) for p in load_positions(path)] == [MINT_B]
+
+    def test_unchanged_save_appends_nothing(self, tmp_path):
+        path = tmp_path / "positions.json"
+        positions = [_position(MINT_A), _position(MINT_B)]
+        save_positions(positions, path)
+        journal_path = path.with_name(path.name + ".journal")
+        size = journal_path.stat().st_size
+        save_positions(positions, path)
+        save_position(positions[0], path)
+        assert journal_path.stat().st_size == size
+
+
+class TestRedisBatch:
+    async def test_one_batch_with_merge_protect(self, tmp_path, monkeypatch):
+        calls = []
+
+        class _State:
+            async def is_connected(self):
+                return True
+
+            async def get_positions_many(self, mints):
+                calls.append(("hmget", sorted(mints)))
+                return {MINT_A: {"is_moonbag": True, "tp_partial_done": True}}
+
+            async def save_positions_batch(self, positions, remove=()):
+                calls.append(("batch", positions, list(remove)))
+                return True
+
+        async def _state():
+            return _State()
+
+        monkeypatch.setattr(position_mod, "_get_redis", _state)
+        path = tmp_path / "positions.json"
+        stale = _position(MINT_A)
+        stale.take_profit_price = 3.0
+        save_positions([stale, _position(MINT_B)], path)
+        remove_position(MINT_B, path)
+        await position_mod._redis_flush_task
+
+        assert calls[0] == ("hmget", [MINT_A])
+        _, saved, removed = calls[1]
+        assert list(saved) == [MINT_A] and removed == [MINT_B]
+        assert saved[MINT_A]["is_moonbag"] is True  # FIX S47-2 kept
+        assert saved[MINT_A]["take_profit_price"] is None
+        assert len(calls) == 2
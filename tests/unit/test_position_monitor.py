@@ -0,0 +1,140 @@
+"""Unit tests for the event-driven PositionMonitorEngine"""
+import asyncio
+from datetime import datetime
+
+from solders.pubkey import Pubkey
+
+from trading.position import Position
+from trading.position_monitor import PositionMonitorEngine
+from utils.batch_price_service import BatchPriceService
+
+MINT = "4k3Dyjzvzp8eMZWUXbBCjEvwSkkk59S5iCNLY3QrkX6R"
+OTHER_MINT = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+
+
+def _position(mint: str = MINT) -> Position:
+    return Position(
+        mint=Pubkey.from_string(mint), symbol="T", entry_price=1.0,
+        quantity=100.0, entry_time=datetime.utcnow(),
+    )
+
+
+class TestPublish:
+    def test_unwatched_mint_is_ignored(self):
+        engine = PositionMonitorEngine()
+        assert engine.publish(MINT, 1.0, "grpc_vault") is False
+        assert engine.get_stats()["unwatched"] == 1
+
+    def test_only_changes_bump_version(self):
+        engine = PositionMonitorEngine()
+        engine.register(_position())
+        assert engine.publish(MINT, 1.0, "grpc_vault") is True
+        assert engine.publish(MINT, 1.0, "batch_cache") is False
+        assert engine.publish(MINT, 0.0, "batch_cache") is False
+        tick = engine.latest(MINT)
+        assert tick.price == 1.0
+        assert tick.source == "grpc_vault"
+        assert tick.version == 1
+
+
+class TestWait:
+    async def test_wakes_on_price_change(self):
+        engine = PositionMonitorEngine()
+        version = engine.register(_position())
+        waiter = asyncio.create_task(engine.wait_for_price(MINT, version, timeout=5.0))
+        await asyncio.sleep(0)
+        engine.publish(MINT, 2.0, "moonbag_grpc")
+        tick = await asyncio.wait_for(waiter, timeout=1.0)
+        assert tick.price == 2.0
+        assert tick.version == version + 1
+
+    async def test_pending_change_returns_immediately(self):
+        engine = PositionMonitorEngine()
+        version = engine.register(_position())
+        engine.publish(MINT, 2.0)
+        engine.publish(MINT, 3.0)
+        tick = await engine.wait_for_price(MINT, version, timeout=5.0)
+        assert tick.price == 3.0  # bursts coalesce to the latest price
+
+    async def test_unchanged_price_times_out(self):
+        engine = PositionMonitorEngine()
+        engine.register(_position())
+        engine.publish(MINT, 1.0)
+        version = engine.latest(MINT).version
+        engine.publish(MINT, 1.0)
+        assert await engine.wait_for_price(MINT, version, timeout=0.01) is None
+        assert engine.get_stats()["timeouts"] == 1
+
+    async def test_unregister_releases_waiter(self):
+        engine = PositionMonitorEngine()
+        pos = _position()
+        version = engine.register(pos)
+        waiter = asyncio.create_task(engine.wait_for_price(MINT, version, timeout=5.0))
+        await asyncio.sleep(0)
+        engine.unregister(MINT, pos)
+        assert await asyncio.wait_for(waiter, timeout=1.0) is None
+        assert MINT not in engine
+
+    async def test_sweep_kicks_monitor_with_exit_due(self):
+        engine = PositionMonitorEngine()
+        pos = _position()
+        pos.stop_loss_price = 0.8
+        pos.max_hold_time = 1
+        pos.entry_time = datetime(2020, 1, 1)  # max hold long expired
+        version = engine.register(pos)
+        engine.publish(MINT, 0.9)  # above SL: price alone would not exit
+        version += 1
+        waiter = asyncio.create_task(engine.wait_for_price(MINT, version, timeout=5.0))
+        await asyncio.sleep(0)
+        decisions = engine.sweep()
+        tick = await asyncio.wait_for(waiter, timeout=1.0)
+        assert tick.version == version  # kick, not a new price
+        assert [(m, r.value) for m, r in decisions] == [(MINT, "max_hold_time")]
+
+    async def test_sweep_respects_no_sl_mints(self):
+        engine = PositionMonitorEngine()
+        engine.set_no_sl_mints({MINT})
+        pos = _position()
+        pos.stop_loss_price = 0.8
+        pos.entry_time = datetime(2020, 1, 1)
+        engine.register(pos)
+        engine.publish(MINT, 0.1)
+        assert engine.sweep() == []
+
+
+class TestRegister:
+    def test_stale_monitor_cannot_unregister_new_owner(self):
+        engine = PositionMonitorEngine()
+        old, new = _position(), _position()
+        engine.register(old)
+        engine.register(new)
+        engine.unregister(MINT, old)
+        assert MINT in engine
+        engine.unregister(MINT, new)
+        assert MINT not in engine
+
+
+class TestBatchPriceServicePush:
+    async def test_batch_refresh_pushes_changed_prices(self, monkeypatch):
+        service = BatchPriceService()
+        engine = PositionMonitorEngine()
+        engine.register(_position(OTHER_MINT))
+        service.add_price_listener(engine.publish)
+        service.watch(OTHER_MINT)
+
+        payload = {
+            "So11111111111111111111111111111111111111112": {"usdPrice": 100.0},
+            OTHER_MINT: {"usdPrice": 0.5},
+        }
+
+        class _MarketData:
+            async def fetch_jupiter_prices(self, mints):
+                return payload
+
+        monkeypatch.setattr("utils.batch_price_service.get_market_data_client", _MarketData)
+        await service._fetch_batch_prices()
+        await service._fetch_batch_prices()
+        tick = engine.latest(OTHER_MINT)
+        assert tick.price == 0.005
+        assert tick.source == "batch_cache"
+        assert tick.version == 1  # second identical refresh did not wake anyone
@@ -0,0 +1,71 @@
+"""Pump pattern detector refresh scheduler: bounded concurrency and priority"""
+import asyncio
+
+from monitoring.pump_pattern_detector import PumpPatternDetector
+
+
+async def test_refreshes_run_concurrently_within_bound(monkeypatch):
+    detector = PumpPatternDetector(birdeye_api_key="key", update_interval=60, max_concurrent_updates=4)
+    active = peak = 0
+    refreshed: list[str] = []
+
+    async def fake_update(mint: str):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        refreshed.append(mint)
+        active -= 1
+
+    monkeypatch.setattr(detector, "_update_token_data", fake_update)
+    for i in range(20):
+        detector.start_tracking(f"mint{i}", f"T{i}")
+
+    for _ in range(100):
+        if len(refreshed) == 20:
+            break
+        await asyncio.sleep(0.01)
+    await detector.stop()
+
+    assert sorted(refreshed) == sorted(f"mint{i}" for i in range(20))  # each refreshed once
+    assert peak == 4
+    assert not detector._due_tokens()  # nothing due again before update_interval
+
+
+async def test_whale_activity_and_volatility_raise_priority(monkeypatch):
+    detector = PumpPatternDetector(update_interval=5.0, price_momentum_threshold=0.1)
+    for mint in ("quiet", "volatile", "whale"):
+        detector.start_tracking(mint, mint)
+        detector._refreshed_at[mint] = 0.0
+    detector.tokens["volatile"].price_change_5m = 30.0  # 3x the momentum threshold
+    monkeypatch.setattr("monitoring.pump_pattern_detector.time.monotonic", lambda: 2.0)
+
+    assert detector._due_tokens() == ["volatile"]  # 2s / 5s * (1 + 3) >= 1
+
+    await detector.record_whale_buy("whale", "wallet", 1.0)
+    assert detector._due_tokens()[0] == "whale"  # refresh forced on the next pass
+    detector._refreshed_at["whale"] = 1.0
+    assert detector._due_tokens() == ["volatile", "whale"]  # 1s / 5s * (1 + 4) >= 1
+
+
+async def test_stop_tracking_cancels_refresh_without_leaking(monkeypatch):
+    detector = PumpPatternDetector(birdeye_api_key="key", update_interval=60)
+    started = asyncio.Event()
+
+    async def slow_update(mint: str):
+        started.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(detector, "_update_token_data", slow_update)
+    detector.start_tracking("mintA", "A")
+    detector.start_tracking("mintB", "B")
+    await asyncio.wait_for(started.wait(), 1)
+    task_a = detector._refresh_tasks["mintA"]
+
+    detector.stop_tracking("mintA")
+    await asyncio.sleep(0)
+    assert task_a.cancelled()
+    assert "mintA" not in detector._refreshed_at and "mintA" not in detector._refresh_tasks
+
+    await detector.stop()
+    assert not detector._refresh_tasks and not detector._refreshing
@@ -0,0 +1,69 @@
+"""Purchase history index: write-behind log, cross-process refresh, compaction"""
+import json
+from datetime import datetime, timedelta
+
+from trading.purchase_history import PurchaseHistoryIndex
+
+
+def _entry(age_seconds: float = 0.0) -> dict:
+    ts = datetime.utcnow() - timedelta(seconds=age_seconds)
+    return {"symbol": "SYM", "bot_name": "b", "timestamp": ts.isoformat()}
+
+
+def test_write_behind_and_cross_process_tail(tmp_path):
+    log = tmp_path / "history.jsonl"
+    bot_a = PurchaseHistoryIndex(log)
+    bot_a.add("mintA", _entry())
+    assert "mintA" in bot_a  # visible before it reaches disk
+    assert bot_a.flush()
+
+    bot_b = PurchaseHistoryIndex(log)
+    assert "mintA" in bot_b
+    bot_b.add("mintB", _entry())
+    bot_b.flush()
+    assert "mintB" in bot_a  # picked up by tailing the appended bytes
+    assert "pending" not in json.dumps(bot_a.records()["mintA"])
+
+    with open(log, "a") as f:
+        f.write('{"mint": "torn", "symbol"')  # partial line from a concurrent writer
+    assert "torn" not in bot_a
+    with open(log, "a") as f:
+        f.write(': "X"}\n')
+    assert "torn" in bot_a
+
+
+def test_prune_compacts_and_other_processes_reload(tmp_path):
+    log = tmp_path / "history.jsonl"
+    bot_a = PurchaseHistoryIndex(log)
+    bot_b = PurchaseHistoryIndex(log)
+    bot_a.add("old", _entry(age_seconds=7200))
+    bot_a.add("new", _entry())
+    bot_a.flush()
+    assert "old" in bot_b
+
+    expired, kept = bot_a.prune(3600)
+    assert expired == {"old"} and kept == 1
+    assert "old" not in bot_b and "new" in bot_b
+    assert len(log.read_text().splitlines()) == 1
+
+
+def test_legacy_json_is_migrated_once(tmp_path):
+    legacy = tmp_path / "history.json"
+    legacy.write_text(json.dumps({"purchased_tokens": {"legacyMint": _entry()}}))
+    index = PurchaseHistoryIndex(tmp_path / "history.jsonl", legacy_json=legacy)
+    assert "legacyMint" in index
+    assert not legacy.exists() and (tmp_path / "history.json.migrated").exists()
+
+
+def test_update_amount_goes_through_the_index(tmp_path, monkeypatch):
+    import trading.purchase_history as purchase_history
+
+    index = PurchaseHistoryIndex(tmp_path / "history.jsonl")
+    monkeypatch.setattr(purchase_history, "_index", index)
+    assert not purchase_history.update_purchase_amount("unknown", 5.0)
+    purchase_history.add_to_purchase_history("mintA", "SYM", amount=10.0)
+    assert purchase_history.update_purchase_amount("mintA", 4.0)
+    index.flush()
+    reloaded = PurchaseHistoryIndex(tmp_path / "history.jsonl")
+    assert reloaded.records()["mintA"]["amount"] == 4.0
+    assert reloaded.records()["mintA"]["symbol"] == "SYM"
@@ -0,0 +1,99 @@
+"""Unit tests for the async pooled Redis facade (stub client, no server)"""
+import asyncio
+import json
+
+from core.redis_pool import AsyncRedis
+
+
+class _StubPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.command_stack = []
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self.command_stack.append((name, args))
+            return self
+        return _queue
+
+    async def execute(self):
+        self.client.round_trips += 1
+        return [getattr(self.client, f"_{name}")(*args) for name, args in self.command_stack]
+
+
+class _StubRedis:
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return _StubPipeline(self)
+
+    def _get(self, key):
+        return self.data.get(key, (None,))[0]
+
+    def _pttl(self, key):
+        return self.data[key][1] * 1000 if key in self.data else -2
+
+    def _setex(self, key, ttl, value):
+        self.data[key] = (value, ttl)
+
+    def _set(self, key, value):
+        self.data[key] = (value, -1)
+
+    async def zrem(self, key, *members):
+        self.round_trips += 1
+        return len(members)
+
+    async def ping(self):
+        self.round_trips += 1
+        return True
+
+
+def _facade() -> tuple[AsyncRedis, _StubRedis]:
+    facade = AsyncRedis()
+    stub = _StubRedis()
+    facade._client = stub
+    facade._loop = asyncio.get_running_loop()
+    return facade, stub
+
+
+async def test_get_json_mirrors_redis_value():
+    facade, stub = _facade()
+    stub.data["rpc:x"] = (json.dumps({"v": 1}), 30)
+    assert await facade.get_json("rpc:x") == {"v": 1}
+    assert await facade.get_json("rpc:x") == {"v": 1}
+    assert stub.round_trips == 1  # second read served by the local mirror
+
+
+async def test_queued_writes_flush_in_one_pipeline():
+    facade, stub = _facade()
+    for i in range(5):
+        facade.set_json_nowait(f"rpc:{i}", i, ttl=10, caller="client_cache")
+    assert await facade.get_json("rpc:3") == 3  # visible locally before the flush
+    await facade._flush_task
+    assert stub.round_trips == 1
+    assert json.loads(stub.data["rpc:4"][0]) == 4
+    assert facade.get_stats()["callers"]["client_cache.pipeline"]["calls"] == 5
+
+
+async def test_instrumented_client_times_per_caller():
+    facade, stub = _facade()
+    client = facade.client_for("redis_state")
+    assert await client.ping() is True
+    assert await facade.zrem("sold_mints", "a", "b", caller="sold_mints") == 2
+    callers = facade.get_stats()["callers"]
+    assert callers["redis_state.ping"]["calls"] == 1
+    assert callers["sold_mints"]["calls"] == 1
+
+
+async def test_connection_error_backs_off():
+    facade, stub = _facade()
+
+    async def _down(*a):
+        raise ConnectionError("refused")
+    stub.zrem = _down
+    assert await facade.zrem("sold_mints", "a") == 0
+    assert facade.available is False
+    assert await facade.get_json("rpc:missing") is None
+    assert facade.get_stats()["callers"]["zset"]["errors"] == 1
@@ -0,0 +1,118 @@
+"""Send fabric against local stub HTTP endpoints"""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from core.send_fabric import SendEndpoint, SendFabric, primary_endpoint
+
+
+class _StubEndpoint:
+    """JSON-RPC sendTransaction stub with a fixed delay; counts TCP connections."""
+
+    def __init__(self, delay: float, status: int = 200, error: bool = False):
+        self.delay = delay
+        self.status = status
+        self.error = error
+        self.requests = 0
+        self.peers = set()
+        self.runner = None
+        self.url = ""
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if request.method == "GET":
+            return web.Response(text="ok")
+        self.requests += 1
+        body = await request.json()
+        await asyncio.sleep(self.delay)
+        if self.status != 200:
+            return web.Response(status=self.status)
+        if self.error:
+            return web.json_response({"jsonrpc": "2.0", "id": 1, "error": {"code": -32002, "message": "boom"}})
+        return web.json_response({"jsonrpc": "2.0", "id": 1, "result": f"sig-{body['params'][0][:4]}"})
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/rpc"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+
+async def _run(fabric: SendFabric, n: int) -> list:
+    results = []
+    for _ in range(n):
+        results.append(await fabric.send(b"\x01" * 64))
+    await asyncio.sleep(0.15)  # let background losers report
+    return results
+
+
+async def test_learns_fastest_endpoints_and_reuses_connections():
+    async with _StubEndpoint(0.005) as fast, _StubEndpoint(0.05) as slow, _StubEndpoint(0.01, error=True) as bad:
+        fabric = SendFabric(
+            [SendEndpoint("fast", fast.url), SendEndpoint("slow", slow.url), SendEndpoint("bad", bad.url)],
+            top_k=1, min_samples=3, explore=0.0,
+        )
+        try:
+            await fabric.start()
+            results = await _run(fabric, 3)  # cold start: everyone gets it
+            assert all(r.is_success and r.provider == "fast" for r in results)
+            assert (fast.requests, slow.requests, bad.requests) == (3, 3, 3)
+
+            await _run(fabric, 5)  # warmed up: only the best one
+            assert (fast.requests, slow.requests, bad.requests) == (8, 3, 3)
+            stats = fabric.get_stats()
+            assert stats["fast"]["wins"] == 8 and stats["slow"]["ewma_ms"] > stats["fast"]["ewma_ms"]
+            assert stats["bad"]["success"] < 1.0 and stats["bad"]["cooling"]  # 3 consecutive failures
+            assert len(fast.peers) == 1  # warm-up connection reused by every send
+        finally:
+            await fabric.close()
+
+
+async def test_rate_limited_endpoint_cools_down_and_all_failed_reports():
+    async with _StubEndpoint(0.0, status=429) as limited, _StubEndpoint(0.0, error=True) as bad:
+        fabric = SendFabric([SendEndpoint("limited", limited.url), SendEndpoint("bad", bad.url)], top_k=1)
+        try:
+            result = await fabric.send(b"\x02" * 64)
+            assert not result.is_success and "All 2 send endpoints failed" in result.error
+            assert fabric.get_stats()["limited"]["cooling"]
+            assert [e.name for e in fabric.select()] == ["bad"]
+        finally:
+            await fabric.close()
+
+
+def test_endpoint_payloads_and_signature_parsing():
+    assert SendEndpoint("j", "u", kind="jito").payload("TX")["params"] == ["TX", {"encoding": "base64"}]
+    assert SendEndpoint("b", "u", kind="bloxroute").parse({"signature": "S"}) == "S"
+    assert SendEndpoint("c", "u", kind="circular").parse({"result": {"signature": "S"}}) == "S"
+    with pytest.raises(RuntimeError):
+        SendEndpoint("r", "u").parse({"error": {"message": "nope"}})
+
+
+async def test_primary_added_after_start_is_warmed_and_pinned_per_send():
+    async with _StubEndpoint(0.005) as other, _StubEndpoint(0.005) as mine, _StubEndpoint(0.05) as theirs:
+        fabric = SendFabric([SendEndpoint("other", other.url)], top_k=1, min_samples=1, explore=0.0)
+        try:
+            await fabric.start()
+            fabric.add(primary_endpoint(mine.url))
+            fabric.add(primary_endpoint(theirs.url))
+            await asyncio.sleep(0.1)
+            assert len(mine.peers) == 1  # warmed without waiting for keep-alive
+            for endpoint, latency in zip(fabric.endpoints, (5.0, 40.0, 50.0)):
+                endpoint.record(True, latency)
+            for _ in range(3):
+                await fabric.send(b"\x01" * 64, primary_url=mine.url)
+            await asyncio.sleep(0.15)
+            assert mine.requests == 3  # the sender's own primary: in every fan-out
+            assert theirs.requests == 0  # another bot's primary is not pinned for us
+            assert set(fabric.get_stats()) == {"other", "primary-127.0.0.1", "primary-127.0.0.1-2"}
+        finally:
+            await fabric.close()
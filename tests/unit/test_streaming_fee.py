@@ -0,0 +1,98 @@
+"""Streaming priority fee estimator and its DynamicPriorityFee integration"""
+import base58
+import pytest
+
+from core.priority_fee.dynamic_fee import DynamicPriorityFee, FeeStrategy
+from core.priority_fee.streaming_fee import (
+    COMPUTE_BUDGET_PROGRAM,
+    SlidingHistogram,
+    StreamingFeeEstimator,
+    compute_unit_price,
+)
+from geyser.generated import solana_storage_pb2
+
+PUMP = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+
+
+def _message(price: int | None, program: str = PUMP):
+    keys = [b"\x01" * 32, base58.b58decode(COMPUTE_BUDGET_PROGRAM), base58.b58decode(program)]
+    ixs = [solana_storage_pb2.CompiledInstruction(program_id_index=1, data=b"\x02" + (200_000).to_bytes(4, "little"))]
+    if price is not None:
+        ixs.append(solana_storage_pb2.CompiledInstruction(program_id_index=1, data=b"\x03" + price.to_bytes(8, "little")))
+    ixs.append(solana_storage_pb2.CompiledInstruction(program_id_index=2, data=b"\x66" * 8))
+    return solana_storage_pb2.Message(account_keys=keys, instructions=ixs)
+
+
+def test_compute_unit_price_extraction():
+    assert compute_unit_price(_message(123_456)) == (123_456, PUMP)
+    assert compute_unit_price(_message(None)) == (None, PUMP)
+
+
+def test_histogram_quantiles_and_window():
+    hist = SlidingHistogram(window=60.0, slices=6)
+    for v in range(1, 1001):
+        hist.add(v * 1000, now=100.0)
+    p50 = hist.quantile(0.5, now=100.0)
+    assert 500_000 <= p50 <= 500_000 * 1.2  # rounded up to the bucket bound
+    assert hist.quantile(0.9, now=100.0) >= 900_000
+    hist.add(10, now=150.0)
+    assert hist.count(now=150.0) == 1001
+    assert hist.count(now=165.0) == 1  # first slice fell out of the window
+    assert hist.count(now=1000.0) == 0
+
+
+def test_estimator_is_cold_until_min_samples():
+    est = StreamingFeeEstimator(min_samples=5)
+    est.QUOTE_REFRESH = 0
+    meta = solana_storage_pb2.TransactionStatusMeta(err=solana_storage_pb2.TransactionError(err=b"x"))
+    est.observe_transaction(_message(1_000_000), meta)  # failed tx ignored
+    assert est.quote(0.5) is None
+    for _ in range(5):
+        est.observe_transaction(_message(1_000_000))
+    assert est.quote(0.5) >= 1_000_000
+    assert est.quote(0.5, PUMP) == est.quote(0.5)
+
+
+class _NoRpcClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def post_rpc(self, body):
+        self.calls += 1
+        return {"result": [{"prioritizationFee": 2_000_000}] * 3}
+
+
+async def test_dynamic_fee_prefers_stream_and_falls_back_to_rpc():
+    est = StreamingFeeEstimator(min_samples=3)
+    client = _NoRpcClient()
+    plugin = DynamicPriorityFee(client, strategy=FeeStrategy.CONSERVATIVE, estimator=est)
+
+    assert await plugin.get_priority_fee() == 2_000_000  # cold: RPC
+    assert client.calls == 1
+
+    for _ in range(3):
+        est.observe(300_000, PUMP)
+    plugin._cache = None
+    fee = await plugin.get_priority_fee()
+    assert client.calls == 1
+    assert fee == pytest.approx(300_000, rel=0.2)
+
+
+async def test_streamed_quote_is_capped_by_rpc_quote():
+    est = StreamingFeeEstimator(min_samples=3)
+    client = _NoRpcClient()
+    plugin = DynamicPriorityFee(client, strategy=FeeStrategy.CONSERVATIVE, estimator=est, max_fee=50_000_000)
+    for _ in range(3):
+        est.observe(20_000_000, PUMP)  # whale-biased stream
+
+    assert await plugin.get_priority_fee() == 2_000_000  # capped by the RPC quote
+    assert await plugin.get_priority_fee() == 2_000_000
+    assert client.calls == 1  # RPC re-fetched only every RPC_ANCHOR_TTL
+
+
+def test_duplicate_signatures_are_counted_once():
+    est = StreamingFeeEstimator(min_samples=1)
+    for _ in range(2):  # same tx from two endpoints
+        est.observe_transaction(_message(1_000_000), signature=b"\x07" * 64)
+    est.observe_transaction(_message(1_000_000), signature=b"\x08" * 64)
+    assert est.sample_count() == 2 and est.stats["duplicates"] == 1
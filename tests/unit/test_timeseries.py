@@ -0,0 +1,38 @@
+"""Ring-buffer time series: eviction, expiry, running sums"""
+import pytest
+
+from monitoring.trending_scanner import RateLimiter
+from utils.timeseries import RingSeries
+
+
+def test_ring_evicts_oldest_and_keeps_running_sums():
+    series = RingSeries(capacity=3, columns=2)
+    for i in range(5):
+        series.append(float(i), i, 10 * i)
+
+    assert len(series) == 3
+    assert list(series) == [(2.0, 2.0, 20.0), (3.0, 3.0, 30.0), (4.0, 4.0, 40.0)]
+    assert (series.sum(0), series.sum(1)) == (9.0, 90.0)
+    assert series.last(1) == 40.0 and series.first_ts() == 2.0
+
+    assert series.count_since(2.5) == 2
+    assert series.expire(3.0) == 2
+    assert series.values(0) == [4.0] and series.sum(0) == 4.0
+    series.expire(10.0)
+    assert not series and series.sum(1) == 0.0 and series.last() is None
+
+    with pytest.raises(ValueError):
+        series.append(1.0, 1.0)
+
+
+def test_rate_limiter_window(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("monitoring.trending_scanner.time.monotonic", lambda: clock[0])
+    limiter = RateLimiter(max_requests=2, window_seconds=10)
+    limiter.record_request()
+    clock[0] += 4
+    limiter.record_request()
+    assert not limiter.can_request()
+    assert limiter.time_until_available() == pytest.approx(6.0)
+    clock[0] += 6
+    assert limiter.can_request() and len(limiter.requests) == 1
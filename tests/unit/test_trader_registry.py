@@ -0,0 +1,64 @@
+"""Trader registry with several bots in one process"""
+from types import SimpleNamespace
+
+from trading import trader_registry
+
+
+def test_first_registered_trader_is_primary():
+    first, second = object(), object()
+    try:
+        trader_registry.register_trader(first)
+        trader_registry.register_trader(second)
+        trader_registry.register_trader(first)  # re-registering keeps the order
+
+        assert trader_registry.get_trader() is first
+        assert trader_registry.get_traders() == [first, second]
+
+        trader_registry.unregister_trader(first)
+        assert trader_registry.get_trader() is second
+    finally:
+        trader_registry.unregister_trader()
+    assert trader_registry.get_trader() is None
+
+
+def _trader(wallet: str, platform: str, mints: set[str]):
+    return SimpleNamespace(
+        wallet=SimpleNamespace(pubkey=wallet),
+        platform=SimpleNamespace(value=platform),
+        has_active_position=mints.__contains__,
+    )
+
+
+def test_lookup_reaches_the_owning_trader():
+    pump, bonk = _trader("W1", "pump_fun", {"M1"}), _trader("W2", "lets_bonk", {"M2"})
+    try:
+        trader_registry.register_trader(pump)
+        trader_registry.register_trader(bonk)
+
+        assert trader_registry.get_trader(mint="M2") is bonk
+        assert trader_registry.get_trader(mint="M3", wallet="W2") is bonk
+        assert trader_registry.get_trader(platform="lets_bonk") is bonk
+        assert trader_registry.get_trader(mint="M3", wallet="W9") is pump  # primary fallback
+    finally:
+        trader_registry.unregister_trader()
+
+
+def test_positions_split_by_wallet():
+    pump, bonk = _trader("W1", "pump_fun", {"M1"}), _trader("W2", "lets_bonk", {"M2"})
+    stored = [
+        {"mint": "M1"},                  # untagged, held by W1's bot
+        {"mint": "M2"},                  # untagged, held by W2's bot
+        {"mint": "M3", "wallet": "W2"},  # tagged, not in memory
+        {"mint": "M4"},                  # untagged, nobody holds it
+    ]
+    try:
+        trader_registry.register_trader(pump)
+        trader_registry.register_trader(bonk)
+
+        mints = lambda ps: [p["mint"] for p in ps]
+        assert mints(trader_registry.positions_for_wallet(stored, "W1")) == ["M1"]
+        assert mints(trader_registry.positions_for_wallet(stored, "W2")) == ["M2", "M3"]
+        assert mints(trader_registry.positions_for_wallet(stored, "W1", claim_untagged=True)) == ["M1", "M4"]
+        assert trader_registry.get_traders_for_wallet("W2") == [bonk]
+    finally:
+        trader_registry.unregister_trader()
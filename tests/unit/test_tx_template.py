@@ -0,0 +1,64 @@
+"""Pre-compiled buy transaction templates vs the per-call builders"""
+from types import SimpleNamespace
+
+import pytest
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
+
+from core.client import set_loaded_accounts_data_size_limit
+from core.tx_template import TxTemplateCache, build_buy_template
+from interfaces.core import Platform, TokenInfo
+from platforms import get_platform_implementations
+
+
+def _token(platform: Platform) -> TokenInfo:
+    return TokenInfo(
+        name="Test", symbol="TST", uri="", mint=Pubkey.new_unique(), platform=platform,
+        creator=Pubkey.new_unique(), bonding_curve=Pubkey.new_unique(),
+        associated_bonding_curve=Pubkey.new_unique(), pool_state=Pubkey.new_unique(),
+        base_vault=Pubkey.new_unique(), quote_vault=Pubkey.new_unique(),
+    )
+
+
+@pytest.mark.parametrize("platform", [Platform.PUMP_FUN, Platform.LETS_BONK, Platform.BAGS])
+async def test_rendered_template_matches_regular_build(platform):
+    impl = get_platform_implementations(platform, SimpleNamespace(rpc_endpoint="http://template-test"))
+    builder, provider = impl.instruction_builder, impl.address_provider
+    if hasattr(builder, "_generate_wsol_seed"):
+        builder._generate_wsol_seed = lambda user: "f" * 32  # time-based otherwise
+    signer, token = Keypair(), _token(platform)
+    tip = transfer(TransferParams(from_pubkey=signer.pubkey(), to_pubkey=Pubkey.new_unique(), lamports=10_000))
+
+    template = await build_buy_template(
+        builder, provider, token, signer.pubkey(),
+        compute_unit_limit=150_000, account_data_size_limit=512_000, tip_instruction=tip,
+    )
+    blockhash = Hash.new_unique()
+    for amount_in, min_out, fee in [(1_100_000_000, 35_000_000_000, 250_000), (5_000, 1, 0)]:
+        expected_ixs = (
+            [set_loaded_accounts_data_size_limit(512_000), set_compute_unit_limit(150_000), set_compute_unit_price(fee)]
+            + await builder.build_buy_instruction(token, signer.pubkey(), amount_in, min_out, provider)
+            + [tip]
+        )
+        expected = Transaction([signer], Message(expected_ixs, signer.pubkey()), blockhash)
+        assert bytes(template.render(signer, blockhash, amount_in, min_out, fee)) == bytes(expected)
+
+    with pytest.raises(ValueError):
+        template.render(Keypair(), blockhash, 1, 1)
+
+
+def test_cache_is_lru_and_shape_checked():
+    cache = TxTemplateCache(max_entries=2)
+    a, b, c = (SimpleNamespace(shape=("s",)) for _ in range(3))
+    cache.put(("pump_fun", "m1", "w"), a)
+    cache.put(("pump_fun", "m2", "w"), b)
+    assert cache.get(("pump_fun", "m1", "w"), ("s",)) is a
+    assert cache.get(("pump_fun", "m1", "w"), ("other",)) is None  # e.g. mayhem mode flipped
+    cache.put(("pump_fun", "m3", "w"), c)
+    assert cache.get(("pump_fun", "m2", "w"), ("s",)) is None  # least recently used
+    assert cache.get_stats()["evictions"] == 1
@@ -0,0 +1,72 @@
+"""Unit tests for WhaleGeyserReceiver raw-bytes pre-filter"""
+import json
+import os
+import struct
+
+import base58
+import pytest
+
+from geyser.generated import geyser_pb2
+from monitoring.whale_geyser import WhaleGeyserReceiver
+
+
+def _address() -> str:
+    return base58.b58encode(os.urandom(32)).decode()
+
+
+@pytest.fixture
+def receiver(tmp_path):
+    whale = _address()
+    wallets_file = tmp_path / "wallets.json"
+    wallets_file.write_text(json.dumps({"whales": [{"wallet": whale, "label": "w1"}]}))
+    r = WhaleGeyserReceiver(wallets_file=str(wallets_file))
+    r.test_whale = whale
+    return r
+
+
+class TestTxPrefilter:
+    def test_contains_whales_and_own_wallet(self, receiver):
+        assert base58.b58decode(receiver.test_whale) in receiver._tx_filter_raw
+        me = _address()
+        receiver.set_wallet_pubkey(me)
+        assert base58.b58decode(me) in receiver._tx_filter_raw
+        assert receiver._wallet_pubkey_raw == base58.b58decode(me)
+
+
+class TestAccountMaps:
+    async def test_vault_update_by_raw_pubkey(self, receiver):
+        mint, base_vault, quote_vault = _address(), _address(), _address()
+        await receiver.subscribe_vault_accounts(mint, base_vault, quote_vault, "SYM", 6)
+        assert receiver._vault_address_map.contains_raw(base58.b58decode(quote_vault))
+
+        update = geyser_pb2.SubscribeUpdateAccount(
+            slot=10,
+            account=geyser_pb2.SubscribeUpdateAccountInfo(
+                pubkey=base58.b58decode(quote_vault),
+                data=b"\0" * 64 + struct.pack("<Q", 2 * 10**9),
+            ),
+        )
+        receiver._handle_vault_account_update(update, slot=10)
+        assert receiver._vault_subscriptions[mint].quote_reserve == 2.0
+
+        await receiver.unsubscribe_vault_accounts(mint)
+        assert not receiver._vault_address_map.contains_raw(base58.b58decode(quote_vault))
+
+
+class TestCurveSnapshot:
+    async def test_curve_update_builds_snapshot(self, receiver):
+        mint, curve = _address(), _address()
+        await receiver.subscribe_bonding_curve(mint, curve, "SYM")
+        update = geyser_pb2.SubscribeUpdateAccount(
+            slot=7,
+            account=geyser_pb2.SubscribeUpdateAccountInfo(
+                pubkey=base58.b58decode(curve),
+                data=b"\0" * 8 + struct.pack("<QQQQQ?", 10**15, 30 * 10**9, 9 * 10**14, 2 * 10**9, 10**15, False),
+            ),
+        )
+        receiver._handle_curve_account_update(update, slot=7)
+        snap = receiver.get_curve_snapshot(mint)
+        assert snap.reserves == (10**15, 30 * 10**9)
+        assert snap.real_quote_reserves == 2 * 10**9 and snap.slot == 7
+        assert receiver.get_curve_price(mint) == snap.price()
+        assert receiver.get_curve_snapshot(_address()) is None